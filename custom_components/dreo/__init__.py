@@ -4,11 +4,33 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 from .haimports import *  # pylint: disable=W0401,W0614
-from .const import DOMAIN, PYDREO_MANAGER, DREO_PLATFORMS, CONF_AUTO_RECONNECT, DEBUG_TEST_MODE
+from .const import (
+    DOMAIN,
+    PYDREO_MANAGER,
+    DREO_PLATFORMS,
+    DREO_STATE_WRITER,
+    DREO_ONBOARDING,
+    DREO_DEVICE_DISCOVERY,
+    DREO_OPTIONS,
+    CONF_AUTO_RECONNECT,
+    CONF_COMMAND_TRACING,
+    CONF_DISCOVERY_INTERVAL,
+    CONF_METRICS_SENSORS,
+    CONF_STATE_WRITE_WINDOW,
+    DEFAULT_DISCOVERY_INTERVAL,
+    DEFAULT_STATE_WRITE_WINDOW,
+    DEBUG_TEST_MODE,
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_STORAGE_VERSION,
+)
+from .dreobasedevice import DreoStateWriter
+from .discovery import DreoDeviceDiscovery
+from .onboarding import DreoDeviceOnboarding
 
 if TYPE_CHECKING:
     from .pydreo import PyDreo
@@ -135,6 +157,7 @@ def _install_ha_call_later_scheduler(
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     "HomeAssistant EntryPoint"
     _LOGGER.debug("async_setup_entry: Starting setup")
+    setup_started = time.monotonic()
 
     _LOGGER.debug("async_setup_entry: Username: %s", config_entry.data.get(CONF_USERNAME))
     username = config_entry.data.get(CONF_USERNAME)
@@ -149,7 +172,6 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         region = None
 
     from .pydreo import PyDreo  # pylint: disable=C0415
-    from .pydreo.constant import DreoDeviceType  # pylint: disable=C0415
 
     if DEBUG_TEST_MODE:
         _LOGGER.error("async_setup_entry: DEBUG_TEST_MODE is True!")
@@ -161,8 +183,9 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
             return False
         pydreo_manager = PyDreo("TEST_EMAIL", "TEST_PASSWORD", redact=True, debug_test_mode=True, debug_test_mode_payload=debug__test_mode_payload)
     else:
-        pydreo_manager = PyDreo(username, password, region=region)
+        pydreo_manager = PyDreo(username, password, region=region, aiohttp_session=async_get_clientsession(hass))
         pydreo_manager.auto_reconnect = auto_reconnect
+    pydreo_manager.tracer.enabled = config_entry.options.get(CONF_COMMAND_TRACING, False)
 
     # Prefer HA event-loop timers over raw threading.Timer for delayed device work.
     try:
@@ -179,24 +202,80 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
             ex,
         )
 
-    login = await hass.async_add_executor_job(pydreo_manager.login)
+    # Build devices from the last snapshot when there is a usable one, so setup does not
+    # wait on the cloud; the snapshot is reconciled with REST once setup completes.
+    snapshot_store = _snapshot_store(hass, config_entry)
+    warm_start = False
+    if not DEBUG_TEST_MODE:
+        snapshot = await snapshot_store.async_load()
+        warm_start = snapshot is not None and pydreo_manager.load_from_snapshot(snapshot)
+
+    if warm_start:
+        _LOGGER.info("async_setup_entry: Loaded devices from snapshot; reconciling in the background")
+    else:
+        login = await pydreo_manager.async_login()
+
+        if not login:
+            _LOGGER.error("async_setup_entry: Unable to login to the dreo server")
+            raise ConfigEntryNotReady("Unable to login to the Dreo server")
+
+        # Device states load in the background once the platforms are set up;
+        # each device's entities are added as soon as its state is in.
+        load_devices = await pydreo_manager.async_load_devices(load_state=False)
+
+        if not load_devices:
+            _LOGGER.error("async_setup_entry: Unable to load devices from the dreo server")
+            raise ConfigEntryNotReady("Unable to load devices from the Dreo server")
+
+    _LOGGER.info("async_setup_entry: %d Dreo devices found", len(pydreo_manager.devices))
+    platforms = _platforms_for_devices(pydreo_manager.devices)
+
+    pydreo_manager.start_transport()
+
+    hass.data[DOMAIN] = {}
+    hass.data[DOMAIN][PYDREO_MANAGER] = pydreo_manager
+    hass.data[DOMAIN][DREO_PLATFORMS] = platforms
+    onboarding = DreoDeviceOnboarding(pydreo_manager, setup_started)
+    hass.data[DOMAIN][DREO_ONBOARDING] = onboarding
+    state_write_window = config_entry.options.get(CONF_STATE_WRITE_WINDOW, DEFAULT_STATE_WRITE_WINDOW)
+    hass.data[DOMAIN][DREO_STATE_WRITER] = DreoStateWriter(hass.loop, state_write_window / 1000)
+
+    _LOGGER.debug("async_setup_entry: Platforms are: %s", platforms)
 
-    if not login:
-        _LOGGER.error("async_setup_entry: Unable to login to the dreo server")
-        raise ConfigEntryNotReady("Unable to login to the Dreo server")
+    await hass.config_entries.async_forward_entry_setups(config_entry, platforms)
 
-    load_devices = await hass.async_add_executor_job(pydreo_manager.load_devices)
+    ## Create update listener
+    hass.data[DOMAIN][DREO_OPTIONS] = (dict(config_entry.data), dict(config_entry.options))
+    config_entry.async_on_unload(config_entry.add_update_listener(_async_update_listener))
 
-    if not load_devices:
-        _LOGGER.error("async_setup_entry: Unable to load devices from the dreo server")
-        raise ConfigEntryNotReady("Unable to load devices from the Dreo server")
+    discovery = DreoDeviceDiscovery(
+        hass, config_entry, lambda: _async_discover_devices(hass, config_entry, pydreo_manager, onboarding, None if DEBUG_TEST_MODE else snapshot_store)
+    )
+    hass.data[DOMAIN][DREO_DEVICE_DISCOVERY] = discovery
+    config_entry.async_on_unload(discovery.async_stop)
+    if not DEBUG_TEST_MODE:
+        discovery.async_set_interval(config_entry.options.get(CONF_DISCOVERY_INTERVAL, DEFAULT_DISCOVERY_INTERVAL))
+
+    if warm_start:
+        config_entry.async_create_background_task(
+            hass, _async_reconcile_snapshot(hass, config_entry, pydreo_manager, snapshot_store), "dreo_reconcile_snapshot"
+        )
+    if not warm_start or onboarding.pending:
+        store = None if warm_start or DEBUG_TEST_MODE else snapshot_store
+        config_entry.async_create_background_task(hass, _async_onboard_devices(onboarding, pydreo_manager, store), "dreo_onboard_devices")
 
-    _LOGGER.debug("async_setup_entry: Checking for supported installed device types")
+    return True
+
+
+def _platforms_for_devices(devices: list) -> set[Platform]:
+    """The platforms whose entities the given devices need."""
+    from .pydreo.constant import DreoDeviceType  # pylint: disable=C0415
+
+    _LOGGER.debug("_platforms_for_devices: Checking for supported installed device types")
     device_types = set()
-    for device in pydreo_manager.devices:
+    for device in devices:
         device_types.add(device.type)
-    _LOGGER.debug("async_setup_entry: Device types found are: %s", device_types)
-    _LOGGER.info("async_setup_entry: %d Dreo devices found", len(pydreo_manager.devices))
+    _LOGGER.debug("_platforms_for_devices: Device types found are: %s", device_types)
 
     platforms = set()
     if (
@@ -256,39 +335,114 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         platforms.add(Platform.LIGHT)
         platforms.add(Platform.SELECT)
 
-    pydreo_manager.start_transport()
+    return platforms
 
-    hass.data[DOMAIN] = {}
-    hass.data[DOMAIN][PYDREO_MANAGER] = pydreo_manager
-    hass.data[DOMAIN][DREO_PLATFORMS] = platforms
 
-    _LOGGER.debug("async_setup_entry: Platforms are: %s", platforms)
+# Options that add or remove entities; changing them still reloads the entry.
+_RELOAD_OPTIONS = (CONF_METRICS_SENSORS,)
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, platforms)
 
-    async def _update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
-        """Handle options update."""
+async def _async_update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Apply changed options to the running session, reloading only when they need new entities."""
+    data, options = hass.data[DOMAIN][DREO_OPTIONS]
+    if dict(config_entry.data) != data or any(config_entry.options.get(key) != options.get(key) for key in _RELOAD_OPTIONS):
         await hass.config_entries.async_reload(config_entry.entry_id)
+        return
+    hass.data[DOMAIN][DREO_OPTIONS] = (data, dict(config_entry.options))
 
-    ## Create update listener
-    config_entry.async_on_unload(config_entry.add_update_listener(_update_listener))
+    pydreo_manager: "PyDreo" = hass.data[DOMAIN][PYDREO_MANAGER]
+    auto_reconnect = config_entry.options.get(CONF_AUTO_RECONNECT)
+    if not DEBUG_TEST_MODE:
+        pydreo_manager.auto_reconnect = True if auto_reconnect is None else auto_reconnect
+    pydreo_manager.tracer.enabled = config_entry.options.get(CONF_COMMAND_TRACING, False)
+    hass.data[DOMAIN][DREO_STATE_WRITER].window = config_entry.options.get(CONF_STATE_WRITE_WINDOW, DEFAULT_STATE_WRITE_WINDOW) / 1000
+    if not DEBUG_TEST_MODE:
+        hass.data[DOMAIN][DREO_DEVICE_DISCOVERY].async_set_interval(config_entry.options.get(CONF_DISCOVERY_INTERVAL, DEFAULT_DISCOVERY_INTERVAL))
+    _LOGGER.debug("_async_update_listener: Applied options %s", config_entry.options)
 
-    return True
+
+async def _async_discover_devices(
+    hass: HomeAssistant, config_entry: ConfigEntry, pydreo_manager: "PyDreo", onboarding: DreoDeviceOnboarding, store: Store | None
+) -> None:
+    """Attach devices added to the account and detach removed ones, with their entities."""
+    result = await pydreo_manager.async_discover_devices()
+    if result is None:
+        return
+    added, removed = result
+    if not added and not removed:
+        return
+
+    device_registry = dr.async_get(hass)
+    for device in removed:
+        onboarding.async_remove_device(device)
+        if (device_entry := device_registry.async_get_device(identifiers={(DOMAIN, device.serial_number)})) is not None:
+            device_registry.async_update_device(device_entry.id, remove_config_entry_id=config_entry.entry_id)
+
+    # Loaded platforms pick up the new devices through onboarding; platforms
+    # no device needed before are set up now and add theirs when they register.
+    not_ready = [device for device in added if not onboarding.async_add_device(device)]
+    platforms: set = hass.data[DOMAIN][DREO_PLATFORMS]
+    new_platforms = _platforms_for_devices(added) - platforms
+    if new_platforms:
+        platforms.update(new_platforms)
+        await hass.config_entries.async_forward_entry_setups(config_entry, new_platforms)
+    if store is not None:
+        await store.async_save(pydreo_manager.export_snapshot())
+    if not_ready:
+        config_entry.async_create_background_task(hass, onboarding.async_retry(not_ready), "dreo_onboard_devices")
+
+
+def _snapshot_store(hass: HomeAssistant, config_entry: ConfigEntry) -> Store:
+    """Storage for this entry's warm-start snapshot."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, SNAPSHOT_STORAGE_KEY.format(config_entry.entry_id), private=True)
+
+
+async def _async_onboard_devices(onboarding: DreoDeviceOnboarding, pydreo_manager: "PyDreo", store: Store | None) -> None:
+    """Load device states for the platforms, save a snapshot, then keep retrying devices that failed."""
+    failed = await onboarding.async_load()
+    _LOGGER.info("_async_onboard_devices: Dreo devices onboarded: %s", onboarding.stats())
+    if store is not None:
+        await store.async_save(pydreo_manager.export_snapshot())
+    await onboarding.async_retry(failed)
+
+
+async def _async_reconcile_snapshot(hass: HomeAssistant, config_entry: ConfigEntry, pydreo_manager: "PyDreo", store: Store) -> None:
+    """Refresh snapshot-loaded devices from the cloud and save a fresh snapshot."""
+    result = await pydreo_manager.async_reconcile()
+    if result is None:
+        # Cloud unreachable; devices keep their snapshot state and WebSocket updates.
+        return
+    if result is False:
+        _LOGGER.info("_async_reconcile_snapshot: Dreo device list changed; reloading")
+        await store.async_remove()
+        hass.config_entries.async_schedule_reload(config_entry.entry_id)
+        return
+    await store.async_save(pydreo_manager.export_snapshot())
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     pydreo_manager = hass.data[DOMAIN][PYDREO_MANAGER]
+    state_writer: DreoStateWriter | None = hass.data[DOMAIN].get(DREO_STATE_WRITER)
+    if state_writer is not None:
+        _LOGGER.debug("async_unload_entry: State writes %s", state_writer.stats())
+        state_writer.close()
     if unload_ok := await hass.config_entries.async_unload_platforms(
         config_entry,
         hass.data[DOMAIN][DREO_PLATFORMS],
     ):
         hass.data.pop(DOMAIN)
 
-    pydreo_manager.stop_transport()
+    # Joins the report workers and the WebSocket thread, so keep it off the event loop.
+    await hass.async_add_executor_job(pydreo_manager.stop_transport)
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Delete the warm-start snapshot along with the config entry."""
+    await _snapshot_store(hass, config_entry).async_remove()
+
+
 async def async_remove_config_entry_device(hass: HomeAssistant, config_entry: ConfigEntry, device_entry: DeviceEntry) -> bool:
     """Remove a config entry from a device.
 
@@ -12,20 +12,19 @@ from dataclasses import dataclass
 import logging
 
 from .dreobasedevice import DreoBaseDeviceHA
-from .pydreo import PyDreo
 from .pydreo.pydreobasedevice import PyDreoBaseDevice
-from .pydreo.constant import DreoDeviceType
-from .pydreo.pydreohumidifier import WATER_LEVEL_STATUS_KEY, WATER_LEVEL_EMPTY
-from .pydreo.pydreoevaporativecooler import (
+from .pydreo.constant import (
+    DreoDeviceType,
+    WATER_LEVEL_STATUS_KEY,
+    WATER_LEVEL_EMPTY,
     WATER_LEVEL_KEY as EVAP_WATER_LEVEL_KEY,
     WATER_LEVEL_EMPTY as EVAP_WATER_LEVEL_EMPTY,
-)
-from .pydreo.pydreodehumidifier import (
     ERROR_CODE_KEY as DEHUMIDIFIER_ERROR_CODE_KEY,
     ERROR_CODE_WATER_EMPTY as DEHUMIDIFIER_WATER_EMPTY,
 )
 from .haimports import *  # pylint: disable=W0401,W0614
-from .const import DOMAIN, PYDREO_MANAGER
+from .const import DOMAIN, DREO_ONBOARDING
+from .onboarding import DreoDeviceOnboarding
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -38,6 +37,9 @@ class DreoBinarySensorEntityDescription(BinarySensorEntityDescription):
     exists_fn: Callable[[PyDreoBaseDevice], bool] = None
     icon_fn: Callable[[PyDreoBaseDevice], str] = None
     attrs_fn: Callable[[PyDreoBaseDevice], dict] = None
+    # Device attributes (as named in device callbacks) the entity state reads;
+    # None subscribes the entity to every change.
+    depends_on: tuple[str, ...] | None = None
     # Suffix appended to the device serial to form the entity's unique_id.
     # Defaults to `key`; water_empty pins its historical "water-empty" spelling
     # because changing a unique_id orphans the entity in users' registries.
@@ -87,6 +89,7 @@ BINARY_SENSORS: tuple[DreoBinarySensorEntityDescription, ...] = (
         device_class=BinarySensorDeviceClass.PROBLEM,
         entity_registry_enabled_default=True,
         value_fn=_water_empty_value,
+        depends_on=("water_level", "wrong"),
         exists_fn=_water_empty_exists,
         icon_fn=lambda device: "mdi:water-remove" if _water_empty_value(device) else "mdi:water-check",
         attrs_fn=lambda device: {"water_level": getattr(device, "water_level", None)},
@@ -138,8 +141,8 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Dreo Binary Sensor platform."""
     _LOGGER.info("Starting Dreo Binary Sensor Platform")
-    pydreo_manager: PyDreo = hass.data[DOMAIN][PYDREO_MANAGER]
-    async_add_entities(get_entries(pydreo_manager.devices))
+    onboarding: DreoDeviceOnboarding = hass.data[DOMAIN][DREO_ONBOARDING]
+    onboarding.async_add_platform(get_entries, async_add_entities)
 
 
 class DreoBinarySensorHA(DreoBaseDeviceHA, BinarySensorEntity):
@@ -7,15 +7,16 @@
 import logging
 
 from .haimports import *  # pylint: disable=W0401,W0614
-from .pydreo import PyDreo, PyDreoBaseDevice
+from .pydreo import PyDreoBaseDevice
 from .pydreo.constant import DreoDeviceType
 from .dreoairconditioner import DreoAirConditionerHA
 from .dreoheater import DreoHeaterHA
 
 from .const import (
     DOMAIN,
-    PYDREO_MANAGER,
+    DREO_ONBOARDING,
 )
+from .onboarding import DreoDeviceOnboarding
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,12 +50,5 @@ async def async_setup_entry(
     _LOGGER.info("get_entries: Starting Dreo Climate Platform")
     _LOGGER.debug("get_entries: async_setup_entry")
 
-    pydreo_manager: PyDreo = hass.data[DOMAIN][PYDREO_MANAGER]
-
-    climate_entities_ha = get_entries(pydreo_manager.devices)
-
-    _LOGGER.debug(
-        "async_setup_entry: Adding Climate Devices (%s)",
-        len(climate_entities_ha),
-    )
-    async_add_entities(climate_entities_ha)
+    onboarding: DreoDeviceOnboarding = hass.data[DOMAIN][DREO_ONBOARDING]
+    onboarding.async_add_platform(get_entries, async_add_entities)
@@ -7,7 +7,16 @@ import voluptuous as vol
 from homeassistant.helpers import selector
 
 from .haimports import *  # pylint: disable=W0401,W0614
-from .const import DOMAIN, CONF_AUTO_RECONNECT
+from .const import (
+    DOMAIN,
+    CONF_AUTO_RECONNECT,
+    CONF_COMMAND_TRACING,
+    CONF_DISCOVERY_INTERVAL,
+    CONF_METRICS_SENSORS,
+    CONF_STATE_WRITE_WINDOW,
+    DEFAULT_DISCOVERY_INTERVAL,
+    DEFAULT_STATE_WRITE_WINDOW,
+)
 from .pydreo import PyDreo
 
 _LOGGER = logging.getLogger(__name__)
@@ -19,7 +28,15 @@ REGION_OPTIONS = [
     {"value": "EU", "label": "Europe"},
 ]
 
-OPTIONS_SCHEMA = vol.Schema({vol.Required(CONF_AUTO_RECONNECT): bool})
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_AUTO_RECONNECT): bool,
+        vol.Optional(CONF_STATE_WRITE_WINDOW, default=DEFAULT_STATE_WRITE_WINDOW): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+        vol.Optional(CONF_METRICS_SENSORS, default=False): bool,
+        vol.Optional(CONF_COMMAND_TRACING, default=False): bool,
+        vol.Optional(CONF_DISCOVERY_INTERVAL, default=DEFAULT_DISCOVERY_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=0, max=1440)),
+    }
+)
 
 
 class OptionsFlowHandler(OptionsFlow):
@@ -88,8 +105,8 @@ class DreoFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         region = user_input.get(CONF_REGION, CONF_REGION_AUTO)
         normalized_region = None if region == CONF_REGION_AUTO else region
 
-        pydreo_manager = PyDreo(self._username, self._password, region=normalized_region)
-        login = await self.hass.async_add_executor_job(pydreo_manager.login)
+        pydreo_manager = PyDreo(self._username, self._password, region=normalized_region, aiohttp_session=async_get_clientsession(self.hass))
+        login = await pydreo_manager.async_login()
         if not login:
             return self._show_form(errors={"base": "invalid_auth"})
 
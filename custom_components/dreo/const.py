@@ -7,5 +7,23 @@ DREO_DISCOVERY = "dreo_discovery_{}"
 SERVICE_UPDATE_DEVS = "update_devices"
 PYDREO_MANAGER = "pydreo_manager"
 DREO_PLATFORMS = "platforms"
+DREO_STATE_WRITER = "state_writer"
+DREO_ONBOARDING = "onboarding"
+DREO_DEVICE_DISCOVERY = "device_discovery"
+DREO_OPTIONS = "options"
 
 CONF_AUTO_RECONNECT = "auto_reconnect"
+CONF_STATE_WRITE_WINDOW = "state_write_window"
+CONF_METRICS_SENSORS = "metrics_sensors"
+CONF_COMMAND_TRACING = "command_tracing"
+CONF_DISCOVERY_INTERVAL = "discovery_interval"
+
+# Default window (ms) for coalescing entity state writes; 0 flushes once per event loop tick.
+DEFAULT_STATE_WRITE_WINDOW = 0
+
+# Minutes between checks of the account's device list for added or removed devices; 0 turns them off.
+DEFAULT_DISCOVERY_INTERVAL = 60
+
+# Warm-start snapshot of the device list and last-known states (.storage/dreo.<entry_id>.snapshot)
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_STORAGE_KEY = "dreo.{}.snapshot"
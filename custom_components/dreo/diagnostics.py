@@ -11,7 +11,7 @@ from typing import Any
 
 from .pydreo import PyDreo
 from .haimports import *  # pylint: disable=W0401,W0614
-from .const import DOMAIN, PYDREO_MANAGER
+from .const import DOMAIN, PYDREO_MANAGER, DREO_STATE_WRITER, DREO_ONBOARDING, DREO_DEVICE_DISCOVERY
 
 KEYS_TO_REDACT = {
     "sn",
@@ -38,6 +38,7 @@ KEYS_TO_EXCLUDE = {
     "_device_definition",
     "_lock",
     "_attr_cbs",
+    "_notified_state",
 }
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,7 +48,14 @@ async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigE
     """Return diagnostics for a config entry."""
     pydreo_manager: PyDreo = hass.data[DOMAIN][PYDREO_MANAGER]
 
-    return _get_diagnostics(pydreo_manager)
+    data = _get_diagnostics(pydreo_manager)
+    if (state_writer := hass.data[DOMAIN].get(DREO_STATE_WRITER)) is not None:
+        data[DOMAIN]["state_writes"] = state_writer.stats()
+    if (onboarding := hass.data[DOMAIN].get(DREO_ONBOARDING)) is not None:
+        data[DOMAIN]["onboarding"] = onboarding.stats()
+    if (discovery := hass.data[DOMAIN].get(DREO_DEVICE_DISCOVERY)) is not None:
+        data[DOMAIN]["device_discovery"] = discovery.stats()
+    return data
 
 
 def _get_diagnostics(pydreo_manager: PyDreo) -> dict[str, Any]:
@@ -55,6 +63,12 @@ def _get_diagnostics(pydreo_manager: PyDreo) -> dict[str, Any]:
         DOMAIN: {
             "device_count": len(pydreo_manager.devices),
             "raw_devicelist": _redact_values(pydreo_manager.raw_response),
+            "transport": pydreo_manager.transport_status,
+            "state_reads": pydreo_manager.state_read_stats,
+            "resync": pydreo_manager.resync_stats,
+            "report_dispatch": pydreo_manager.dispatch_stats,
+            "metrics": pydreo_manager.metrics.snapshot(),
+            "command_traces": pydreo_manager.tracer.chrome_trace(),
         },
         "devices": [_redact_values(device.__dict__) for device in pydreo_manager.devices],
     }
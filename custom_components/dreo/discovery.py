@@ -0,0 +1,77 @@
+"""Periodic device discovery for the Dreo integration.
+
+Devices added to or removed from the Dreo account used to appear only after a
+config-entry reload. ``DreoDeviceDiscovery`` runs a discovery pass (see
+``_async_discover_devices`` in ``__init__``) on a low-frequency interval as a
+config-entry background task; only the changed devices and their entities
+are attached or detached. Passes never overlap, and the interval can be
+changed live from the options flow.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+
+from .haimports import *  # pylint: disable=W0401,W0614
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DreoDeviceDiscovery:
+    """Runs ``discover()`` every ``interval`` minutes (0 turns it off). Runs on the event loop."""
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry, discover: Callable[[], Awaitable[None]]) -> None:
+        self._hass = hass
+        self._config_entry = config_entry
+        self._discover = discover
+        self.interval = 0
+        self._unsub: Callable[[], None] | None = None
+        self._running = False
+        self.runs = 0
+        self.skipped = 0
+        self.last_run: float | None = None  # wall clock
+
+    def async_set_interval(self, minutes: int) -> None:
+        """(Re)schedule discovery every minutes; 0 stops it."""
+        if minutes == self.interval and (self._unsub is not None or minutes == 0):
+            return
+        self.async_stop()
+        self.interval = minutes
+        if minutes > 0:
+            _LOGGER.debug("async_set_interval: Discovering devices every %d minutes", minutes)
+            self._unsub = async_track_time_interval(self._hass, self._async_tick, timedelta(minutes=minutes), name="dreo device discovery")
+
+    def async_stop(self) -> None:
+        """Stop the periodic discovery."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_tick(self, _now=None) -> None:
+        if self._running:
+            self.skipped += 1
+            return
+        self._config_entry.async_create_background_task(self._hass, self.async_run(), "dreo_discover_devices")
+
+    async def async_run(self) -> None:
+        """Run one discovery pass now, unless one is already running."""
+        if self._running:
+            self.skipped += 1
+            return
+        self._running = True
+        try:
+            await self._discover()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("async_run: Device discovery failed")
+        finally:
+            self._running = False
+            self.runs += 1
+            self.last_run = time.time()
+
+    def stats(self) -> dict:
+        """Discovery schedule and counters for diagnostics."""
+        return {"interval_minutes": self.interval, "runs": self.runs, "skipped": self.skipped, "last_run": self.last_run}
@@ -5,14 +5,13 @@
 # Suppress warnings about unused function arguments
 # pylint: disable=W0613
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 import logging
 
 from .haimports import *  # pylint: disable=W0401,W0614
 from .dreobasedevice import DreoBaseDeviceHA
 
 from .pydreo import (
-    PyDreoAC,
     ANGLE_OSCANGLE_MAP,
     OSCANGLE_ANGLE_MAP,
     TEMP_RANGE,
@@ -22,7 +21,10 @@ from .pydreo import (
     PRESET_SLEEP,
 )
 
-from .pydreo.pydreoairconditioner import DreoACMode, DreoACFanMode
+from .pydreo.constant import DreoACMode, DreoACFanMode
+
+if TYPE_CHECKING:
+    from .pydreo import PyDreoAC
 
 from .const import (
     DOMAIN,
@@ -102,7 +104,7 @@ class DreoAirConditionerHA(DreoBaseDeviceHA, ClimateEntity):
     _last_hvac_mode = HVACMode.OFF
     _enable_turn_on_off_backwards_compatibility = False
 
-    def __init__(self, pyDreoDevice: PyDreoAC) -> None:
+    def __init__(self, pyDreoDevice: "PyDreoAC") -> None:
         super().__init__(pyDreoDevice)
         self.device = pyDreoDevice
         _LOGGER.info(
@@ -1,9 +1,83 @@
 """BaseDevice utilities for Dreo Component."""
 
+import asyncio
+import logging
+import threading
+
 from .pydreo.pydreobasedevice import PyDreoBaseDevice
 from .haimports import *  # pylint: disable=W0401,W0614
 
-from .const import DOMAIN
+from .const import DOMAIN, DREO_STATE_WRITER
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DreoStateWriter:
+    """Coalesces entity state writes requested from the transport thread.
+
+    Device callbacks mark entities dirty; the first mark schedules a flush on the
+    event loop (next iteration, or after ``window`` seconds) and every entity
+    marked before that flush is written once with ``async_write_ha_state``.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, window: float = 0) -> None:
+        self._loop = loop
+        self.window = window
+        self._lock = threading.Lock()
+        self._dirty: dict[int, Entity] = {}
+        self._flush_pending = False
+        self._closed = False
+        self.requested = 0
+        self.written = 0
+        # Requests absorbed by a write already pending for the same entity.
+        self.coalesced = 0
+
+    def mark_dirty(self, entity: Entity) -> None:
+        """Request a state write for entity. Safe to call from any thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self.requested += 1
+            if id(entity) in self._dirty:
+                self.coalesced += 1
+                return
+            self._dirty[id(entity)] = entity
+            if self._flush_pending:
+                return
+            self._flush_pending = True
+        self._loop.call_soon_threadsafe(self._schedule_flush)
+
+    def _schedule_flush(self) -> None:
+        if self.window > 0:
+            self._loop.call_later(self.window, self._flush)
+        else:
+            self._loop.call_soon(self._flush)
+
+    def _flush(self) -> None:
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = {}
+            self._flush_pending = False
+        for entity in dirty.values():
+            if entity.hass is None:
+                continue
+            self.written += 1
+            try:
+                entity.async_write_ha_state()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("_flush: state write failed for %s", entity.entity_id)
+        if dirty:
+            _LOGGER.debug("_flush: wrote %d entities; %d of %d writes coalesced so far", len(dirty), self.coalesced, self.requested)
+
+    def close(self) -> None:
+        """Drop pending writes and ignore further requests."""
+        with self._lock:
+            self._closed = True
+            self._dirty = {}
+
+    def stats(self) -> dict[str, int]:
+        """Counters for diagnostics."""
+        return {"requested": self.requested, "written": self.written, "coalesced": self.coalesced}
 
 
 class DreoBaseDeviceHA(Entity):
@@ -46,10 +120,26 @@ class DreoBaseDeviceHA(Entity):
 
         # Create a callback to update state in HA and add it a callback in
         # the PyDreo device. This will cause all handle_server_update responses
-        # to update the state in HA.
+        # that change device state to update the state in HA.
         @callback
-        def update_state():
-            # Tell HA we're ready to update
-            self.schedule_update_ha_state(True)
+        def update_state(changed: frozenset[str] | None = None):
+            # Bursts of reports write each entity once per flush when the entry has a state writer.
+            state_writer: DreoStateWriter | None = (self.hass.data.get(DOMAIN) or {}).get(DREO_STATE_WRITER) if self.hass else None
+            if state_writer is not None:
+                state_writer.mark_dirty(self)
+            else:
+                self.schedule_update_ha_state(True)
+
+        self.pydreo_device.add_attr_callback(update_state, self.depends_on)
+
+    @property
+    def depends_on(self) -> frozenset[str] | None:
+        """Device attributes whose changes should update this entity.
 
-        self.pydreo_device.add_attr_callback(update_state)
+        Taken from the entity description's ``depends_on`` (plus ``connected``,
+        which drives availability). None, the default, means every change.
+        """
+        depends_on = getattr(getattr(self, "entity_description", None), "depends_on", None)
+        if depends_on is None:
+            return None
+        return frozenset(depends_on) | {"connected"}
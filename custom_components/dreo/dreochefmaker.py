@@ -3,13 +3,14 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .haimports import *  # pylint: disable=W0401,W0614
 
 from .dreobasedevice import DreoBaseDeviceHA
 
-from .pydreo.pydreochefmaker import PyDreoChefMaker
+if TYPE_CHECKING:
+    from .pydreo.pydreochefmaker import PyDreoChefMaker
 
 _LOGGER = logging.getLogger(__name__)
 
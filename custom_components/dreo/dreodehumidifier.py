@@ -5,12 +5,14 @@
 # Suppress warnings about unused function arguments
 # pylint: disable=W0613
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 import logging
 
 from .haimports import *  # pylint: disable=W0401,W0614
 from .dreobasedevice import DreoBaseDeviceHA
-from .pydreo import PyDreoDehumidifier
+
+if TYPE_CHECKING:
+    from .pydreo import PyDreoDehumidifier
 
 from .const import (
     DOMAIN,
@@ -23,7 +25,7 @@ _LOGGER = logging.getLogger(__name__)
 class DreoDehumidifierHA(DreoBaseDeviceHA, HumidifierEntity):
     """Representation of a Dreo Dehumidifier entity."""
 
-    def __init__(self, pyDreoDevice: PyDreoDehumidifier) -> None:
+    def __init__(self, pyDreoDevice: "PyDreoDehumidifier") -> None:
         super().__init__(pyDreoDevice)
         self.device = pyDreoDevice
         _LOGGER.info("DreoDehumidifierHA:__init__(%s)", pyDreoDevice.name)
@@ -5,13 +5,12 @@
 # Suppress warnings about unused function arguments
 # pylint: disable=W0613
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 import logging
 
 from .haimports import *  # pylint: disable=W0401,W0614
 from .dreobasedevice import DreoBaseDeviceHA
 from .pydreo import (
-    PyDreoHeater,
     ECOLEVEL_RANGE,
     ANGLE_OSCANGLE_MAP,
     OSCANGLE_ANGLE_MAP,
@@ -23,6 +22,9 @@ from .pydreo.constant import (
     HEATER_SWING_OSCMODE_MAP,
 )
 
+if TYPE_CHECKING:
+    from .pydreo import PyDreoHeater
+
 from .const import (
     DOMAIN,
 )
@@ -83,7 +85,7 @@ class DreoHeaterHA(DreoBaseDeviceHA, ClimateEntity):
     _last_hvac_mode = HVACMode.OFF
     _enable_turn_on_off_backwards_compatibility = False
 
-    def __init__(self, pyDreoDevice: PyDreoHeater) -> None:
+    def __init__(self, pyDreoDevice: "PyDreoHeater") -> None:
         super().__init__(pyDreoDevice)
         self.device = pyDreoDevice
         _LOGGER.info(
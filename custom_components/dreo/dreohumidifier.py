@@ -5,12 +5,14 @@
 # Suppress warnings about unused function arguments
 # pylint: disable=W0613
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 import logging
 
 from .haimports import *  # pylint: disable=W0401,W0614
 from .dreobasedevice import DreoBaseDeviceHA
-from .pydreo import PyDreoHumidifier
+
+if TYPE_CHECKING:
+    from .pydreo import PyDreoHumidifier
 
 from .const import (
     DOMAIN,
@@ -23,7 +25,7 @@ _LOGGER = logging.getLogger(__name__)
 class DreoHumidifierHA(DreoBaseDeviceHA, HumidifierEntity):
     """Representation of a Dreo Humidifier entity."""
 
-    def __init__(self, pyDreoDevice: PyDreoHumidifier) -> None:
+    def __init__(self, pyDreoDevice: "PyDreoHumidifier") -> None:
         super().__init__(pyDreoDevice)
         self.device = pyDreoDevice
         _LOGGER.info("DreoHumidifierHA:__init__(%s)", pyDreoDevice.name)
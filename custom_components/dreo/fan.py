@@ -4,11 +4,12 @@ from __future__ import annotations
 import logging
 
 from .haimports import *  # pylint: disable=W0401,W0614
-from .pydreo import PyDreo, PyDreoBaseDevice
+from .pydreo import PyDreoBaseDevice
 from .pydreo.constant import DreoDeviceType
 from .dreofan import DreoFanHA
 
-from .const import DOMAIN, PYDREO_MANAGER
+from .const import DOMAIN, DREO_ONBOARDING
+from .onboarding import DreoDeviceOnboarding
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,9 +43,5 @@ async def async_setup_entry(
     _LOGGER.info("get_entries: Starting Dreo Fan Platform")
     _LOGGER.debug("get_entries: async_setup_entry")
 
-    pydreo_manager: PyDreo = hass.data[DOMAIN][PYDREO_MANAGER]
-
-    fan_entities_ha = get_entries(pydreo_manager.devices)
-
-    _LOGGER.debug("async_setup_entry: Adding Fans (%s)", len(fan_entities_ha))
-    async_add_entities(fan_entities_ha)
+    onboarding: DreoDeviceOnboarding = hass.data[DOMAIN][DREO_ONBOARDING]
+    onboarding.async_add_platform(get_entries, async_add_entities)
@@ -15,7 +15,9 @@ from homeassistant import config_entries, core
 
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
 
 from homeassistant.components.diagnostics import REDACTED
 from homeassistant.config_entries import ConfigEntry, OptionsFlow, ConfigFlowResult
@@ -25,6 +27,7 @@ from homeassistant.helpers.typing import StateType
 
 from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.entity_registry import async_entries_for_config_entry
 from homeassistant.helpers.device_registry import DeviceEntry
 from homeassistant.helpers.selector import (
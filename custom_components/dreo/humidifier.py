@@ -4,14 +4,15 @@ from __future__ import annotations
 import logging
 
 from .haimports import *  # pylint: disable=W0401,W0614
-from .pydreo import PyDreo, PyDreoBaseDevice, PyDreoHumidifier, PyDreoDehumidifier
+from .pydreo import PyDreoBaseDevice
 from .pydreo.constant import DreoDeviceType
 from .dreobasedevice import DreoBaseDeviceHA
 
 from .dreodehumidifier import DreoDehumidifierHA
 from .dreohumidifier import DreoHumidifierHA
 
-from .const import DOMAIN, PYDREO_MANAGER
+from .const import DOMAIN, DREO_ONBOARDING
+from .onboarding import DreoDeviceOnboarding
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,9 +42,5 @@ async def async_setup_entry(
     _LOGGER.info("get_entries: Starting Dreo Humidifier Platform")
     _LOGGER.debug("Dreo Humidifier:async_setup_entry")
 
-    pydreo_manager: PyDreo = hass.data[DOMAIN][PYDREO_MANAGER]
-
-    humidifier_entities_ha = get_entries(pydreo_manager.devices)
-
-    _LOGGER.debug("Humidifier:async_setup_entry: Adding Humidifiers (%s)", len(humidifier_entities_ha))
-    async_add_entities(humidifier_entities_ha)
+    onboarding: DreoDeviceOnboarding = hass.data[DOMAIN][DREO_ONBOARDING]
+    onboarding.async_add_platform(get_entries, async_add_entities)
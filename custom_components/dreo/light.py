@@ -10,13 +10,12 @@ import logging
 import math
 
 from .haimports import *  # pylint: disable=W0401,W0614
-from .pydreo import PyDreo
 from .pydreo.pydreobasedevice import PyDreoBaseDevice
-from .pydreo.pydreoceilingfan import PyDreoCeilingFan
 from .pydreo.constant import DreoDeviceType  # pylint: disable=C0415
 from .dreobasedevice import DreoBaseDeviceHA
 
-from .const import DOMAIN, PYDREO_MANAGER
+from .const import DOMAIN, DREO_ONBOARDING
+from .onboarding import DreoDeviceOnboarding
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -79,11 +78,11 @@ async def async_setup_entry(
     """
     _LOGGER.info("get_entries: Starting Dreo Light Platform")
 
-    # Get the PyDreo manager from Home Assistant's data storage
-    pydreo_manager: PyDreo = hass.data[DOMAIN][PYDREO_MANAGER]
+    # Devices are handed over by onboarding as each one's state loads
+    onboarding: DreoDeviceOnboarding = hass.data[DOMAIN][DREO_ONBOARDING]
 
     # Discover and register all light entities
-    async_add_entities(get_entries(pydreo_manager.devices))
+    onboarding.async_add_platform(get_entries, async_add_entities)
 
 
 class DreoLightHA(DreoBaseDeviceHA, LightEntity):  # pylint: disable=abstract-method
@@ -209,7 +208,7 @@ class DreoLightHA(DreoBaseDeviceHA, LightEntity):  # pylint: disable=abstract-me
         # them as separate sequential commands caused the light to intermittently fail to
         # turn on (issue #846). Gated on the main light attribute so atmosphere/RGB lights
         # (which reuse this entity with a different on attribute) keep their own behaviour.
-        if self._light_on_attr == "light_on" and isinstance(self.pydreo_device, PyDreoCeilingFan):
+        if self._light_on_attr == "light_on" and self.pydreo_device.type == DreoDeviceType.CEILING_FAN:
             self.pydreo_device.turn_light_on(brightness=computed_brightness, color_temp=computed_color_temp)
             return
 
@@ -10,12 +10,12 @@ from dataclasses import dataclass
 import logging
 
 from .haimports import *  # pylint: disable=W0401,W0614
-from .pydreo import PyDreo
 from .pydreo.pydreobasedevice import PyDreoBaseDevice
 from .pydreo.constant import DreoDeviceType, TIMER_MAX_MINUTES
 from .dreobasedevice import DreoBaseDeviceHA
 
-from .const import DOMAIN, PYDREO_MANAGER
+from .const import DOMAIN, DREO_ONBOARDING
+from .onboarding import DreoDeviceOnboarding
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +27,9 @@ class DreoNumberEntityDescription(NumberEntityDescription):
     attr_name: str = None
     icon: str = None
     exists_fn: Callable[[PyDreoBaseDevice], bool] = None
+    # Device attributes (as named in device callbacks) the entity state reads;
+    # None subscribes the entity to every change.
+    depends_on: tuple[str, ...] | None = None
 
     def __repr__(self):
         # Representation string of object.
@@ -41,6 +44,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="fixed_conf_settle_seconds",
         translation_key="fixed_conf_settle_seconds",
         attr_name="fixed_conf_settle_seconds",
+        depends_on=("fixed_conf_settle_seconds",),
         icon="mdi:timer-outline",
         min_value=0,
         max_value=30,
@@ -53,6 +57,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Horizontal Angle",
         translation_key="horizontal_angle",
         attr_name="horizontal_angle",
+        depends_on=("fixed_conf", "horizontal_angle", "horizontal_angle_adj"),
         icon="mdi:angle-acute",
         min_value=-60,
         max_value=60,
@@ -63,6 +68,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Vertical Angle",
         translation_key="vertical_angle",
         attr_name="vertical_angle",
+        depends_on=("fixed_conf",),
         icon="mdi:angle-acute",
         min_value=0,
         max_value=90,
@@ -73,6 +79,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Horizontal Oscillation Angle Left",
         translation_key="horizontal_osc_angle_left",
         attr_name="horizontal_osc_angle_left",
+        depends_on=("cruise_conf", "horizontal_angle_range"),
         icon="mdi:vector-radius",
         min_value=-60,
         max_value=60,
@@ -83,6 +90,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Horizontal Oscillation Angle Right",
         translation_key="horizontal_osc_angle_right",
         attr_name="horizontal_osc_angle_right",
+        depends_on=("cruise_conf", "horizontal_angle_range"),
         icon="mdi:vector-radius",
         min_value=-60,
         max_value=60,
@@ -93,6 +101,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Vertical Oscillation Angle Top",
         translation_key="vertical_osc_angle_top",
         attr_name="vertical_osc_angle_top",
+        depends_on=("cruise_conf",),
         icon="mdi:vector-radius",
         min_value=0,
         max_value=90,
@@ -103,6 +112,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Vertical Oscillation Angle Bottom",
         translation_key="vertical_osc_angle_bottom",
         attr_name="vertical_osc_angle_bottom",
+        depends_on=("cruise_conf",),
         icon="mdi:vector-radius",
         min_value=0,
         max_value=90,
@@ -113,6 +123,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Oscillation Angle",
         translation_key="osc_angle",
         attr_name="shakehorizonangle",
+        depends_on=("shakehorizonangle",),
         icon="mdi:angle-acute",
         min_value=30,
         max_value=120,
@@ -123,6 +134,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Horizontal Oscillation Angle",
         translation_key="horizontal_oscillation_angle",
         attr_name="horizontal_oscillation_angle",
+        depends_on=("horizontal_angle_adj", "horizontal_oscillation_angle"),
         icon="mdi:angle-acute",
         min_value=-60,
         max_value=60,
@@ -133,6 +145,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Vertical Oscillation Angle",
         translation_key="vertical_oscillation_angle",
         attr_name="vertical_oscillation_angle",
+        depends_on=("horizontal_angle_adj", "vertical_oscillation_angle"),
         icon="mdi:angle-acute",
         min_value=0,
         max_value=90,
@@ -143,6 +156,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Target Humidity",
         translation_key="target_humidity",
         attr_name="target_humidity",
+        depends_on=("target_humidity",),
         icon="mdi:water-percent",
         min_value=40,
         max_value=90,
@@ -152,6 +166,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Fog Level",
         translation_key="fog_level",
         attr_name="fog_level",
+        depends_on=("fog_level",),
         icon="mdi:weather-fog",
         min_value=0,
         max_value=6,
@@ -162,6 +177,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Sleep Target Humidity",
         translation_key="sleep_target_humidity",
         attr_name="sleep_target_humidity",
+        depends_on=("sleep_target_humidity",),
         icon="mdi:water-percent",
         min_value=30,
         max_value=90,
@@ -172,6 +188,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Ambient Light Threshold Low",
         translation_key="ambient_light_threshold_low",
         attr_name="rgbth_low",
+        depends_on=("rgbth",),
         icon="mdi:water-percent",
         min_value=0,
         max_value=100,
@@ -183,6 +200,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Ambient Light Threshold High",
         translation_key="ambient_light_threshold_high",
         attr_name="rgbth_high",
+        depends_on=("rgbth",),
         icon="mdi:water-percent",
         min_value=0,
         max_value=100,
@@ -194,6 +212,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Timer On",
         translation_key="timer_on",
         attr_name="timer_on",
+        depends_on=("timer_on",),
         icon="mdi:timer-play-outline",
         min_value=0,
         max_value=TIMER_MAX_MINUTES,
@@ -205,6 +224,7 @@ NUMBERS: tuple[DreoNumberEntityDescription, ...] = (
         key="Timer Off",
         translation_key="timer_off",
         attr_name="timer_off",
+        depends_on=("timer_off",),
         icon="mdi:timer-off-outline",
         min_value=0,
         max_value=TIMER_MAX_MINUTES,
@@ -247,6 +267,7 @@ def get_entries(pydreo_devices: list[PyDreoBaseDevice]) -> list[DreoNumberHA]:
                         device_class=number_definition.device_class,
                         native_unit_of_measurement=number_definition.native_unit_of_measurement,
                         exists_fn=number_definition.exists_fn,
+                        depends_on=number_definition.depends_on,
                     )
                     number_ha_collection.append(DreoNumberHA(pydreo_device, dned))
                 else:
@@ -283,9 +304,9 @@ async def async_setup_entry(
     """Set up the Dreo Number platform."""
     _LOGGER.info("async_setup_entry: Starting Dreo Number Platform")
 
-    pydreo_manager: PyDreo = hass.data[DOMAIN][PYDREO_MANAGER]
+    onboarding: DreoDeviceOnboarding = hass.data[DOMAIN][DREO_ONBOARDING]
 
-    async_add_entities(get_entries(pydreo_manager.devices))
+    onboarding.async_add_platform(get_entries, async_add_entities)
 
 
 class DreoNumberHA(DreoBaseDeviceHA, NumberEntity):  # pylint: disable=abstract-method
@@ -0,0 +1,173 @@
+"""Progressive device onboarding for the Dreo integration.
+
+A cold start builds the devices from the device list without their state
+(``PyDreo.async_load_devices(load_state=False)``), forwards the platforms and
+then loads each device's state in the background. ``DreoDeviceOnboarding``
+gives every device a readiness event: platforms register an entity factory,
+and a device's entities are added as soon as its state has loaded. A device
+whose state cannot be loaded is retried with backoff instead of holding up the
+config entry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Iterable
+
+from .haimports import *  # pylint: disable=W0401,W0614
+from .pydreo import PyDreo, PyDreoBaseDevice
+from .pydreo.reconnectpolicy import BackoffPolicy
+
+_LOGGER = logging.getLogger(__name__)
+
+# Devices whose state could not be loaded: retried after about 5 seconds, backing off to 5 minutes.
+ONBOARDING_RETRY_BACKOFF = BackoffPolicy(base_delay=5.0, max_delay=300.0)
+
+EntityFactory = Callable[[list[PyDreoBaseDevice]], Iterable[Entity]]
+
+
+class DreoDeviceOnboarding:
+    """Publishes devices to the platforms as each one's state loads.
+
+    Devices that already have state (warm start from a snapshot) are ready
+    from the start. Everything here runs on the event loop.
+    """
+
+    def __init__(self, pydreo_manager: PyDreo, started: float | None = None, retry_backoff: BackoffPolicy = ONBOARDING_RETRY_BACKOFF) -> None:
+        self._manager = pydreo_manager
+        self._started = time.monotonic() if started is None else started
+        self.retry_backoff = retry_backoff
+        self._platforms: list[tuple[EntityFactory, AddEntitiesCallback]] = []
+        self._ready: dict[str, asyncio.Event] = {}
+        for device in pydreo_manager.devices:
+            event = self._ready.setdefault(device.serial_number, asyncio.Event())
+            if device.state_loaded:
+                event.set()
+        self._retrying: set[str] = set()
+        self.entities_added = 0
+        self.load_failures = 0
+        self.first_entity_at: float | None = None
+        self.all_entities_at: float | None = None
+
+    def is_ready(self, device: PyDreoBaseDevice) -> bool:
+        """True once the device's state has loaded and its entities are published."""
+        event = self._ready.get(device.serial_number)
+        return event is not None and event.is_set()
+
+    @property
+    def pending(self) -> list[PyDreoBaseDevice]:
+        """Devices still waiting for their state."""
+        return [device for device in self._manager.devices if not self.is_ready(device)]
+
+    def async_add_platform(self, get_entities: EntityFactory, async_add_entities: AddEntitiesCallback) -> None:
+        """Add a platform's entities for the ready devices now and for the others as they become ready."""
+        self._platforms.append((get_entities, async_add_entities))
+        ready = [device for device in self._manager.devices if self.is_ready(device)]
+        if ready:
+            self._add_entities(get_entities, async_add_entities, ready)
+
+    async def async_wait_ready(self, device: PyDreoBaseDevice) -> None:
+        """Wait until the device's entities are published."""
+        await self._ready.setdefault(device.serial_number, asyncio.Event()).wait()
+
+    def async_add_device(self, device: PyDreoBaseDevice) -> bool:
+        """Track a device attached after setup, publishing it now if its state is loaded. Returns whether it is ready."""
+        self._ready.setdefault(device.serial_number, asyncio.Event())
+        if device.state_loaded:
+            self.async_device_ready(device)
+        return self.is_ready(device)
+
+    def async_remove_device(self, device: PyDreoBaseDevice) -> None:
+        """Forget a device that left the account; a retry for it stops."""
+        self._ready.pop(device.serial_number, None)
+        self._retrying.discard(device.serial_number)
+
+    def async_device_ready(self, device: PyDreoBaseDevice) -> None:
+        """Mark a device ready and add its entities on every registered platform."""
+        event = self._ready.setdefault(device.serial_number, asyncio.Event())
+        if event.is_set():
+            return
+        event.set()
+        _LOGGER.debug("async_device_ready: %s is ready", device.name)
+        for get_entities, async_add_entities in self._platforms:
+            self._add_entities(get_entities, async_add_entities, [device])
+
+    def _add_entities(self, get_entities: EntityFactory, async_add_entities: AddEntitiesCallback, devices: list[PyDreoBaseDevice]) -> None:
+        entities = list(get_entities(devices))
+        if entities:
+            async_add_entities(entities)
+            self.entities_added += len(entities)
+        now = time.monotonic()
+        if entities and self.first_entity_at is None:
+            self.first_entity_at = now
+        if not self.pending:
+            self.all_entities_at = now
+
+    async def async_load(self) -> list[PyDreoBaseDevice]:
+        """Load the state of every pending device, publishing each as it loads.
+
+        Loads run concurrently, bounded by the manager's ``state_load_workers``.
+        Returns the devices that failed; ``async_retry`` keeps trying those.
+        """
+        pending = self.pending
+        if not pending:
+            return []
+        limit = asyncio.Semaphore(max(1, self._manager.state_load_workers))
+        loaded = await asyncio.gather(*(self._async_load_one(device, limit) for device in pending))
+        failed = [device for device, ok in zip(pending, loaded) if not ok]
+        if failed:
+            _LOGGER.warning("async_load: Unable to load the state of %d Dreo devices; retrying in the background", len(failed))
+        return failed
+
+    async def async_retry(self, devices: list[PyDreoBaseDevice]) -> None:
+        """Retry loading each device with backoff until it loads. Runs until cancelled or done."""
+        if not devices:
+            return
+        limit = asyncio.Semaphore(max(1, self._manager.state_load_workers))
+        self._retrying.update(device.serial_number for device in devices)
+
+        async def retry(device: PyDreoBaseDevice) -> None:
+            try:
+                attempt = 0
+                while device.serial_number in self._ready and not self.is_ready(device):
+                    delay = self.retry_backoff.delay(attempt)
+                    _LOGGER.debug("async_retry: Retrying %s in %.1f seconds", device.name, delay)
+                    await asyncio.sleep(delay)
+                    if device.serial_number in self._ready:
+                        await self._async_load_one(device, limit)
+                    attempt += 1
+            finally:
+                self._retrying.discard(device.serial_number)
+
+        await asyncio.gather(*(retry(device) for device in devices))
+
+    async def _async_load_one(self, device: PyDreoBaseDevice, limit: asyncio.Semaphore) -> bool:
+        async with limit:
+            try:
+                loaded = await self._manager.async_load_device_state(device)
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.debug("_async_load_one: Loading %s failed: %s", device.name, ex)
+                loaded = False
+        if not loaded:
+            self.load_failures += 1
+            return False
+        self.async_device_ready(device)
+        return True
+
+    def stats(self) -> dict:
+        """Onboarding progress and timings (seconds from setup start) for diagnostics."""
+
+        def elapsed(at: float | None) -> float | None:
+            return round(at - self._started, 3) if at is not None else None
+
+        return {
+            "devices": len(self._ready),
+            "ready": sum(1 for event in self._ready.values() if event.is_set()),
+            "retrying": len(self._retrying),
+            "load_failures": self.load_failures,
+            "entities_added": self.entities_added,
+            "time_to_first_entity": elapsed(self.first_entity_at),
+            "time_to_all_entities": elapsed(self.all_entities_at),
+        }
@@ -2,60 +2,214 @@
 
 # flake8: noqa
 # from .pydreo import PyDreo
+import asyncio
+import importlib
 import logging
 import threading
 import sys
+import time
 
 import json
-from itertools import chain
-from typing import Callable, Optional, Tuple, TypeAlias
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain, count
+from collections.abc import Awaitable, Generator
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Tuple, TypeAlias
 from asyncio.exceptions import CancelledError
 
+import requests
+from urllib3.util.retry import Retry
+
 from .constant import *
 from .helpers import Helpers
 from .models import *
+from .modelindex import MODEL_INDEX
 from .commandtransport import CommandTransport
+from .reconnectpolicy import CircuitState, ConnectionState
+from .metrics import (
+    BATCH_SIZE_BUCKETS,
+    METRIC_COMMAND_ACK_LATENCY,
+    METRIC_COMMAND_ACK_TIMEOUTS,
+    METRIC_COMMAND_BATCH_KEYS,
+    METRIC_COMMAND_RETRIES,
+    METRIC_COMMANDS_FAILED,
+    METRIC_COMMANDS_SENT,
+    METRIC_REPORT_QUEUE_DEPTH,
+    METRIC_REST_CALLS,
+    METRIC_REST_ERRORS,
+    METRIC_REST_LATENCY,
+    MetricsRegistry,
+)
+from .tracing import OUTCOME_FAILED, OUTCOME_NOT_ACKED, CommandTrace, CommandTracer, current_trace
+from .resync import StateResyncer
+from .statereader import DEFAULT_STATE_CACHE_TTL, DeviceStateReader
+from .reportdispatcher import DEFAULT_DISPATCH_QUEUE_DEPTH, DEFAULT_DISPATCH_WORKERS, OverflowPolicy, ReportDispatcher
 from .pydreobasedevice import PyDreoBaseDevice, UnknownModelError, UnknownProductError
 from .pydreounknowndevice import PyDreoUnknownDevice
-from .pydreotowerfan import PyDreoTowerFan
-from .pydreoaircirculator import PyDreoAirCirculator
-from .pydreoceilingfan import PyDreoCeilingFan
-from .pydreoairpurifier import PyDreoAirPurifier
-from .pydreoheater import PyDreoHeater
-from .pydreoairconditioner import PyDreoAC
-from .pydreochefmaker import PyDreoChefMaker
-from .pydreohumidifier import PyDreoHumidifier
-from .pydreodehumidifier import PyDreoDehumidifier
-from .pydreoevaporativecooler import PyDreoEvaporativeCooler
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from .pydreotowerfan import PyDreoTowerFan
+    from .pydreoaircirculator import PyDreoAirCirculator
+    from .pydreoceilingfan import PyDreoCeilingFan
+    from .pydreoairpurifier import PyDreoAirPurifier
+    from .pydreoheater import PyDreoHeater
+    from .pydreoairconditioner import PyDreoAC
+    from .pydreochefmaker import PyDreoChefMaker
+    from .pydreohumidifier import PyDreoHumidifier
+    from .pydreodehumidifier import PyDreoDehumidifier
+    from .pydreoevaporativecooler import PyDreoEvaporativeCooler
 
 _LOGGER = logging.getLogger(__name__)
 
 _COMMAND_ACK_TIMEOUT = 2  # seconds to wait for server to confirm command
 _ACK_METHOD_NAMES = {"control-report", "control-reply"}  # consider fast server reply and later device confirmation as ack
 _MAX_COMMAND_RETRIES = 2  # retry failed commands up to this many times
+_STALE_STATE_RETRIES = 2  # refetch a devicestate response overtaken by a report up to this many times
+DEFAULT_STATE_LOAD_WORKERS = 8  # concurrent REST calls while loading initial device state
+DEFAULT_HTTP_POOL_SIZE = DEFAULT_STATE_LOAD_WORKERS  # keep-alive connections per API region
+DEFAULT_HTTP_RETRIES = 2  # connection/gateway-error retries for idempotent REST reads
+DEVICELIST_PAGE_SIZE = 100  # devices requested per devicelist page
+
+SNAPSHOT_VERSION = 1  # bump when the export_snapshot layout changes
+DEFAULT_SNAPSHOT_MAX_AGE = 7 * 24 * 3600  # seconds a warm-start snapshot stays usable
 
 # Host delayed scheduler: (delay_seconds, work) -> cancel_fn.
 # Home Assistant installs async_call_later; tests inject a manual scheduler.
 ScheduleCallLater: TypeAlias = Callable[[float, Callable[[], None]], Callable[[], None]]
 
+# Called by load_devices / async_load_devices with the devices each devicelist
+# page added, as soon as their state is loaded.
+DevicesAddedCallback: TypeAlias = Callable[[list["PyDreoBaseDevice"]], None]
+
 # control-reply is the server echoing what it ACCEPTED, not what the device did:
 # it is unicast to the issuing connection and arrives before (or without) any
 # device execution. Applying it as device state corrupts the local cache when the
 # device doesn't follow through. Only these methods carry actual device state.
 _STATE_METHOD_NAMES = {"report", "control-report"}
 
-_DREO_DEVICE_TYPE_TO_CLASS = {
-    DreoDeviceType.TOWER_FAN: PyDreoTowerFan,
-    DreoDeviceType.AIR_CIRCULATOR: PyDreoAirCirculator,
-    DreoDeviceType.AIR_PURIFIER: PyDreoAirPurifier,
-    DreoDeviceType.CEILING_FAN: PyDreoCeilingFan,
-    DreoDeviceType.HEATER: PyDreoHeater,
-    DreoDeviceType.AIR_CONDITIONER: PyDreoAC,
-    DreoDeviceType.CHEF_MAKER: PyDreoChefMaker,
-    DreoDeviceType.HUMIDIFIER: PyDreoHumidifier,
-    DreoDeviceType.DEHUMIDIFIER: PyDreoDehumidifier,
-    DreoDeviceType.EVAPORATIVE_COOLER: PyDreoEvaporativeCooler,
+
+@dataclass
+class _PendingCommand:
+    """A command in flight to one device, waiting for its ack."""
+
+    params: dict
+    ack_received: bool = False
+    # Set when tracing: the command's trace and the monotonic time of its ack.
+    trace: CommandTrace | None = None
+    acked_at: float | None = None
+    # Wake-ups for async waiters, fired under the command condition on ack and
+    # on release. Each must be non-blocking and safe to call from any thread.
+    listeners: list[Callable[[], None]] = field(default_factory=list)
+
+    def notify(self) -> None:
+        """Fire and drop every registered listener."""
+        listeners, self.listeners = self.listeners, []
+        for listener in listeners:
+            listener()
+
+
+def _wake_future(loop: asyncio.AbstractEventLoop, future: asyncio.Future) -> Callable[[], None]:
+    """Return a thread-safe callable that resolves ``future`` on ``loop``."""
+
+    def _resolve() -> None:
+        if not future.done():
+            future.set_result(None)
+
+    def wake() -> None:
+        try:
+            loop.call_soon_threadsafe(_resolve)
+        except RuntimeError:
+            # Waiter's loop already closed; nobody is left to wake.
+            pass
+
+    return wake
+
+
+class _IoStep(NamedTuple):
+    """One I/O call requested by a flow: ``blocking`` or ``awaitable``, with ``args``."""
+
+    blocking: Callable[..., Any]
+    awaitable: Callable[..., Awaitable[Any]]
+    args: tuple = ()
+
+
+# Login, re-login and command sending are each written once, as a generator
+# that yields the I/O it needs (_IoStep) and is sent back the result or thrown
+# the exception. _run_flow drives one with blocking calls, _async_run_flow on
+# the caller's event loop.
+_IoFlow: TypeAlias = Generator[_IoStep, Any, Any]
+
+
+def _run_flow(flow: _IoFlow) -> Any:
+    """Run ``flow`` on the calling thread and return its result."""
+    value, error = None, None
+    while True:
+        try:
+            step = flow.send(value) if error is None else flow.throw(error)
+        except StopIteration as done:
+            return done.value
+        try:
+            value, error = step.blocking(*step.args), None
+        except Exception as ex:  # pylint: disable=broad-except
+            value, error = None, ex
+
+
+async def _async_run_flow(flow: _IoFlow) -> Any:
+    """Run ``flow`` on the running event loop and return its result."""
+    value, error = None, None
+    while True:
+        try:
+            step = flow.send(value) if error is None else flow.throw(error)
+        except StopIteration as done:
+            return done.value
+        try:
+            value, error = await step.awaitable(*step.args), None
+        except Exception as ex:  # pylint: disable=broad-except
+            value, error = None, ex
+
+
+# Device classes by type, as (module, class name). A device module is imported
+# the first time a device of its type is found, so an account with only tower
+# fans never loads the chef maker, AC or humidifier code.
+_DREO_DEVICE_TYPE_TO_CLASS: dict[DreoDeviceType, tuple[str, str]] = {
+    DreoDeviceType.TOWER_FAN: ("pydreotowerfan", "PyDreoTowerFan"),
+    DreoDeviceType.AIR_CIRCULATOR: ("pydreoaircirculator", "PyDreoAirCirculator"),
+    DreoDeviceType.AIR_PURIFIER: ("pydreoairpurifier", "PyDreoAirPurifier"),
+    DreoDeviceType.CEILING_FAN: ("pydreoceilingfan", "PyDreoCeilingFan"),
+    DreoDeviceType.HEATER: ("pydreoheater", "PyDreoHeater"),
+    DreoDeviceType.AIR_CONDITIONER: ("pydreoairconditioner", "PyDreoAC"),
+    DreoDeviceType.CHEF_MAKER: ("pydreochefmaker", "PyDreoChefMaker"),
+    DreoDeviceType.HUMIDIFIER: ("pydreohumidifier", "PyDreoHumidifier"),
+    DreoDeviceType.DEHUMIDIFIER: ("pydreodehumidifier", "PyDreoDehumidifier"),
+    DreoDeviceType.EVAPORATIVE_COOLER: ("pydreoevaporativecooler", "PyDreoEvaporativeCooler"),
 }
+_DEVICE_CLASS_MODULES = {class_name: module for module, class_name in _DREO_DEVICE_TYPE_TO_CLASS.values()}
+
+
+def _load_device_class(module: str, class_name: str) -> type[PyDreoBaseDevice]:
+    device_class = getattr(importlib.import_module(f".{module}", __name__), class_name)
+    globals()[class_name] = device_class  # later lookups skip __getattr__
+    return device_class
+
+
+def device_class_for_type(device_type: DreoDeviceType) -> Optional[type[PyDreoBaseDevice]]:
+    """The device class for a device type, importing its module on first use. None if the type has no class."""
+    entry = _DREO_DEVICE_TYPE_TO_CLASS.get(device_type)
+    return _load_device_class(*entry) if entry is not None else None
+
+
+def __getattr__(name: str):
+    """Import device classes (``PyDreoTowerFan`` etc.) on first access."""
+    module = _DEVICE_CLASS_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _load_device_class(module, name)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _DEVICE_CLASS_MODULES.keys())
 
 
 class PyDreo:  # pylint: disable=function-redefined
@@ -88,9 +242,43 @@ class PyDreo:  # pylint: disable=function-redefined
         debug_test_mode_payload=None,
         token=None,
         region: str | None = None,
+        state_load_workers: int = DEFAULT_STATE_LOAD_WORKERS,
+        http_pool_size: int = DEFAULT_HTTP_POOL_SIZE,
+        http_retries: int | Retry = DEFAULT_HTTP_RETRIES,
+        aiohttp_session: "aiohttp.ClientSession | None" = None,
+        dispatch_workers: int = DEFAULT_DISPATCH_WORKERS,
+        dispatch_queue_depth: int = DEFAULT_DISPATCH_QUEUE_DEPTH,
+        dispatch_overflow: OverflowPolicy = OverflowPolicy.COALESCE,
+        state_cache_ttl: float = DEFAULT_STATE_CACHE_TTL,
     ) -> None:
         """Initialize Dreo class with username, password and time zone."""
-        self._transport = CommandTransport(self._transport_consume_message)
+        # Transport, command and REST metrics; see metrics.py.
+        self.metrics = MetricsRegistry()
+        self._transport = CommandTransport(self._transport_consume_message, self.metrics, self._transport_state_changed)
+        self._transport_available = True
+        # Reports are applied off the WebSocket thread while the transport runs.
+        self._dispatcher = ReportDispatcher(
+            self._apply_reports,
+            workers=dispatch_workers,
+            max_depth=dispatch_queue_depth,
+            overflow=dispatch_overflow,
+            coalesce=lambda device, messages: device.coalesce_reports(messages),
+        )
+        self.metrics.gauge(METRIC_REPORT_QUEUE_DEPTH, lambda: sum(self._dispatcher.depths().values()))
+        self.metrics.histogram(METRIC_COMMAND_BATCH_KEYS, BATCH_SIZE_BUCKETS)
+        # Optional per-command traces for diagnostics; see tracing.py. Off until enabled.
+        self.tracer = CommandTracer()
+        # Shared, briefly cached devicestate reads; see statereader.py.
+        self._state_reader = DeviceStateReader(self._request_device_state, self._async_request_device_state, state_cache_ttl)
+        # Stamps from one counter: each device's last state report, and every
+        # devicestate fetch, so a response can be checked against later reports.
+        self._report_stamps = count()
+        self._last_report_stamp: dict[str, int] = {}
+        # REST refresh of every device after the WebSocket reconnects; see resync.py.
+        self._resyncer = StateResyncer(self._resync_device, self.schedule_call_later, lambda device: device.commands_pending)
+        self._transport_has_connected = False
+        # Devices with commands in flight when the connection dropped; resynced first.
+        self._resync_priority: set[str] = set()
 
         if region in (DREO_AUTH_REGION_NA, DREO_AUTH_REGION_EU):
             self.auth_region = region
@@ -112,14 +300,35 @@ class PyDreo:  # pylint: disable=function-redefined
         self._dev_list = {}
         self._device_list_by_sn = {}
         self.devices: list[PyDreoBaseDevice] = []
+        # Upper bound on concurrent devicestate/setting REST calls during load_devices.
+        self.state_load_workers: int = state_load_workers
+
+        # Pooled keep-alive REST sessions, one per API region, created on first
+        # use so every call after the first skips the TCP+TLS handshake.
+        self.http_pool_size: int = http_pool_size
+        self.http_retries: int | Retry = http_retries
+        self._http_sessions: dict[str, requests.Session] = {}
+        self._http_sessions_lock = threading.Lock()
+        # Caller-owned aiohttp session for the async API (under HA, the shared
+        # client session). Without one, async REST calls fall back to the
+        # pooled requests sessions on a worker thread.
+        self.aiohttp_session: "aiohttp.ClientSession | None" = aiohttp_session
+
+        # Settings fetched ahead of device construction by async_load_devices,
+        # keyed by (serial number, setting); consumed by get_device_setting.
+        self._prefetched_settings: dict[tuple[str, DreoDeviceSetting], Any] = {}
+        # Every setting value read so far, by serial number, for export_snapshot.
+        self._resolved_settings: dict[str, dict[str, Any]] = {}
 
         self.debug_test_mode: bool = debug_test_mode
         self.debug_test_mode_payload: dict = debug_test_mode_payload
 
+        # In-flight commands keyed by device serial number. Each device has at
+        # most one command awaiting its ack; different devices proceed in
+        # parallel so a scene touching many devices is not serialized behind
+        # one slow ack.
         self._command_condition = threading.Condition()
-        self._pending_command_device: Optional[str] = None
-        self._pending_command_params: Optional[dict] = None
-        self._ack_received: bool = False
+        self._pending_commands: dict[str, _PendingCommand] = {}
 
         # Host-provided delayed scheduler; see ScheduleCallLater / class docstring.
         self._schedule_call_later: ScheduleCallLater | None = None
@@ -153,6 +362,31 @@ class PyDreo:  # pylint: disable=function-redefined
         _LOGGER.debug("auto_reconnect.setter: Setting auto_reconnect to %s", value)
         self._transport.auto_reconnect = value
 
+    @property
+    def dispatch_stats(self) -> dict:
+        """Report dispatch queue metrics (depths, coalesced and dropped reports)."""
+        return self._dispatcher.stats()
+
+    @property
+    def transport_available(self) -> bool:
+        """False while the WebSocket reconnect circuit is open and commands fail fast."""
+        return self._transport.available
+
+    @property
+    def transport_status(self) -> dict:
+        """WebSocket connection and circuit breaker state, for diagnostics."""
+        return self._transport.status()
+
+    @property
+    def state_read_stats(self) -> dict:
+        """devicestate cache hits, misses and shared in-flight reads, for diagnostics."""
+        return self._state_reader.stats()
+
+    @property
+    def resync_stats(self) -> dict:
+        """Post-reconnect resync counters, for diagnostics."""
+        return self._resyncer.stats()
+
     @property
     def redact(self) -> bool:
         """Return debug flag."""
@@ -181,7 +415,7 @@ class PyDreo:  # pylint: disable=function-redefined
         """Return device list, filtering out devices without a deviceId."""
         return [dev for dev in devices if dev.get("deviceId") is not None]
 
-    def _process_devices(self, dev_list: list) -> bool:
+    def _process_devices(self, dev_list: list, on_devices: DevicesAddedCallback | None = None) -> bool:
         """Instantiate Device Objects."""
         devices = self.set_dev_id(dev_list)
         _LOGGER.debug("_process_devices: Processing devices")
@@ -202,111 +436,522 @@ class PyDreo:  # pylint: disable=function-redefined
 
         # devices[:] = [x for x in devices if self.add_dev_test(x)]
 
-        # detail_keys = ['deviceType', 'deviceName', 'deviceStatus']
-        for dev in devices:
-            # Get the state of the device...separate API call...boo
-            try:
-                model = dev.get("model", None)
-
-                _LOGGER.debug("_process_devices: Found device with model %s", model)
-
-                if model is not None:
-                    # Get the prefix of the model number to match against the supported devices.
-                    # Not all models will have known prefixes.
-                    model_prefix = None
-                    for prefix in SUPPORTED_MODEL_PREFIXES:
-                        if model[: len(prefix) :] == prefix:
-                            model_prefix = prefix
-                            _LOGGER.debug("_process_devices: Prefix %s assigned from model %s", model_prefix, model)
-                            break
-
-                    device_details = None
-                    if model in SUPPORTED_DEVICES:
-                        _LOGGER.debug("_process_devices: Device %s found!", model)
-                        device_details = SUPPORTED_DEVICES[model]
-                    elif model_prefix is not None and model_prefix in SUPPORTED_DEVICES:
-                        _LOGGER.debug("_process_devices: Device %s found! via prefix %s", model, model_prefix)
-                        device_details = SUPPORTED_DEVICES[model_prefix]
-
-                # If device_details is None at this point, we have an unknown device model.
-                # Unsupported/Unknown Device. Load the state, but store it in an "unsupported objects"
-                # list for later use in diagnostics.
-                device_class = None
-
-                if device_details is not None:
-                    device_class = _DREO_DEVICE_TYPE_TO_CLASS.get(device_details.device_type, None)
-                else:
-                    device_details = DreoDeviceDetails(device_type=DreoDeviceType.UNKNOWN)
+        # Building a device may itself call the API (fans read their temperature
+        # offset setting) and its initial state is one more round trip, so both
+        # run on a bounded worker pool. Results are applied here, in device list
+        # order, so the resulting device order does not depend on the cloud.
+        added = []
+        workers = max(1, min(self.state_load_workers, len(devices)))
+        fetched = next(self._report_stamps)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="DreoStateLoad") as executor:
+            builds = [executor.submit(self._build_device, dev) for dev in devices]
+            for dev, build in zip(devices, builds):
+                try:
+                    device, response = build.result()
+                    self._register_device(device, response)
+                    if self._reported_since(device.serial_number, fetched):
+                        # Reports before registration were dropped; the response may predate them.
+                        self.load_device_state(device, fresh=True)
+                    added.append(device)
+                except UnknownModelError as ume:
+                    _LOGGER.warning("_process_devices: Unknown device model: %s", ume)
+                    _LOGGER.debug("_process_devices: %s", dev)
+
+        self._devices_added(added, on_devices)
+        return True
+
+    @staticmethod
+    def _devices_added(added: list[PyDreoBaseDevice], on_devices: DevicesAddedCallback | None) -> None:
+        """Hand a page's new devices to the caller's callback."""
+        if on_devices is None or not added:
+            return
+        try:
+            on_devices(added)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("_devices_added: Devices-added callback failed")
 
-                if device_class is None:
-                    device_class = PyDreoUnknownDevice
+    def _register_device(self, device: PyDreoBaseDevice, response: Optional[dict], apply_state: bool = True) -> None:
+        """Apply a freshly built device's state and add it to the device list."""
+        if self.enabled and apply_state:
+            self._apply_device_state(device, response)
 
-                device: PyDreoBaseDevice = device_class(device_details, dev, self)
+        # Applying the state ran the overrides; without state they run now and
+        # again once it loads, since some read it.
+        if not device.state_loaded:
+            self._apply_device_overrides(device)
 
-                self.load_device_state(device)
+        self.devices.append(device)
 
-                if device_details.override_fn is not None:
-                    device_details.override_fn(device)
+        self._device_list_by_sn[device.serial_number] = device
 
-                self.devices.append(device)
+    def _build_device(self, dev: dict) -> Tuple[PyDreoBaseDevice, Optional[dict]]:
+        """Instantiate one device and fetch its state. Runs on a state-load worker thread."""
+        device_class, device_details = self._resolve_device_class(dev)
+        device: PyDreoBaseDevice = device_class(device_details, dev, self)
 
-                self._device_list_by_sn[device.serial_number] = device
-            except UnknownModelError as ume:
-                _LOGGER.warning("_process_devices: Unknown device model: %s", ume)
-                _LOGGER.debug("_process_devices: %s", dev)
+        # Get the state of the device...separate API call...boo
+        response = self._fetch_device_state(device.serial_number) if self.enabled else None
+        return device, response
 
-        return True
+    @staticmethod
+    def _resolve_device_class(dev: dict) -> Tuple[type[PyDreoBaseDevice], DreoDeviceDetails]:
+        """Find the device class and definition for a devicelist entry."""
+        model = dev.get("model", None)
+        device_details = None
+
+        _LOGGER.debug("_resolve_device_class: Found device with model %s", model)
+
+        match = MODEL_INDEX.resolve(model)
+        if match is not None:
+            device_details = match.details
+            if match.exact:
+                _LOGGER.debug("_resolve_device_class: Device %s found!", model)
+            else:
+                _LOGGER.debug("_resolve_device_class: Device %s found! via prefix %s", model, match.key)
+
+        # If device_details is None at this point, we have an unknown device model.
+        # Unsupported/Unknown Device. Load the state, but store it in an "unsupported objects"
+        # list for later use in diagnostics.
+        device_class = None
 
-    def load_devices(self) -> bool:
-        """Load devices from API. This is called once upon initialization."""
+        if device_details is not None:
+            device_class = device_class_for_type(device_details.device_type)
+        else:
+            device_details = DreoDeviceDetails(device_type=DreoDeviceType.UNKNOWN)
+
+        if device_class is None:
+            device_class = PyDreoUnknownDevice
+
+        return device_class, device_details
+
+    def load_devices(self, on_devices: DevicesAddedCallback | None = None) -> bool:
+        """Load devices from API. This is called once upon initialization.
+
+        Walks every devicelist page, fetching the next page while the devices
+        of the current one are built and their state loaded. ``on_devices``
+        receives each page's devices once they are ready. Returns False if the
+        first page has no devices or any page cannot be read.
+        """
         if not self.enabled:
             return False
 
         self.in_process = True
         proc_return = False
 
-        response = None
-
         if self.debug_test_mode:
             _LOGGER.debug("load_devices: Debug Test Mode is enabled.  Using test payload.")
-            response = self.debug_test_mode_payload.get("get_devices", None)
-        else:
-            response, _ = self.call_dreo_api(DREO_API_DEVICELIST)
+            device_list = self._device_list_from_response(self.debug_test_mode_payload.get("get_devices", None))
+            if device_list is not None:
+                proc_return = self._process_devices(device_list, on_devices)
+            self.in_process = False
+            return proc_return
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="DreoDeviceList") as pager:
+            page_no, response = 1, self._fetch_device_page(1)
+            while True:
+                device_list = self._device_list_from_response(response, page_no)
+                if device_list is None:
+                    proc_return = False
+                    break
+                next_page = pager.submit(self._fetch_device_page, page_no + 1) if self._has_more_pages(response, page_no) else None
+                if device_list or page_no == 1:
+                    proc_return = self._process_devices(device_list, on_devices) or proc_return
+                if next_page is None or not proc_return:
+                    break
+                page_no, response = page_no + 1, next_page.result()
 
-        # Stash the raw response for use by the diagnostics system, so we don't have to pull
-        # logs
-        self.raw_response = response
+        self.in_process = False
+
+        return proc_return
+
+    async def async_load_devices(self, on_devices: DevicesAddedCallback | None = None, load_state: bool = True) -> bool:
+        """Load devices from the API without blocking the caller's event loop.
+
+        Async counterpart of ``load_devices``: each device's state and any
+        settings its class reads while constructing are fetched concurrently
+        (bounded by ``state_load_workers``), then applied in device-list order,
+        while the next devicelist page is fetched.
+
+        With ``load_state`` False the devices are built without their state;
+        load it per device with ``async_load_device_state`` (``state_loaded``
+        says which devices have it).
+        """
+        if not self.enabled:
+            return False
+
+        self.in_process = True
+        proc_return = False
 
+        if self.debug_test_mode:
+            _LOGGER.debug("async_load_devices: Debug Test Mode is enabled.  Using test payload.")
+            device_list = self._device_list_from_response(self.debug_test_mode_payload.get("get_devices", None))
+            if device_list is not None:
+                proc_return = await self._async_process_devices(device_list, on_devices, load_state)
+            self.in_process = False
+            return proc_return
+
+        page_no, response = 1, await self._async_fetch_device_page(1)
+        next_page: asyncio.Future | None = None
+        try:
+            while True:
+                device_list = self._device_list_from_response(response, page_no)
+                if device_list is None:
+                    proc_return = False
+                    break
+                if self._has_more_pages(response, page_no):
+                    next_page = asyncio.ensure_future(self._async_fetch_device_page(page_no + 1))
+                if device_list or page_no == 1:
+                    proc_return = await self._async_process_devices(device_list, on_devices, load_state) or proc_return
+                if next_page is None or not proc_return:
+                    break
+                page_no, response = page_no + 1, await next_page
+                next_page = None
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+        self.in_process = False
+
+        return proc_return
+
+    def _fetch_device_page(self, page_no: int) -> Optional[dict]:
+        """Fetch one page of the account's device list."""
+        response, _ = self.call_dreo_api(DREO_API_DEVICELIST, self._device_page_params(page_no))
+        return response
+
+    async def _async_fetch_device_page(self, page_no: int) -> Optional[dict]:
+        """Async counterpart of ``_fetch_device_page``."""
+        response, _ = await self.async_call_dreo_api(DREO_API_DEVICELIST, self._device_page_params(page_no))
+        return response
+
+    async def _async_fetch_device_list(self) -> Optional[dict]:
+        """The whole device list: every page's entries in the first page's response, or None if a page fails."""
+        page_no, response = 1, await self._async_fetch_device_page(1)
+        merged = None
+        while True:
+            if not (response and Helpers.code_check(response) and LIST_KEY in response.get(DATA_KEY, {})):
+                return None
+            if merged is None:
+                merged = {**response, DATA_KEY: {**response[DATA_KEY], LIST_KEY: list(response[DATA_KEY][LIST_KEY])}}
+            else:
+                merged[DATA_KEY][LIST_KEY].extend(response[DATA_KEY][LIST_KEY])
+            if not self._has_more_pages(response, page_no):
+                return merged
+            page_no, response = page_no + 1, await self._async_fetch_device_page(page_no + 1)
+
+    @staticmethod
+    def _device_page_params(page_no: int) -> dict:
+        return {"pageNo": str(page_no), "pageSize": str(DEVICELIST_PAGE_SIZE)}
+
+    @staticmethod
+    def _has_more_pages(response: dict, page_no: int) -> bool:
+        """Whether the devicelist has pages after page_no.
+
+        Uses ``totalPage`` when the cloud sends it, otherwise assumes more
+        pages while a page comes back full.
+        """
+        data = response[DATA_KEY]
+        total_pages = data.get("totalPage")
+        if total_pages is not None:
+            return page_no < int(total_pages)
+        return len(data[LIST_KEY]) >= int(data.get("pageSize", DEVICELIST_PAGE_SIZE))
+
+    def _device_list_from_response(self, response: Optional[dict], page_no: int = 1) -> Optional[list]:
+        """Stash a devicelist response and return its device entries, or None on error.
+
+        Later pages are appended to the device list of the stashed first page.
+        """
         if response and Helpers.code_check(response):
             if DATA_KEY in response and LIST_KEY in response[DATA_KEY]:
                 device_list = response[DATA_KEY][LIST_KEY]
-                proc_return = self._process_devices(device_list)
-            else:
-                _LOGGER.error("load_devices: Device list in response not found")
+                # Stash the raw response for use by the diagnostics system, so we don't have to pull
+                # logs
+                if page_no == 1 or self.raw_response is None:
+                    self.raw_response = response
+                else:
+                    self.raw_response[DATA_KEY][LIST_KEY] = [*self.raw_response[DATA_KEY][LIST_KEY], *device_list]
+                return device_list
+            _LOGGER.error("load_devices: Device list in response not found (page %d)", page_no)
         else:
-            _LOGGER.warning("load_devices: Error retrieving device list")
+            _LOGGER.warning("load_devices: Error retrieving device list (page %d)", page_no)
+        if page_no == 1:
+            self.raw_response = response
+        return None
 
-        self.in_process = False
+    async def _async_process_devices(self, dev_list: list, on_devices: DevicesAddedCallback | None = None, load_state: bool = True) -> bool:
+        """Async counterpart of ``_process_devices``."""
+        devices = self.set_dev_id(dev_list)
+        if not devices:
+            _LOGGER.warning("_async_process_devices: No devices found in api return")
+            return False
 
-        return proc_return
+        limit = asyncio.Semaphore(max(1, self.state_load_workers))
+
+        async def fetch(dev: dict) -> Tuple[dict, Optional[dict]]:
+            device_class, _ = self._resolve_device_class(dev)
+            serial_number = dev.get("sn")
+            async with limit:
+                settings = {}
+                if not self.debug_test_mode:
+                    for setting in device_class.prefetch_settings(dev):
+                        settings[setting] = await self._async_fetch_setting(serial_number, setting)
+                return settings, await self._async_fetch_device_state(serial_number) if load_state else None
+
+        fetched = next(self._report_stamps)
+        results = await asyncio.gather(*(fetch(dev) for dev in devices))
+
+        added = []
+        for dev, (settings, response) in zip(devices, results):
+            serial_number = dev.get("sn")
+            try:
+                for setting, value in settings.items():
+                    self._prefetched_settings[(serial_number, setting)] = value
+                device_class, device_details = self._resolve_device_class(dev)
+                device: PyDreoBaseDevice = device_class(device_details, dev, self)
+                self._register_device(device, response, load_state)
+                if load_state and self._reported_since(serial_number, fetched):
+                    # Reports before registration were dropped; the response may predate them.
+                    await self.async_load_device_state(device, fresh=True)
+                added.append(device)
+            except UnknownModelError as ume:
+                _LOGGER.warning("_async_process_devices: Unknown device model: %s", ume)
+                _LOGGER.debug("_async_process_devices: %s", dev)
+            finally:
+                for setting in settings:
+                    self._prefetched_settings.pop((serial_number, setting), None)
+
+        self._devices_added(added, on_devices)
+        return True
+
+    def export_snapshot(self) -> dict:
+        """Return a JSON-serializable snapshot of the loaded account for warm starts.
+
+        Holds the devicelist response, each device's last devicestate response,
+        the settings read while building devices and the access token with its
+        region. Feed it back to ``load_from_snapshot`` on the next start.
+        """
+        return {
+            "version": SNAPSHOT_VERSION,
+            "saved_at": time.time(),
+            "username": self.username,
+            "token": self.token,
+            "auth_region": self.auth_region,
+            "device_list": self.raw_response,
+            "states": {device.serial_number: device.raw_state for device in self.devices},
+            "settings": {sn: dict(values) for sn, values in self._resolved_settings.items()},
+        }
+
+    def load_from_snapshot(self, snapshot: dict, max_age: float = DEFAULT_SNAPSHOT_MAX_AGE) -> bool:
+        """Build devices from an ``export_snapshot`` result without touching the network.
+
+        Returns False, leaving the manager untouched, if the snapshot is from
+        another layout version or account, has no token, or is older than
+        ``max_age`` seconds; the caller should then fall back to ``login`` and
+        ``load_devices``. States loaded this way are last-known values, so
+        follow up with ``async_reconcile`` once the transport is up.
+        """
+        if self.debug_test_mode or not isinstance(snapshot, dict):
+            return False
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            _LOGGER.info("load_from_snapshot: Snapshot version %s not supported", snapshot.get("version"))
+            return False
+        if snapshot.get("username") != self.username or not snapshot.get("token"):
+            _LOGGER.info("load_from_snapshot: Snapshot is for a different account or has no token")
+            return False
+        age = time.time() - snapshot.get("saved_at", 0)
+        if not 0 <= age <= max_age:
+            _LOGGER.info("load_from_snapshot: Snapshot is stale (%.0f seconds old)", age)
+            return False
+
+        device_list = self._device_list_from_response(snapshot.get("device_list"))
+        if device_list is None:
+            return False
+        devices = self.set_dev_id(device_list)
+
+        self.token = snapshot["token"]
+        self.auth_region = snapshot.get("auth_region", self.auth_region)
+        self.enabled = True
+
+        states = snapshot.get("states") or {}
+        settings = snapshot.get("settings") or {}
+        for dev in devices:
+            serial_number = dev.get("sn")
+            stored = settings.get(serial_number, {})
+            prefetched = []
+            try:
+                device_class, device_details = self._resolve_device_class(dev)
+                # Every setting the class reads while constructing gets a value, None when the
+                # last run could not read it, so construction never falls back to the API.
+                for setting in {*device_class.prefetch_settings(dev), *map(DreoDeviceSetting, stored)}:
+                    prefetched.append((serial_number, setting))
+                    self._prefetched_settings[(serial_number, setting)] = stored.get(setting.value)
+                device: PyDreoBaseDevice = device_class(device_details, dev, self)
+                self._register_device(device, states.get(serial_number))
+            except (UnknownModelError, ValueError) as ex:
+                _LOGGER.warning("load_from_snapshot: Skipping device %s: %s", serial_number, ex)
+            finally:
+                for key in prefetched:
+                    self._prefetched_settings.pop(key, None)
+
+        _LOGGER.info("load_from_snapshot: Loaded %d devices from a %.0f second old snapshot", len(self.devices), age)
+        return True
+
+    async def async_reconcile(self) -> Optional[bool]:
+        """Refresh devices built by ``load_from_snapshot`` from the cloud.
+
+        Returns True once the device states are refreshed (registered
+        callbacks fire for each device), False if the account's device list
+        no longer matches the loaded devices (the caller should reload), and
+        None if the cloud could not be reached.
+        """
+        response = await self._async_fetch_device_list()
+        if response is None:
+            _LOGGER.warning("async_reconcile: Unable to retrieve device list; keeping snapshot state")
+            return None
+
+        serial_numbers = {dev.get("sn") for dev in response[DATA_KEY][LIST_KEY]}
+        if serial_numbers != set(self._device_list_by_sn):
+            _LOGGER.info("async_reconcile: Device list changed since the snapshot")
+            return False
+        self.raw_response = response
+
+        limit = asyncio.Semaphore(max(1, self.state_load_workers))
+
+        async def refresh(device: PyDreoBaseDevice) -> Optional[frozenset[str]]:
+            async with limit:
+                return await _async_run_flow(self._load_state_flow(device))
+
+        devices = list(self.devices)
+        for device, changed in zip(devices, await asyncio.gather(*(refresh(device) for device in devices))):
+            if changed:
+                device._do_callbacks(changed)  # pylint: disable=protected-access
+        return True
+
+    async def async_discover_devices(self) -> Optional[Tuple[list[PyDreoBaseDevice], list[PyDreoBaseDevice]]]:
+        """Attach devices added to the account and detach removed ones, leaving the rest alone.
 
-    def load_device_state(self, device: PyDreoBaseDevice) -> bool:
-        """Load device state from API. This is called once upon initialization for each supported device."""
+        Returns the ``(added, removed)`` devices, or None if the device list
+        could not be read. Added devices are built with their state; removed
+        devices are disposed.
+        """
+        response = await self._async_fetch_device_list()
+        if response is None:
+            _LOGGER.warning("async_discover_devices: Unable to retrieve device list")
+            return None
+
+        listed = self.set_dev_id(response[DATA_KEY][LIST_KEY])
+        serial_numbers = {dev.get("sn") for dev in listed}
+        removed = [device for device in list(self.devices) if device.serial_number not in serial_numbers]
+        for device in removed:
+            self._detach_device(device)
+
+        added: list[PyDreoBaseDevice] = []
+        new = [dev for dev in listed if dev.get("sn") not in self._device_list_by_sn]
+        if new:
+            await self._async_process_devices(new, added.extend)
+        self.raw_response = response
+
+        if added or removed:
+            _LOGGER.info("async_discover_devices: %d devices added, %d removed", len(added), len(removed))
+        return added, removed
+
+    def _detach_device(self, device: PyDreoBaseDevice) -> None:
+        """Remove a device that left the account and release its resources."""
+        _LOGGER.info("_detach_device: %s is no longer on the account", device.name)
+        self._device_list_by_sn.pop(device.serial_number, None)
+        if device in self.devices:
+            self.devices.remove(device)
+        self._state_reader.invalidate(device.serial_number)
+        try:
+            device.dispose()
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.debug("_detach_device: dispose failed for %s: %s", device, ex)
+
+    def load_device_state(self, device: PyDreoBaseDevice, fresh: bool = False) -> bool:
+        """Load device state from API. This is called once upon initialization for each supported device.
+
+        A response fetched in the last ``state_cache_ttl`` seconds may be reused
+        unless ``fresh`` is set.
+        """
         _LOGGER.debug("load_device_state: %s, enabled: %s", device.name, self.enabled)
         if not self.enabled:
             return False
 
         self.in_process = True
-        proc_return = False
+        proc_return = _run_flow(self._load_state_flow(device, fresh)) is not None
+        self.in_process = False
 
-        response = None
+        return proc_return
+
+    async def async_load_device_state(self, device: PyDreoBaseDevice, fresh: bool = False) -> bool:
+        """Async counterpart of ``load_device_state``."""
+        _LOGGER.debug("async_load_device_state: %s, enabled: %s", device.name, self.enabled)
+        if not self.enabled:
+            return False
 
+        return await _async_run_flow(self._load_state_flow(device, fresh)) is not None
+
+    def _reported_since(self, serial_number: str, stamp: int) -> bool:
+        """True if a state report for the device arrived after ``stamp`` was taken."""
+        return self._last_report_stamp.get(serial_number, -1) > stamp
+
+    def _load_state_flow(self, device: PyDreoBaseDevice, fresh: bool = False) -> _IoFlow:
+        """Fetch and apply a device's state; returns the attributes that changed, or None if none could be applied.
+
+        The response is applied under the device's ``state_lock``, which report
+        application also holds, so the two never interleave. A response
+        fetched before the device's latest report may predate it: it is
+        fetched again, and if reports keep overtaking it, dropped in favour of
+        the reports (a device whose state never loaded takes it anyway, as its
+        baseline).
+        """
+        for attempt in range(_STALE_STATE_RETRIES + 1):
+            fetched = next(self._report_stamps)
+            response = yield _IoStep(self._fetch_device_state, self._async_fetch_device_state, (device.serial_number, fresh or attempt > 0))
+            with device.state_lock:
+                if self._reported_since(device.serial_number, fetched):
+                    if attempt < _STALE_STATE_RETRIES:
+                        _LOGGER.debug("_load_state_flow: %s reported during the devicestate read; reading again", device.name)
+                        continue
+                    if device.state_loaded:
+                        _LOGGER.debug("_load_state_flow: %s keeps reporting; keeping reported state over devicestate", device.name)
+                        return frozenset()
+                before = device._state_snapshot()  # pylint: disable=protected-access
+                if not self._apply_device_state(device, response):
+                    return None
+                return device._changed_since(before)  # pylint: disable=protected-access
+        return None
+
+    def _fetch_device_state(self, serial_number: str, fresh: bool = False) -> Optional[dict]:
+        """Fetch the raw devicestate response for a device without applying it.
+
+        Concurrent reads of one device share a request; see ``DeviceStateReader``.
+        """
         if self.debug_test_mode:
-            _LOGGER.debug("load_device_state: Debug Test Mode is enabled.  Using test payload.")
-            response = self.debug_test_mode_payload.get(device.serial_number, None)
-        else:
-            response, _ = self.call_dreo_api(DREO_API_DEVICESTATE, {DEVICESN_KEY: device.serial_number})
+            _LOGGER.debug("_fetch_device_state: Debug Test Mode is enabled.  Using test payload.")
+            return self.debug_test_mode_payload.get(serial_number, None)
 
+        return self._state_reader.read(serial_number, fresh)
+
+    async def _async_fetch_device_state(self, serial_number: str, fresh: bool = False) -> Optional[dict]:
+        """Async counterpart of ``_fetch_device_state``."""
+        if self.debug_test_mode:
+            return self.debug_test_mode_payload.get(serial_number, None)
+
+        return await self._state_reader.async_read(serial_number, fresh)
+
+    def _request_device_state(self, serial_number: str) -> Optional[dict]:
+        """The devicestate REST call behind ``DeviceStateReader``."""
+        response, _ = self.call_dreo_api(DREO_API_DEVICESTATE, {DEVICESN_KEY: serial_number})
+        return response
+
+    async def _async_request_device_state(self, serial_number: str) -> Optional[dict]:
+        """Async counterpart of ``_request_device_state``."""
+        response, _ = await self.async_call_dreo_api(DREO_API_DEVICESTATE, {DEVICESN_KEY: serial_number})
+        return response
+
+    def _apply_device_state(self, device: PyDreoBaseDevice, response: Optional[dict]) -> bool:
+        """Apply a raw devicestate response to a device."""
         # stash the raw return value from the devicestate api call
         device.raw_state = response
 
@@ -314,19 +959,49 @@ class PyDreo:  # pylint: disable=function-redefined
             if DATA_KEY in response and MIXED_KEY in response[DATA_KEY]:
                 device_state = response[DATA_KEY][MIXED_KEY]
                 device.update_state(device_state)
-                proc_return = True
-            else:
-                _LOGGER.error("load_device_state: Mixed state in response not found: %s", device.name)
+                if not device.state_loaded:
+                    device.state_loaded = True
+                    self._apply_device_overrides(device)
+                    device._mark_state_notified()  # pylint: disable=protected-access
+                return True
+            _LOGGER.error("load_device_state: Mixed state in response not found: %s", device.name)
         else:
             _LOGGER.error("load_device_state: Error retrieving device state: %s", device.name)
 
-        self.in_process = False
+        return False
 
-        return proc_return
+    @staticmethod
+    def _apply_device_overrides(device: PyDreoBaseDevice) -> None:
+        """Run the model's ``override_fn`` (hardware-revision tweaks), if it has one."""
+        if device.device_definition.override_fn is not None:
+            device.device_definition.override_fn(device)
 
     def login(self) -> bool:
         """Return True if log in request succeeds."""
+        return _run_flow(self._login_flow())
+
+    async def async_login(self) -> bool:
+        """Async counterpart of ``login``; runs on the caller's event loop."""
+        return await _async_run_flow(self._login_flow())
+
+    def _login_flow(self) -> _IoFlow:
+        """Log in, following the region the auth server reports."""
+        while True:
+            precheck = self._login_precheck()
+            if precheck is not None:
+                return precheck
+
+            response, status_code = yield _IoStep(self.call_dreo_api, self.async_call_dreo_api, (DREO_API_LOGIN,))
+
+            result = self._handle_login_response(response, status_code)
+            if result is not None:
+                return result
 
+    def _login_precheck(self) -> Optional[bool]:
+        """Settle login without a network call where possible.
+
+        Returns the login result, or None if credentials must be sent.
+        """
         if self.debug_test_mode:
             self.enabled = True
             _LOGGER.debug("login: Debug Test Mode is enabled.  Skipping login.")
@@ -348,8 +1023,10 @@ class PyDreo:  # pylint: disable=function-redefined
         if pass_check is False:
             _LOGGER.error("login: Password invalid")
             return False
-        response, status_code = self.call_dreo_api(DREO_API_LOGIN)
+        return None
 
+    def _handle_login_response(self, response: Optional[dict], status_code: Optional[int]) -> Optional[bool]:
+        """Apply a login response. Returns None if the login must be retried in another region."""
         if response is None:
             status_msg = f"status: {status_code}" if status_code else "no status code"
             _LOGGER.error("login: No response from Dreo API (%s). Check network connectivity and API endpoint.", status_msg)
@@ -362,7 +1039,7 @@ class PyDreo:  # pylint: disable=function-redefined
             if auth_region != self.auth_region:
                 _LOGGER.info("login: Dreo Auth reports different region than current; retrying.")
                 self.auth_region = auth_region
-                return self.login()
+                return None
             else:
                 self.token = response[DATA_KEY][ACCESS_TOKEN_KEY]
                 self.enabled = True
@@ -384,8 +1061,12 @@ class PyDreo:  # pylint: disable=function-redefined
         if not self.enabled:
             return None
 
+        prefetch_key = (device.serial_number, setting)
+        if prefetch_key in self._prefetched_settings:
+            _LOGGER.debug("get_device_setting: Using prefetched value for %s(%s)", device.name, setting)
+            return self._remember_setting(device.serial_number, setting, self._prefetched_settings.pop(prefetch_key))
+
         self.in_process = True
-        setting_value = None
         response = None
 
         if self.debug_test_mode:
@@ -396,19 +1077,37 @@ class PyDreo:  # pylint: disable=function-redefined
         else:
             response, _ = self.call_dreo_api(DREO_API_SETTING_GET, {DEVICESN_KEY: device.serial_number, DREO_API_SETTING_DATA_KEY: setting})
 
+        setting_value = self._setting_value_from_response(response, device.name, setting)
+
+        self.in_process = False
+
+        return self._remember_setting(device.serial_number, setting, setting_value)
+
+    def _remember_setting(self, serial_number: str, setting: DreoDeviceSetting, value: Any) -> Any:
+        """Record a setting value for export_snapshot and pass it through."""
+        if value is not None:
+            self._resolved_settings.setdefault(serial_number, {})[DreoDeviceSetting(setting).value] = value
+        return value
+
+    async def _async_fetch_setting(self, serial_number: str, setting: DreoDeviceSetting) -> bool | int | None:
+        """Fetch one device setting through the async API."""
+        response, _ = await self.async_call_dreo_api(
+            DREO_API_SETTING_GET, {DEVICESN_KEY: serial_number, DREO_API_SETTING_DATA_KEY: setting}
+        )
+        return self._setting_value_from_response(response, serial_number, setting)
+
+    @staticmethod
+    def _setting_value_from_response(response: Optional[dict], device_name: str, setting: DreoDeviceSetting) -> bool | int | None:
+        """Extract a setting value from a setting_get response."""
         if response and Helpers.code_check(response):
             if DATA_KEY in response:
                 data_node = response[DATA_KEY]
                 if DREO_API_SETTING_DATA_VALUE in data_node:
-                    setting_value = data_node[DREO_API_SETTING_DATA_VALUE]
-                else:
-                    _LOGGER.error("get_device_setting: %s key not found in returned data. %s", DREO_API_SETTING_DATA_VALUE, data_node)
+                    return data_node[DREO_API_SETTING_DATA_VALUE]
+                _LOGGER.error("get_device_setting: %s key not found in returned data. %s", DREO_API_SETTING_DATA_VALUE, data_node)
         else:
-            _LOGGER.error("get_device_setting: Error retrieving device setting: %s:%s", device.name, setting.name)
-
-        self.in_process = False
-
-        return setting_value
+            _LOGGER.error("get_device_setting: Error retrieving device setting: %s:%s", device_name, setting.name)
+        return None
 
     def set_device_setting(self, device: PyDreoBaseDevice, setting: DreoDeviceSetting, value: bool | int) -> None:
         """Set a device setting from the API."""
@@ -445,6 +1144,60 @@ class PyDreo:  # pylint: disable=function-redefined
         """Call the Dreo API. This is used for login and the initial device list and states as well
         as device settings."""
         _LOGGER.debug("call_dreo_api: Calling Dreo API: {%s}", api)
+
+        def _call() -> tuple:
+            with self.metrics.timer(METRIC_REST_LATENCY):
+                result = Helpers.call_api(*self._api_request(api, json_object), session=self._http_session())
+            self._record_rest_call(result[1])
+            return result
+
+        response, status_code = _call()
+
+        # If we got a 401 and this isn't the login call itself, try re-authenticating
+        if status_code == 401 and api != DREO_API_LOGIN:
+            _LOGGER.warning("call_dreo_api: Got 401 for %s - attempting re-login", api)
+            if self._re_login():
+                # Retry the original call with refreshed token
+                response, status_code = _call()
+
+        return response, status_code
+
+    async def async_call_dreo_api(self, api: str, json_object: Optional[dict] = None) -> tuple:
+        """Async counterpart of ``call_dreo_api``.
+
+        Uses ``aiohttp_session`` on the caller's event loop when one is set;
+        otherwise runs the pooled requests call on a worker thread.
+        """
+        _LOGGER.debug("async_call_dreo_api: Calling Dreo API: {%s}", api)
+
+        async def _call() -> tuple:
+            request = self._api_request(api, json_object)
+            with self.metrics.timer(METRIC_REST_LATENCY):
+                if self.aiohttp_session is not None:
+                    result = await Helpers.async_call_api(*request, session=self.aiohttp_session)
+                else:
+                    result = await asyncio.to_thread(Helpers.call_api, *request, session=self._http_session())
+            self._record_rest_call(result[1])
+            return result
+
+        response, status_code = await _call()
+
+        # If we got a 401 and this isn't the login call itself, try re-authenticating
+        if status_code == 401 and api != DREO_API_LOGIN:
+            _LOGGER.warning("async_call_dreo_api: Got 401 for %s - attempting re-login", api)
+            if await self._async_re_login():
+                # Retry the original call with refreshed token
+                response, status_code = await _call()
+
+        return response, status_code
+
+    def _record_rest_call(self, status_code: Optional[int]) -> None:
+        self.metrics.inc(METRIC_REST_CALLS)
+        if status_code != 200:
+            self.metrics.inc(METRIC_REST_ERRORS)
+
+    def _api_request(self, api: str, json_object: Optional[dict]) -> tuple:
+        """Build the (url, path, method, body, headers) arguments for an API call."""
         api_url = DREO_API_URL_FORMAT.format(self.api_server_region)
 
         if json_object is None:
@@ -452,7 +1205,7 @@ class PyDreo:  # pylint: disable=function-redefined
 
         json_object_full = {**Helpers.req_body(self, api), **json_object}
 
-        response, status_code = Helpers.call_api(
+        return (
             api_url,
             DREO_APIS[api][DREO_API_PATH],
             DREO_APIS[api][DREO_API_METHOD],
@@ -460,29 +1213,47 @@ class PyDreo:  # pylint: disable=function-redefined
             Helpers.req_headers(self),
         )
 
-        # If we got a 401 and this isn't the login call itself, try re-authenticating
-        if status_code == 401 and api != DREO_API_LOGIN:
-            _LOGGER.warning("call_dreo_api: Got 401 for %s - attempting re-login", api)
-            if self._re_login():
-                # Retry the original call with refreshed token
-                json_object_full = {**Helpers.req_body(self, api), **json_object}
-                response, status_code = Helpers.call_api(
-                    api_url,
-                    DREO_APIS[api][DREO_API_PATH],
-                    DREO_APIS[api][DREO_API_METHOD],
-                    json_object_full,
-                    Helpers.req_headers(self),
-                )
+    def _http_session(self) -> requests.Session:
+        """Return the pooled HTTP session for the current API region.
 
-        return response, status_code
+        Re-read per call: login may switch the auth region, which moves every
+        later call to a different host (and therefore a different pool).
+        """
+        region = self.api_server_region
+        with self._http_sessions_lock:
+            session = self._http_sessions.get(region)
+            if session is None:
+                _LOGGER.debug("_http_session: Creating pooled session for region %s", region)
+                session = Helpers.build_session(self.http_pool_size, self.http_retries)
+                self._http_sessions[region] = session
+            return session
+
+    def close_http_sessions(self) -> None:
+        """Close pooled HTTP sessions. A later API call opens a fresh one."""
+        with self._http_sessions_lock:
+            sessions = list(self._http_sessions.values())
+            self._http_sessions.clear()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.debug("close_http_sessions: close failed: %s", ex)
 
     def _re_login(self) -> bool:
         """Re-authenticate to refresh the token. Updates transport if running."""
+        return _run_flow(self._re_login_flow())
+
+    async def _async_re_login(self) -> bool:
+        """Async counterpart of ``_re_login``."""
+        return await _async_run_flow(self._re_login_flow())
+
+    def _re_login_flow(self) -> _IoFlow:
+        """Clear the token, log in again and hand the new token to the transport."""
         _LOGGER.info("_re_login: Attempting to refresh authentication token")
         old_token = self.token
         # Clear token so login() performs a real authentication
         self.token = None
-        if self.login():
+        if (yield _IoStep(self.login, self.async_login)):
             _LOGGER.info("_re_login: Re-login successful, token refreshed")
             # Update the WebSocket transport with the new token
             if not self.debug_test_mode and self.token != old_token:
@@ -538,10 +1309,15 @@ class PyDreo:  # pylint: disable=function-redefined
     def start_transport(self) -> None:
         """Initialize the websocket and start transport"""
         if not self.debug_test_mode:
+            self._transport_has_connected = False
+            self._dispatcher.start()
             self._transport.start_transport(self.api_server_region, self.token)
 
     def stop_transport(self) -> None:
         """Close down the transport socket and dispose device resources."""
+        # Drop queued reports and resyncs first so none is applied to a disposed device.
+        self._dispatcher.stop()
+        self._resyncer.cancel()
         # Cancel device-owned delayed work before tearing down the WebSocket so
         # callbacks cannot run after unload.
         for device in list(self.devices):
@@ -552,6 +1328,51 @@ class PyDreo:  # pylint: disable=function-redefined
                 _LOGGER.debug("stop_transport: dispose failed for %s: %s", device, ex)
         if not self.debug_test_mode:
             self._transport.stop_transport()
+        self.close_http_sessions()
+
+    def _transport_state_changed(self, connection_state: ConnectionState, circuit_state: CircuitState) -> None:
+        """Tell devices' listeners when the transport becomes unavailable or available again.
+
+        Runs on the transport thread. Devices report ``connected`` False while
+        the transport is unavailable (see ``PyDreoBaseDevice.connected``).
+        Reconnecting after a dropped connection also triggers a state resync.
+        """
+        self._track_resync(connection_state)
+        available = circuit_state == CircuitState.CLOSED
+        if available == self._transport_available:
+            return
+        self._transport_available = available
+        _LOGGER.info("_transport_state_changed: Transport %s (%s, circuit %s)", "available" if available else "unavailable", connection_state, circuit_state)
+        for device in list(self.devices):
+            device.transport_state_changed()
+
+    def _track_resync(self, connection_state: ConnectionState) -> None:
+        """Resync every device when the WebSocket comes back after a dropped connection.
+
+        Reports sent while the socket was down are lost. Devices with a command
+        in flight or keys waiting in their outbox around the drop go first.
+        """
+        if connection_state != ConnectionState.CONNECTED:
+            with self._command_condition:
+                self._resync_priority.update(self._pending_commands)
+            self._resync_priority.update(device.serial_number for device in list(self.devices) if device.commands_pending)
+            return
+        if not self._transport_has_connected:
+            self._transport_has_connected = True
+            self._resync_priority.clear()
+            return
+        priority, self._resync_priority = self._resync_priority, set()
+        _LOGGER.info("_track_resync: Reconnected; resyncing %d devices (%d first)", len(self.devices), len(priority))
+        self._resyncer.request(list(self.devices), priority)
+
+    def _resync_device(self, device: PyDreoBaseDevice) -> bool:
+        """Fetch and apply one device's state, notifying listeners of what changed."""
+        changed = _run_flow(self._load_state_flow(device, fresh=True))
+        if changed is None:
+            return False
+        if changed:
+            device._do_callbacks(changed)  # pylint: disable=protected-access
+        return True
 
     def testonly_interrupt_transport(self) -> None:
         """Close down the transport socket"""
@@ -566,6 +1387,11 @@ class PyDreo:  # pylint: disable=function-redefined
 
         # Check for command acknowledgment (pass reported params for matching)
         self._handle_command_ack(message_device_sn, message_method, message_reported)
+        if message_method in _STATE_METHOD_NAMES:
+            self.tracer.on_report(message_device_sn, message_reported)
+            if message_device_sn is not None:
+                self._state_reader.invalidate(message_device_sn)
+                self._last_report_stamp[message_device_sn] = next(self._report_stamps)
 
         # Existing device update handling
         if message_device_sn in self._device_list_by_sn:
@@ -574,8 +1400,7 @@ class PyDreo:  # pylint: disable=function-redefined
                 # machinery above but must never be applied as device state.
                 _LOGGER.debug("_transport_consume_message: %s is not a state method; not applying as state", message_method)
                 return
-            device = self._device_list_by_sn[message_device_sn]
-            device.handle_server_update_base(message)
+            self._dispatcher.submit(self._device_list_by_sn[message_device_sn], message)
         else:
             # Message is to an unknown device, log it out just in case...
             _LOGGER.debug(
@@ -584,68 +1409,178 @@ class PyDreo:  # pylint: disable=function-redefined
             )
             _LOGGER.debug("_transport_consume_message: Message: %s", message)
 
-    def send_command(self, device: PyDreoBaseDevice, params) -> None:
-        """Send a command to Dreo servers via the WebSocket."""
+    @staticmethod
+    def _apply_reports(device: PyDreoBaseDevice, messages: list[dict]) -> None:
+        """Apply one device's reports; a burst of several gets a single callback fan-out."""
+        with device.state_lock:
+            if len(messages) == 1:
+                device.handle_server_update_base(messages[0])
+            else:
+                device.handle_server_updates(messages)
+
+    def send_command(self, device: PyDreoBaseDevice, params) -> bool:
+        """Send a command to Dreo servers via the WebSocket.
+
+        Blocks the calling thread until the command is acknowledged (True) or
+        every attempt timed out (False).
+        """
+        return _run_flow(self._send_command_flow(device, params))
+
+    async def async_send_command(self, device: PyDreoBaseDevice, params: dict) -> bool:
+        """Send a command and await its ack on the caller's event loop.
+
+        Same retry and per-device slot semantics as ``send_command``, but no
+        thread is parked: the WebSocket send is awaited on the transport loop
+        and the ack wakes this coroutine directly.
+        """
+        return await _async_run_flow(self._send_command_flow(device, params))
+
+    def _send_command_flow(self, device: PyDreoBaseDevice, params: dict) -> _IoFlow:
+        """Send ``params``, retrying up to ``_MAX_COMMAND_RETRIES`` times until acked."""
         if self.debug_test_mode:
             _LOGGER.debug("send_command: Debug Test Mode enabled. Simulating ack...")
             self._transport_consume_message({"devicesn": device.serial_number, "method": "control-report", "reported": params})
-            return
+            return True
 
+        self._record_command_sent(params)
+        self._state_reader.invalidate(device.serial_number)
+        trace = current_trace() or self.tracer.start(device.serial_number, device.name, params)
         for attempt in range(_MAX_COMMAND_RETRIES + 1):
-            full_params = {
-                "devicesn": device.serial_number,
-                "method": "control",
-                "params": params,
-                "timestamp": Helpers.api_timestamp(),
-            }
-            content = json.dumps(full_params)
-
-            if attempt > 0:
-                _LOGGER.info("send_command: Retry %d for %s: %s", attempt, device.name, params)
-            else:
-                _LOGGER.debug("send_command: %s", content)
+            content = self._command_content(device, params, attempt)
 
-            self._reserve_command_slot(device.serial_number, params)
+            slot_wait = time.monotonic()
+            pending = yield _IoStep(self._reserve_command_slot, self._async_reserve_command_slot, (device.serial_number, params, trace))
+            if trace is not None:
+                trace.span("command.slot", slot_wait, attempt=attempt)
 
+            sent = time.monotonic()
             try:
-                self._transport.send_message(content)
+                # The driver runs the send in this generator's context, so the trace is active for it.
+                with CommandTracer.activate(trace):
+                    yield _IoStep(self._transport.send_message, self._transport.async_send_message, (content,))
             except Exception:  # pylint: disable=broad-except
-                self._release_command_slot()
+                self._release_command_slot(device.serial_number)
+                self.metrics.inc(METRIC_COMMANDS_FAILED)
+                if trace is not None:
+                    self.tracer.finish(trace, OUTCOME_FAILED)
                 raise
+            send_done = time.monotonic()
+            if trace is not None:
+                trace.span("ws.send", sent, send_done, attempt=attempt)
 
-            ack_received = self._wait_for_command_ack(device)
+            ack_received = yield _IoStep(self._wait_for_command_ack, self._async_wait_for_command_ack, (device, pending))
+            if trace is not None:
+                self._trace_ack(trace, pending, send_done, attempt)
             if ack_received:
-                return  # Success!
+                self.metrics.observe(METRIC_COMMAND_ACK_LATENCY, time.monotonic() - sent)
+                return True  # Success!
 
             # Timeout - will retry if attempts remain
+            self.metrics.inc(METRIC_COMMAND_ACK_TIMEOUTS)
             if attempt < _MAX_COMMAND_RETRIES:
+                self.metrics.inc(METRIC_COMMAND_RETRIES)
                 _LOGGER.warning("send_command: No ack for %s, will retry...", device.name)
 
+        self.metrics.inc(METRIC_COMMANDS_FAILED)
+        if trace is not None:
+            self.tracer.finish(trace, OUTCOME_NOT_ACKED)
         _LOGGER.warning("send_command: Failed after %d retries for %s", _MAX_COMMAND_RETRIES, device.name)
+        return False
+
+    def _record_command_sent(self, params: dict) -> None:
+        self.metrics.inc(METRIC_COMMANDS_SENT)
+        # Every CommandOutbox flush lands here, so this is the outbox batch size.
+        self.metrics.observe(METRIC_COMMAND_BATCH_KEYS, len(params))
 
-    def _reserve_command_slot(self, device_sn: str, params: dict) -> None:
-        """Wait until no other command is in-flight, then reserve slot."""
-        _LOGGER.debug("_reserve_command_slot: Waiting for slot, pending=%s", self._pending_command_device)
+    @staticmethod
+    def _trace_ack(trace: CommandTrace, pending: _PendingCommand, sent: float, attempt: int) -> None:
+        """Record the wait from the end of the send to the ack (or the ack timeout)."""
+        if pending.acked_at is None:
+            trace.span("ack", sent, attempt=attempt, timed_out=True)
+        else:
+            trace.span("ack", sent, pending.acked_at, attempt=attempt)
+
+    @staticmethod
+    def _command_content(device: PyDreoBaseDevice, params: dict, attempt: int) -> str:
+        """Serialize a control message for the WebSocket."""
+        full_params = {
+            "devicesn": device.serial_number,
+            "method": "control",
+            "params": params,
+            "timestamp": Helpers.api_timestamp(),
+        }
+        content = json.dumps(full_params)
+
+        if attempt > 0:
+            _LOGGER.info("send_command: Retry %d for %s: %s", attempt, device.name, params)
+        else:
+            _LOGGER.debug("send_command: %s", content)
+        return content
+
+    async def _async_reserve_command_slot(self, device_sn: str, params: dict, trace: CommandTrace | None = None) -> _PendingCommand:
+        """Async counterpart of ``_reserve_command_slot``."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._command_condition:
+                current = self._pending_commands.get(device_sn)
+                if current is None:
+                    pending = _PendingCommand(params=params, trace=trace)
+                    self._pending_commands[device_sn] = pending
+                    _LOGGER.debug("_async_reserve_command_slot: Acquired slot for %s with params %s", device_sn, params)
+                    return pending
+                released = loop.create_future()
+                current.listeners.append(_wake_future(loop, released))
+            _LOGGER.debug("_async_reserve_command_slot: Slot busy for %s, waiting...", device_sn)
+            await released
+
+    async def _async_wait_for_command_ack(self, device: PyDreoBaseDevice, pending: _PendingCommand) -> bool:
+        """Async counterpart of ``_wait_for_command_ack``."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _COMMAND_ACK_TIMEOUT
+        try:
+            while True:
+                with self._command_condition:
+                    if pending.ack_received:
+                        _LOGGER.debug("_async_wait_for_command_ack: Ack received for %s", device.name)
+                        return True
+                    woken = loop.create_future()
+                    pending.listeners.append(_wake_future(loop, woken))
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    _LOGGER.debug("_async_wait_for_command_ack: Timed out for %s", device.name)
+                    return False
+                try:
+                    await asyncio.wait_for(woken, remaining)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            # Always clear slot when done (success, timeout or cancellation)
+            with self._command_condition:
+                self._clear_pending_command_locked(device.serial_number)
+
+    def _reserve_command_slot(self, device_sn: str, params: dict, trace: CommandTrace | None = None) -> _PendingCommand:
+        """Wait until no other command is in-flight for this device, then reserve its slot."""
+        _LOGGER.debug("_reserve_command_slot: Waiting for slot for %s", device_sn)
         with self._command_condition:
-            while self._pending_command_device is not None:
-                _LOGGER.debug("_reserve_command_slot: Slot busy (pending=%s), waiting...", self._pending_command_device)
+            while device_sn in self._pending_commands:
+                _LOGGER.debug("_reserve_command_slot: Slot busy for %s, waiting...", device_sn)
                 self._command_condition.wait()
-            self._pending_command_device = device_sn
-            self._pending_command_params = params
-            self._ack_received = False
+            pending = _PendingCommand(params=params, trace=trace)
+            self._pending_commands[device_sn] = pending
             _LOGGER.debug("_reserve_command_slot: Acquired slot for %s with params %s", device_sn, params)
+            return pending
 
-    def _release_command_slot(self) -> None:
-        """Release command slot after error."""
+    def _release_command_slot(self, device_sn: str) -> None:
+        """Release a device's command slot after error."""
         with self._command_condition:
-            self._clear_pending_command_locked()
+            self._clear_pending_command_locked(device_sn)
 
-    def _wait_for_command_ack(self, device: PyDreoBaseDevice) -> bool:
+    def _wait_for_command_ack(self, device: PyDreoBaseDevice, pending: _PendingCommand) -> bool:
         """Wait for server acknowledgment or timeout. Returns True if ack received."""
         _LOGGER.debug("_wait_for_command_ack: Waiting for ack from %s", device.name)
         with self._command_condition:
             ack_received = self._command_condition.wait_for(
-                lambda: self._ack_received,  # Wait for OUR ack flag, not slot release
+                lambda: pending.ack_received,  # Wait for OUR ack flag, not slot release
                 timeout=_COMMAND_ACK_TIMEOUT,
             )
             if not ack_received:
@@ -653,7 +1588,7 @@ class PyDreo:  # pylint: disable=function-redefined
             else:
                 _LOGGER.debug("_wait_for_command_ack: Ack received for %s", device.name)
             # Always clear slot when done (success or timeout)
-            self._clear_pending_command_locked()
+            self._clear_pending_command_locked(device.serial_number)
             return ack_received
 
     def _handle_command_ack(self, device_sn: Optional[str], method: Optional[str], reported: Optional[dict]) -> None:
@@ -666,18 +1601,25 @@ class PyDreo:  # pylint: disable=function-redefined
         """
         if device_sn is None or method not in _ACK_METHOD_NAMES:
             return
-        _LOGGER.debug("_handle_command_ack: Got %s for %s, pending=%s, reported=%s", method, device_sn, self._pending_command_device, reported)
+        _LOGGER.debug("_handle_command_ack: Got %s for %s, reported=%s", method, device_sn, reported)
         with self._command_condition:
-            if self._pending_command_device != device_sn:
-                _LOGGER.debug("_handle_command_ack: Ignoring, pending device is %s", self._pending_command_device)
+            pending = self._pending_commands.get(device_sn)
+            if pending is None:
+                _LOGGER.debug("_handle_command_ack: Ignoring, no command pending for %s", device_sn)
                 return
             # Accept any control-reply/control-report for the correct device as an ACK.
             _LOGGER.debug("_handle_command_ack: Signaling ack for %s, reported=%s", device_sn, reported)
-            self._ack_received = True
+            pending.ack_received = True
+            if pending.trace is not None:
+                # Registered here, on the transport thread, so a report in this same frame or the next one is matched.
+                pending.acked_at = time.monotonic()
+                self.tracer.await_report(pending.trace, pending.acked_at)
+            pending.notify()
             self._command_condition.notify_all()
 
-    def _clear_pending_command_locked(self) -> None:
-        """Reset pending command (must hold condition lock)."""
-        self._pending_command_device = None
-        self._pending_command_params = None
+    def _clear_pending_command_locked(self, device_sn: str) -> None:
+        """Reset a device's pending command (must hold condition lock)."""
+        pending = self._pending_commands.pop(device_sn, None)
+        if pending is not None:
+            pending.notify()
         self._command_condition.notify_all()
@@ -13,17 +13,36 @@ host scheduler injected at construction (``PyDreo.schedule_call_later``, which
 under Home Assistant is ``async_call_later`` running the work in an executor
 job, and a daemon ``threading.Timer`` when running standalone). That keeps
 timer lifecycle with the host, so everything is cancelled on unload.
+
+``submit`` returns a ``concurrent.futures.Future`` shared by every caller whose
+keys ride in the same batch, so a caller can block on it (``result()``) or
+await it (``asyncio.wrap_future``) instead of sleeping and polling attributes.
+
+With an enabled ``CommandTracer`` each batch also carries a ``CommandTrace``
+(see tracing.py); the outbox records its own waits and makes the trace current
+while ``send`` runs.
 """
 
 import logging
 import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import Future
 from dataclasses import dataclass
 from typing import ClassVar
 
+from .tracing import OUTCOME_DROPPED, OUTCOME_FAILED, OUTCOME_NOT_ACKED, CommandTrace, CommandTracer
+
 _LOGGER = logging.getLogger(__name__)
 
+
+class CommandNotAckedError(Exception):
+    """The batch was sent, but the device never acknowledged it."""
+
+
+class CommandDroppedError(Exception):
+    """The batch was dropped before it was sent (outbox cancelled or finalize failed)."""
+
 # Lands the timer callback just past its deadline instead of a float hair before it.
 _TIMER_EPSILON = 0.005
 
@@ -75,7 +94,8 @@ class CommandOutbox:
       ``work`` may land on any thread, and ``cancel`` must be safe to call from
       another one.
 
-    * ``send(params)`` - the transport call. Invoked OUTSIDE the outbox lock:
+    * ``send(params) -> bool | None`` - the transport call, returning False if
+      the device never acknowledged the command. Invoked OUTSIDE the outbox lock:
       it may block for seconds (ack waits, transport retries), and holding the
       lock would stall every submitter behind it. A failed send is logged and
       the batch DROPPED, never re-queued - a zombie command firing long after
@@ -91,6 +111,14 @@ class CommandOutbox:
       before sending. An exception drops the batch.
     * ``on_sent()`` - after every send attempt, success or failure, outside
       the lock.
+    * ``tracer`` - optional ``CommandTracer``; ``serial_number`` identifies
+      the device to it.
+
+    Batch futures resolve to True once ``send`` returns anything but False,
+    and fail with ``CommandNotAckedError`` if it returns False, with the
+    transport's own exception if it raises, and with ``CommandDroppedError``
+    if the batch never reaches ``send``. They are resolved outside the lock,
+    after ``on_sent``, so a woken caller sees post-send state.
 
     ``on_submit`` and ``finalize`` share the lock so that by the time
     ``finalize`` reads device state, every key in the claimed batch has already
@@ -105,12 +133,14 @@ class CommandOutbox:
         self,
         name: str,
         timing: OutboxTiming,
-        send: Callable[[dict], None],
+        send: Callable[[dict], bool | None],
         schedule: Callable[[float, Callable[[], None]], Callable[[], None]],
         *,
         on_submit: Callable[[dict], None] | None = None,
         finalize: Callable[[dict], dict] | None = None,
         on_sent: Callable[[], None] | None = None,
+        tracer: CommandTracer | None = None,
+        serial_number: str | None = None,
     ) -> None:
         self._name = name
         self.timing = timing
@@ -119,9 +149,13 @@ class CommandOutbox:
         self._on_submit = on_submit
         self._finalize = finalize
         self._on_sent = on_sent
+        self._tracer = tracer
+        self._serial_number = serial_number
 
         self._lock = threading.Lock()
         self._pending: dict = {}
+        self._pending_future: Future | None = None
+        self._pending_trace: CommandTrace | None = None
         self._cancel_scheduled: Callable[[], None] | None = None
         self._disposed = False
         self._in_flight = False
@@ -129,17 +163,26 @@ class CommandOutbox:
         self._last_submit = 0.0
         self._last_send = float("-inf")
 
-    def submit(self, params: dict) -> None:
-        """Merge params into the pending batch and (re)schedule its flush."""
+    def submit(self, params: dict) -> Future:
+        """Merge params into the pending batch and (re)schedule its flush.
+
+        Returns the batch's future, shared with every other caller whose keys
+        land in the same batch. In immediate mode it is already resolved.
+        """
         if not params:
-            return
+            return _resolved(True)
         with self._lock:
             if self._disposed:
                 _LOGGER.debug("outbox %s: disposed; dropping %s", self._name, params)
-                return
+                return _failed(CommandDroppedError(f"outbox {self._name} is disposed"))
             now = time.monotonic()
             if not self._pending:
                 self._batch_started = now
+            if self._pending_future is None:
+                self._pending_future = Future()
+            future = self._pending_future
+            if self._tracer is not None:
+                self._trace_submit_locked(params, now)
             self._pending.update(params)
             self._last_submit = now
             if self._on_submit is not None:
@@ -150,6 +193,7 @@ class CommandOutbox:
                 self._arm(self._delay_until_ready(now))
         if flush_inline:
             self._flush()
+        return future
 
     def cancel(self) -> None:
         """Drop unsent keys and cancel any pending flush.
@@ -164,6 +208,12 @@ class CommandOutbox:
             if self._pending:
                 _LOGGER.debug("outbox %s: dropping unsent %s", self._name, self._pending)
                 self._pending = {}
+            future, self._pending_future = self._pending_future, None
+            trace, self._pending_trace = self._pending_trace, None
+        if trace is not None:
+            self._tracer.finish(trace, OUTCOME_DROPPED)
+        if future is not None:
+            future.set_exception(CommandDroppedError(f"outbox {self._name} cancelled"))
 
     @property
     def busy(self) -> bool:
@@ -182,6 +232,28 @@ class CommandOutbox:
         pace_remaining = timing.min_interval - (now - self._last_send)
         return max(min(quiet_remaining, max_wait_remaining), pace_remaining)
 
+    def _trace_submit_locked(self, params: dict, now: float) -> None:
+        """Start or extend the pending batch's trace. Caller must hold the lock."""
+        trace = self._pending_trace
+        if trace is None:
+            trace = self._pending_trace = self._tracer.start(self._serial_number, self._name, params, now)
+            if trace is None:
+                return
+        else:
+            trace.add_keys(params)
+        trace.event("submit", now, keys=sorted(params))
+
+    def _trace_claim_locked(self, trace: CommandTrace, now: float) -> None:
+        """Record the outbox waits of a claimed batch. Caller must hold the lock."""
+        timing = self.timing
+        if timing.is_immediate:
+            trace.span("outbox.collect", self._batch_started, now)
+            return
+        collect_ready = min(self._last_submit + timing.quiet_period, self._batch_started + timing.max_wait)
+        trace.span("outbox.collect", self._batch_started, min(collect_ready, now))
+        if now > collect_ready and self._last_send + timing.min_interval > collect_ready:
+            trace.span("outbox.pace", collect_ready, now)
+
     def _cancel_scheduled_locked(self) -> None:
         """Cancel the pending flush, if any. Caller must hold the lock."""
         if self._cancel_scheduled is None:
@@ -219,11 +291,13 @@ class CommandOutbox:
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("outbox %s: error flushing command batch", self._name)
 
-    def _claim_batch(self) -> dict | None:
+    def _claim_batch(self) -> tuple[dict, Future, CommandTrace | None] | None:
         """Claim the pending batch if it is ready to send.
 
-        Returns the finalized params, or None if there is nothing to do or a
-        timer was (re)armed for later. Timing is validated here rather than
+        Returns the finalized params, the batch's future and its trace, or None if there
+        is nothing to do or a timer was (re)armed for later. A batch that is
+        dropped or finalizes to nothing resolves its future here, after the
+        lock is released. Timing is validated here rather than
         trusted from the timer: ``Timer.cancel()`` cannot stop a callback that
         has already started, so a stale callback may fire moments after a
         fresh submit restarted the window.
@@ -231,40 +305,61 @@ class CommandOutbox:
         with self._lock:
             if not self._pending or self._in_flight:
                 return None
+            now = time.monotonic()
             if not self.timing.is_immediate:
-                delay = self._delay_until_ready(time.monotonic())
+                delay = self._delay_until_ready(now)
                 if delay > 0:
                     self._arm(delay)
                     return None
             snapshot = self._pending
             self._pending = {}
+            future, self._pending_future = self._pending_future, None
+            trace, self._pending_trace = self._pending_trace, None
+            if trace is not None:
+                self._trace_claim_locked(trace, now)
+            drop_error: Exception | None = None
             try:
                 params = dict(snapshot) if self._finalize is None else self._finalize(dict(snapshot))
                 # Fold derived keys (e.g. gate keys) into local state too.
                 derived = {key: value for key, value in params.items() if key not in snapshot}
                 if derived and self._on_submit is not None:
                     self._on_submit(derived)
-            except Exception:  # pylint: disable=broad-except
+            except Exception as ex:  # pylint: disable=broad-except
                 _LOGGER.exception("outbox %s: finalize failed; dropping batch %s", self._name, snapshot)
-                return None
-            if not params:
-                return None
-            self._in_flight = True
-            return params
+                params = {}
+                drop_error = CommandDroppedError(f"finalize failed: {ex}")
+            if params:
+                if trace is not None:
+                    trace.add_keys(params)
+                self._in_flight = True
+                return params, future, trace
+            if trace is not None:
+                self._tracer.finish(trace, OUTCOME_DROPPED)
+        # Resolved outside the lock: a done-callback may submit() to this outbox again.
+        if drop_error is not None:
+            future.set_exception(drop_error)
+        else:
+            future.set_result(True)
+        return None
 
     def _flush(self) -> None:
         """Send the ready batch; drain anything submitted during the send."""
         while True:
-            params = self._claim_batch()
-            if params is None:
+            claimed = self._claim_batch()
+            if claimed is None:
                 return
+            params, future, trace = claimed
             send_error: Exception | None = None
+            acked = None
             try:
                 _LOGGER.debug("outbox %s: sending batch %s", self._name, params)
-                self._send(params)
+                with CommandTracer.activate(trace):
+                    acked = self._send(params)
             except Exception as ex:  # pylint: disable=broad-except
                 _LOGGER.warning("outbox %s: send failed; dropping batch %s: %s", self._name, params, ex)
                 send_error = ex
+            if trace is not None and (send_error is not None or acked is False):
+                self._tracer.finish(trace, OUTCOME_FAILED if send_error is not None else OUTCOME_NOT_ACKED)
             drain_inline = False
             with self._lock:
                 self._last_send = time.monotonic()
@@ -281,6 +376,12 @@ class CommandOutbox:
                     self._on_sent()
                 except Exception:  # pylint: disable=broad-except
                     _LOGGER.exception("outbox %s: post-send hook failed", self._name)
+            if send_error is not None:
+                future.set_exception(send_error)
+            elif acked is False:
+                future.set_exception(CommandNotAckedError(f"no ack for {params}"))
+            else:
+                future.set_result(True)
             if send_error is not None and self.timing.is_immediate:
                 # Immediate mode still has the submitting caller on the stack, and
                 # that caller owns the error - device classes unwind their own
@@ -291,3 +392,15 @@ class CommandOutbox:
                 raise send_error
             if not drain_inline:
                 return
+
+
+def _resolved(value) -> Future:
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+def _failed(error: Exception) -> Future:
+    future = Future()
+    future.set_exception(error)
+    return future
@@ -15,20 +15,55 @@ import websockets
 
 from .constant import *  # pylint: disable=W0401,W0614
 from .helpers import Helpers
+from .metrics import (
+    METRIC_WS_CIRCUIT_OPENS,
+    METRIC_WS_CONNECT_FAILURES,
+    METRIC_WS_CONNECTED,
+    METRIC_WS_CONNECTS,
+    METRIC_WS_MESSAGES,
+    METRIC_WS_RECONNECTS,
+    METRIC_WS_SEND_FAILURES,
+    METRIC_WS_SEND_RETRIES,
+    MetricsRegistry,
+)
 from .models import *  # pylint: disable=W0401,W0614
+from .reconnectpolicy import RECONNECT_BACKOFF, SEND_BACKOFF, CircuitBreaker, CircuitState, ConnectionState
+from .tracing import CommandTrace, current_trace
 
 _LOGGER = logging.getLogger(__name__)
 
 WEBSOCKET_PING_INTERVAL = 15  # seconds between keepalive pings
 WEBSOCKET_PING_MESSAGE = "2"  # Dreo WebSocket keepalive message
-MAX_RETRY_COUNT = 3
-RETRY_DELAY = 5  # seconds between send retries
+MAX_RETRY_COUNT = 3  # send attempts while the socket is (re)connecting
+SEND_TIMEOUT = SEND_BACKOFF.max_total(MAX_RETRY_COUNT - 1) + 5  # overall bound on one send, retries included
+
+
+class TransportUnavailableError(RuntimeError):
+    """The reconnect circuit is open; the command was not sent."""
+
+
+def _raise_connect_errors(exc: Exception) -> Exception:
+    """``process_exception`` for ``websockets.connect``: treat every failure as fatal.
+
+    The library would otherwise retry connection errors itself on its own
+    schedule, hidden from the backoff policy and circuit breaker here.
+    """
+    return exc
 
 
 class CommandTransport:
-    """Command transport class for Dreo API."""
+    """Command transport class for Dreo API.
+
+    ``on_state_change(connection_state, circuit_state)``, if given, runs on the
+    transport thread whenever either changes.
+    """
 
-    def __init__(self, recv_callback: Callable[[dict], None]):
+    def __init__(
+        self,
+        recv_callback: Callable[[dict], None],
+        metrics: MetricsRegistry | None = None,
+        on_state_change: Callable[[ConnectionState, CircuitState], None] | None = None,
+    ):
 
         self._event_thread = None
         self._ws = None
@@ -43,6 +78,60 @@ class CommandTransport:
         self._token = None
         self._recv_callback = recv_callback
 
+        self._metrics = metrics if metrics is not None else MetricsRegistry()
+        self._messages_received = self._metrics.counter(METRIC_WS_MESSAGES)
+        self._connected_gauge = self._metrics.gauge(METRIC_WS_CONNECTED)
+
+        self.reconnect_backoff = RECONNECT_BACKOFF
+        self.send_backoff = SEND_BACKOFF
+        self._on_state_change = on_state_change
+        self._connection_state = ConnectionState.STOPPED
+        self._connected_event = None  # asyncio.Event, created on the WS event loop
+        self._breaker = CircuitBreaker(on_change=self._circuit_changed)
+
+    @property
+    def connection_state(self) -> ConnectionState:
+        """Where the connection loop is: connecting, connected, backing off or stopped."""
+        return self._connection_state
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        """Reconnect circuit breaker state."""
+        return self._breaker.state
+
+    @property
+    def available(self) -> bool:
+        """False while the circuit is open or half-open and commands fail fast."""
+        return self._breaker.allows_requests
+
+    def status(self) -> dict:
+        """Connection and circuit state for diagnostics."""
+        return {"connection": str(self._connection_state), "circuit": self._breaker.stats()}
+
+    def _set_connection_state(self, state: ConnectionState) -> None:
+        if state == self._connection_state:
+            return
+        self._connection_state = state
+        if self._connected_event is not None:
+            if state == ConnectionState.CONNECTED:
+                self._connected_event.set()
+            else:
+                self._connected_event.clear()
+        self._notify_state()
+
+    def _circuit_changed(self, state: CircuitState) -> None:
+        if state == CircuitState.OPEN:
+            self._metrics.inc(METRIC_WS_CIRCUIT_OPENS)
+        self._notify_state()
+
+    def _notify_state(self) -> None:
+        if self._on_state_change is None:
+            return
+        try:
+            self._on_state_change(self._connection_state, self._breaker.state)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("_notify_state: State change callback failed")
+
     @property
     def auto_reconnect(self) -> bool:
         """Return auto_reconnect option."""
@@ -50,9 +139,15 @@ class CommandTransport:
 
     @auto_reconnect.setter
     def auto_reconnect(self, value: bool) -> None:
-        """Set auto_reconnect option."""
+        """Set auto_reconnect option.
+
+        Turning it back on restarts a transport that stopped reconnecting.
+        """
         _LOGGER.debug("auto_reconnect.setter: Setting auto_reconnect to %s", value)
         self._auto_reconnect = value
+        if value and self._transport_enabled and not self._signal_close and self._event_thread is not None and not self._event_thread.is_alive():
+            _LOGGER.info("auto_reconnect.setter: Restarting the stopped transport")
+            self.start_transport(self._api_server_region, self._token)
 
     def start_transport(self, api_server_region: str, token: str) -> None:
         """Initialize the websocket and start monitoring"""
@@ -65,6 +160,7 @@ class CommandTransport:
         self._token = token
         self._transport_enabled = True
         self._signal_close = False
+        self._breaker.reset()
 
         def start_ws_wrapper():
             asyncio.run(self._start_websocket())
@@ -107,13 +203,16 @@ class CommandTransport:
         _LOGGER.info("_start_websocket: Starting WebSocket for incoming changes and commands.")
         self._loop = asyncio.get_running_loop()
         self._ws_send_lock = asyncio.Lock()
+        self._connected_event = asyncio.Event()
 
         try:
             while not self._signal_close:
                 # Rebuild URL each attempt so a refreshed token is always used
-                url = f"wss://wsb-{self._api_server_region}.dreo-tech.com/websocket?accessToken={self._token}&timestamp={Helpers.api_timestamp()}"
+                url = f"{DREO_WEBSOCKET_URL_FORMAT.format(self._api_server_region)}?accessToken={self._token}&timestamp={Helpers.api_timestamp()}"
+                self._set_connection_state(ConnectionState.CONNECTING)
+                self._breaker.attempt()
                 try:
-                    async for ws in websockets.connect(url):
+                    async for ws in websockets.connect(url, process_exception=_raise_connect_errors):
                         if self._signal_close:
                             _LOGGER.info("_start_websocket: Transport has been stopped")
                             break
@@ -121,9 +220,17 @@ class CommandTransport:
                         try:
                             self._ws = ws
                             _LOGGER.info("_start_websocket: WebSocket successfully opened")
+                            if self._metrics.value(METRIC_WS_CONNECTS):
+                                self._metrics.inc(METRIC_WS_RECONNECTS)
+                            self._metrics.inc(METRIC_WS_CONNECTS)
+                            self._connected_gauge.set(1)
+                            self._breaker.record_success()
+                            self._set_connection_state(ConnectionState.CONNECTED)
                             await self._ws_handler(ws)
                         except websockets.exceptions.ConnectionClosed:
                             pass
+                        finally:
+                            self._connected_gauge.set(0)
 
                         if not self._auto_reconnect:
                             _LOGGER.error("_start_websocket: WebSocket appears closed.  Not Reconnecting.  Restart HA to reconnect.")
@@ -135,14 +242,25 @@ class CommandTransport:
 
                 except Exception as ex:  # pylint: disable=broad-except
                     _LOGGER.error("_start_websocket: WebSocket connection failed: %s", ex)
+                    self._metrics.inc(METRIC_WS_CONNECT_FAILURES)
+                    self._breaker.record_failure()
                     if not self._auto_reconnect or self._signal_close:
                         break
-                    await asyncio.sleep(RETRY_DELAY)
+
+                if self._signal_close:
+                    break
+                # Jittered so clients dropped by the same outage do not reconnect in lockstep.
+                delay = self.reconnect_backoff.delay(self._breaker.failures)
+                _LOGGER.info("_start_websocket: Reconnecting in %.1f seconds (circuit %s)", delay, self._breaker.state)
+                self._set_connection_state(ConnectionState.BACKOFF)
+                await asyncio.sleep(delay)
 
         finally:
             # Always clear loop and ws references, even on unhandled BaseException
             self._loop = None
             self._ws = None
+            self._connected_event = None
+            self._set_connection_state(ConnectionState.STOPPED)
             _LOGGER.info("_start_websocket: Transport has been stopped and thread done")
 
     async def _ws_handler(self, ws):
@@ -169,6 +287,7 @@ class CommandTransport:
         try:
             async for message in ws:
                 _LOGGER.debug("_ws_consumer_handler: got message")
+                self._messages_received.inc()
                 try:
                     self._ws_consume_message(json.loads(message))
                 except json.JSONDecodeError as ex:
@@ -213,40 +332,105 @@ class CommandTransport:
 
     def send_message(self, content: dict):
         """Send a command to Dreo servers via the WebSocket."""
-        if not self._transport_enabled:
-            _LOGGER.error("send_message: Command transport disabled. Run start_transport first.")
-            raise RuntimeError("Command transport disabled. Run start_transport first.")
+        self._check_transport_enabled()
 
         if self._loop is None or self._loop.is_closed():
             # Transport thread may have died unexpectedly while transport is still "enabled".
             # Detect this and try to restart the thread automatically.
-            thread_dead = self._event_thread is not None and not self._event_thread.is_alive()
-            if thread_dead:
-                _LOGGER.warning("send_message: Transport thread has died unexpectedly. Restarting.")
-                self.start_transport(self._api_server_region, self._token)
+            if self._restart_dead_thread():
                 # Poll briefly for the event loop to be initialized by the new thread
                 deadline = time.monotonic() + 5.0
                 while (self._loop is None or self._loop.is_closed()) and time.monotonic() < deadline:
                     time.sleep(0.1)
 
-            if self._loop is None or self._loop.is_closed():
-                _LOGGER.error("send_message: WebSocket event loop not available.")
-                raise RuntimeError("WebSocket event loop not available.")
+            self._check_loop_available()
 
-        async def send_internal() -> None:
-            retry_count = 0
-            while retry_count < MAX_RETRY_COUNT:
-                try:
-                    if self._ws is None or getattr(self._ws, "closed", False):
-                        raise RuntimeError("WebSocket not connected")
-                    async with self._ws_send_lock:
-                        await self._ws.send(content)
-                    return
-                except Exception:  # pylint: disable=broad-except
-                    retry_count += 1
-                    _LOGGER.error("send_message: Error sending command. Retrying in %s seconds. Retry count: %s", RETRY_DELAY, retry_count)
-                    await asyncio.sleep(RETRY_DELAY)
-            raise RuntimeError(f"send_message: Failed to send command after {MAX_RETRY_COUNT} retries")
+        future = asyncio.run_coroutine_threadsafe(self._send_with_retries(content, current_trace()), self._loop)
+        future.result(timeout=SEND_TIMEOUT)
+
+    async def async_send_message(self, content: dict):
+        """Async counterpart of ``send_message``.
+
+        The send still runs on the transport's own loop; callers on another
+        loop await it through a wrapped future instead of parking a thread.
+        """
+        self._check_transport_enabled()
+
+        if self._loop is None or self._loop.is_closed():
+            if self._restart_dead_thread():
+                deadline = time.monotonic() + 5.0
+                while (self._loop is None or self._loop.is_closed()) and time.monotonic() < deadline:
+                    await asyncio.sleep(0.1)
+
+            self._check_loop_available()
+
+        trace = current_trace()
+        if asyncio.get_running_loop() is self._loop:
+            await asyncio.wait_for(self._send_with_retries(content, trace), SEND_TIMEOUT)
+            return
 
-        future = asyncio.run_coroutine_threadsafe(send_internal(), self._loop)
-        future.result(timeout=MAX_RETRY_COUNT * RETRY_DELAY + 5)
+        future = asyncio.run_coroutine_threadsafe(self._send_with_retries(content, trace), self._loop)
+        await asyncio.wait_for(asyncio.wrap_future(future), SEND_TIMEOUT)
+
+    def _check_transport_enabled(self) -> None:
+        if not self._transport_enabled:
+            _LOGGER.error("send_message: Command transport disabled. Run start_transport first.")
+            raise RuntimeError("Command transport disabled. Run start_transport first.")
+
+    def _check_loop_available(self) -> None:
+        if self._loop is None or self._loop.is_closed():
+            _LOGGER.error("send_message: WebSocket event loop not available.")
+            raise RuntimeError("WebSocket event loop not available.")
+
+    def _restart_dead_thread(self) -> bool:
+        """Restart the transport thread if it died while enabled. Returns True if restarted."""
+        thread_dead = self._event_thread is not None and not self._event_thread.is_alive()
+        if thread_dead:
+            _LOGGER.warning("send_message: Transport thread has died unexpectedly. Restarting.")
+            self.start_transport(self._api_server_region, self._token)
+        return thread_dead
+
+    async def _send_with_retries(self, content: dict, trace: CommandTrace | None = None) -> None:
+        """Send on the WebSocket, retrying while it is (re)connecting. Runs on the transport loop.
+
+        Fails fast with ``TransportUnavailableError`` while the reconnect circuit
+        is open. The caller's trace, if any, is passed in explicitly: this
+        coroutine runs in the transport loop's context, not the caller's.
+        """
+        retry_count = 0
+        while retry_count < MAX_RETRY_COUNT:
+            if not self._breaker.allows_requests:
+                self._metrics.inc(METRIC_WS_SEND_FAILURES)
+                raise TransportUnavailableError(f"send_message: WebSocket unavailable (circuit {self._breaker.state})")
+            try:
+                if self._ws is None or getattr(self._ws, "closed", False):
+                    raise RuntimeError("WebSocket not connected")
+                lock_wait = time.monotonic()
+                async with self._ws_send_lock:
+                    write_started = time.monotonic()
+                    await self._ws.send(content)
+                if trace is not None:
+                    trace.span("ws.lock", lock_wait, write_started, retry=retry_count)
+                    trace.span("ws.write", write_started, retry=retry_count)
+                return
+            except Exception:  # pylint: disable=broad-except
+                retry_count += 1
+                if retry_count >= MAX_RETRY_COUNT:
+                    break
+                self._metrics.inc(METRIC_WS_SEND_RETRIES)
+                delay = self.send_backoff.delay(retry_count - 1)
+                _LOGGER.error("send_message: Error sending command. Retrying in %.1f seconds. Retry count: %s", delay, retry_count)
+                await self._wait_for_connection(delay)
+        self._metrics.inc(METRIC_WS_SEND_FAILURES)
+        raise RuntimeError(f"send_message: Failed to send command after {MAX_RETRY_COUNT} retries")
+
+    async def _wait_for_connection(self, delay: float) -> None:
+        """Wait delay seconds before a send retry, ending early once a (re)connect completes."""
+        event = self._connected_event
+        if event is None or self._connection_state == ConnectionState.CONNECTED:
+            await asyncio.sleep(delay)
+            return
+        try:
+            await asyncio.wait_for(event.wait(), delay)
+        except asyncio.TimeoutError:
+            pass
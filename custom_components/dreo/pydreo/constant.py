@@ -97,8 +97,36 @@ RGBPRESETSEL_KEY = "rgbpresetsel"
 RGBPRESETNUM_KEY = "rgbpresetnum"
 RGBEFFECTID_KEY = "rgbeffectid"
 
+# Humidifiers, Evaporative Coolers and Dehumidifiers.
+# The HA platforms read these too, so they live here instead of in the device
+# modules: importing a platform must not load every device class.
+WATER_LEVEL_STATUS_KEY = "wrong"
+WATER_LEVEL_KEY = "water_level"
+FILTERTIME_KEY = "filtertime"
+FILTERON_KEY = "filteron"
+SUSPEND_KEY = "suspend"
+# Status for water level indicator
+WATER_LEVEL_OK = "ok"
+WATER_LEVEL_EMPTY = "empty"
+# The Dreo API uses "wrong" as an error code field.
+# Known values: 0 = OK (no error), 1 = water level empty.
+# There may be additional error codes, but their meanings are not yet known.
+ERROR_CODE_KEY = "wrong"
+# Human-readable labels for known error code values
+ERROR_CODE_OK = "ok"
+ERROR_CODE_WATER_EMPTY = "empty"
+
+# Chef Maker modes
+MODE_STANDBY = "standby"
+MODE_CONFIGURING = "ckcfm"  # Transient "configuring" mode reported before a cook starts (see #868).
+MODE_COOKING = "cooking"
+MODE_PAUSED = "ckpause"
+MODE_COMPLETE = "ckcomplete"
+MODE_OFF = "off"
+
 
 DREO_API_URL_FORMAT = "https://app-api-{0}.dreo-tech.com"  # {0} is the 2 letter region code
+DREO_WEBSOCKET_URL_FORMAT = "wss://wsb-{0}.dreo-tech.com/websocket"  # {0} is the 2 letter region code
 
 DREO_API_PATH = "path"
 DREO_API_METHOD = "method"
@@ -4,9 +4,14 @@ import hashlib
 import logging
 import time
 import json
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:
+    import aiohttp
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -105,6 +110,29 @@ class Helpers:
             )
         return stringvalue
 
+    @staticmethod
+    def build_session(pool_size: int, retries: Union[int, Retry]) -> requests.Session:
+        """Build a keep-alive HTTP session with a bounded connection pool.
+
+        An int ``retries`` retries connection failures and gateway errors on
+        idempotent GETs with a short backoff; pass a urllib3 ``Retry`` for full
+        control over the policy.
+        """
+        if not isinstance(retries, Retry):
+            retries = Retry(
+                total=retries,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+                raise_on_status=False,
+            )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retries)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
     @staticmethod
     def call_api(
         url: str,
@@ -112,8 +140,14 @@ class Helpers:
         method: str,
         json_object: Optional[dict] = None,
         headers: Optional[dict] = None,
+        session: Optional[requests.Session] = None,
     ) -> tuple:
-        """Make API calls by passing endpoint, header and body."""
+        """Make API calls by passing endpoint, header and body.
+
+        Uses ``session`` (and its pooled keep-alive connections) when given,
+        otherwise a one-off connection per call.
+        """
+        http = session if session is not None else requests
         response = None
         status_code = None
         r = None  # Response object
@@ -124,14 +158,14 @@ class Helpers:
             _LOGGER.debug("call_api: API call headers: \n  %s", Helpers.redactor(json.dumps(headers)))
             _LOGGER.debug("call_api: API call json: \n  %s", Helpers.redactor(json.dumps(json_object)))
             if method.lower() == "get":
-                r = requests.get(
+                r = http.get(
                     url + api,
                     headers=headers,
                     params={**json_object, "timestamp": Helpers.api_timestamp()},
                     timeout=API_TIMEOUT,
                 )
             elif method.lower() == "post":
-                r = requests.post(
+                r = http.post(
                     url + api,
                     json=json_object,
                     headers=headers,
@@ -139,7 +173,7 @@ class Helpers:
                     timeout=API_TIMEOUT,
                 )
             elif method.lower() == "put":
-                r = requests.put(url + api, json=json_object, headers=headers, timeout=API_TIMEOUT)
+                r = http.put(url + api, json=json_object, headers=headers, timeout=API_TIMEOUT)
         except requests.exceptions.RequestException as exception:
             _LOGGER.error("call_api: Request failed - %s", exception)
         else:
@@ -155,6 +189,54 @@ class Helpers:
                 _LOGGER.error("call_api: API request failed with status code %s for %s%s", r.status_code, url, api)
         return response, status_code
 
+    @staticmethod
+    async def async_call_api(
+        url: str,
+        api: str,
+        method: str,
+        json_object: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        session: "aiohttp.ClientSession" = None,
+    ) -> tuple:
+        """Async counterpart of ``call_api`` on a caller-owned aiohttp session.
+
+        Returns ``(response, status_code)`` with the same semantics.
+        """
+        import aiohttp  # pylint: disable=import-outside-toplevel
+
+        response = None
+        status_code = None
+        if json_object is None:
+            json_object = {}
+        _LOGGER.debug("async_call_api: [%s] calling '%s' api", method, api)
+        _LOGGER.debug("async_call_api: API call URL: \n  %s%s", url, api)
+        _LOGGER.debug("async_call_api: API call json: \n  %s", Helpers.redactor(json.dumps(json_object)))
+
+        if method.lower() == "get":
+            kwargs = {"params": {**json_object, "timestamp": Helpers.api_timestamp()}}
+        elif method.lower() == "post":
+            kwargs = {"json": json_object, "params": {"timestamp": Helpers.api_timestamp()}}
+        elif method.lower() == "put":
+            kwargs = {"json": json_object}
+        else:
+            return response, status_code
+
+        try:
+            async with session.request(
+                method.upper(), url + api, headers=headers, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT), **kwargs
+            ) as r:
+                if r.status == 200:
+                    status_code = 200
+                    content = await r.read()
+                    if content:
+                        response = json.loads(content)
+                        _LOGGER.debug("async_call_api: API response: \n\n  %s \n ", Helpers.redactor(json.dumps(response)))
+                else:
+                    _LOGGER.error("async_call_api: API request failed with status code %s for %s%s", r.status, url, api)
+        except (aiohttp.ClientError, TimeoutError, ValueError) as exception:
+            _LOGGER.error("async_call_api: Request failed - %s", exception)
+        return response, status_code
+
     @staticmethod
     def code_check(response_dict: dict) -> bool:
         """Test if code == 0 for successful API call."""
@@ -0,0 +1,212 @@
+"""In-process transport metrics for the Dreo client.
+
+Each ``PyDreo`` owns a ``MetricsRegistry`` of counters, gauges and
+fixed-bucket histograms. Recording is an integer update under an
+uncontended lock (plus a ``bisect`` for histograms), cheap enough for the
+WebSocket and command hot paths. ``snapshot`` returns plain dicts for
+diagnostics and the optional Home Assistant metric sensors.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+# Upper bounds (seconds) of the latency histogram buckets; anything slower lands in +Inf.
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Upper bounds of the command batch size histogram (keys per command).
+BATCH_SIZE_BUCKETS = (1, 2, 3, 4, 6, 8, 12, 16)
+
+# WebSocket transport
+METRIC_WS_CONNECTS = "ws_connects"
+METRIC_WS_RECONNECTS = "ws_reconnects"
+METRIC_WS_CONNECT_FAILURES = "ws_connect_failures"
+METRIC_WS_MESSAGES = "ws_messages_received"
+METRIC_WS_SEND_RETRIES = "ws_send_retries"
+METRIC_WS_SEND_FAILURES = "ws_send_failures"
+METRIC_WS_CONNECTED = "ws_connected"
+METRIC_WS_CIRCUIT_OPENS = "ws_circuit_opens"
+
+# Commands (PyDreo.send_command / async_send_command)
+METRIC_COMMANDS_SENT = "commands_sent"
+METRIC_COMMAND_RETRIES = "command_retries"
+METRIC_COMMAND_ACK_TIMEOUTS = "command_ack_timeouts"
+METRIC_COMMANDS_FAILED = "commands_failed"
+METRIC_COMMAND_ACK_LATENCY = "command_ack_latency"
+METRIC_COMMAND_BATCH_KEYS = "command_batch_keys"
+
+# REST (PyDreo.call_dreo_api / async_call_dreo_api)
+METRIC_REST_CALLS = "rest_calls"
+METRIC_REST_ERRORS = "rest_errors"
+METRIC_REST_LATENCY = "rest_latency"
+
+# Report dispatch
+METRIC_REPORT_QUEUE_DEPTH = "report_queue_depth"
+
+
+class Counter:
+    """Monotonic count."""
+
+    __slots__ = ("_lock", "_value")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        """Add amount to the count."""
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        """Current count."""
+        return self._value
+
+
+class Gauge:
+    """Point-in-time value, either set explicitly or read from ``fn`` on demand."""
+
+    __slots__ = ("_value", "_fn")
+
+    def __init__(self, fn: Callable[[], float] | None = None) -> None:
+        self._value: float = 0
+        self._fn = fn
+
+    def set(self, value: float) -> None:
+        """Set the current value."""
+        self._value = value
+
+    @property
+    def value(self) -> float:
+        """Current value."""
+        return self._fn() if self._fn is not None else self._value
+
+
+class Histogram:
+    """Counts of observations per fixed bucket, with their count and sum."""
+
+    __slots__ = ("_lock", "buckets", "_counts", "_count", "_sum", "_max")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self._lock = threading.Lock()
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            if value > self._max:
+                self._max = value
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return self._count
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding quantile q (the max for +Inf), or None if empty."""
+        with self._lock:
+            counts, total, maximum = list(self._counts), self._count, self._max
+        if total == 0:
+            return None
+        rank = q * total
+        seen = 0
+        for index, count in enumerate(counts):
+            seen += count
+            if seen >= rank and count:
+                return self.buckets[index] if index < len(self.buckets) else maximum
+        return maximum
+
+    def snapshot(self) -> dict:
+        """Bucket counts keyed by upper bound, with count, sum, mean, max and p50/p95 estimates."""
+        with self._lock:
+            counts, total, total_sum, maximum = list(self._counts), self._count, self._sum, self._max
+        buckets = {str(bound): count for bound, count in zip(self.buckets, counts)}
+        buckets["+Inf"] = counts[-1]
+        return {
+            "count": total,
+            "sum": round(total_sum, 6),
+            "mean": round(total_sum / total, 6) if total else None,
+            "max": round(maximum, 6) if total else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "buckets": buckets,
+        }
+
+
+class MetricsRegistry:
+    """Named counters, gauges and histograms. Getters create the metric on first use."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, Counter] = {}
+        self._gauges: dict[str, Gauge] = {}
+        self._histograms: dict[str, Histogram] = {}
+
+    def counter(self, name: str) -> Counter:
+        """The counter called name."""
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(name, Counter())
+        return counter
+
+    def gauge(self, name: str, fn: Callable[[], float] | None = None) -> Gauge:
+        """The gauge called name; fn (on first use) makes it read its value live."""
+        gauge = self._gauges.get(name)
+        if gauge is None:
+            with self._lock:
+                gauge = self._gauges.setdefault(name, Gauge(fn))
+        return gauge
+
+    def histogram(self, name: str, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        """The histogram called name; buckets apply on first use."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, Histogram(buckets))
+        return histogram
+
+    def inc(self, name: str, amount: int = 1) -> None:
+        """Increment the counter called name."""
+        self.counter(name).inc(amount)
+
+    def observe(self, name: str, value: float) -> None:
+        """Record value in the histogram called name."""
+        self.histogram(name).observe(value)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Record the wall time of the with-block, in seconds, in the histogram called name."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.histogram(name).observe(time.perf_counter() - started)
+
+    def value(self, name: str) -> float | None:
+        """Current value of the counter or gauge called name, or None if there is none."""
+        if name in self._counters:
+            return self._counters[name].value
+        if name in self._gauges:
+            return self._gauges[name].value
+        return None
+
+    def snapshot(self) -> dict:
+        """Every metric's current value, for diagnostics."""
+        with self._lock:
+            counters, gauges, histograms = dict(self._counters), dict(self._gauges), dict(self._histograms)
+        return {
+            "counters": {name: counter.value for name, counter in sorted(counters.items())},
+            "gauges": {name: gauge.value for name, gauge in sorted(gauges.items())},
+            "histograms": {name: histogram.snapshot() for name, histogram in sorted(histograms.items())},
+        }
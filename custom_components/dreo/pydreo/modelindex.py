@@ -0,0 +1,69 @@
+"""Model number to device definition lookup.
+
+``_resolve_device_class`` used to scan ``SUPPORTED_MODEL_PREFIXES`` for every
+device, taking the first prefix in set iteration order, and then look the
+model and the prefix up separately. ``ModelIndex`` is built once at import and
+resolves a model in one call: the exact model if it is defined, else the
+longest declared prefix it starts with, else nothing. Prefixes are kept in a
+table keyed by length and probed longest first, so a lookup costs one dict
+probe per distinct prefix length. Results are memoized.
+
+Only the declared family prefixes (``SUPPORTED_MODEL_PREFIXES``) match by
+prefix. A full model number is never used as a prefix: DR-HSH011 and
+DR-HSH011S are different products.
+"""
+
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+from .models import SUPPORTED_DEVICES, SUPPORTED_MODEL_PREFIXES, DreoDeviceDetails
+
+DEFAULT_MODEL_CACHE_SIZE = 512
+
+
+class ModelMatch(NamedTuple):
+    """A resolved model: the ``SUPPORTED_DEVICES`` key that matched and its definition."""
+
+    key: str
+    details: DreoDeviceDetails
+    exact: bool
+
+
+class ModelIndex:
+    """Resolves model numbers: exact model, then longest declared prefix, then ``None``."""
+
+    def __init__(self, devices: Mapping[str, DreoDeviceDetails], prefixes: Iterable[str], cache_size: int = DEFAULT_MODEL_CACHE_SIZE) -> None:
+        self._devices = dict(devices)
+        # Prefixes without a definition can never resolve, so they are left out.
+        by_length: dict[int, set[str]] = {}
+        for prefix in prefixes:
+            if prefix and prefix in self._devices:
+                by_length.setdefault(len(prefix), set()).add(prefix)
+        self._prefixes = tuple((length, frozenset(by_length[length])) for length in sorted(by_length, reverse=True))
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def _resolve(self, model: Optional[str]) -> Optional[ModelMatch]:
+        """Resolve a model number. Use ``resolve``, which is memoized."""
+        if not model:
+            return None
+        details = self._devices.get(model)
+        if details is not None:
+            return ModelMatch(model, details, True)
+        for length, prefixes in self._prefixes:
+            prefix = model[:length]
+            if prefix in prefixes:
+                return ModelMatch(prefix, self._devices[prefix], False)
+        return None
+
+    @property
+    def prefixes(self) -> list[str]:
+        """The prefixes that match, longest first."""
+        return [prefix for _, prefixes in self._prefixes for prefix in sorted(prefixes)]
+
+    def cache_info(self):
+        """Memo hit/miss counters."""
+        return self.resolve.cache_info()
+
+
+MODEL_INDEX = ModelIndex(SUPPORTED_DEVICES, SUPPORTED_MODEL_PREFIXES)
@@ -34,6 +34,7 @@ from .constant import (
 from .commandoutbox import OutboxTiming
 from .helpers import Helpers
 from .pydreofanbase import PyDreoFanBase
+from .pydreobasedevice import ReportField
 from .models import DreoDeviceDetails
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,6 +73,27 @@ class PyDreoAirCirculator(PyDreoFanBase):
     # outbox. See commandoutbox.OutboxTiming.
     _COMMAND_TIMING = OutboxTiming.IMMEDIATE
 
+    _REPORT_SCHEMA = {
+        HORIZONTAL_OSCILLATION_KEY: ReportField("_horizontally_oscillating", bool),
+        VERTICAL_OSCILLATION_KEY: ReportField("_vertically_oscillating", bool),
+        OSCMODE_KEY: ReportField("_osc_mode", int),
+        CRUISECONF_KEY: ReportField("_cruise_conf", str),
+        FIXEDCONF_KEY: ReportField(types=str, handler="_handle_fixed_conf_report"),
+        HORIZONTAL_OSCILLATION_ANGLE_KEY: ReportField("_horizontal_oscillation_angle", int),
+        VERTICAL_OSCILLATION_ANGLE_KEY: ReportField("_vertical_oscillation_angle", int),
+        HORIZONTAL_ANGLE_ADJ_KEY: ReportField("_horizontal_angle_adj", int),
+        ATMON_KEY: ReportField("_atm_light_on", bool),
+        ATMBRI_KEY: ReportField("_atm_brightness", int),
+        ATMCOLOR_KEY: ReportField("_atm_color", int),
+        ATMMODE_KEY: ReportField("_atm_mode", int),
+        LIGHTON_KEY: ReportField("_display_light", bool),
+        HWFPON_KEY: ReportField("_follow_me", bool),
+        HWFPANGLE_KEY: ReportField("_follow_me_angle", int),
+        HBODYCNT_KEY: ReportField("_people_detected", int),
+    }
+    # No merge barriers: queued fixedconf reports are intermediate encoder
+    # positions of one move, and reject detection only needs the last one.
+
     @staticmethod
     def _clamp_rgb_tuple(rgb: tuple) -> tuple[int, int, int]:
         """Clamp RGB tuple values to 0-255 integers."""
@@ -1172,101 +1194,36 @@ class PyDreoAirCirculator(PyDreoFanBase):
         self._follow_me_angle = self.get_state_update_value(state, HWFPANGLE_KEY)
         self._people_detected = self.get_state_update_value(state, HBODYCNT_KEY)
 
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("handle_server_update: handle_server_update")
-        super().handle_server_update(message)
-
-        val_horiz_oscillation = self.get_server_update_key_value(message, HORIZONTAL_OSCILLATION_KEY)
-        if isinstance(val_horiz_oscillation, bool):
-            self._horizontally_oscillating = val_horiz_oscillation
-
-        val_vert_oscillation = self.get_server_update_key_value(message, VERTICAL_OSCILLATION_KEY)
-        if isinstance(val_vert_oscillation, bool):
-            self._vertically_oscillating = val_vert_oscillation
-
-        val_osc_mode = self.get_server_update_key_value(message, OSCMODE_KEY)
-        if isinstance(val_osc_mode, int):
-            self._osc_mode = val_osc_mode
-
-        val_cruiseconf = self.get_server_update_key_value(message, CRUISECONF_KEY)
-        if isinstance(val_cruiseconf, str):
-            self._cruise_conf = val_cruiseconf
-
-        val_fixed_conf = self.get_server_update_key_value(message, FIXEDCONF_KEY)
-        if isinstance(val_fixed_conf, str):
-            method = message.get("method")
-            # control-reply may echo the requested value before the motor moves.
-            # control-report and report carry authoritative encoder positions.
-            if method in _FIXEDCONF_OPTIMISTIC_METHODS:
-                _LOGGER.debug(
-                    "fixedconf: Ignoring optimistic %s value %s (waiting for device report)",
-                    method,
-                    val_fixed_conf,
-                )
-            else:
-                # Centralize UI refresh: confirm/reject clear commanded via
-                # _maybe_log_fixed_conf_reject; pending clear when report matches queue.
-                notify_settle = False
-                with self._fixed_conf_lock:
-                    previous = self._fixed_conf
-                    self._fixed_conf = val_fixed_conf
-                    self._add_angle_preset_option(self._fixed_conf)
-                    if self._maybe_log_fixed_conf_reject(
-                        self._normalize_fixed_conf(val_fixed_conf), previous
-                    ):
-                        notify_settle = True
-                    # If the device already reports the delayed target, drop the timer.
-                    if (
-                        self._pending_fixed_conf is not None
-                        and self._normalize_fixed_conf(val_fixed_conf) == self._pending_fixed_conf
-                    ):
-                        self._pending_fixed_conf = None
-                        self._cancel_fixed_conf_timer_locked()
-                        notify_settle = True
-                if notify_settle:
-                    self._notify_fixed_conf_ui()
-
-        val_horiz_osc_angle = self.get_server_update_key_value(message, HORIZONTAL_OSCILLATION_ANGLE_KEY)
-        if isinstance(val_horiz_osc_angle, int):
-            self._horizontal_oscillation_angle = val_horiz_osc_angle
-
-        val_vert_osc_angle = self.get_server_update_key_value(message, VERTICAL_OSCILLATION_ANGLE_KEY)
-        if isinstance(val_vert_osc_angle, int):
-            self._vertical_oscillation_angle = val_vert_osc_angle
-
-        val_horiz_angle_adj = self.get_server_update_key_value(message, HORIZONTAL_ANGLE_ADJ_KEY)
-        if isinstance(val_horiz_angle_adj, int):
-            self._horizontal_angle_adj = val_horiz_angle_adj
-
-        val_atm_on = self.get_server_update_key_value(message, ATMON_KEY)
-        if isinstance(val_atm_on, bool):
-            self._atm_light_on = val_atm_on
-
-        val_atm_brightness = self.get_server_update_key_value(message, ATMBRI_KEY)
-        if isinstance(val_atm_brightness, int):
-            self._atm_brightness = val_atm_brightness
-
-        val_atm_color = self.get_server_update_key_value(message, ATMCOLOR_KEY)
-        if isinstance(val_atm_color, int):
-            self._atm_color = val_atm_color
-
-        val_atm_mode = self.get_server_update_key_value(message, ATMMODE_KEY)
-        if isinstance(val_atm_mode, int):
-            self._atm_mode = val_atm_mode
-
-        val_display_light = self.get_server_update_key_value(message, LIGHTON_KEY)
-        if isinstance(val_display_light, bool):
-            self._display_light = val_display_light
-
-        val_follow_me = self.get_server_update_key_value(message, HWFPON_KEY)
-        if isinstance(val_follow_me, bool):
-            self._follow_me = val_follow_me
-
-        val_follow_me_angle = self.get_server_update_key_value(message, HWFPANGLE_KEY)
-        if isinstance(val_follow_me_angle, int):
-            self._follow_me_angle = val_follow_me_angle
-
-        val_people_detected = self.get_server_update_key_value(message, HBODYCNT_KEY)
-        if isinstance(val_people_detected, int):
-            self._people_detected = val_people_detected
+    def _handle_fixed_conf_report(self, val_fixed_conf: str, message: dict) -> None:
+        """Apply a reported fixedconf (fixed fan angle)."""
+        method = message.get("method")
+        # control-reply may echo the requested value before the motor moves.
+        # control-report and report carry authoritative encoder positions.
+        if method in _FIXEDCONF_OPTIMISTIC_METHODS:
+            _LOGGER.debug(
+                "fixedconf: Ignoring optimistic %s value %s (waiting for device report)",
+                method,
+                val_fixed_conf,
+            )
+            return
+        # Centralize UI refresh: confirm/reject clear commanded via
+        # _maybe_log_fixed_conf_reject; pending clear when report matches queue.
+        notify_settle = False
+        with self._fixed_conf_lock:
+            previous = self._fixed_conf
+            self._fixed_conf = val_fixed_conf
+            self._add_angle_preset_option(self._fixed_conf)
+            if self._maybe_log_fixed_conf_reject(
+                self._normalize_fixed_conf(val_fixed_conf), previous
+            ):
+                notify_settle = True
+            # If the device already reports the delayed target, drop the timer.
+            if (
+                self._pending_fixed_conf is not None
+                and self._normalize_fixed_conf(val_fixed_conf) == self._pending_fixed_conf
+            ):
+                self._pending_fixed_conf = None
+                self._cancel_fixed_conf_timer_locked()
+                notify_settle = True
+        if notify_settle:
+            self._notify_fixed_conf_ui()
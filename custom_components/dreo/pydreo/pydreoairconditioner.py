@@ -1,6 +1,7 @@
 """Dreo API for controlling air conditioners."""
 
 import logging
+import operator
 from enum import IntEnum
 from typing import TYPE_CHECKING, Dict
 
@@ -32,7 +33,7 @@ from .constant import (
     DreoACFanMode,
 )
 
-from .pydreobasedevice import PyDreoBaseDevice
+from .pydreobasedevice import PyDreoBaseDevice, ReportField
 from .models import DreoACDeviceDetails, DreoDeviceDetails
 
 AC_OSC_ON = 2
@@ -67,6 +68,30 @@ if TYPE_CHECKING:
 class PyDreoAC(PyDreoBaseDevice):
     """Base class for Dreo air conditioner API Calls."""
 
+    _REPORT_SCHEMA = {
+        POWERON_KEY: ReportField("_is_on", bool),
+        TEMPERATURE_KEY: ReportField("_temperature", int),
+        TARGET_TEMPERATURE_KEY: ReportField("_target_temperature", int),
+        HUMIDITY_KEY: ReportField("_humidity", int),
+        TARGET_HUMIDITY_KEY: ReportField("_target_humidity", int),
+        MODE_KEY: ReportField("_mode", int),
+        WINDLEVEL_KEY: ReportField("_fan_mode", int),
+        OSCMODE_KEY: ReportField("_osc_mode", int),
+        MUTEON_KEY: ReportField("_mute_on", bool),
+        DEVON_KEY: ReportField("_dev_on", bool),
+        TIMERON_KEY: ReportField("_timer_on", int),
+        COOLDOWN_KEY: ReportField("_cooldown", int),
+        PTCON_KEY: ReportField("_ptc_on", bool),
+        LIGHTON_KEY: ReportField("_display_auto_off", bool, convert=operator.not_),
+        CTLSTATUS_KEY: ReportField("_ctlstatus", str),
+        TIMEROFF_KEY: ReportField("_timer_off", int),
+        CHILDLOCKON_KEY: ReportField("_childlockon", bool),
+        TEMPOFFSET_KEY: ReportField("_tempoffset", int),
+        FIXEDCONF_KEY: ReportField("_fixed_conf", str),
+        WORKTIME_KEY: ReportField("work_time", int),
+        TEMP_TARGET_REACHED_KEY: ReportField("temp_target_reached", int, convert=lambda reached: "yes" if reached > 0 else "no"),
+    }
+
     def __init__(self, device_definition: DreoACDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize air conditioner devices."""
         super().__init__(device_definition, details, dreo)
@@ -402,100 +427,6 @@ class PyDreoAC(PyDreoBaseDevice):
         self.temp_target_reached = "yes" if temp_target_val is not None and temp_target_val > 0 else "no"
         # TODO ecopauserate
 
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("handle_server_update: handle_server_update(%s): %s", self.name, message)
-
-        val_poweron = self.get_server_update_key_value(message, POWERON_KEY)
-        if isinstance(val_poweron, bool):
-            self._is_on = val_poweron  # Ensure poweron state is updated
-            _LOGGER.debug("handle_server_update: poweron is %s", self._is_on)
-
-        val_temperature = self.get_server_update_key_value(message, TEMPERATURE_KEY)
-        if isinstance(val_temperature, int):
-            self._temperature = val_temperature
-
-        val_target_temperature = self.get_server_update_key_value(message, TARGET_TEMPERATURE_KEY)
-        if isinstance(val_target_temperature, int):
-            _LOGGER.debug("handle_server_update: %s - target_temperature: %s --> %s", self, self._target_temperature, val_target_temperature)
-            self._target_temperature = val_target_temperature
-
-        val_humidity = self.get_server_update_key_value(message, HUMIDITY_KEY)
-        if isinstance(val_humidity, int):
-            self._humidity = val_humidity
-
-        val_target_humidity = self.get_server_update_key_value(message, TARGET_HUMIDITY_KEY)
-        if isinstance(val_target_humidity, int):
-            self._target_humidity = val_target_humidity
-
-        # Reported mode can be an empty string if the AC is off. Deal with that by
-        # explicitly setting that to off.
-        val_mode = self.get_server_update_key_value(message, MODE_KEY)
-        if isinstance(val_mode, int):
-            _LOGGER.debug("handle_server_update: %s - mode: %s --> %s", self, self._mode, val_mode)
-            self._mode = val_mode
-
-        val_fan_mode = self.get_server_update_key_value(message, WINDLEVEL_KEY)
-        if isinstance(val_fan_mode, int):
-            _LOGGER.debug("handle_server_update: %s - fan_mode: %s --> %s", self, self._fan_mode, val_fan_mode)
-            self._fan_mode = val_fan_mode
-
-        val_osc_mode = self.get_server_update_key_value(message, OSCMODE_KEY)
-        if isinstance(val_osc_mode, int):
-            self._osc_mode = val_osc_mode
-
-        val_muteon = self.get_server_update_key_value(message, MUTEON_KEY)
-        if isinstance(val_muteon, bool):
-            self._mute_on = val_muteon
-
-        val_devon = self.get_server_update_key_value(message, DEVON_KEY)
-        if isinstance(val_devon, bool):
-            self._dev_on = val_devon
-
-        val_timeron = self.get_server_update_key_value(message, TIMERON_KEY)
-        if isinstance(val_timeron, int):
-            self._timer_on = val_timeron
-
-        val_cooldown = self.get_server_update_key_value(message, COOLDOWN_KEY)
-        if isinstance(val_cooldown, int):
-            self._cooldown = val_cooldown
-
-        val_ptc_on = self.get_server_update_key_value(message, PTCON_KEY)
-        if isinstance(val_ptc_on, bool):
-            self._ptc_on = val_ptc_on
-
-        val_lighton = self.get_server_update_key_value(message, LIGHTON_KEY)
-        if isinstance(val_lighton, bool):
-            self._display_auto_off = not val_lighton
-
-        val_ctlstatus = self.get_server_update_key_value(message, CTLSTATUS_KEY)
-        if isinstance(val_ctlstatus, str):
-            self._ctlstatus = val_ctlstatus
-
-        val_timer_off = self.get_server_update_key_value(message, TIMEROFF_KEY)
-        if isinstance(val_timer_off, int):
-            self._timer_off = val_timer_off
-
-        val_childlockon = self.get_server_update_key_value(message, CHILDLOCKON_KEY)
-        if isinstance(val_childlockon, bool):
-            self._childlockon = val_childlockon
-
-        val_tempoffset = self.get_server_update_key_value(message, TEMPOFFSET_KEY)
-        if isinstance(val_tempoffset, int):
-            self._tempoffset = val_tempoffset
-
-        val_fixed_conf = self.get_server_update_key_value(message, FIXEDCONF_KEY)
-        if isinstance(val_fixed_conf, str):
-            self._fixed_conf = val_fixed_conf
-
-        val_work_time = self.get_server_update_key_value(message, WORKTIME_KEY)
-        if isinstance(val_work_time, int):
-            self.work_time = val_work_time
-
-        val_temp_target_reached = self.get_server_update_key_value(message, TEMP_TARGET_REACHED_KEY)
-        if isinstance(val_temp_target_reached, int):
-            self.temp_target_reached = "yes" if val_temp_target_reached > 0 else "no"
-
     def set_ha_temperature_unit_is_celsius(self, is_celsius: bool) -> None:
         """Set whether Home Assistant uses Celsius (called by HA climate entity)"""
         self._ha_uses_celsius = is_celsius
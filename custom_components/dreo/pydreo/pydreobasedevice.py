@@ -2,11 +2,15 @@
 
 import threading
 import logging
-from typing import Dict
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, ClassVar, Dict
 from typing import TYPE_CHECKING
 
 from .commandoutbox import CommandOutbox, OutboxTiming
-from .constant import REPORTED_KEY, POWERON_KEY, CONNECTED_KEY, STATE_KEY, PRESET_MODE_STRINGS
+from .constant import REPORTED_KEY, POWERON_KEY, CONNECTED_KEY, STATE_KEY, PRESET_MODE_STRINGS, DreoDeviceSetting
 from .models import DreoDeviceDetails
 
 if TYPE_CHECKING:
@@ -14,6 +18,8 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+
 
 class UnknownProductError(Exception):
     """Exception thrown when we don't recognize a product of a device."""
@@ -23,6 +29,56 @@ class UnknownModelError(Exception):
     """Exception thrown when we don't recognize a model of a device."""
 
 
+@dataclass(frozen=True)
+class ReportField:
+    """How one reported WebSocket key is applied to a device.
+
+    A value that is not an instance of ``types`` is ignored. Otherwise it is
+    looked up in ``mapping`` (unmapped values pass through), passed through
+    ``convert`` and stored on ``attr``. ``when`` gates the field on device
+    state. For anything more involved, ``handler`` names a device method
+    called as ``handler(value, message)`` instead of storing the value.
+    """
+
+    attr: str | None = None
+    types: type | tuple[type, ...] = object
+    mapping: Mapping | None = None
+    convert: Callable[[Any], Any] | None = None
+    when: Callable[["PyDreoBaseDevice"], bool] | None = None
+    handler: str | None = None
+
+
+# (declaration order, key, apply(device, value, message))
+_ReportApplier = tuple[int, str, Callable[["PyDreoBaseDevice", Any, dict], None]]
+
+
+def _compile_report_field(cls: type, field: ReportField) -> Callable[["PyDreoBaseDevice", Any, dict], None]:
+    """Turn a ReportField into a single apply(device, value, message) call."""
+    types, when = field.types, field.when
+
+    if field.handler is not None:
+        method = getattr(cls, field.handler)
+
+        def apply_handler(device, value, message) -> None:
+            if isinstance(value, types) and (when is None or when(device)):
+                method(device, value, message)
+
+        return apply_handler
+
+    attr, mapping, convert = field.attr, field.mapping, field.convert
+
+    def apply(device, value, message) -> None:  # pylint: disable=unused-argument
+        if not isinstance(value, types) or (when is not None and not when(device)):
+            return
+        if mapping is not None:
+            value = mapping.get(value, value)
+        if convert is not None:
+            value = convert(value)
+        setattr(device, attr, value)
+
+    return apply
+
+
 class PyDreoBaseDevice:
     """Base class for all Dreo devices.
 
@@ -35,6 +91,30 @@ class PyDreoBaseDevice:
     # ``OutboxTiming.IMMEDIATE`` to restore synchronous per-key sends.
     _COMMAND_TIMING = OutboxTiming(quiet_period=0.10, max_wait=0.25, min_interval=0.50)
 
+    # Reported WebSocket keys this class applies, declared per class and
+    # compiled (with every base class's schema) into ``_report_dispatch`` when
+    # the class is created. A key declared by both a base and a subclass runs
+    # both fields, base first - the same order a ``super()`` chain would.
+    _REPORT_SCHEMA: ClassVar[dict[str, ReportField]] = {}
+    _report_dispatch: ClassVar[dict[str, tuple[_ReportApplier, ...]]] = {}
+
+    # Reported keys whose handling depends on what was reported before them:
+    # a gate whose transition has side effects, a handler that ignores some
+    # values, a key that reads its neighbours in the same message. When queued
+    # reports are coalesced (see ``coalesce_reports``), a report carrying one of
+    # these starts a new delta instead of merging into the previous one.
+    _REPORT_MERGE_BARRIERS: ClassVar[frozenset[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        dispatch: dict[str, list[_ReportApplier]] = {}
+        order = 0
+        for klass in reversed(cls.__mro__):
+            for key, field in klass.__dict__.get("_REPORT_SCHEMA", {}).items():
+                dispatch.setdefault(key, []).append((order, key, _compile_report_field(cls, field)))
+                order += 1
+        cls._report_dispatch = {key: tuple(appliers) for key, appliers in dispatch.items()}
+
     def __init__(
         self,
         device_definition: DreoDeviceDetails,
@@ -63,8 +143,15 @@ class PyDreoBaseDevice:
         self._feature_key_names: Dict[str, str] = {}
 
         self.raw_state = None
+        # True once a devicestate response (or snapshot state) has been applied.
+        self.state_loaded: bool = False
+        # Held while WebSocket reports or a devicestate response are applied.
+        self.state_lock = threading.RLock()
         self._attr_cbs = []
         self._lock = threading.Lock()
+        # Attribute values as of the last callbacks (or the first state load).
+        # Updated in place, so the dict itself never shows up as a change.
+        self._notified_state: dict = {}
 
         self._outbox = CommandOutbox(
             name=self._name,
@@ -75,7 +162,9 @@ class PyDreoBaseDevice:
             schedule=self._dreo.schedule_call_later,
             on_submit=self._apply_optimistic_state,
             finalize=self._finalize_command_params,
-            on_sent=self._on_command_sent,
+            on_sent=self._after_command_sent,
+            tracer=self._dreo.tracer,
+            serial_number=self._sn,
         )
 
     def __repr__(self):
@@ -89,12 +178,13 @@ class PyDreoBaseDevice:
 
             if (reported is not None) and (key in reported):
                 value = reported[key]
-                _LOGGER.info("report_value: %s reported: %s", key, value)
+                _LOGGER.debug("report_value: %s reported: %s", key, value)
                 return value
 
         return None
 
-    def is_preference_supported(self, preference_type: str, details: dict) -> bool:
+    @staticmethod
+    def is_preference_supported(preference_type: str, details: dict) -> bool:
         """Check if a preference type is supported."""
         _LOGGER.debug("is_preference_supported: Checking for preference type %s", preference_type)
         controls_conf = details.get("controlsConf", None)
@@ -109,6 +199,16 @@ class PyDreoBaseDevice:
         _LOGGER.debug("is_preference_supported: Preference type %s not found", preference_type)
         return False
 
+    @classmethod
+    def prefetch_settings(cls, details: dict) -> list[DreoDeviceSetting]:
+        """Settings this device class reads from the API while constructing.
+
+        ``PyDreo.async_load_devices`` fetches these before building the device
+        so that construction never blocks on a REST call. Base implementation
+        needs none.
+        """
+        return []
+
     def get_setting(self, dreo: "PyDreo", setting_name: str, default_value: any) -> any:
         """Get the value of a preference."""
         _LOGGER.debug("get_setting: %s", setting_name)
@@ -131,35 +231,127 @@ class PyDreoBaseDevice:
 
     def handle_server_update_base(self, message):
         """Initial method called when we get a WebSocket message."""
-        _LOGGER.debug("handle_server_update_base: {%s}: got {%s} message **", self.name, message)
-
-        val_connected = self.get_server_update_key_value(message, CONNECTED_KEY)
-        if isinstance(val_connected, bool):
-            _LOGGER.debug("handle_server_update_base: connected: %s --> %s", self._connected, val_connected)
-            self._connected = val_connected
-
-        # This method exists so that we can run the polymorphic function to process updates, and then
-        # run a _do_callbacks() command safely afterwards.
-        self.handle_server_update(message)
-        self._do_callbacks()
+        self.handle_server_updates([message])
+
+    def handle_server_updates(self, messages: list[dict]):
+        """Apply WebSocket messages in order, then run callbacks once for the net change."""
+        _LOGGER.debug("handle_server_updates: {%s}: got {%s} messages **", self.name, messages)
+        before = self._state_snapshot()
+
+        for message in messages:
+            val_connected = self.get_server_update_key_value(message, CONNECTED_KEY)
+            if isinstance(val_connected, bool):
+                _LOGGER.debug("handle_server_updates: connected: %s --> %s", self._connected, val_connected)
+                self._connected = val_connected
+
+            # This method exists so that we can run the polymorphic function to process updates, and then
+            # run a _do_callbacks() command safely afterwards - but only if something actually changed.
+            self.handle_server_update(message)
+
+        changed = self._changed_since(before)
+        if changed:
+            _LOGGER.debug("handle_server_updates: %s changed %s", self.name, sorted(changed))
+            self._do_callbacks(changed)
+        else:
+            _LOGGER.debug("handle_server_updates: %s no state change, skipping callbacks", self.name)
+
+    @classmethod
+    def coalesce_reports(cls, messages: list[dict]) -> list[dict]:
+        """Merge queued report messages into as few deltas as their ordering allows.
+
+        Consecutive reports merge last value per key wins, keeping the newest
+        method (only ``report``/``control-report`` are queued and both are
+        authoritative). A report starts a new delta instead when it carries a
+        ``_REPORT_MERGE_BARRIERS`` key, or when it would replace a pending
+        value with one of another type - a field ignores values of the wrong
+        type, so the older value must still be applied. Returns new dicts and
+        leaves ``messages`` untouched.
+        """
+        deltas: list[dict] = []
+        last_reported: dict | None = None
+        for message in messages:
+            reported = message.get(REPORTED_KEY) if isinstance(message, dict) else None
+            if not isinstance(reported, dict):
+                deltas.append(message)
+                last_reported = None
+                continue
+            if (
+                last_reported is None
+                or not cls._REPORT_MERGE_BARRIERS.isdisjoint(reported)
+                or any(key in last_reported and type(last_reported[key]) is not type(value) for key, value in reported.items())
+            ):
+                last_reported = dict(reported)
+                deltas.append({**message, REPORTED_KEY: last_reported})
+                continue
+            deltas[-1].update(message)
+            deltas[-1][REPORTED_KEY] = last_reported
+            last_reported.update(reported)
+        return deltas
 
     def handle_server_update(self, message: dict):
-        """Method to process WebSocket message"""
+        """Method to process WebSocket message.
 
-    def _send_command(self, command_key: str, value):
+        Applies the class's compiled report schema, touching only the keys
+        present in the message, in schema declaration order. Subclasses with
+        logic that does not fit the schema override this and call super().
+        """
+        reported = message.get(REPORTED_KEY) if isinstance(message, dict) else None
+        if not isinstance(reported, dict) or not reported:
+            return
+        dispatch = self._report_dispatch
+        appliers = [applier for key in reported if key in dispatch for applier in dispatch[key]]
+        if not appliers:
+            return
+        if len(appliers) > 1:
+            appliers.sort(key=itemgetter(0))
+        _LOGGER.debug("handle_server_update: %s applying %s", self.name, [key for _, key, _ in appliers])
+        for _, key, apply in appliers:
+            apply(self, reported[key], message)
+
+    def _send_command(self, command_key: str, value) -> Future:
         """Send a command to the Dreo servers via WebSocket."""
         _LOGGER.debug("_send_command: %s-> %s", command_key, value)
-        self._send_command_batch({command_key: value})
+        return self._send_command_batch({command_key: value})
 
-    def _send_command_batch(self, params: dict) -> None:
+    def _send_command_batch(self, params: dict) -> Future:
         """Send several key changes as ONE command.
 
         The keys are guaranteed to ship together in a single request (the
         hardware applies multi-key commands atomically); single-key
         ``_send_command`` calls make no such grouping promise, though the
         outbox may still merge them with a concurrent burst.
+
+        Returns the future of the batch carrying these keys; it resolves once
+        the device acks that batch (see ``CommandOutbox``).
         """
-        self._outbox.submit(params)
+        future = self._outbox.submit(params)
+        self._notify_local_changes()
+        return future
+
+    def _after_command_sent(self) -> None:
+        """Outbox ``on_sent``: announce keys derived at flush time, then run the hook."""
+        self._notify_local_changes()
+        self._on_command_sent()
+
+    def _notify_local_changes(self) -> None:
+        """Run callbacks for optimistic writes the callbacks have not seen yet.
+
+        Setters write their attributes before the command goes out, so the
+        device's echo of it changes nothing and would notify nobody.
+        """
+        if not self._notified_state:
+            # No baseline yet (state never loaded): refresh everything.
+            self._do_callbacks(None)
+            return
+        changed = self._changed_since(self._notified_state)
+        if changed:
+            _LOGGER.debug("_notify_local_changes: %s changed %s", self.name, sorted(changed))
+            self._do_callbacks(changed)
+
+    @property
+    def commands_pending(self) -> bool:
+        """True while the outbox holds unsent keys or a batch awaits its ack."""
+        return self._outbox.busy
 
     def _apply_optimistic_state(self, params: dict) -> None:
         """Hook: fold keys we are about to send into local state.
@@ -245,20 +437,48 @@ class PyDreoBaseDevice:
         """
         self._outbox.cancel()
 
-    def add_attr_callback(self, cb):
-        """Add a callback to be called by _do_callbacks."""
+    def add_attr_callback(self, cb, attributes: Iterable[str] | None = None):
+        """Add a callback to be called by _do_callbacks.
+
+        The callback receives the set of attribute names that changed (see
+        ``_changed_since``), or None when the change is not known precisely
+        and everything should be treated as changed. With ``attributes``, the
+        callback only runs when one of those attributes is among the changes.
+        """
         with self._lock:
-            self._attr_cbs.append(cb)
+            self._attr_cbs.append((cb, frozenset(attributes) if attributes is not None else None))
+
+    def _state_snapshot(self) -> dict:
+        """Shallow copy of the instance attributes, for _changed_since."""
+        return dict(vars(self))
+
+    def _changed_since(self, snapshot: dict) -> frozenset[str]:
+        """Names of the attributes whose value differs from ``snapshot``.
+
+        Names are reported without their leading underscores, so ``_is_on``
+        shows up as ``is_on``.
+        """
+        return frozenset(
+            name.lstrip("_")
+            for name, value in vars(self).items()
+            if (old := snapshot.get(name, _MISSING)) is not value and old != value
+        )
+
+    def _mark_state_notified(self) -> None:
+        """Record the current attribute values as seen by the callbacks."""
+        self._notified_state.update(vars(self))
 
-    def _do_callbacks(self):
-        """Run all registered callbacks."""
+    def _do_callbacks(self, changed: frozenset[str] | None = None):
+        """Run all registered callbacks with the changed attribute names."""
+        self._mark_state_notified()
         cbs = []
         with self._lock:
-            for cb in self._attr_cbs:
-                cbs.append(cb)
+            for cb, attributes in self._attr_cbs:
+                if changed is None or attributes is None or not attributes.isdisjoint(changed):
+                    cbs.append(cb)
         for cb in cbs:
             try:
-                cb()
+                cb(changed)
             except Exception as ex:  # pylint: disable=broad-except
                 _LOGGER.error("_do_callbacks: Callback %s raised: %s", cb, ex)
 
@@ -334,9 +554,19 @@ class PyDreoBaseDevice:
 
     @property
     def connected(self) -> bool | None:
-        """Returns True if the device is connected, None if unknown."""
+        """Returns True if the device is connected, None if unknown.
+
+        False while the account's WebSocket transport is unavailable, whatever
+        the device last reported.
+        """
+        if self._dreo.transport_available is False:
+            return False
         return self._connected
 
+    def transport_state_changed(self) -> None:
+        """Notify listeners of ``connected`` that the transport's availability changed."""
+        self._do_callbacks(frozenset({"connected"}))
+
     def is_feature_supported(self, feature: str) -> bool:
         """Does this device support a given feature"""
         _LOGGER.debug("is_feature_supported: Checking if %s supports feature %s", self, feature)
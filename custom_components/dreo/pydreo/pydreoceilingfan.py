@@ -24,6 +24,7 @@ from .constant import (
 )
 
 from .pydreofanbase import PyDreoFanBase
+from .pydreobasedevice import ReportField
 from .models import DreoDeviceDetails
 
 _LOGGER = logging.getLogger(__name__)
@@ -98,6 +99,24 @@ class PyDreoCeilingFan(PyDreoFanBase):
         b = color & 0xFF
         return (r, g, b)
 
+    # Power state (fanon/poweron) is handled by _handle_power_state_update.
+    _REPORT_SCHEMA = {
+        LIGHTON_KEY: ReportField("_light_on", bool),
+        BRIGHTNESS_KEY: ReportField("_brightness", int),
+        COLORTEMP_KEY: ReportField("_color_temp", int),
+        ATMON_KEY: ReportField("_atm_light_on", bool),
+        ATMBRI_KEY: ReportField("_atm_brightness", int),
+        ATMCOLOR_KEY: ReportField("_atm_color", int),
+        ATMMODE_KEY: ReportField("_atm_mode", int),
+        # RGBIC preset system
+        RGBPRESETSEL_KEY: ReportField("_rgb_preset_sel", int),
+        RGBPRESETNUM_KEY: ReportField("_rgb_preset_num", int),
+        RGBEFFECTID_KEY: ReportField("_rgb_effect_id", str),
+    }
+    # A gate-open schedules a REST verification; merging poweron False -> True
+    # across queued reports would hide the transition.
+    _REPORT_MERGE_BARRIERS = frozenset({POWERON_KEY})
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize air devices."""
         super().__init__(device_definition, details, dreo)
@@ -586,54 +605,6 @@ class PyDreoCeilingFan(PyDreoFanBase):
         self._rgb_preset_num = self.get_state_update_value(state, RGBPRESETNUM_KEY)
         self._rgb_effect_id = self.get_state_update_value(state, RGBEFFECTID_KEY)
 
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("handle_server_update: handle_server_update")
-        super().handle_server_update(message)
-
-        # Power state (fanon/poweron) is handled by _handle_power_state_update.
-
-        val_light_on = self.get_server_update_key_value(message, LIGHTON_KEY)
-        if isinstance(val_light_on, bool):
-            self._light_on = val_light_on
-
-        val_brightness = self.get_server_update_key_value(message, BRIGHTNESS_KEY)
-        if isinstance(val_brightness, int):
-            self._brightness = val_brightness
-
-        val_color_temp = self.get_server_update_key_value(message, COLORTEMP_KEY)
-        if isinstance(val_color_temp, int):
-            self._color_temp = val_color_temp
-
-        val_atm_on = self.get_server_update_key_value(message, ATMON_KEY)
-        if isinstance(val_atm_on, bool):
-            self._atm_light_on = val_atm_on
-
-        val_atm_brightness = self.get_server_update_key_value(message, ATMBRI_KEY)
-        if isinstance(val_atm_brightness, int):
-            self._atm_brightness = val_atm_brightness
-
-        val_atm_color = self.get_server_update_key_value(message, ATMCOLOR_KEY)
-        if isinstance(val_atm_color, int):
-            self._atm_color = val_atm_color
-
-        val_atm_mode = self.get_server_update_key_value(message, ATMMODE_KEY)
-        if isinstance(val_atm_mode, int):
-            self._atm_mode = val_atm_mode
-
-        # RGBIC preset system
-        val_rgb_preset_sel = self.get_server_update_key_value(message, RGBPRESETSEL_KEY)
-        if isinstance(val_rgb_preset_sel, int):
-            self._rgb_preset_sel = val_rgb_preset_sel
-
-        val_rgb_preset_num = self.get_server_update_key_value(message, RGBPRESETNUM_KEY)
-        if isinstance(val_rgb_preset_num, int):
-            self._rgb_preset_num = val_rgb_preset_num
-
-        val_rgb_effect_id = self.get_server_update_key_value(message, RGBEFFECTID_KEY)
-        if isinstance(val_rgb_effect_id, str):
-            self._rgb_effect_id = val_rgb_effect_id
-
     def _handle_power_state_update(self, message):
         """Ceiling fans: update the retained load values and the power gate.
 
@@ -728,8 +699,9 @@ class PyDreoCeilingFan(PyDreoFanBase):
             # again after the next quiet stretch.
             self._schedule_state_verification()
             return
+        before = self._state_snapshot()
         try:
-            if self._dreo.load_device_state(self):
+            if self._dreo.load_device_state(self, fresh=True):
                 if self._rest_readback_stale:
                     if self._stale_readback_retries < self._STATE_VERIFY_MAX_STALE_RETRIES:
                         self._stale_readback_retries += 1
@@ -747,10 +719,12 @@ class PyDreoCeilingFan(PyDreoFanBase):
                         self._STATE_VERIFY_MAX_STALE_RETRIES,
                     )
                     self._last_local_write = 0.0
-                    self._dreo.load_device_state(self)
+                    self._dreo.load_device_state(self, fresh=True)
                 self._stale_readback_retries = 0
                 _LOGGER.debug("_verify_state: REST verification complete for %s", self.name)
-                self._do_callbacks()
+                changed = self._changed_since(before)
+                if changed:
+                    self._do_callbacks(changed)
         except Exception as ex:  # pylint: disable=broad-except
             _LOGGER.debug("_verify_state: verification failed for %s: %s", self.name, ex)
 
@@ -6,10 +6,17 @@ from typing import Dict, TYPE_CHECKING
 
 from .constant import (
     POWERON_KEY,
+    REPORTED_KEY,
+    MODE_STANDBY,
+    MODE_CONFIGURING,
+    MODE_COOKING,
+    MODE_PAUSED,
+    MODE_COMPLETE,
+    MODE_OFF,
 )
 from .models import DreoDeviceDetails
 
-from .pydreobasedevice import PyDreoBaseDevice
+from .pydreobasedevice import PyDreoBaseDevice, ReportField
 
 if TYPE_CHECKING:
     from pydreo import PyDreo
@@ -23,12 +30,6 @@ MODE_KEY = "mode"
 # ("wkbegin"), from which the absolute cook end time is derived (see cook_end_time).
 COOK_TIME_ESTIMATED_KEY = "wkestdu"  # Estimated total cook duration in seconds.
 COOK_TIME_BEGIN_KEY = "wkbegin"  # Epoch (seconds) at which the current cook began.
-MODE_STANDBY = "standby"
-MODE_CONFIGURING = "ckcfm"  # Transient "configuring" mode reported before a cook starts (see #868).
-MODE_COOKING = "cooking"
-MODE_PAUSED = "ckpause"
-MODE_COMPLETE = "ckcomplete"
-MODE_OFF = "off"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,6 +37,16 @@ _LOGGER = logging.getLogger(__name__)
 class PyDreoChefMaker(PyDreoBaseDevice):
     """Representation of a Dreo ChefMaker device."""
 
+    _REPORT_SCHEMA = {
+        POWERON_KEY: ReportField(types=bool, handler="_handle_poweron_report"),
+        LIGHT_KEY: ReportField("_ledpotkepton", int),
+        MODE_KEY: ReportField("mode", str),
+        COOK_TIME_ESTIMATED_KEY: ReportField("_cook_time_estimated", int),
+        COOK_TIME_BEGIN_KEY: ReportField("_cook_time_begin", int),
+    }
+    # poweron resets the mode, so a mode queued before it must not be merged past it.
+    _REPORT_MERGE_BARRIERS = frozenset({POWERON_KEY})
+
     def __init__(
         self,
         device_definition: DreoDeviceDetails,
@@ -137,48 +148,19 @@ class PyDreoChefMaker(PyDreoBaseDevice):
 
     def handle_server_update(self, message):
         """Process a websocket update"""
-        _LOGGER.debug("handle_server_update: %s", message)
-
-        val_poweron = self.get_server_update_key_value(message, POWERON_KEY)
-        if isinstance(val_poweron, bool):
-            _LOGGER.debug(
-                "handle_server_update: poweron: %s --> %s",
-                self._is_on,
-                val_poweron,
-            )
-            self._is_on = val_poweron  # Ensure poweron state is updated
-            self.set_mode_from_is_on()
-
-        val_ledpotkepton = self.get_server_update_key_value(message, LIGHT_KEY)
-        if isinstance(val_ledpotkepton, int):
-            _LOGGER.debug(
-                "handle_server_update: ledpotkepton: %s --> %s",
-                self._ledpotkepton,
-                val_ledpotkepton,
-            )
-            self._ledpotkepton = val_ledpotkepton
+        super().handle_server_update(message)
 
-        val_mode = self.get_server_update_key_value(message, MODE_KEY)
-        if isinstance(val_mode, str):
-            _LOGGER.debug(
-                "handle_server_update: mode: %s --> %s",
-                self.mode,
-                val_mode,
-            )
-            self.mode = val_mode
-
-        val_cook_time_estimated = self.get_server_update_key_value(message, COOK_TIME_ESTIMATED_KEY)
-        if isinstance(val_cook_time_estimated, int):
-            self._cook_time_estimated = val_cook_time_estimated
-
-        val_cook_time_begin = self.get_server_update_key_value(message, COOK_TIME_BEGIN_KEY)
-        if isinstance(val_cook_time_begin, int):
-            self._cook_time_begin = val_cook_time_begin
-
-        if isinstance(val_cook_time_estimated, int) or isinstance(val_cook_time_begin, int):
+        reported = message.get(REPORTED_KEY) or {}
+        if isinstance(reported.get(COOK_TIME_ESTIMATED_KEY), int) or isinstance(reported.get(COOK_TIME_BEGIN_KEY), int):
             _LOGGER.debug(
                 "handle_server_update: cook_end_time: estimated=%s begin=%s --> %s",
                 self._cook_time_estimated,
                 self._cook_time_begin,
                 self.cook_end_time,
             )
+
+    def _handle_poweron_report(self, value: bool, message: dict) -> None:
+        """Apply a reported poweron and derive the mode from it."""
+        _LOGGER.debug("_handle_poweron_report: poweron: %s --> %s", self._is_on, value)
+        self._is_on = value  # Ensure poweron state is updated
+        self.set_mode_from_is_on()
@@ -3,9 +3,23 @@
 import logging
 from typing import TYPE_CHECKING, Dict
 
-from .constant import MODE_KEY, MUTEON_KEY, POWERON_KEY, HUMIDITY_KEY, WINDLEVEL_KEY, CHILDLOCKON_KEY, LIGHTON_KEY, SPEED_RANGE, TEMPERATURE_KEY, TemperatureUnit
-
-from .pydreobasedevice import PyDreoBaseDevice
+from .constant import (
+    MODE_KEY,
+    MUTEON_KEY,
+    POWERON_KEY,
+    HUMIDITY_KEY,
+    WINDLEVEL_KEY,
+    CHILDLOCKON_KEY,
+    LIGHTON_KEY,
+    SPEED_RANGE,
+    TEMPERATURE_KEY,
+    TemperatureUnit,
+    ERROR_CODE_KEY,
+    ERROR_CODE_OK,
+    ERROR_CODE_WATER_EMPTY,
+)
+
+from .pydreobasedevice import PyDreoBaseDevice, ReportField
 from .models import DreoDeviceDetails
 
 _LOGGER = logging.getLogger(__name__)
@@ -16,14 +30,6 @@ if TYPE_CHECKING:
 # Dehumidifier-specific constants
 RHAUTOLEVEL_KEY = "rhautolevel"
 AUTOON_KEY = "autoon"
-# The Dreo API uses "wrong" as an error code field.
-# Known values: 0 = OK (no error), 1 = water level empty.
-# There may be additional error codes, but their meanings are not yet known.
-ERROR_CODE_KEY = "wrong"
-
-# Human-readable labels for known error code values
-ERROR_CODE_OK = "ok"
-ERROR_CODE_WATER_EMPTY = "empty"
 
 ERROR_CODE_MAP = {0: ERROR_CODE_OK, 1: ERROR_CODE_WATER_EMPTY, ERROR_CODE_OK: 0, ERROR_CODE_WATER_EMPTY: 1}
 
@@ -31,6 +37,20 @@ ERROR_CODE_MAP = {0: ERROR_CODE_OK, 1: ERROR_CODE_WATER_EMPTY, ERROR_CODE_OK: 0,
 class PyDreoDehumidifier(PyDreoBaseDevice):
     """Base class for Dreo Dehumidifiers"""
 
+    _REPORT_SCHEMA = {
+        POWERON_KEY: ReportField("_is_on", bool),
+        MODE_KEY: ReportField("_mode", int),
+        HUMIDITY_KEY: ReportField("_humidity", int),
+        RHAUTOLEVEL_KEY: ReportField("_target_humidity", int),
+        WINDLEVEL_KEY: ReportField("_wind_level", int),
+        MUTEON_KEY: ReportField("_mute_on", bool),
+        LIGHTON_KEY: ReportField("_light_on", bool),
+        CHILDLOCKON_KEY: ReportField("_child_lock_on", bool),
+        AUTOON_KEY: ReportField("_auto_on", bool),
+        TEMPERATURE_KEY: ReportField("_temperature", (int, float)),
+        ERROR_CODE_KEY: ReportField("_wrong", int, convert=ERROR_CODE_MAP.get),
+    }
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize dehumidifier devices."""
         super().__init__(device_definition, details, dreo)
@@ -284,52 +304,3 @@ class PyDreoDehumidifier(PyDreoBaseDevice):
         wrong_raw = self.get_state_update_value(state, ERROR_CODE_KEY)
         if wrong_raw is not None:
             self._wrong = ERROR_CODE_MAP.get(wrong_raw, None)
-
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("handle_server_update: handle_server_update(%s): %s", self.name, message)
-
-        val_poweron = self.get_server_update_key_value(message, POWERON_KEY)
-        if isinstance(val_poweron, bool):
-            self._is_on = val_poweron
-            _LOGGER.debug("handle_server_update: handle_server_update - poweron is %s", self._is_on)
-
-        val_mode = self.get_server_update_key_value(message, MODE_KEY)
-        if isinstance(val_mode, int):
-            self._mode = val_mode
-
-        val_humidity = self.get_server_update_key_value(message, HUMIDITY_KEY)
-        if isinstance(val_humidity, int):
-            self._humidity = val_humidity
-
-        val_target_humidity = self.get_server_update_key_value(message, RHAUTOLEVEL_KEY)
-        if isinstance(val_target_humidity, int):
-            self._target_humidity = val_target_humidity
-
-        val_wind_level = self.get_server_update_key_value(message, WINDLEVEL_KEY)
-        if isinstance(val_wind_level, int):
-            self._wind_level = val_wind_level
-
-        val_mute = self.get_server_update_key_value(message, MUTEON_KEY)
-        if isinstance(val_mute, bool):
-            self._mute_on = val_mute
-
-        val_light = self.get_server_update_key_value(message, LIGHTON_KEY)
-        if isinstance(val_light, bool):
-            self._light_on = val_light
-
-        val_child_lock = self.get_server_update_key_value(message, CHILDLOCKON_KEY)
-        if isinstance(val_child_lock, bool):
-            self._child_lock_on = val_child_lock
-
-        val_auto = self.get_server_update_key_value(message, AUTOON_KEY)
-        if isinstance(val_auto, bool):
-            self._auto_on = val_auto
-
-        val_temperature = self.get_server_update_key_value(message, TEMPERATURE_KEY)
-        if isinstance(val_temperature, (int, float)):
-            self._temperature = val_temperature
-
-        val_wrong = self.get_server_update_key_value(message, ERROR_CODE_KEY)
-        if isinstance(val_wrong, int):
-            self._wrong = ERROR_CODE_MAP.get(val_wrong, None)
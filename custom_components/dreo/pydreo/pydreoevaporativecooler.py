@@ -3,6 +3,7 @@
 import logging
 from typing import TYPE_CHECKING, Dict, Optional
 from .pydreofanbase import PyDreoFanBase
+from .pydreobasedevice import ReportField
 
 from .constant import (
     CHILDLOCKON_KEY,
@@ -22,6 +23,10 @@ from .constant import (
     RGB_MODE_RANGE,
     RGB_BRI,
     TEMPOFFSET_KEY,
+    WATER_LEVEL_STATUS_KEY,
+    WATER_LEVEL_KEY,
+    WATER_LEVEL_OK,
+    WATER_LEVEL_EMPTY,
 )
 from .helpers import Helpers
 from .models import DreoDeviceDetails
@@ -33,14 +38,8 @@ HUMIDIFY_MODE_KEY = "rhmode"
 HUMIDIFY_SUSPEND_KEY = "rhsuspend"
 HUMIDITY_TARGET_KEY = "rhtarget"
 WORKTIME_KEY = "worktime"
-WATER_LEVEL_STATUS_KEY = "wrong"
-WATER_LEVEL_KEY = "water_level"
 RGB_ON_KEY = "rgbon"
 
-# Status for water level indicator
-WATER_LEVEL_OK = "ok"
-WATER_LEVEL_EMPTY = "empty"
-
 # States (enabled, disabled) for humidifier
 HUMIDIFY_MODE_MAP = {
     0: False,
@@ -68,6 +67,32 @@ if TYPE_CHECKING:
 class PyDreoEvaporativeCooler(PyDreoFanBase):
     """Base class for Dreo evaporative cooler API Calls."""
 
+    _REPORT_SCHEMA = {
+        TEMPOFFSET_KEY: ReportField("_temperature_offset", int),
+        HORIZONTAL_OSCILLATION_KEY: ReportField("_oscillating", bool),
+        HUMIDITY_KEY: ReportField("_humidity", int),
+        MUTEON_KEY: ReportField("_mute_on", bool),
+        HUMIDIFY_MODE_KEY: ReportField("_humidify", int, convert=lambda mode: mode == 2),
+        HUMIDITY_TARGET_KEY: ReportField("_target_humidity", int),
+        CHILDLOCKON_KEY: ReportField("_childlockon", bool),
+        # WebSocket sends 1-4 directly — store as int to stay consistent with
+        # the int stored by update_state via _map_wind_mode_from_rest().
+        WIND_MODE_KEY: ReportField("_wind_mode", int),
+        WORKTIME_KEY: ReportField("_work_time", int),
+        WATER_LEVEL_STATUS_KEY: ReportField("_water_level", int, mapping=WATER_LEVEL_STATUS_MAP),
+        FOG_LEVEL_KEY: ReportField("_fog_level", int),
+        RGB_ON_KEY: ReportField("_rgb_light_on", bool),
+        RGB_LEVEL: ReportField("_rgblevel", int),
+        RGB_TH: ReportField("_rgbth", str),
+        RGB_MODE: ReportField("_rgbmode", int),
+        RGB_COLOR: ReportField("_rgbcolor", int),
+        RGB_BRI: ReportField("_rgbbri", int),
+        LIGHTON_KEY: ReportField("_light_on", bool),
+        HUMIDIFY_SUSPEND_KEY: ReportField("_suspend", bool),
+        HORIZONTAL_ANGLE_ADJ_KEY: ReportField("_horizontal_angle", int),
+        HORIZONTAL_OSCILLATION_ANGLE_KEY: ReportField(types=str, handler="_handle_angle_range_report"),
+    }
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize evaporative cooler devices."""
         super().__init__(device_definition, details, dreo)
@@ -559,93 +584,6 @@ class PyDreoEvaporativeCooler(PyDreoFanBase):
         self._horizontal_angle = self.get_state_update_value(state, HORIZONTAL_ANGLE_ADJ_KEY)
         self._horizontal_angle_range = self._parse_angle_range(self.get_state_update_value(state, HORIZONTAL_OSCILLATION_ANGLE_KEY))
 
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("handle_server_update: handle_server_update")
-        super().handle_server_update(message)
-
-        val_temperature_offset = self.get_server_update_key_value(message, TEMPOFFSET_KEY)
-        if isinstance(val_temperature_offset, int):
-            self._temperature_offset = val_temperature_offset
-
-        val_oscon = self.get_server_update_key_value(message, HORIZONTAL_OSCILLATION_KEY)
-        if isinstance(val_oscon, bool):
-            self._oscillating = val_oscon
-
-        val_humidity = self.get_server_update_key_value(message, HUMIDITY_KEY)
-        if isinstance(val_humidity, int):
-            self._humidity = val_humidity
-
-        val_muteon = self.get_server_update_key_value(message, MUTEON_KEY)
-        if isinstance(val_muteon, bool):
-            self._mute_on = val_muteon
-
-        val_humidify = self.get_server_update_key_value(message, HUMIDIFY_MODE_KEY)
-        if isinstance(val_humidify, int):
-            self._humidify = val_humidify == 2
-
-        val_target_humidity = self.get_server_update_key_value(message, HUMIDITY_TARGET_KEY)
-        if isinstance(val_target_humidity, int):
-            self._target_humidity = val_target_humidity
-
-        val_childlockon = self.get_server_update_key_value(message, CHILDLOCKON_KEY)
-        if isinstance(val_childlockon, bool):
-            self._childlockon = val_childlockon
-
-        val_wind_mode = self.get_server_update_key_value(message, WIND_MODE_KEY)
-        if isinstance(val_wind_mode, int):
-            # WebSocket sends 1-4 directly — store as int to stay consistent with
-            # the int stored by update_state via _map_wind_mode_from_rest().
-            self._wind_mode = val_wind_mode
-
-        val_work_time = self.get_server_update_key_value(message, WORKTIME_KEY)
-        if isinstance(val_work_time, int):
-            self._work_time = val_work_time
-
-        val_water_level = self.get_server_update_key_value(message, WATER_LEVEL_STATUS_KEY)
-        if isinstance(val_water_level, int):
-            self._water_level = WATER_LEVEL_STATUS_MAP.get(val_water_level, val_water_level)
-
-        val_fog_level = self.get_server_update_key_value(message, FOG_LEVEL_KEY)
-        if isinstance(val_fog_level, int):
-            self._fog_level = val_fog_level
-
-        val_rgb_light_on = self.get_server_update_key_value(message, RGB_ON_KEY)
-        if isinstance(val_rgb_light_on, bool):
-            self._rgb_light_on = val_rgb_light_on
-
-        val_rgblevel = self.get_server_update_key_value(message, RGB_LEVEL)
-        if isinstance(val_rgblevel, int):
-            self._rgblevel = val_rgblevel
-
-        val_rgbth = self.get_server_update_key_value(message, RGB_TH)
-        if isinstance(val_rgbth, str):
-            self._rgbth = val_rgbth
-
-        val_rgbmode = self.get_server_update_key_value(message, RGB_MODE)
-        if isinstance(val_rgbmode, int):
-            self._rgbmode = val_rgbmode
-
-        val_rgbcolor = self.get_server_update_key_value(message, RGB_COLOR)
-        if isinstance(val_rgbcolor, int):
-            self._rgbcolor = val_rgbcolor
-
-        val_rgbbri = self.get_server_update_key_value(message, RGB_BRI)
-        if isinstance(val_rgbbri, int):
-            self._rgbbri = val_rgbbri
-
-        val_light_on = self.get_server_update_key_value(message, LIGHTON_KEY)
-        if isinstance(val_light_on, bool):
-            self._light_on = val_light_on
-
-        val_suspend = self.get_server_update_key_value(message, HUMIDIFY_SUSPEND_KEY)
-        if isinstance(val_suspend, bool):
-            self._suspend = val_suspend
-
-        val_horizontal_angle = self.get_server_update_key_value(message, HORIZONTAL_ANGLE_ADJ_KEY)
-        if isinstance(val_horizontal_angle, int):
-            self._horizontal_angle = val_horizontal_angle
-
-        val_horizontal_angle_range = self.get_server_update_key_value(message, HORIZONTAL_OSCILLATION_ANGLE_KEY)
-        if isinstance(val_horizontal_angle_range, str):
-            self._horizontal_angle_range = self._parse_angle_range(val_horizontal_angle_range)
+    def _handle_angle_range_report(self, value: str, message: dict) -> None:
+        """Apply a reported oscillation angle range such as "-30,30"."""
+        self._horizontal_angle_range = self._parse_angle_range(value)
@@ -29,7 +29,7 @@ from .constant import (
     PREFERENCE_TYPE_TEMPERATURE_CALIBRATION,
 )
 
-from .pydreobasedevice import PyDreoBaseDevice
+from .pydreobasedevice import PyDreoBaseDevice, ReportField
 from .models import DreoDeviceDetails
 from .helpers import Helpers
 
@@ -42,6 +42,25 @@ if TYPE_CHECKING:
 class PyDreoFanBase(PyDreoBaseDevice):
     """Base class for Dreo Fan API Calls."""
 
+    _REPORT_SCHEMA = {
+        WINDLEVEL_KEY: ReportField("_fan_speed", int),
+        TEMPERATURE_KEY: ReportField("_temperature", int),
+        TEMPOFFSET_KEY: ReportField("_temperature_offset", int, when=lambda fan: fan._supports_temperature_calibration),
+        LEDALWAYSON_KEY: ReportField("_led_always_on", bool),
+        LEDKEPTON_KEY: ReportField("_led_kept_on", bool),
+        VOICEON_KEY: ReportField("_voice_on", bool),
+        MISTON_KEY: ReportField("_mist_on", bool),
+        WIND_MODE_KEY: ReportField("_wind_mode", (int, str)),
+        WINDTYPE_KEY: ReportField("_wind_type", int),
+        LIGHTSENSORON_KEY: ReportField("_light_sensor_on", bool),
+        MUTEON_KEY: ReportField("_mute_on", bool),
+        CHILDLOCKON_KEY: ReportField("_child_lock_on", bool),
+        LOCATEMEON_KEY: ReportField("_locate_me_on", bool),
+        PM25_KEY: ReportField("_pm25", int),
+        TIMERON_KEY: ReportField("_timer_on", int, when=lambda fan: fan._timer_on is not None),
+        TIMEROFF_KEY: ReportField("_timer_off", int, when=lambda fan: fan._timer_off is not None),
+    }
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize air devices."""
         super().__init__(device_definition, details, dreo)
@@ -88,6 +107,13 @@ class PyDreoFanBase(PyDreoBaseDevice):
         self._timer_on = None
         self._timer_off = None
 
+    @classmethod
+    def prefetch_settings(cls, details: dict) -> list[DreoDeviceSetting]:
+        """Fans read their temperature offset while constructing, if calibration is supported."""
+        if cls.is_preference_supported(PREFERENCE_TYPE_TEMPERATURE_CALIBRATION, details):
+            return [DreoDeviceSetting.FAN_TEMP_OFFSET]
+        return []
+
     def parse_speed_range(self, details: Dict[str, list]) -> tuple[int, int]:
         """Parse the speed range from the details."""
         # There are a bunch of different places this could be, so we're going to look in
@@ -517,15 +543,11 @@ class PyDreoFanBase(PyDreoBaseDevice):
 
     def handle_server_update(self, message):
         """Process a websocket update"""
-        _LOGGER.debug("handle_server_update: handle_server_update")
         super().handle_server_update(message)
 
         # Handle power state
         self._handle_power_state_update(message)
 
-        # Handle common fan properties
-        self._handle_fan_properties_update(message)
-
     def _handle_power_state_update(self, message):
         """Handle power state updates"""
         # Use _power_state_key if set (e.g. HPF017S sends fanon for state but uses poweron for commands)
@@ -534,69 +556,3 @@ class PyDreoFanBase(PyDreoBaseDevice):
         if isinstance(val_poweron, bool):
             self._is_on = val_poweron
             _LOGGER.debug("_handle_power_state_update: _handle_power_state_update - %s is %s", state_key, self._is_on)
-
-    def _handle_fan_properties_update(self, message):
-        """Handle common fan properties"""
-        val_wind_level = self.get_server_update_key_value(message, WINDLEVEL_KEY)
-        if isinstance(val_wind_level, int):
-            self._fan_speed = val_wind_level
-
-        val_temperature = self.get_server_update_key_value(message, TEMPERATURE_KEY)
-        if isinstance(val_temperature, int):
-            self._temperature = val_temperature
-
-        val_temp_offset = self.get_server_update_key_value(message, TEMPOFFSET_KEY)
-        if isinstance(val_temp_offset, int) and self._supports_temperature_calibration:
-            self._temperature_offset = val_temp_offset
-
-        val_display_always_on = self.get_server_update_key_value(message, LEDALWAYSON_KEY)
-        if isinstance(val_display_always_on, bool):
-            self._led_always_on = val_display_always_on
-
-        val_led_kept_on = self.get_server_update_key_value(message, LEDKEPTON_KEY)
-        if isinstance(val_led_kept_on, bool):
-            self._led_kept_on = val_led_kept_on
-
-        val_panel_sound = self.get_server_update_key_value(message, VOICEON_KEY)
-        if isinstance(val_panel_sound, bool):
-            self._voice_on = val_panel_sound
-
-        val_mist = self.get_server_update_key_value(message, MISTON_KEY)
-        if isinstance(val_mist, bool):
-            self._mist_on = val_mist
-
-        val_wind_mode = self.get_server_update_key_value(message, WIND_MODE_KEY)
-        if isinstance(val_wind_mode, (int, str)):
-            self._wind_mode = val_wind_mode
-
-        val_wind_type = self.get_server_update_key_value(message, WINDTYPE_KEY)
-        if isinstance(val_wind_type, int):
-            self._wind_type = val_wind_type
-
-        val_light_sensor = self.get_server_update_key_value(message, LIGHTSENSORON_KEY)
-        if isinstance(val_light_sensor, bool):
-            self._light_sensor_on = val_light_sensor
-
-        val_mute = self.get_server_update_key_value(message, MUTEON_KEY)
-        if isinstance(val_mute, bool):
-            self._mute_on = val_mute
-
-        val_child_lock = self.get_server_update_key_value(message, CHILDLOCKON_KEY)
-        if isinstance(val_child_lock, bool):
-            self._child_lock_on = val_child_lock
-
-        val_locate_me = self.get_server_update_key_value(message, LOCATEMEON_KEY)
-        if isinstance(val_locate_me, bool):
-            self._locate_me_on = val_locate_me
-
-        val_pm25 = self.get_server_update_key_value(message, PM25_KEY)
-        if isinstance(val_pm25, int):
-            self._pm25 = val_pm25
-
-        val_timer_on = self.get_server_update_key_value(message, TIMERON_KEY)
-        if isinstance(val_timer_on, int) and self._timer_on is not None:
-            self._timer_on = val_timer_on
-
-        val_timer_off = self.get_server_update_key_value(message, TIMEROFF_KEY)
-        if isinstance(val_timer_off, int) and self._timer_off is not None:
-            self._timer_off = val_timer_off
@@ -31,7 +31,7 @@ from .constant import (
     SWING_OFF,
 )
 
-from .pydreobasedevice import PyDreoBaseDevice
+from .pydreobasedevice import PyDreoBaseDevice, ReportField
 from .models import DreoHeaterDeviceDetails, HEAT_RANGE, ECOLEVEL_RANGE
 
 _LOGGER = logging.getLogger(__name__)
@@ -43,6 +43,36 @@ if TYPE_CHECKING:
 class PyDreoHeater(PyDreoBaseDevice):
     """Base class for Dreo heater API Calls."""
 
+    _REPORT_SCHEMA = {
+        HTALEVEL_KEY: ReportField("_htalevel", int),
+        # Do NOT reset _mode to OFF on poweron. The hvac_mode property already returns
+        # HVACMode.OFF when _is_on is False, regardless of _mode. Resetting _mode
+        # to OFF causes hvac_mode to show OFF after the device powers on if the
+        # power-on WebSocket ACK doesn't include the mode (a common occurrence).
+        POWERON_KEY: ReportField("_is_on", bool),
+        TEMPERATURE_KEY: ReportField("_temperature", int),
+        MODE_KEY: ReportField(types=str, handler="_handle_mode_report"),
+        OSCON_KEY: ReportField("_oscon", bool),
+        OSCANGLE_KEY: ReportField("_oscangle", int),
+        OSCMODE_KEY: ReportField("_oscmode", int),
+        MUTEON_KEY: ReportField("_mute_on", bool),
+        DEVON_KEY: ReportField("_dev_on", bool),
+        # TODO: This seems wrong; unsure if we need to parse DU out of this like we do in the intial state.
+        TIMERON_KEY: ReportField("_timeron", int),
+        COOLDOWN_KEY: ReportField("_cooldown", int),
+        PTCON_KEY: ReportField(types=bool, handler="_handle_ptc_on_report"),
+        LIGHTON_KEY: ReportField("_light_on", bool),
+        CTLSTATUS_KEY: ReportField("_ctlstatus", str),
+        TIMEROFF_KEY: ReportField("_timer_off", int),
+        ECOLEVEL_KEY: ReportField("_ecolevel", int),
+        CHILDLOCKON_KEY: ReportField("_childlockon", bool),
+        TEMPOFFSET_KEY: ReportField("_tempoffset", int),
+        FIXEDCONF_KEY: ReportField("_fixed_conf", str),
+    }
+    # An empty mode is ignored (it must not replace the mode queued before it),
+    # and ptcon infers poweron, so a later poweron must not be merged past it.
+    _REPORT_MERGE_BARRIERS = frozenset({MODE_KEY, POWERON_KEY})
+
     def __init__(self, device_definition: DreoHeaterDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize heater devices."""
         super().__init__(device_definition, details, dreo)
@@ -371,96 +401,23 @@ class PyDreoHeater(PyDreoBaseDevice):
         self._tempoffset = self.get_state_update_value(state, TEMPOFFSET_KEY)
         self._fixed_conf = self.get_state_update_value(state, FIXEDCONF_KEY)
 
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("handle_server_update: handle_server_update(%s): %s", self.name, message)
-
-        val_htalevel = self.get_server_update_key_value(message, HTALEVEL_KEY)
-        if isinstance(val_htalevel, int):
-            self._htalevel = val_htalevel
-
-        # no base class method to handle _is_on
-        val_power_on = self.get_server_update_key_value(message, POWERON_KEY)
-        if isinstance(val_power_on, bool):
-            self._is_on = val_power_on
-            # Do NOT reset _mode to OFF here. The hvac_mode property already returns
-            # HVACMode.OFF when _is_on is False, regardless of _mode. Resetting _mode
-            # to OFF causes hvac_mode to show OFF after the device powers on if the
-            # power-on WebSocket ACK doesn't include the mode (a common occurrence).
-
-        val_temperature = self.get_server_update_key_value(message, TEMPERATURE_KEY)
-        if isinstance(val_temperature, int):
-            self._temperature = val_temperature
-
-        # Reported mode can be an empty string if the heater is off. Ignore empty
-        # mode strings to preserve the last known active mode so that hvac_mode
-        # correctly reflects the device state when it powers back on.
-        val_mode = self.get_server_update_key_value(message, MODE_KEY)
-        if isinstance(val_mode, str) and val_mode:
-            self._mode = val_mode if val_mode in self.device_definition.modes else DreoHeaterMode.OFF
-
-        val_oscon = self.get_server_update_key_value(message, OSCON_KEY)
-        if isinstance(val_oscon, bool):
-            self._oscon = val_oscon
-
-        val_oscangle = self.get_server_update_key_value(message, OSCANGLE_KEY)
-        if isinstance(val_oscangle, int):
-            self._oscangle = val_oscangle
-
-        val_oscmode = self.get_server_update_key_value(message, OSCMODE_KEY)
-        if isinstance(val_oscmode, int):
-            self._oscmode = val_oscmode
-
-        val_muteon = self.get_server_update_key_value(message, MUTEON_KEY)
-        if isinstance(val_muteon, bool):
-            self._mute_on = val_muteon
-
-        val_devon = self.get_server_update_key_value(message, DEVON_KEY)
-        if isinstance(val_devon, bool):
-            self._dev_on = val_devon
-
-        # TODO: This seems wrong; unsure if we need to parse DU out of this like we do in the intial state.
-        val_timeron = self.get_server_update_key_value(message, TIMERON_KEY)
-        if isinstance(val_timeron, int):
-            self._timeron = val_timeron
-
-        val_cooldown = self.get_server_update_key_value(message, COOLDOWN_KEY)
-        if isinstance(val_cooldown, int):
-            self._cooldown = val_cooldown
-
-        val_ptc_on = self.get_server_update_key_value(message, PTCON_KEY)
-        if isinstance(val_ptc_on, bool):
-            self._ptc_on = val_ptc_on
-            # If PTC (heating element) is on, the device must be powered on
-            # This handles cases where the WebSocket update includes ptcon but not poweron
-            if val_ptc_on and not self._is_on:
-                _LOGGER.debug("handle_server_update: PTC turned on, inferring device is powered on")
-                self._is_on = True
-
-        val_light_on = self.get_server_update_key_value(message, LIGHTON_KEY)
-        if isinstance(val_light_on, bool):
-            self._light_on = val_light_on
-
-        val_ctlstatus = self.get_server_update_key_value(message, CTLSTATUS_KEY)
-        if isinstance(val_ctlstatus, str):
-            self._ctlstatus = val_ctlstatus
-
-        val_timer_off = self.get_server_update_key_value(message, TIMEROFF_KEY)
-        if isinstance(val_timer_off, int):
-            self._timer_off = val_timer_off
-
-        val_ecolevel = self.get_server_update_key_value(message, ECOLEVEL_KEY)
-        if isinstance(val_ecolevel, int):
-            self._ecolevel = val_ecolevel
-
-        val_childlockon = self.get_server_update_key_value(message, CHILDLOCKON_KEY)
-        if isinstance(val_childlockon, bool):
-            self._childlockon = val_childlockon
-
-        val_tempoffset = self.get_server_update_key_value(message, TEMPOFFSET_KEY)
-        if isinstance(val_tempoffset, int):
-            self._tempoffset = val_tempoffset
-
-        val_fixed_conf = self.get_server_update_key_value(message, FIXEDCONF_KEY)
-        if isinstance(val_fixed_conf, str):
-            self._fixed_conf = val_fixed_conf
+    def _handle_mode_report(self, value: str, message: dict) -> None:
+        """Apply a reported mode.
+
+        Reported mode can be an empty string if the heater is off. Ignore empty
+        mode strings to preserve the last known active mode so that hvac_mode
+        correctly reflects the device state when it powers back on.
+        """
+        if value:
+            self._mode = value if value in self.device_definition.modes else DreoHeaterMode.OFF
+
+    def _handle_ptc_on_report(self, value: bool, message: dict) -> None:
+        """Apply a reported ptcon.
+
+        If PTC (heating element) is on, the device must be powered on. This
+        handles cases where the WebSocket update includes ptcon but not poweron.
+        """
+        self._ptc_on = value
+        if value and not self._is_on:
+            _LOGGER.debug("_handle_ptc_on_report: PTC turned on, inferring device is powered on")
+            self._is_on = True
@@ -15,7 +15,6 @@ from .constant import (
     FOG_LEVEL_KEY,
     LEDKEPTON_KEY,
     LEDLEVEL_KEY,
-    LED_LEVEL_KEY,
     RGB_LEVEL,
     RGB_TH,
     RGB_MODE,
@@ -25,26 +24,24 @@ from .constant import (
     ATMMODE_KEY,
     ATMCOLOR_KEY,
     ATMBRI_KEY,
+    WATER_LEVEL_STATUS_KEY,
+    FILTERTIME_KEY,
+    FILTERON_KEY,
+    SUSPEND_KEY,
+    WATER_LEVEL_OK,
+    WATER_LEVEL_EMPTY,
 )
 
 from .helpers import Helpers
 
 
-from .pydreobasedevice import PyDreoBaseDevice
+from .pydreobasedevice import PyDreoBaseDevice, ReportField
 from .models import DreoDeviceDetails
 
 _LOGGER = logging.getLogger(__name__)
 
-WATER_LEVEL_STATUS_KEY = "wrong"
 WORKTIME_KEY = "worktime"
 FOGLEVEL_INTERNAL_KEY = "foglevel"
-FILTERTIME_KEY = "filtertime"
-FILTERON_KEY = "filteron"
-SUSPEND_KEY = "suspend"
-
-# Status for water level indicator
-WATER_LEVEL_OK = "ok"
-WATER_LEVEL_EMPTY = "empty"
 
 LIGHT_ON = "Enable"
 LIGHT_OFF = "Disabled"
@@ -65,6 +62,35 @@ if TYPE_CHECKING:
 class PyDreoHumidifier(PyDreoBaseDevice):
     """Base class for Dreo Humidifiers"""
 
+    _REPORT_SCHEMA = {
+        POWERON_KEY: ReportField("_is_on", bool),
+        MODE_KEY: ReportField("_mode", int),
+        WORKTIME_KEY: ReportField("_worktime", int),
+        WATER_LEVEL_STATUS_KEY: ReportField("_wrong", int, mapping=WATER_LEVEL_STATUS_MAP),
+        FOGLEVEL_INTERNAL_KEY: ReportField("_foglevel", int),
+        RGB_LEVEL: ReportField("_rgblevel", int),
+        RGB_TH: ReportField("_rgbth", str),
+        RGB_MODE: ReportField("_rgbmode", int),
+        RGB_COLOR: ReportField("_rgbcolor", int),
+        # LED_LEVEL_KEY and LEDLEVEL_KEY are the same "ledlevel" key.
+        LEDLEVEL_KEY: ReportField("_ledlevel", int, convert=lambda level: LEDLEVEL_MAP.get(level, LIGHT_OFF)),
+        SCHEDULE_ENABLE: ReportField("_scheon", bool),
+        MUTEON_KEY: ReportField("_mute_on", bool),
+        HUMIDITY_KEY: ReportField("_humidity", int),
+        TARGET_AUTO_HUMIDITY_KEY: ReportField("_target_humidity", int),
+        TARGET_SLEEP_HUMIDITY_KEY: ReportField("_sleep_target_humidity", int),
+        LEDKEPTON_KEY: ReportField("_ledkepton", bool),
+        FOG_LEVEL_KEY: ReportField("_fog_level", int),
+        FILTERTIME_KEY: ReportField("_filtertime", int),
+        FILTERON_KEY: ReportField("_filteron", bool),
+        SUSPEND_KEY: ReportField("_suspend", bool),
+        # Newer firmware ambient light keys (atm* / ambient_switch).
+        AMBIENT_SWITCH_KEY: ReportField("_atm_on", bool),
+        ATMMODE_KEY: ReportField("_atm_mode", str),
+        ATMCOLOR_KEY: ReportField("_atm_color", int),
+        ATMBRI_KEY: ReportField("_atm_brightness", int),
+    }
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize air conditioner devices."""
         super().__init__(device_definition, details, dreo)
@@ -596,118 +622,3 @@ class PyDreoHumidifier(PyDreoBaseDevice):
         self._atm_mode = self.get_state_update_value(state, ATMMODE_KEY)
         self._atm_color = self.get_state_update_value(state, ATMCOLOR_KEY)
         self._atm_brightness = self.get_state_update_value(state, ATMBRI_KEY)
-
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("handle_server_update: handle_server_update(%s): %s", self.name, message)
-
-        val_poweron = self.get_server_update_key_value(message, POWERON_KEY)
-        if isinstance(val_poweron, bool):
-            self._is_on = val_poweron
-            _LOGGER.debug("handle_server_update: handle_server_update - poweron is %s", self._is_on)
-
-        val_mode = self.get_server_update_key_value(message, MODE_KEY)
-        if isinstance(val_mode, int):
-            self._mode = val_mode
-
-        val_worktime = self.get_server_update_key_value(message, WORKTIME_KEY)
-        if isinstance(val_worktime, int):
-            self._worktime = val_worktime
-
-        val_water_level = self.get_server_update_key_value(message, WATER_LEVEL_STATUS_KEY)
-        if isinstance(val_water_level, int):
-            val_water_level = WATER_LEVEL_STATUS_MAP.get(val_water_level, val_water_level)
-            self._wrong = val_water_level
-
-        val_foglevel = self.get_server_update_key_value(message, FOGLEVEL_INTERNAL_KEY)
-        if isinstance(val_foglevel, int):
-            self._foglevel = val_foglevel
-
-        val_rgblevel = self.get_server_update_key_value(message, RGB_LEVEL)
-        if isinstance(val_rgblevel, int):
-            self._rgblevel = val_rgblevel
-
-        val_rgbth = self.get_server_update_key_value(message, RGB_TH)
-        if isinstance(val_rgbth, str):
-            self._rgbth = val_rgbth
-
-        val_rgbmode = self.get_server_update_key_value(message, RGB_MODE)
-        if isinstance(val_rgbmode, int):
-            self._rgbmode = val_rgbmode
-
-        val_rgbcolor = self.get_server_update_key_value(message, RGB_COLOR)
-        if isinstance(val_rgbcolor, int):
-            self._rgbcolor = val_rgbcolor
-
-        val_ledlevel = self.get_server_update_key_value(message, LED_LEVEL_KEY)
-        if isinstance(val_ledlevel, int):
-            self._ledlevel = val_ledlevel
-
-        val_ledlevel = self.get_server_update_key_value(message, LED_LEVEL_KEY)
-        if isinstance(val_ledlevel, int):
-            self._ledlevel = val_ledlevel
-
-        val_scheon = self.get_server_update_key_value(message, SCHEDULE_ENABLE)
-        if isinstance(val_scheon, bool):
-            self._scheon = val_scheon
-
-        val_mute_on = self.get_server_update_key_value(message, MUTEON_KEY)
-        if isinstance(val_mute_on, bool):
-            self._mute_on = val_mute_on
-
-        val_humidity = self.get_server_update_key_value(message, HUMIDITY_KEY)
-        if isinstance(val_humidity, int):
-            self._humidity = val_humidity
-            _LOGGER.debug("handle_server_update: handle_server_update - humidity is %s", self._humidity)
-
-        val_target_humidity = self.get_server_update_key_value(message, TARGET_AUTO_HUMIDITY_KEY)
-        if isinstance(val_target_humidity, int):
-            self._target_humidity = val_target_humidity
-            _LOGGER.debug("handle_server_update: handle_server_update - target_humidity is %s", self._target_humidity)
-
-        val_sleep_target_humidity = self.get_server_update_key_value(message, TARGET_SLEEP_HUMIDITY_KEY)
-        if isinstance(val_sleep_target_humidity, int):
-            self._sleep_target_humidity = val_sleep_target_humidity
-            _LOGGER.debug("handle_server_update: handle_server_update - sleep_target_humidity is %s", self._sleep_target_humidity)
-
-        val_ledkepton = self.get_server_update_key_value(message, LEDKEPTON_KEY)
-        if isinstance(val_ledkepton, bool):
-            self._ledkepton = val_ledkepton
-
-        val_ledlevel = self.get_server_update_key_value(message, LEDLEVEL_KEY)
-        if isinstance(val_ledlevel, int):
-            self._ledlevel = LEDLEVEL_MAP.get(val_ledlevel, LIGHT_OFF)
-
-        val_fog_level = self.get_server_update_key_value(message, FOG_LEVEL_KEY)
-        if isinstance(val_fog_level, int):
-            self._fog_level = val_fog_level
-            _LOGGER.debug("handle_server_update: handle_server_update - fog_level is %s", self._fog_level)
-            
-        val_filtertime = self.get_server_update_key_value(message, FILTERTIME_KEY)
-        if isinstance(val_filtertime, int):
-            self._filtertime = val_filtertime
-
-        val_filteron = self.get_server_update_key_value(message, FILTERON_KEY)
-        if isinstance(val_filteron, bool):
-            self._filteron = val_filteron
-
-        val_suspend = self.get_server_update_key_value(message, SUSPEND_KEY)
-        if isinstance(val_suspend, bool):
-            self._suspend = val_suspend
-
-        # Newer firmware ambient light keys (atm* / ambient_switch).
-        val_atm_on = self.get_server_update_key_value(message, AMBIENT_SWITCH_KEY)
-        if isinstance(val_atm_on, bool):
-            self._atm_on = val_atm_on
-
-        val_atm_mode = self.get_server_update_key_value(message, ATMMODE_KEY)
-        if isinstance(val_atm_mode, str):
-            self._atm_mode = val_atm_mode
-
-        val_atm_color = self.get_server_update_key_value(message, ATMCOLOR_KEY)
-        if isinstance(val_atm_color, int):
-            self._atm_color = val_atm_color
-
-        val_atm_brightness = self.get_server_update_key_value(message, ATMBRI_KEY)
-        if isinstance(val_atm_brightness, int):
-            self._atm_brightness = val_atm_brightness
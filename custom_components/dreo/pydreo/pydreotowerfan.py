@@ -3,9 +3,10 @@
 import logging
 from typing import TYPE_CHECKING, Dict
 
-from .constant import SHAKEHORIZON_KEY, SHAKEHORIZONANGLE_KEY, OSCILLATION_KEY, HORIZONTAL_OSCILLATION_ANGLE_KEY, SPEED_RANGE
+from .constant import REPORTED_KEY, SHAKEHORIZON_KEY, SHAKEHORIZONANGLE_KEY, OSCILLATION_KEY, HORIZONTAL_OSCILLATION_ANGLE_KEY, SPEED_RANGE
 
 from .pydreofanbase import PyDreoFanBase
+from .pydreobasedevice import ReportField
 from .models import DreoDeviceDetails
 
 _LOGGER = logging.getLogger(__name__)
@@ -17,6 +18,17 @@ if TYPE_CHECKING:
 class PyDreoTowerFan(PyDreoFanBase):
     """Base class for Dreo Fan API Calls."""
 
+    # Some tower fans use SHAKEHORIZON and some seem to use OSCON
+    _REPORT_SCHEMA = {
+        SHAKEHORIZON_KEY: ReportField("_shakehorizon", bool),
+        SHAKEHORIZONANGLE_KEY: ReportField(types=int, handler="_handle_shakehorizonangle_report"),
+        HORIZONTAL_OSCILLATION_ANGLE_KEY: ReportField(handler="_handle_hoscangle_report"),
+        OSCILLATION_KEY: ReportField("_oscillating", bool),
+    }
+    # hoscangle is ignored when shakehorizonangle is in the same message, so a
+    # hoscangle queued after a shakehorizonangle must not be merged into it.
+    _REPORT_MERGE_BARRIERS = frozenset({HORIZONTAL_OSCILLATION_ANGLE_KEY})
+
     def __init__(self, device_definition: DreoDeviceDetails, details: Dict[str, list], dreo: "PyDreo"):
         """Initialize air devices."""
         super().__init__(device_definition, details, dreo)
@@ -170,27 +182,14 @@ class PyDreoTowerFan(PyDreoFanBase):
                 self._oscillation_angle_key = HORIZONTAL_OSCILLATION_ANGLE_KEY
         self._oscillating = self.get_state_update_value(state, OSCILLATION_KEY)
 
-    def handle_server_update(self, message):
-        """Process a websocket update"""
-        _LOGGER.debug("handle_server_update: handle_server_update")
-        super().handle_server_update(message)
-
-        # Some tower fans use SHAKEHORIZON and some seem to use OSCON
-        val_shakehorizon = self.get_server_update_key_value(message, SHAKEHORIZON_KEY)
-        if isinstance(val_shakehorizon, bool):
-            self._shakehorizon = val_shakehorizon
+    def _handle_shakehorizonangle_report(self, value: int, message: dict) -> None:
+        """Apply a reported shakehorizonangle; it also selects the oscillation angle key."""
+        self._shakehorizonangle = value
+        self._oscillation_angle_key = SHAKEHORIZONANGLE_KEY
 
-        val_shakehorizonangle = self.get_server_update_key_value(message, SHAKEHORIZONANGLE_KEY)
-        if isinstance(val_shakehorizonangle, int):
-            self._shakehorizonangle = val_shakehorizonangle
-            self._oscillation_angle_key = SHAKEHORIZONANGLE_KEY
-
-        val_hoscangle = self.get_server_update_key_value(message, HORIZONTAL_OSCILLATION_ANGLE_KEY)
-        parsed_hoscangle = self._parse_hoscangle(val_hoscangle)
-        if parsed_hoscangle is not None and not isinstance(val_shakehorizonangle, int):
+    def _handle_hoscangle_report(self, value, message: dict) -> None:
+        """Apply a reported hoscangle, unless shakehorizonangle came in the same message."""
+        parsed_hoscangle = self._parse_hoscangle(value)
+        if parsed_hoscangle is not None and not isinstance(message[REPORTED_KEY].get(SHAKEHORIZONANGLE_KEY), int):
             self._shakehorizonangle = parsed_hoscangle
             self._oscillation_angle_key = HORIZONTAL_OSCILLATION_ANGLE_KEY
-
-        val_horiz_oscillation = self.get_server_update_key_value(message, OSCILLATION_KEY)
-        if isinstance(val_horiz_oscillation, bool):
-            self._oscillating = val_horiz_oscillation
@@ -0,0 +1,133 @@
+"""Reconnect backoff and circuit breaker for the WebSocket transport.
+
+A fixed retry delay makes every client reconnect in lockstep after a Dreo
+outage, and a command sent while the cloud is down blocks for the whole retry
+budget. Instead:
+
+* ``BackoffPolicy`` spaces attempts with capped exponential backoff and
+  "equal" jitter: attempt n waits a random time between half and all of
+  ``min(max_delay, base_delay * multiplier ** n)``.
+* ``CircuitBreaker`` counts consecutive connection failures. At
+  ``failure_threshold`` it opens and commands fail fast instead of waiting for
+  a connection. The next connection attempt after the backoff is the
+  half-open probe: success closes the circuit, failure re-opens it.
+"""
+
+import logging
+import random
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from enum import StrEnum
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConnectionState(StrEnum):
+    """Where the transport's connection loop is."""
+
+    STOPPED = "stopped"
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    BACKOFF = "backoff"  # waiting before the next connection attempt
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker state."""
+
+    CLOSED = "closed"  # connected, or failures below the threshold; commands wait for a connection
+    OPEN = "open"  # too many consecutive failures; commands fail fast
+    HALF_OPEN = "half_open"  # probing with one connection attempt; commands still fail fast
+
+
+@dataclass(frozen=True)
+class BackoffPolicy:
+    """Capped exponential backoff with jitter."""
+
+    base_delay: float
+    max_delay: float
+    multiplier: float = 2.0
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number attempt (0-based)."""
+        ceiling = min(self.max_delay, self.base_delay * self.multiplier**attempt)
+        return ceiling * (0.5 + random.random() / 2)
+
+    def max_total(self, attempts: int) -> float:
+        """Upper bound of the summed delays of the first attempts retries."""
+        return sum(min(self.max_delay, self.base_delay * self.multiplier**attempt) for attempt in range(attempts))
+
+
+# Reconnects: about a second after a dropped connection, up to five minutes while the cloud stays down.
+RECONNECT_BACKOFF = BackoffPolicy(base_delay=1.0, max_delay=300.0)
+# Send retries while the socket reconnects.
+SEND_BACKOFF = BackoffPolicy(base_delay=0.5, max_delay=4.0)
+DEFAULT_FAILURE_THRESHOLD = 3
+
+
+class CircuitBreaker:
+    """Opens after consecutive connection failures; closes on the next success.
+
+    ``on_change(state)`` runs on every state change, on the thread recording
+    the outcome.
+    """
+
+    def __init__(self, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD, on_change: Callable[[CircuitState], None] | None = None) -> None:
+        self.failure_threshold = failure_threshold
+        self._on_change = on_change
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self.failures = 0
+        self.opened = 0  # times the circuit has opened
+
+    @property
+    def state(self) -> CircuitState:
+        """Current circuit state."""
+        return self._state
+
+    @property
+    def allows_requests(self) -> bool:
+        """True unless commands should fail fast."""
+        return self._state == CircuitState.CLOSED
+
+    def attempt(self) -> None:
+        """A connection attempt is starting; an open circuit moves to half-open."""
+        self._transition(CircuitState.HALF_OPEN, only_from=CircuitState.OPEN)
+
+    def record_success(self) -> None:
+        """A connection was established."""
+        with self._lock:
+            self.failures = 0
+        self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """A connection attempt failed."""
+        with self._lock:
+            self.failures += 1
+            trip = self._state == CircuitState.HALF_OPEN or self.failures >= self.failure_threshold
+        if trip:
+            self._transition(CircuitState.OPEN)
+
+    def reset(self) -> None:
+        """Forget failures and close the circuit (transport stopped or restarted)."""
+        with self._lock:
+            self.failures = 0
+        self._transition(CircuitState.CLOSED)
+
+    def _transition(self, state: CircuitState, only_from: CircuitState | None = None) -> None:
+        with self._lock:
+            if self._state == state or (only_from is not None and self._state != only_from):
+                return
+            previous, self._state = self._state, state
+            if state == CircuitState.OPEN and previous == CircuitState.CLOSED:
+                self.opened += 1
+        _LOGGER.info("_transition: WebSocket circuit %s -> %s after %d consecutive failures", previous, state, self.failures)
+        if self._on_change is not None:
+            try:
+                self._on_change(state)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("_transition: Circuit state callback failed")
+
+    def stats(self) -> dict:
+        """Circuit state for diagnostics."""
+        return {"state": str(self._state), "failures": self.failures, "failure_threshold": self.failure_threshold, "opened": self.opened}
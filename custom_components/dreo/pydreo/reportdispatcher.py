@@ -0,0 +1,222 @@
+"""Per-device queues between the WebSocket reader and device state application.
+
+The transport thread reads every frame for the account. Applying a report runs
+the device's ``handle_server_update`` and every registered callback, which can
+block on a lock held by an executor-thread setter or on a slow host callback;
+done inline, that stalls the socket read and delays keepalive pings for every
+device. The dispatcher hands each report to a bounded per-device queue instead
+and applies queues on a small worker pool:
+
+* Reports for one device are applied in arrival order, by one worker at a time.
+  A worker takes everything queued for its device as one burst; the optional
+  ``coalesce`` hook merges the burst into as few deltas as the device's
+  ordering rules allow, and ``apply`` runs them with one callback fan-out.
+* Different devices are applied concurrently.
+* A full queue is handled by the ``OverflowPolicy``: ``COALESCE`` merges the
+  new report into the newest queued one (last value per key wins, subject to
+  ``coalesce``; a report it refuses falls back to dropping the oldest), and
+  ``DROP_OLDEST`` discards the oldest queued report.
+
+Until ``start`` is called (unit tests, debug test mode, standalone use without
+a transport) reports are applied inline on the caller's thread.
+"""
+
+import logging
+import threading
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import StrEnum
+from typing import TYPE_CHECKING
+
+from .constant import REPORTED_KEY
+
+if TYPE_CHECKING:
+    from .pydreobasedevice import PyDreoBaseDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_DISPATCH_WORKERS = 4  # devices whose reports are applied at the same time
+DEFAULT_DISPATCH_QUEUE_DEPTH = 32  # reports queued per device before the overflow policy applies
+
+
+class OverflowPolicy(StrEnum):
+    """What to do with a report for a device whose queue is full."""
+
+    COALESCE = "coalesce"
+    DROP_OLDEST = "drop_oldest"
+
+
+@dataclass
+class _DeviceQueue:
+    """Queued reports for one device."""
+
+    device: "PyDreoBaseDevice"
+    messages: deque = field(default_factory=deque)
+    # True while a worker owns this queue; keeps one device on one worker.
+    scheduled: bool = False
+
+
+class ReportDispatcher:
+    """Applies device reports from per-device queues on a worker pool.
+
+    ``apply(device, messages)`` is the state application for a burst of one
+    device's reports, in order. ``coalesce(device, messages)``, if given, runs
+    first and returns the (fewer) deltas to apply. Exceptions from either are
+    logged and do not affect other reports.
+    """
+
+    def __init__(
+        self,
+        apply: Callable[["PyDreoBaseDevice", list[dict]], None],
+        workers: int = DEFAULT_DISPATCH_WORKERS,
+        max_depth: int = DEFAULT_DISPATCH_QUEUE_DEPTH,
+        overflow: OverflowPolicy = OverflowPolicy.COALESCE,
+        coalesce: Callable[["PyDreoBaseDevice", list[dict]], list[dict]] | None = None,
+    ) -> None:
+        self._apply = apply
+        self._coalesce = coalesce
+        self.workers = workers
+        self.max_depth = max_depth
+        self.overflow = OverflowPolicy(overflow)
+        self._lock = threading.Lock()
+        self._queues: dict[str, _DeviceQueue] = {}
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Metrics, updated under the lock.
+        self.dispatched = 0
+        self.bursts = 0
+        self.merged = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.peak_depth = 0
+
+    @property
+    def running(self) -> bool:
+        """True if reports are queued for the worker pool rather than applied inline."""
+        return self._executor is not None
+
+    def start(self) -> None:
+        """Start the worker pool."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="DreoReportDispatch")
+
+    def stop(self) -> None:
+        """Discard queued reports and stop the worker pool.
+
+        A report already being applied finishes first.
+        """
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+            discarded = sum(len(queue.messages) for queue in self._queues.values())
+            self._queues.clear()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if discarded:
+            _LOGGER.debug("stop: Discarded %d queued reports", discarded)
+
+    def submit(self, device: "PyDreoBaseDevice", message: dict) -> None:
+        """Queue a report for device. Never blocks on state application while running."""
+        serial_number = device.serial_number
+        with self._lock:
+            executor = self._executor
+            if executor is not None:
+                queue = self._queues.get(serial_number)
+                if queue is None:
+                    queue = self._queues[serial_number] = _DeviceQueue(device)
+                self._enqueue_locked(queue, message)
+                schedule = not queue.scheduled
+                queue.scheduled = True
+
+        if executor is None:
+            self._apply_burst(device, [message])
+        elif schedule:
+            try:
+                executor.submit(self._drain, serial_number)
+            except RuntimeError:
+                # Stopped between queueing and scheduling; the queue is gone.
+                _LOGGER.debug("submit: Dispatcher stopped; dropping report for %s", device.name)
+
+    def _enqueue_locked(self, queue: _DeviceQueue, message: dict) -> None:
+        messages = queue.messages
+        if len(messages) >= self.max_depth:
+            if self.overflow == OverflowPolicy.COALESCE and self._merge_into_tail(queue, message):
+                self.coalesced += 1
+                return
+            messages.popleft()
+            self.dropped += 1
+        messages.append(message)
+        self.peak_depth = max(self.peak_depth, len(messages))
+
+    def _merge_into_tail(self, queue: _DeviceQueue, message: dict) -> bool:
+        """Merge message into the newest queued report, newest values winning.
+
+        With a ``coalesce`` hook the device's ordering rules decide; a report
+        it will not merge is left for the overflow fallback.
+        """
+        tail = queue.messages[-1]
+        if self._coalesce is not None:
+            merged = self._coalesce(queue.device, [tail, message])
+            if len(merged) != 1:
+                return False
+            queue.messages[-1] = merged[0]
+            return True
+        target_reported = tail.get(REPORTED_KEY)
+        reported = message.get(REPORTED_KEY)
+        if not isinstance(target_reported, dict) or not isinstance(reported, dict):
+            return False
+        tail[REPORTED_KEY] = {**target_reported, **reported}
+        tail["method"] = message.get("method", tail.get("method"))
+        return True
+
+    def _drain(self, serial_number: str) -> None:
+        """Apply one device's queued reports, a burst at a time, until its queue is empty."""
+        while True:
+            with self._lock:
+                queue = self._queues.get(serial_number)
+                if queue is None:
+                    return
+                if not queue.messages:
+                    queue.scheduled = False
+                    return
+                burst = list(queue.messages)
+                queue.messages.clear()
+                self.dispatched += len(burst)
+                self.bursts += 1
+            self._apply_burst(queue.device, burst)
+
+    def _apply_burst(self, device: "PyDreoBaseDevice", messages: list[dict]) -> None:
+        try:
+            if self._coalesce is not None and len(messages) > 1:
+                deltas = self._coalesce(device, messages)
+                with self._lock:
+                    self.merged += len(messages) - len(deltas)
+                messages = deltas
+            self._apply(device, messages)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("_apply_burst: Error applying reports for %s", device.name)
+
+    def depths(self) -> dict[str, int]:
+        """Current queue depth per device serial number, for devices with queued reports."""
+        with self._lock:
+            return {serial_number: len(queue.messages) for serial_number, queue in self._queues.items() if queue.messages}
+
+    def stats(self) -> dict:
+        """Queue metrics for diagnostics."""
+        depths = self.depths()
+        return {
+            "running": self.running,
+            "workers": self.workers,
+            "max_depth": self.max_depth,
+            "overflow": str(self.overflow),
+            "queued": sum(depths.values()),
+            "peak_depth": self.peak_depth,
+            "dispatched": self.dispatched,
+            "bursts": self.bursts,
+            "merged": self.merged,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,204 @@
+"""Device state resync after the WebSocket reconnects.
+
+Reports sent while the socket was down are lost, so cached state can stay
+stale until the next change on each device. After a reconnect PyDreo asks the
+``StateResyncer`` to refresh every device over REST:
+
+* Work runs as jobs on the host scheduler (``PyDreo.schedule_call_later``),
+  ``workers`` of them draining one shared queue, so concurrency is bounded,
+  the resyncer owns no threads, and unload cancels whatever has not started.
+* Single flight per device: a device is queued at most once, and a device
+  requested while its refresh runs is refreshed once more afterwards.
+* Priority devices (those with a command in flight or an outbox batch pending
+  around the disconnect) are refreshed first.
+* A device whose outbox is busy is deferred rather than read: a readback
+  taken mid-batch would revert its optimistic state.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .pydreobasedevice import PyDreoBaseDevice
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RESYNC_WORKERS = 2  # devices refreshed at the same time after a reconnect
+RESYNC_DELAY = 0.5  # seconds after the reconnect before the first refresh
+RESYNC_BUSY_RETRY = 1.0  # seconds before retrying a device whose outbox is busy
+
+
+class StateResyncer:
+    """Refreshes device state through a bounded set of host-scheduled jobs.
+
+    ``refresh(device) -> bool`` fetches and applies one device's state, firing
+    its callbacks; it is called on whichever thread the scheduler runs work
+    on. ``busy(device) -> bool`` says whether a refresh must wait.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[["PyDreoBaseDevice"], bool],
+        schedule: Callable[[float, Callable[[], None]], Callable[[], None]],
+        busy: Callable[["PyDreoBaseDevice"], bool],
+        workers: int = DEFAULT_RESYNC_WORKERS,
+    ) -> None:
+        self._refresh = refresh
+        self._schedule = schedule
+        self._busy = busy
+        self.workers = workers
+        self._lock = threading.Lock()
+        self._priority: deque = deque()
+        self._normal: deque = deque()
+        self._queued: set[str] = set()
+        self._running: set[str] = set()
+        self._again: dict[str, bool] = {}  # requested while running -> priority
+        self._active_workers = 0
+        # Cancel handles of scheduled jobs that have not started yet.
+        self._cancels: dict[int, Callable[[], None]] = {}
+        self._job_ids = 0
+        # Bumped by cancel(); jobs scheduled under an older generation do nothing.
+        self._generation = 0
+
+        # Metrics, updated under the lock.
+        self.requested = 0
+        self.refreshed = 0
+        self.failed = 0
+        self.deferred = 0
+        self.last_started: float | None = None
+        self.last_duration: float | None = None
+
+    def request(self, devices: Iterable["PyDreoBaseDevice"], priority: Iterable[str] = ()) -> None:
+        """Queue devices for a refresh; serial numbers in priority go first."""
+        priority = set(priority)
+        with self._lock:
+            for device in devices:
+                self.requested += 1
+                self._enqueue_locked(device, device.serial_number in priority)
+            if self.last_started is None or self.last_duration is not None:
+                self.last_started, self.last_duration = time.monotonic(), None
+            self._start_workers_locked(RESYNC_DELAY)
+
+    def cancel(self) -> None:
+        """Drop queued refreshes and cancel jobs that have not started. A running refresh finishes."""
+        with self._lock:
+            self._generation += 1
+            cancels, self._cancels = list(self._cancels.values()), {}
+            self._priority.clear()
+            self._normal.clear()
+            self._queued.clear()
+            self._again.clear()
+            self._active_workers = 0
+        for cancel in cancels:
+            try:
+                cancel()
+            except Exception as ex:  # pylint: disable=broad-except
+                _LOGGER.debug("cancel: cancel handle failed: %s", ex)
+
+    @property
+    def pending(self) -> int:
+        """Devices queued or being refreshed."""
+        with self._lock:
+            return len(self._queued) + len(self._running)
+
+    def _enqueue_locked(self, device: "PyDreoBaseDevice", priority: bool) -> None:
+        serial_number = device.serial_number
+        if serial_number in self._running:
+            self._again[serial_number] = self._again.get(serial_number, False) or priority
+            return
+        if serial_number in self._queued:
+            if priority and device in self._normal:
+                self._normal.remove(device)
+                self._priority.append(device)
+            return
+        self._queued.add(serial_number)
+        (self._priority if priority else self._normal).append(device)
+
+    def _schedule_locked(self, delay: float, work: Callable[[], None]) -> None:
+        """Schedule work on the host for this generation. Caller must hold the lock."""
+        generation = self._generation
+        self._job_ids += 1
+        job_id = self._job_ids
+
+        def run() -> None:
+            with self._lock:
+                self._cancels.pop(job_id, None)
+                if generation != self._generation:
+                    return
+            work()
+
+        self._cancels[job_id] = self._schedule(delay, run)
+
+    def _start_workers_locked(self, delay: float) -> None:
+        wanted = min(self.workers, len(self._queued)) - self._active_workers
+        generation = self._generation
+        for _ in range(max(0, wanted)):
+            self._active_workers += 1
+            self._schedule_locked(delay, lambda: self._work(generation))
+
+    def _next_locked(self) -> "PyDreoBaseDevice | None":
+        queue = self._priority or self._normal
+        if not queue:
+            return None
+        device = queue.popleft()
+        self._queued.discard(device.serial_number)
+        self._running.add(device.serial_number)
+        return device
+
+    def _work(self, generation: int) -> None:
+        """Scheduler entry point: refresh queued devices until the queue is empty."""
+        while True:
+            with self._lock:
+                if generation != self._generation:
+                    return
+                device = self._next_locked()
+                if device is None:
+                    self._active_workers -= 1
+                    if self._active_workers == 0 and self.last_duration is None and not self._running:
+                        self.last_duration = time.monotonic() - self.last_started
+                    return
+            self._refresh_one(device, generation)
+
+    def _refresh_one(self, device: "PyDreoBaseDevice", generation: int) -> None:
+        serial_number = device.serial_number
+        ok = deferred = False
+        try:
+            if self._busy(device):
+                deferred = True
+            else:
+                ok = self._refresh(device)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("_refresh_one: Resync failed for %s", device.name)
+        with self._lock:
+            self._running.discard(serial_number)
+            if generation != self._generation:
+                return
+            again = self._again.pop(serial_number, None)
+            if deferred:
+                self.deferred += 1
+                _LOGGER.debug("_refresh_one: %s has commands pending; resync deferred", device.name)
+                self._schedule_locked(RESYNC_BUSY_RETRY, lambda: self.request([device], [serial_number]))
+            elif ok:
+                self.refreshed += 1
+            else:
+                self.failed += 1
+            if again is not None:
+                self._enqueue_locked(device, again)
+
+    def stats(self) -> dict:
+        """Resync counters for diagnostics."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queued": len(self._queued),
+                "running": len(self._running),
+                "requested": self.requested,
+                "refreshed": self.refreshed,
+                "failed": self.failed,
+                "deferred": self.deferred,
+                "last_duration": round(self.last_duration, 3) if self.last_duration is not None else None,
+            }
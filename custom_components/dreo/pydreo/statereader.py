@@ -0,0 +1,143 @@
+"""Single-flight, TTL-cached REST device state reads.
+
+Startup, the ceiling fan's state verification and the post-reconnect resync
+all read ``devicestate``. ``DeviceStateReader`` sits in front of those reads:
+
+* Concurrent reads of one device share a single in-flight request, whether
+  the callers are threads or coroutines.
+* A successful response is served from a cache for ``ttl`` seconds.
+  ``fresh=True`` skips the cache (it still joins a request already in
+  flight).
+* ``invalidate`` drops a device's cached response when a command is sent or a
+  report arrives. A request in flight at that moment is not cached.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from typing import Optional
+
+from .helpers import Helpers
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_STATE_CACHE_TTL = 2.0  # seconds a devicestate response is reused
+
+
+class DeviceStateReader:
+    """Deduplicates and caches ``devicestate`` responses by serial number.
+
+    ``fetch(serial_number)`` and ``async_fetch(serial_number)`` make the actual
+    REST call and return the raw response (or None).
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Optional[dict]],
+        async_fetch: Callable[[str], Awaitable[Optional[dict]]],
+        ttl: float = DEFAULT_STATE_CACHE_TTL,
+    ) -> None:
+        self._fetch = fetch
+        self._async_fetch = async_fetch
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._cache: dict[str, tuple[float, dict]] = {}  # serial number -> (fetched at, response)
+        # Serial number -> (shared result, generation when the request started).
+        self._in_flight: dict[str, tuple[Future, int]] = {}
+        self._generations: dict[str, int] = {}  # bumped by invalidate
+
+        # Counters, updated under the lock.
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.bypassed = 0
+
+    def read(self, serial_number: str, fresh: bool = False) -> Optional[dict]:
+        """The device's devicestate response, blocking while a request is in flight."""
+        future, leader = self._claim(serial_number, fresh)
+        if not leader:
+            return future.result()
+        try:
+            response = self._fetch(serial_number)
+        except BaseException as ex:
+            self._complete(serial_number, future, exception=ex)
+            raise
+        self._complete(serial_number, future, response)
+        return response
+
+    async def async_read(self, serial_number: str, fresh: bool = False) -> Optional[dict]:
+        """Async counterpart of ``read``."""
+        future, leader = self._claim(serial_number, fresh)
+        if not leader:
+            return await asyncio.wrap_future(future)
+        try:
+            response = await self._async_fetch(serial_number)
+        except BaseException as ex:
+            self._complete(serial_number, future, exception=ex)
+            raise
+        self._complete(serial_number, future, response)
+        return response
+
+    def invalidate(self, serial_number: str) -> None:
+        """Forget the device's cached response; a request in flight will not be cached."""
+        with self._lock:
+            self._cache.pop(serial_number, None)
+            self._generations[serial_number] = self._generations.get(serial_number, 0) + 1
+
+    def clear(self) -> None:
+        """Forget every cached response."""
+        with self._lock:
+            for serial_number in self._cache:
+                self._generations[serial_number] = self._generations.get(serial_number, 0) + 1
+            self._cache.clear()
+
+    def _claim(self, serial_number: str, fresh: bool) -> tuple[Future, bool]:
+        """A future for the read and whether the caller must make the request.
+
+        A cache hit returns an already resolved future.
+        """
+        with self._lock:
+            if fresh:
+                self.bypassed += 1
+            else:
+                cached = self._cache.get(serial_number)
+                if cached is not None and time.monotonic() - cached[0] < self.ttl:
+                    self.hits += 1
+                    future: Future = Future()
+                    future.set_result(cached[1])
+                    return future, False
+            flight = self._in_flight.get(serial_number)
+            if flight is not None:
+                self.shared += 1
+                return flight[0], False
+            self.misses += 1
+            future = Future()
+            self._in_flight[serial_number] = (future, self._generations.get(serial_number, 0))
+            return future, True
+
+    def _complete(self, serial_number: str, future: Future, response: Optional[dict] = None, exception: BaseException | None = None) -> None:
+        with self._lock:
+            _, generation = self._in_flight.pop(serial_number)
+            if exception is None and response and Helpers.code_check(response) and generation == self._generations.get(serial_number, 0):
+                self._cache[serial_number] = (time.monotonic(), response)
+        if exception is not None:
+            _LOGGER.debug("_complete: devicestate read failed for %s: %s", serial_number, exception)
+            future.set_exception(exception)
+        else:
+            future.set_result(response)
+
+    def stats(self) -> dict:
+        """Read counters for diagnostics."""
+        with self._lock:
+            return {
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "shared": self.shared,
+                "bypassed": self.bypassed,
+                "cached": len(self._cache),
+                "in_flight": len(self._in_flight),
+            }
@@ -0,0 +1,208 @@
+"""Per-command tracing from setter to confirmed report.
+
+When enabled, every ``CommandOutbox`` batch gets a ``CommandTrace`` that
+records timed spans as the batch moves through the command path:
+
+* ``outbox.collect`` - first key submitted until the quiet period / max wait
+  allowed the batch to go.
+* ``outbox.pace`` - further wait imposed by ``min_interval`` since the
+  previous send to the device.
+* ``command.slot`` - waiting for the device's in-flight command to finish.
+* ``ws.send`` - ``CommandTransport.send_message``, with ``ws.lock`` (waiting
+  for the WebSocket send lock) and ``ws.write`` nested inside it.
+* ``ack`` - send complete until the control-reply (or the ack timeout).
+* ``report`` - ack until the first report for the device carrying one of the
+  batch's keys.
+
+Each ``submit`` also adds a ``submit`` instant event with its keys. Times are
+``time.monotonic()`` seconds, the clock the outbox already paces with.
+
+The trace travels with the batch: the outbox activates it around its ``send``
+callback (``current_trace``), ``PyDreo.send_command`` hands it to the
+transport and parks it on the pending command for the ack, and the tracer
+matches the report. ``chrome_trace`` exports the recent traces in the Chrome
+trace event format (load the JSON in Perfetto or chrome://tracing).
+
+Tracing is off by default; a disabled tracer's ``start`` returns None and every
+hook is skipped.
+"""
+
+import itertools
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+DEFAULT_TRACE_CAPACITY = 100  # recent traces kept for export
+
+OUTCOME_CONFIRMED = "confirmed"
+OUTCOME_UNCONFIRMED = "unconfirmed"  # acked, but a newer command for the device came before a matching report
+OUTCOME_NOT_ACKED = "not_acked"
+OUTCOME_FAILED = "failed"
+OUTCOME_DROPPED = "dropped"
+
+_current_trace: ContextVar["CommandTrace | None"] = ContextVar("dreo_command_trace", default=None)
+
+
+def current_trace() -> "CommandTrace | None":
+    """The trace of the batch being sent on this thread / task, if any."""
+    return _current_trace.get()
+
+
+class CommandTrace:
+    """Spans and events recorded for one command batch."""
+
+    __slots__ = ("trace_id", "device_sn", "device_name", "keys", "started", "started_at", "spans", "events", "outcome")
+
+    def __init__(self, trace_id: str, device_sn: str, device_name: str, keys: Iterable[str], started: float) -> None:
+        self.trace_id = trace_id
+        self.device_sn = device_sn
+        self.device_name = device_name
+        self.keys: set[str] = set(keys)
+        self.started = started
+        self.started_at = time.time()
+        # (name, start, end, args); appended from the outbox, sender and transport threads.
+        self.spans: list[tuple[str, float, float, dict]] = []
+        self.events: list[tuple[str, float, dict]] = []
+        self.outcome: str | None = None
+
+    def span(self, name: str, start: float, end: float | None = None, **args) -> None:
+        """Record a span from start to end (now if omitted)."""
+        self.spans.append((name, start, time.monotonic() if end is None else end, args))
+
+    def event(self, name: str, at: float | None = None, **args) -> None:
+        """Record an instant event at at (now if omitted)."""
+        self.events.append((name, time.monotonic() if at is None else at, args))
+
+    def add_keys(self, keys: Iterable[str]) -> None:
+        """Add keys merged into the batch after it started."""
+        self.keys.update(keys)
+
+    def as_dict(self) -> dict:
+        """The trace with span times in milliseconds since its first submit."""
+
+        def offset(at: float) -> float:
+            return round((at - self.started) * 1000, 3)
+
+        return {
+            "trace_id": self.trace_id,
+            "device": self.device_name,
+            "keys": sorted(self.keys),
+            "started_at": self.started_at,
+            "outcome": self.outcome,
+            "spans": [
+                {"name": name, "start_ms": offset(start), "duration_ms": round((end - start) * 1000, 3), **args}
+                for name, start, end, args in list(self.spans)
+            ],
+            "events": [{"name": name, "at_ms": offset(at), **args} for name, at, args in list(self.events)],
+        }
+
+
+class CommandTracer:
+    """Creates command traces and keeps the most recent for export."""
+
+    def __init__(self, capacity: int = DEFAULT_TRACE_CAPACITY, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._recent: deque[CommandTrace] = deque(maxlen=capacity)
+        # Acked traces waiting for their confirming report, by device serial number.
+        self._awaiting_report: dict[str, CommandTrace] = {}
+
+    def start(self, device_sn: str, device_name: str, keys: Iterable[str], started: float | None = None) -> CommandTrace | None:
+        """Begin a trace for a batch, or return None if tracing is disabled."""
+        if not self.enabled:
+            return None
+        started = time.monotonic() if started is None else started
+        trace = CommandTrace(f"{next(self._ids):x}", device_sn, device_name, keys, started)
+        with self._lock:
+            self._recent.append(trace)
+        return trace
+
+    @staticmethod
+    @contextmanager
+    def activate(trace: CommandTrace | None) -> Iterator[None]:
+        """Make trace the ``current_trace`` for the with-block."""
+        token = _current_trace.set(trace)
+        try:
+            yield
+        finally:
+            _current_trace.reset(token)
+
+    def finish(self, trace: CommandTrace, outcome: str) -> None:
+        """Close trace with outcome; a trace already closed keeps its first outcome."""
+        with self._lock:
+            if trace.outcome is None:
+                trace.outcome = outcome
+            if self._awaiting_report.get(trace.device_sn) is trace:
+                del self._awaiting_report[trace.device_sn]
+
+    def await_report(self, trace: CommandTrace, acked: float) -> None:
+        """Wait for the report confirming an acked trace.
+
+        A newer command for the same device supersedes any trace still waiting.
+        """
+        with self._lock:
+            previous = self._awaiting_report.get(trace.device_sn)
+            if previous is not None and previous.outcome is None:
+                previous.outcome = OUTCOME_UNCONFIRMED
+            trace.event("acked", acked)
+            self._awaiting_report[trace.device_sn] = trace
+
+    def on_report(self, device_sn: str | None, reported: dict | None) -> None:
+        """Close the device's awaiting trace if reported carries one of its keys."""
+        if not self._awaiting_report or device_sn is None or not isinstance(reported, dict):
+            return
+        now = time.monotonic()
+        with self._lock:
+            trace = self._awaiting_report.get(device_sn)
+            if trace is None or trace.keys.isdisjoint(reported):
+                return
+            del self._awaiting_report[device_sn]
+            # Record the span before the outcome so a confirmed trace is complete.
+            acked = next((at for name, at, _ in reversed(trace.events) if name == "acked"), now)
+            trace.span("report", acked, now, keys=sorted(trace.keys.intersection(reported)))
+            if trace.outcome is None:
+                trace.outcome = OUTCOME_CONFIRMED
+
+    def recent(self) -> list[dict]:
+        """The recent traces, oldest first."""
+        with self._lock:
+            traces = list(self._recent)
+        return [trace.as_dict() for trace in traces]
+
+    def chrome_trace(self) -> dict:
+        """The recent traces in Chrome trace event format.
+
+        Each device is a process and each trace a thread within it, so spans of
+        one trace nest and concurrent traces do not overlap.
+        """
+        with self._lock:
+            traces = list(self._recent)
+        pids: dict[str, int] = {}
+        events: list[dict] = []
+        for tid, trace in enumerate(traces, start=1):
+            pid = pids.get(trace.device_name)
+            if pid is None:
+                pid = pids[trace.device_name] = len(pids) + 1
+                events.append({"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": trace.device_name}})
+            events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": f"trace {trace.trace_id}"}})
+            common = {"trace_id": trace.trace_id, "keys": sorted(trace.keys), "outcome": trace.outcome}
+            for name, start, end, args in list(trace.spans):
+                events.append(
+                    {
+                        "name": name,
+                        "cat": "command",
+                        "ph": "X",
+                        "ts": round(start * 1e6, 1),
+                        "dur": round((end - start) * 1e6, 1),
+                        "pid": pid,
+                        "tid": tid,
+                        "args": {**common, **args},
+                    }
+                )
+            for name, at, args in list(trace.events):
+                events.append({"name": name, "cat": "command", "ph": "i", "s": "t", "ts": round(at * 1e6, 1), "pid": pid, "tid": tid, "args": {**common, **args}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
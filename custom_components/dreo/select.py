@@ -13,11 +13,11 @@ import logging
 
 from .haimports import *  # pylint: disable=W0401,W0614
 from .dreobasedevice import DreoBaseDeviceHA
-from .pydreo import PyDreo
 from .pydreo.pydreobasedevice import PyDreoBaseDevice
 from .pydreo.constant import DreoDeviceType
 
-from .const import DOMAIN, PYDREO_MANAGER
+from .const import DOMAIN, DREO_ONBOARDING
+from .onboarding import DreoDeviceOnboarding
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,6 +30,9 @@ class DreoSelectEntityDescription(SelectEntityDescription):
     options_list: list[str] = field(default_factory=list)
     raw_values: list[int] = field(default_factory=list)
     exists_fn: Callable[[PyDreoBaseDevice], bool] | None = None
+    # Device attributes (as named in device callbacks) the entity state reads;
+    # None subscribes the entity to every change.
+    depends_on: tuple[str, ...] | None = None
 
 
 SELECTS: tuple[DreoSelectEntityDescription, ...] = (
@@ -37,6 +40,7 @@ SELECTS: tuple[DreoSelectEntityDescription, ...] = (
         key="Mist Level",
         translation_key="mist_level",
         attr_name="mist_level",
+        depends_on=("foglevel",),
         icon="mdi:weather-windy",
         options_list=["low", "medium", "high"],
         raw_values=[1, 2, 3],
@@ -46,6 +50,7 @@ SELECTS: tuple[DreoSelectEntityDescription, ...] = (
         key="Ambient Light Mode",
         translation_key="ambient_light_mode",
         attr_name="rgbmode",
+        depends_on=("rgbmode", "rgbmode_options"),
         icon="mdi:lightbulb-cog",
         options_list=["humidity", "color"],
         raw_values=[0, 1],
@@ -56,6 +61,7 @@ SELECTS: tuple[DreoSelectEntityDescription, ...] = (
         key="3D Angle Preset",
         translation_key="three_d_angle_preset",
         attr_name="angle_preset",
+        depends_on=("angle_preset_options", "fixed_conf"),
         icon="mdi:axis-arrow",
         exists_fn=lambda device: device.type == DreoDeviceType.AIR_CIRCULATOR and device.is_feature_supported("angle_preset"),
     ),
@@ -85,8 +91,8 @@ async def async_setup_entry(
     """Set up the Dreo Select platform."""
     _LOGGER.info("Starting Dreo Select Platform")
 
-    pydreo_manager: PyDreo = hass.data[DOMAIN][PYDREO_MANAGER]
-    async_add_entities(get_entries(pydreo_manager.devices))
+    onboarding: DreoDeviceOnboarding = hass.data[DOMAIN][DREO_ONBOARDING]
+    onboarding.async_add_platform(get_entries, async_add_entities)
 
 
 class DreoSelectHA(DreoBaseDeviceHA, SelectEntity):
@@ -15,6 +15,17 @@ from .dreobasedevice import DreoBaseDeviceHA
 from .pydreo import PyDreo
 from .pydreo.pydreobasedevice import PyDreoBaseDevice
 from .pydreo.constant import HUMIDITY_KEY, MODE_KEY, PM25_KEY, DreoDeviceType
+from .pydreo.metrics import (
+    METRIC_COMMAND_ACK_LATENCY,
+    METRIC_COMMAND_ACK_TIMEOUTS,
+    METRIC_COMMAND_RETRIES,
+    METRIC_REPORT_QUEUE_DEPTH,
+    METRIC_REST_ERRORS,
+    METRIC_REST_LATENCY,
+    METRIC_WS_RECONNECTS,
+    METRIC_WS_SEND_RETRIES,
+    MetricsRegistry,
+)
 
 
 from .haimports import *  # pylint: disable=W0401,W0614
@@ -22,25 +33,22 @@ from .haimports import *  # pylint: disable=W0401,W0614
 from .const import (
     DOMAIN,
     PYDREO_MANAGER,
+    DREO_ONBOARDING,
+    CONF_METRICS_SENSORS,
 )
+from .onboarding import DreoDeviceOnboarding
 
-from .pydreo.pydreochefmaker import (
+from .pydreo.constant import (
     MODE_OFF,
     MODE_CONFIGURING,
     MODE_COOKING,
     MODE_STANDBY,
     MODE_PAUSED,
     MODE_COMPLETE,
-)
-
-from .pydreo.pydreohumidifier import (
     WORKTIME_KEY,
     FILTERTIME_KEY,
     FILTERON_KEY,
     SUSPEND_KEY,
-    MODE_NORMAL,
-    MODE_AUTO,
-    MODE_SLEEP,
     WATER_LEVEL_OK,
     WATER_LEVEL_EMPTY,
     WATER_LEVEL_STATUS_KEY,
@@ -56,6 +64,9 @@ class DreoSensorEntityDescription(SensorEntityDescription):
     value_fn: Callable[[DreoBaseDeviceHA], StateType] = None
     exists_fn: Callable[[DreoBaseDeviceHA], bool] = None
     native_unit_of_measurement_fn: Callable[[DreoBaseDeviceHA], str] = None
+    # Device attributes (as named in device callbacks) the entity state reads;
+    # None subscribes the entity to every change.
+    depends_on: tuple[str, ...] | None = None
 
 
 SENSORS: tuple[DreoSensorEntityDescription, ...] = (
@@ -66,6 +77,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTemperature.FAHRENHEIT,
         value_fn=lambda device: device.temperature,
+        depends_on=("temperature", "temperature_offset"),
         exists_fn=lambda device: (
             (device.type not in {DreoDeviceType.HEATER, DreoDeviceType.AIR_CONDITIONER}) and device.is_feature_supported("temperature")
         ),
@@ -77,6 +89,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement_fn=lambda device: "%",
         value_fn=lambda device: device.humidity,
+        depends_on=("humidity",),
         exists_fn=lambda device: device.is_feature_supported("humidity"),
     ),
     DreoSensorEntityDescription(
@@ -86,6 +99,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement_fn=lambda device: "h",
         value_fn=lambda device: device.work_time,
+        depends_on=("work_time",),
         exists_fn=lambda device: device.is_feature_supported("work_time"),
     ),
     DreoSensorEntityDescription(
@@ -94,6 +108,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENUM,
         options=["yes", "no"],
         value_fn=lambda device: device.temp_target_reached,
+        depends_on=("temp_target_reached",),
         exists_fn=lambda device: device.is_feature_supported("temp_target_reached"),
     ),
     DreoSensorEntityDescription(
@@ -102,6 +117,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENUM,
         options=[MODE_STANDBY, MODE_CONFIGURING, MODE_COOKING, MODE_OFF, MODE_PAUSED, MODE_COMPLETE],
         value_fn=lambda device: device.mode,
+        depends_on=("mode",),
         exists_fn=lambda device: (device.type in {DreoDeviceType.CHEF_MAKER}) and device.is_feature_supported(MODE_KEY),
     ),
     DreoSensorEntityDescription(
@@ -109,6 +125,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         translation_key="cook_end_time",
         device_class=SensorDeviceClass.TIMESTAMP,
         value_fn=lambda device: device.cook_end_time,
+        depends_on=("cook_time_begin", "cook_time_estimated", "mode"),
         exists_fn=lambda device: device.type in {DreoDeviceType.CHEF_MAKER},
     ),
     DreoSensorEntityDescription(
@@ -118,6 +135,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=MICROGRAMS_PER_CUBIC_METER,
         value_fn=lambda device: device.pm25,
+        depends_on=("pm25",),
         exists_fn=lambda device: device.is_feature_supported(PM25_KEY),
     ),
     DreoSensorEntityDescription(
@@ -126,6 +144,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENUM,
         options=[WATER_LEVEL_OK, WATER_LEVEL_EMPTY],
         value_fn=lambda device: device.water_level,
+        depends_on=("wrong",),
         exists_fn=lambda device: (device.type != DreoDeviceType.HUMIDIFIER) and device.is_feature_supported(WATER_LEVEL_STATUS_KEY),
     ),
     DreoSensorEntityDescription(
@@ -135,6 +154,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement_fn=lambda device: "h",
         value_fn=lambda device: device.worktime,
+        depends_on=("worktime",),
         exists_fn=lambda device: (device.type in {DreoDeviceType.HUMIDIFIER}) and device.is_feature_supported(WORKTIME_KEY),
     ),
     DreoSensorEntityDescription(
@@ -144,6 +164,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement_fn=lambda device: "%",
         value_fn=lambda device: device.filtertime,
+        depends_on=("filtertime",),
         exists_fn=lambda device: (device.type in {DreoDeviceType.HUMIDIFIER}) and device.is_feature_supported(FILTERTIME_KEY),
     ),
     DreoSensorEntityDescription(
@@ -153,6 +174,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENUM,
         options=["active", "inactive"],
         value_fn=lambda device: None if device.filteron is None else ("active" if device.filteron else "inactive"),
+        depends_on=("filteron",),
         exists_fn=lambda device: (device.type in {DreoDeviceType.HUMIDIFIER}) and device.is_feature_supported(FILTERON_KEY),
     ),
     DreoSensorEntityDescription(
@@ -162,6 +184,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENUM,
         options=["yes", "no"],
         value_fn=lambda device: None if device.suspend is None else ("yes" if device.suspend else "no"),
+        depends_on=("suspend",),
         exists_fn=lambda device: (device.type in {DreoDeviceType.HUMIDIFIER, DreoDeviceType.EVAPORATIVE_COOLER}) and device.is_feature_supported(SUSPEND_KEY),
     ),
     DreoSensorEntityDescription(
@@ -170,6 +193,7 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         icon="mdi:account-multiple",
         state_class=SensorStateClass.MEASUREMENT,
         value_fn=lambda device: device.people_detected,
+        depends_on=("people_detected",),
         exists_fn=lambda device: device.is_feature_supported("people_detected"),
     ),
     DreoSensorEntityDescription(
@@ -179,11 +203,88 @@ SENSORS: tuple[DreoSensorEntityDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement_fn=lambda device: "°",
         value_fn=lambda device: device.follow_me_angle,
+        depends_on=("follow_me_angle",),
         exists_fn=lambda device: device.is_feature_supported("follow_me_angle"),
     ),
 )
 
 
+@dataclass
+class DreoMetricSensorEntityDescription(SensorEntityDescription):
+    """Describe a Dreo transport metric sensor."""
+
+    value_fn: Callable[[MetricsRegistry], StateType] = None
+
+
+def _p95_ms(metrics: MetricsRegistry, name: str) -> StateType:
+    """p95 estimate of a latency histogram in milliseconds, or None before the first sample."""
+    p95 = metrics.histogram(name).quantile(0.95)
+    return None if p95 is None else round(p95 * 1000, 1)
+
+
+# Per config entry, opt-in via the metrics_sensors option.
+METRIC_SENSORS: tuple[DreoMetricSensorEntityDescription, ...] = (
+    DreoMetricSensorEntityDescription(
+        key=METRIC_WS_RECONNECTS,
+        translation_key="metric_ws_reconnects",
+        icon="mdi:connection",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.counter(METRIC_WS_RECONNECTS).value,
+    ),
+    DreoMetricSensorEntityDescription(
+        key=METRIC_WS_SEND_RETRIES,
+        translation_key="metric_ws_send_retries",
+        icon="mdi:send-clock",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.counter(METRIC_WS_SEND_RETRIES).value,
+    ),
+    DreoMetricSensorEntityDescription(
+        key=METRIC_COMMAND_ACK_TIMEOUTS,
+        translation_key="metric_command_ack_timeouts",
+        icon="mdi:timer-alert-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.counter(METRIC_COMMAND_ACK_TIMEOUTS).value,
+    ),
+    DreoMetricSensorEntityDescription(
+        key=METRIC_COMMAND_RETRIES,
+        translation_key="metric_command_retries",
+        icon="mdi:replay",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.counter(METRIC_COMMAND_RETRIES).value,
+    ),
+    DreoMetricSensorEntityDescription(
+        key=METRIC_REST_ERRORS,
+        translation_key="metric_rest_errors",
+        icon="mdi:cloud-alert",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: metrics.counter(METRIC_REST_ERRORS).value,
+    ),
+    DreoMetricSensorEntityDescription(
+        key=f"{METRIC_COMMAND_ACK_LATENCY}_p95",
+        translation_key="metric_command_ack_latency_p95",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda metrics: _p95_ms(metrics, METRIC_COMMAND_ACK_LATENCY),
+    ),
+    DreoMetricSensorEntityDescription(
+        key=f"{METRIC_REST_LATENCY}_p95",
+        translation_key="metric_rest_latency_p95",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        value_fn=lambda metrics: _p95_ms(metrics, METRIC_REST_LATENCY),
+    ),
+    DreoMetricSensorEntityDescription(
+        key=METRIC_REPORT_QUEUE_DEPTH,
+        translation_key="metric_report_queue_depth",
+        icon="mdi:tray-full",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.gauge(METRIC_REPORT_QUEUE_DEPTH).value,
+    ),
+)
+
+
 def get_entries(pydreo_devices: list[PyDreoBaseDevice]) -> list[DreoSensorHA]:
     """Add Sensor entries for Dreo devices."""
     sensor_ha_collection: list[DreoSensorHA] = []
@@ -217,8 +318,12 @@ async def async_setup_entry(
     _LOGGER.info("get_entries: Starting Dreo Sensor Platform")
 
     pydreo_manager: PyDreo = hass.data[DOMAIN][PYDREO_MANAGER]
+    onboarding: DreoDeviceOnboarding = hass.data[DOMAIN][DREO_ONBOARDING]
 
-    async_add_entities(get_entries(pydreo_manager.devices))
+    onboarding.async_add_platform(get_entries, async_add_entities)
+
+    if config_entry.options.get(CONF_METRICS_SENSORS, False):
+        async_add_entities(DreoMetricSensorHA(config_entry, pydreo_manager.metrics, description) for description in METRIC_SENSORS)
 
 
 class DreoSensorHA(DreoBaseDeviceHA, SensorEntity):
@@ -252,3 +357,25 @@ class DreoSensorHA(DreoBaseDeviceHA, SensorEntity):
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
         return self.entity_description.value_fn(self.device)
+
+
+class DreoMetricSensorHA(SensorEntity):
+    """Diagnostic sensor exposing one PyDreo transport metric for a config entry.
+
+    Metrics change on every message and command, so these poll rather than
+    subscribing to device callbacks.
+    """
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = True
+
+    def __init__(self, config_entry: ConfigEntry, metrics: MetricsRegistry, description: DreoMetricSensorEntityDescription) -> None:
+        self.metrics = metrics
+        self.entity_description = description
+        self._attr_unique_id = f"{config_entry.entry_id}-metrics-{description.key}"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the current value of the metric."""
+        return self.entity_description.value_fn(self.metrics)
@@ -13,10 +13,11 @@ import logging
 from .haimports import *  # pylint: disable=W0401,W0614
 from .dreobasedevice import DreoBaseDeviceHA
 from .dreochefmaker import DreoChefMakerHA
-from .pydreo import PyDreo, PyDreoBaseDevice
+from .pydreo import PyDreoBaseDevice
 from .pydreo.constant import DreoDeviceType
 
-from .const import DOMAIN, PYDREO_MANAGER
+from .const import DOMAIN, DREO_ONBOARDING
+from .onboarding import DreoDeviceOnboarding
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,10 +28,13 @@ class DreoSwitchEntityDescription(SwitchEntityDescription):
 
     Extends Home Assistant's SwitchEntityDescription to add Dreo-specific fields:
     - attr_name: The PyDreo device attribute name to control
+    - depends_on: The device attributes (as named in device callbacks) that
+      attr_name reads; only changes to these update the entity
     - icon: Material Design Icon to display in the UI
     """
 
     attr_name: str = None  # Name of the device attribute (e.g., "childlockon")
+    depends_on: tuple[str, ...] | None = None  # None updates on every change
     icon: str = None  # MDI icon identifier (e.g., "mdi:lock")
 
 
@@ -41,91 +45,106 @@ SWITCHES: tuple[DreoSwitchEntityDescription, ...] = (
         key="Horizontally Oscillating",
         translation_key="horizontally_oscillating",
         attr_name="horizontally_oscillating",
+        depends_on=("horizontally_oscillating", "osc_mode"),
         icon="mdi:rotate-360",
     ),
     DreoSwitchEntityDescription(
         key="Vertically Oscillating",
         translation_key="vertically_oscillating",
         attr_name="vertically_oscillating",
+        depends_on=("osc_mode", "vertically_oscillating"),
         icon="mdi:rotate-360",
     ),
     DreoSwitchEntityDescription(
         key="Display Auto Off",
         translation_key="display_auto_off",
         attr_name="display_auto_off",
+        depends_on=("display_auto_off", "led_always_on", "led_kept_on"),
         icon="mdi:monitor",
     ),
     DreoSwitchEntityDescription(
         key="Panel Sound",
         translation_key="panel_sound",
         attr_name="panel_sound",
+        depends_on=("mute_on", "voice_on"),
         icon="mdi:volume-high",
     ),
     DreoSwitchEntityDescription(
         key="Misting",
         translation_key="mist",
         attr_name="mist",
+        depends_on=("mist_on",),
         icon="mdi:sprinkler-variant",
     ),
     DreoSwitchEntityDescription(
         key="Adaptive Brightness",
         translation_key="adaptive_brightness",
         attr_name="adaptive_brightness",
+        depends_on=("light_sensor_on",),
         icon="mdi:monitor",
     ),
     DreoSwitchEntityDescription(
         key="Oscillating",
         translation_key="oscon",
         attr_name="oscon",
+        depends_on=("osc_mode", "oscon"),
         icon="mdi:rotate-360",
     ),
-    DreoSwitchEntityDescription(key="PTC", translation_key="ptcon", attr_name="ptcon", icon="mdi:help"),
+    DreoSwitchEntityDescription(key="PTC", translation_key="ptcon", attr_name="ptcon", depends_on=("ptc_on",), icon="mdi:help"),
     DreoSwitchEntityDescription(
         key="Child Lock",
         translation_key="childlockon",
         attr_name="childlockon",
+        depends_on=("child_lock_on", "childlockon"),
         icon="mdi:lock",
     ),
     DreoSwitchEntityDescription(
         key="Presence Sensor",
         translation_key="locatemeon",
         attr_name="locatemeon",
+        depends_on=("locate_me_on",),
         icon="mdi:crosshairs-gps",
     ),
     DreoSwitchEntityDescription(
         key="Light",
         translation_key="light",
         attr_name="ledpotkepton",
+        depends_on=("ledpotkepton",),
         icon="mdi:led-on",
     ),
     DreoSwitchEntityDescription(
         key="Humidify",
         translation_key="humidify",
         attr_name="humidify",
+        depends_on=("humidify",),
         icon="mdi:air-humidifier",
     ),
     DreoSwitchEntityDescription(
         key="Display Light",
         translation_key="display_light",
         attr_name="display_light",
+        depends_on=("display_light", "ledlevel", "light_on"),
         icon="mdi:led-on",
     ),
     DreoSwitchEntityDescription(
         key="Auto Turn On",
         translation_key="auto_mode",
         attr_name="auto_mode",
+        depends_on=("auto_on",),
         icon="mdi:autorenew",
     ),
     DreoSwitchEntityDescription(
         key="Schedule",
         translation_key="scheon",
         attr_name="scheon",
+        depends_on=("scheon",),
         icon="mdi:calendar",
     ),
     DreoSwitchEntityDescription(
         key="Follow Me",
         translation_key="follow_me",
         attr_name="follow_me",
+        depends_on=("follow_me",),
         icon="mdi:motion-sensor",
     ),
 )
@@ -180,23 +199,24 @@ async def async_setup_entry(
     """
     _LOGGER.info("get_entries: Starting Dreo Switch Platform")
 
-    # Get the PyDreo manager from Home Assistant's data storage
-    pydreo_manager: PyDreo = hass.data[DOMAIN][PYDREO_MANAGER]
+    # Devices are handed over by onboarding as each one's state loads
+    onboarding: DreoDeviceOnboarding = hass.data[DOMAIN][DREO_ONBOARDING]
 
-    switch_entities_ha: list[SwitchEntity] = []
+    def get_switch_entities(pydreo_devices: list[PyDreoBaseDevice]) -> list[SwitchEntity]:
+        switch_entities_ha: list[SwitchEntity] = []
 
-    # Special case: ChefMaker devices get their own switch class
-    # (ChefMaker has complex cooking modes that need custom handling)
-    for pydreo_device in pydreo_manager.devices:
-        if pydreo_device.type == DreoDeviceType.CHEF_MAKER:
-            switch_entities_ha.append(DreoChefMakerHA(pydreo_device))
+        # Special case: ChefMaker devices get their own switch class
+        # (ChefMaker has complex cooking modes that need custom handling)
+        for pydreo_device in pydreo_devices:
+            if pydreo_device.type == DreoDeviceType.CHEF_MAKER:
+                switch_entities_ha.append(DreoChefMakerHA(pydreo_device))
 
-    # Add standard feature switches for all devices
-    switch_entities_to_add = get_entries(pydreo_manager.devices)
-    switch_entities_ha.extend(switch_entities_to_add)
+        # Add standard feature switches for all devices
+        switch_entities_ha.extend(get_entries(pydreo_devices))
+        return switch_entities_ha
 
     # Register all switch entities with Home Assistant
-    async_add_entities(switch_entities_ha)
+    onboarding.async_add_platform(get_switch_entities, async_add_entities)
 
 
 class DreoSwitchHA(DreoBaseDeviceHA, SwitchEntity):
@@ -5,3 +5,15 @@ import sys
 import importlib.util
 from typing import TYPE_CHECKING
 from custom_components.dreo.pydreo import *
+from custom_components.dreo.pydreo import (  # device classes load lazily, so the star import above leaves them out
+    PyDreoAC,
+    PyDreoAirCirculator,
+    PyDreoAirPurifier,
+    PyDreoCeilingFan,
+    PyDreoChefMaker,
+    PyDreoDehumidifier,
+    PyDreoEvaporativeCooler,
+    PyDreoHeater,
+    PyDreoHumidifier,
+    PyDreoTowerFan,
+)
@@ -0,0 +1,165 @@
+"""Integration tests for attribute-scoped entity subscriptions."""
+
+# pylint: disable=used-before-assignment
+import asyncio
+import contextlib
+import logging
+import os
+from unittest.mock import PropertyMock, patch
+import pytest
+from homeassistant.helpers.entity import Entity
+
+from custom_components.dreo import binary_sensor
+from custom_components.dreo import humidifier
+from custom_components.dreo import light
+from custom_components.dreo import number
+from custom_components.dreo import select
+from custom_components.dreo import sensor
+from custom_components.dreo import switch
+from custom_components.dreo.dreobasedevice import DreoBaseDeviceHA
+
+from .imports import *  # pylint: disable=W0401,W0614
+from .integrationtestbase import IntegrationTestBase, API_REPONSE_BASE_PATH, PATCH_SEND_COMMAND
+from . import call_json
+
+PATCH_BASE_PATH = "homeassistant.helpers.entity.Entity"
+PATCH_SCHEDULE_UPDATE_HA_STATE = f"{PATCH_BASE_PATH}.schedule_update_ha_state"
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+DEVICES_FILES = sorted(name for name in os.listdir(API_REPONSE_BASE_PATH) if name.startswith("get_devices_"))
+
+# Properties that make up each description-driven entity's state.
+STATE_PROPERTIES = {
+    switch.DreoSwitchHA: ("is_on",),
+    sensor.DreoSensorHA: ("native_value",),
+    number.DreoNumberHA: ("native_value",),
+    select.DreoSelectHA: ("current_option", "options"),
+    binary_sensor.DreoBinarySensorHA: ("is_on", "icon", "extra_state_attributes"),
+}
+
+
+def _description_entities(devices) -> list[DreoBaseDeviceHA]:
+    entities = []
+    for platform in (switch, sensor, number, select, binary_sensor):
+        entities.extend(platform.get_entries(devices))
+    return entities
+
+
+def _entity_state(entity) -> tuple:
+    state = []
+    for prop in STATE_PROPERTIES[type(entity)]:
+        try:
+            state.append(repr(getattr(entity, prop)))
+        except Exception as ex:  # pylint: disable=broad-except
+            state.append(type(ex).__name__)
+    return tuple(state)
+
+
+def _perturbed(value):
+    """A different value of the same type, or None when we cannot make one."""
+    if isinstance(value, bool):
+        return not value
+    if isinstance(value, (int, float)):
+        return value + 1
+    if isinstance(value, str):
+        return value + "1"
+    return None
+
+
+class TestEntitySubscriptions(IntegrationTestBase):
+    """Check depends_on declarations against every model fixture."""
+
+    @pytest.mark.parametrize("devices_file", DEVICES_FILES)
+    def test_depends_on_covers_entity_state(self, devices_file: str):
+        """Changing an attribute an entity did not declare never changes its state."""
+        with patch(PATCH_SCHEDULE_UPDATE_HA_STATE):
+            self.get_devices_file_name = devices_file
+            try:
+                self.pydreo_manager.load_devices()
+            except Exception:  # pylint: disable=broad-except
+                pytest.skip(f"{devices_file} does not load")
+
+            for entity in _description_entities(self.pydreo_manager.devices):
+                depends_on = entity.depends_on
+                if depends_on is None:
+                    continue
+                device = entity.pydreo_device
+                baseline = _entity_state(entity)
+                for name, value in list(vars(device).items()):
+                    perturbed = _perturbed(value)
+                    if name.lstrip("_") in depends_on or perturbed is None:
+                        continue
+                    setattr(device, name, perturbed)
+                    try:
+                        state = _entity_state(entity)
+                    finally:
+                        setattr(device, name, value)
+                    assert state == baseline, f"{entity.entity_description.key} on {device.model} reads {name} but does not declare it"
+
+    @pytest.mark.parametrize(
+        ("key", "action"),
+        [
+            ("Sleep Target Humidity", lambda entity: entity.set_native_value(50)),
+            ("Panel Sound", lambda entity: entity.turn_off()),
+            ("Mist Level", lambda entity: entity.select_option(next(option for option in entity.options if option != entity.current_option))),
+        ],
+    )
+    def test_optimistic_write_updates_entity(self, key: str, action):
+        """Setting through an entity writes it by the time the device echoes the command, whether or not the setter updated state optimistically."""
+        self.get_devices_file_name = "get_devices_HHM001S.json"
+        self.pydreo_manager.load_devices()
+        device = self.pydreo_manager.devices[0]
+        entity = next(entity for entity in _description_entities([device]) if entity.entity_description.key == key)
+        before = _entity_state(entity)
+
+        with patch.object(Entity, "schedule_update_ha_state", autospec=True) as mock_write, patch(PATCH_SEND_COMMAND) as mock_send_command:
+            asyncio.run(entity.async_added_to_hass())
+            action(entity)
+            ((_, params),) = [call.args for call in mock_send_command.call_args_list]
+            echo = {"devicesn": device.serial_number, "method": "control-report", REPORTED_KEY: params}
+            device.handle_server_update_base(echo)
+            assert entity in [call.args[0] for call in mock_write.call_args_list]
+            assert _entity_state(entity) != before
+
+            writes = mock_write.call_count
+            device.handle_server_update_base(echo)
+            assert mock_write.call_count == writes
+
+    def test_state_writes_per_message_benchmark(self):
+        """Benchmark: scoped subscriptions cut state writes per WebSocket message."""
+        self.get_devices_file_name = "get_devices_HHM015S.json"
+        self.pydreo_manager.load_devices()
+        device = self.pydreo_manager.devices[0]
+        entities = [humidifier.DreoHumidifierHA(device), *light.get_entries([device]), *_description_entities([device])]
+
+        mixed = call_json.get_response_from_file(f"get_device_state_{device.serial_number}.json")[DATA_KEY]["mixed"]
+        messages = []
+        for key, value in mixed.items():
+            perturbed = _perturbed(value.get("state")) if isinstance(value, dict) else None
+            if perturbed is not None:
+                messages.append({"devicesn": device.serial_number, "method": "report", REPORTED_KEY: {key: perturbed}})
+                messages.append({"devicesn": device.serial_number, "method": "report", REPORTED_KEY: {key: value["state"]}})
+
+        def count_writes(scoped: bool) -> int:
+            device._attr_cbs.clear()  # pylint: disable=protected-access
+            unscoped = patch.object(DreoBaseDeviceHA, "depends_on", PropertyMock(return_value=None))
+            with patch(PATCH_SCHEDULE_UPDATE_HA_STATE) as mock_write:
+                with contextlib.nullcontext() if scoped else unscoped:
+                    for entity in entities:
+                        asyncio.run(entity.async_added_to_hass())
+                for message in messages:
+                    device.handle_server_update_base(message)
+                return mock_write.call_count
+
+        unscoped = count_writes(scoped=False)
+        scoped = count_writes(scoped=True)
+        logger.info(
+            "state writes: %d entities, %d messages, %.2f writes/message unscoped, %.2f scoped",
+            len(entities),
+            len(messages),
+            unscoped / len(messages),
+            scoped / len(messages),
+        )
+        assert scoped < unscoped / 2
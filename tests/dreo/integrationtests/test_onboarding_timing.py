@@ -0,0 +1,82 @@
+"""Time-to-entity measurements for progressive onboarding on the DEBUG_TEST_MODE payloads."""
+
+import asyncio
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from custom_components.dreo import fan, sensor
+from custom_components.dreo.debug_test_mode import get_debug_test_mode_payload
+from custom_components.dreo.onboarding import DreoDeviceOnboarding
+from custom_components.dreo.pydreo import PyDreo
+from custom_components.dreo.pydreo.reconnectpolicy import BackoffPolicy
+
+PATCH_SCHEDULE_UPDATE_HA_STATE = "homeassistant.helpers.entity.Entity.schedule_update_ha_state"
+
+SLOW_DEVICE_DELAY = 0.3  # seconds the slow device's state takes to load
+DEVICE_DELAY = 0.01  # seconds every other device's state takes
+
+logger = logging.getLogger(__name__)
+
+
+class TestOnboardingTiming:
+    """Measure time-to-first-entity and time-to-all-entities with one slow and one unavailable device."""
+
+    @classmethod
+    def setup_class(cls):
+        """Run generateE2ETestData.py before running tests."""
+        script_path = Path(__file__).parent.parent.parent.parent / "testScripts" / "generateE2ETestData.py"
+        result = subprocess.run([sys.executable, str(script_path)], capture_output=True, text=True, check=False)
+        if result.returncode != 0:
+            raise RuntimeError(f"Test data generation failed: {result.stderr}")
+
+    def test_time_to_first_and_all_entities(self):
+        """Fast devices get their entities long before the slow one; an unavailable one is retried, not waited on."""
+        payload = get_debug_test_mode_payload("testScripts/temp")
+        pydreo_manager = PyDreo("EMAIL", "PASSWORD", redact=True, debug_test_mode=True, debug_test_mode_payload=payload)
+        pydreo_manager.login()
+
+        async def run():
+            started = time.monotonic()
+            assert await pydreo_manager.async_load_devices(load_state=False) is True
+            devices = pydreo_manager.devices
+            assert not any(device.state_loaded for device in devices)
+            slow, unavailable = devices[0].serial_number, devices[-1].serial_number
+            unavailable_state = payload.pop(unavailable)
+            fetch = pydreo_manager._async_fetch_device_state  # pylint: disable=protected-access
+
+            async def delayed_fetch(serial_number, fresh=False):
+                await asyncio.sleep(SLOW_DEVICE_DELAY if serial_number == slow else DEVICE_DELAY)
+                return await fetch(serial_number, fresh)
+
+            onboarding = DreoDeviceOnboarding(pydreo_manager, started, retry_backoff=BackoffPolicy(base_delay=0.05, max_delay=0.1))
+            added = []
+            onboarding.async_add_platform(fan.get_entries, added.extend)
+            onboarding.async_add_platform(sensor.get_entries, added.extend)
+
+            with patch.object(pydreo_manager, "_async_fetch_device_state", delayed_fetch):
+                failed = await onboarding.async_load()
+                assert [device.serial_number for device in failed] == [unavailable]
+                partial = onboarding.stats()
+
+                payload[unavailable] = unavailable_state
+                await asyncio.wait_for(onboarding.async_retry(failed), timeout=5)
+            return onboarding, partial, added
+
+        with patch(PATCH_SCHEDULE_UPDATE_HA_STATE, MagicMock()):
+            onboarding, partial, added = asyncio.run(run())
+
+        stats = onboarding.stats()
+        logger.info("Onboarding %d devices: %s", stats["devices"], stats)
+        assert partial["ready"] == stats["devices"] - 1
+        assert partial["time_to_all_entities"] is None
+        assert stats["ready"] == stats["devices"] == len(pydreo_manager.devices)
+        assert stats["load_failures"] == 1
+        assert stats["entities_added"] == len(added) > 0
+        assert all(device.state_loaded for device in pydreo_manager.devices)
+        # The first entities arrive as soon as a fast device loads, not after the slow one.
+        assert stats["time_to_first_entity"] < SLOW_DEVICE_DELAY / 2
+        assert stats["time_to_all_entities"] >= SLOW_DEVICE_DELAY
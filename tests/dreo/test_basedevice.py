@@ -1,9 +1,11 @@
 """Tests for the Dreo Base Device HA class."""
 
+import asyncio
+import threading
 from unittest.mock import patch, MagicMock
 
-from custom_components.dreo.dreobasedevice import DreoBaseDeviceHA
-from custom_components.dreo.const import DOMAIN
+from custom_components.dreo.dreobasedevice import DreoBaseDeviceHA, DreoStateWriter
+from custom_components.dreo.const import DOMAIN, DREO_STATE_WRITER
 
 from .testdevicebase import TestDeviceBase
 from .custommocks import PyDreoDeviceMock
@@ -12,6 +14,12 @@ PATCH_BASE_PATH = "homeassistant.helpers.entity.Entity"
 PATCH_UPDATE_HA_STATE = f"{PATCH_BASE_PATH}.schedule_update_ha_state"
 
 
+def _mock_entity() -> MagicMock:
+    entity = MagicMock()
+    entity.hass = MagicMock()
+    return entity
+
+
 class TestDreoBaseDeviceHA(TestDeviceBase):
     """Test the Dreo Base Device HA class."""
 
@@ -83,3 +91,114 @@ class TestDreoBaseDeviceHA(TestDeviceBase):
 
             base = DreoBaseDeviceHA(device)
             assert base.should_poll is False
+
+
+class TestDreoStateWriter:
+    """Test coalescing of entity state writes."""
+
+    def test_burst_writes_each_entity_once(self):
+        """Marks from the transport thread before a flush collapse to one write per entity."""
+        entities = [_mock_entity() for _ in range(3)]
+
+        async def run() -> DreoStateWriter:
+            writer = DreoStateWriter(asyncio.get_running_loop())
+
+            def burst():
+                for _ in range(10):
+                    for entity in entities:
+                        writer.mark_dirty(entity)
+
+            thread = threading.Thread(target=burst)
+            thread.start()
+            thread.join()
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            return writer
+
+        writer = asyncio.run(run())
+        for entity in entities:
+            entity.async_write_ha_state.assert_called_once()
+        assert writer.stats() == {"requested": 30, "written": 3, "coalesced": 27}
+
+    def test_marks_after_flush_write_again(self):
+        """An entity marked after a flush is written again on the next one."""
+        entity = _mock_entity()
+
+        async def run():
+            writer = DreoStateWriter(asyncio.get_running_loop())
+            writer.mark_dirty(entity)
+            await asyncio.sleep(0.01)
+            writer.mark_dirty(entity)
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+        assert entity.async_write_ha_state.call_count == 2
+
+    def test_window_delays_flush(self):
+        """With a window the flush waits for it, collecting marks made meanwhile."""
+        entity = _mock_entity()
+
+        async def run():
+            writer = DreoStateWriter(asyncio.get_running_loop(), window=0.05)
+            writer.mark_dirty(entity)
+            await asyncio.sleep(0.01)
+            writer.mark_dirty(entity)
+            assert entity.async_write_ha_state.call_count == 0
+            await asyncio.sleep(0.1)
+            return writer
+
+        writer = asyncio.run(run())
+        entity.async_write_ha_state.assert_called_once()
+        assert writer.coalesced == 1
+
+    def test_skips_removed_entities_and_failures(self):
+        """Entities removed from HA are skipped and one failing write does not stop the rest."""
+        removed = _mock_entity()
+        removed.hass = None
+        failing = _mock_entity()
+        failing.async_write_ha_state.side_effect = RuntimeError("boom")
+        healthy = _mock_entity()
+
+        async def run():
+            writer = DreoStateWriter(asyncio.get_running_loop())
+            for entity in (removed, failing, healthy):
+                writer.mark_dirty(entity)
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+        removed.async_write_ha_state.assert_not_called()
+        healthy.async_write_ha_state.assert_called_once()
+
+    def test_close_drops_pending_writes(self):
+        """Writes pending at close, and marks after it, are dropped."""
+        entity = _mock_entity()
+
+        async def run():
+            writer = DreoStateWriter(asyncio.get_running_loop())
+            writer.mark_dirty(entity)
+            writer.close()
+            writer.mark_dirty(entity)
+            await asyncio.sleep(0.01)
+
+        asyncio.run(run())
+        entity.async_write_ha_state.assert_not_called()
+
+    def test_update_state_uses_entry_state_writer(self):
+        """Device callbacks go through the entry's state writer once the entity is added."""
+        with patch(PATCH_UPDATE_HA_STATE) as mock_update:
+            device = MagicMock()
+            base = DreoBaseDeviceHA(device)
+            writer = MagicMock()
+            base.hass = MagicMock()
+            base.hass.data = {DOMAIN: {DREO_STATE_WRITER: writer}}
+            asyncio.run(base.async_added_to_hass())
+            update_state = device.add_attr_callback.call_args[0][0]
+
+            update_state(frozenset({"is_on"}))
+            writer.mark_dirty.assert_called_once_with(base)
+            mock_update.assert_not_called()
+
+            # Without a writer (e.g. during unload) fall back to a direct update.
+            base.hass.data = {}
+            update_state(None)
+            mock_update.assert_called_once_with(True)
@@ -4,7 +4,8 @@ import asyncio
 from unittest.mock import patch, MagicMock, AsyncMock
 
 from custom_components.dreo import climate
-from custom_components.dreo.const import DOMAIN, PYDREO_MANAGER
+from custom_components.dreo.const import DOMAIN, DREO_ONBOARDING, PYDREO_MANAGER
+from custom_components.dreo.onboarding import DreoDeviceOnboarding
 
 from .testdevicebase import TestDeviceBase
 from .custommocks import PyDreoDeviceMock
@@ -197,7 +198,7 @@ class TestDreoClimatePlatform(TestDeviceBase):
             mock_pydreo.devices = [heater]
 
             mock_hass = MagicMock()
-            mock_hass.data = {DOMAIN: {PYDREO_MANAGER: mock_pydreo}}
+            mock_hass.data = {DOMAIN: {PYDREO_MANAGER: mock_pydreo, DREO_ONBOARDING: DreoDeviceOnboarding(mock_pydreo)}}
 
             mock_config_entry = MagicMock()
             mock_add_entities = MagicMock()
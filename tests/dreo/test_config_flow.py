@@ -4,6 +4,7 @@ import asyncio
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from collections import OrderedDict
+import voluptuous as vol
 
 from custom_components.dreo.config_flow import DreoFlowHandler, OptionsFlowHandler, OPTIONS_SCHEMA
 
@@ -84,13 +85,16 @@ class TestDreoFlowHandler:
         flow.async_create_entry = MagicMock(return_value="entry_result")
 
         mock_hass = MagicMock()
-        mock_hass.async_add_executor_job = AsyncMock(return_value=True)
         flow.hass = mock_hass
 
         user_input = {"username": "test@example.com", "password": "testpass123"}
 
-        with patch("custom_components.dreo.config_flow.PyDreo") as mock_pydreo:
+        with (
+            patch("custom_components.dreo.config_flow.PyDreo") as mock_pydreo,
+            patch("custom_components.dreo.config_flow.async_get_clientsession") as mock_session,
+        ):
             mock_manager = MagicMock()
+            mock_manager.async_login = AsyncMock(return_value=True)
             mock_pydreo.return_value = mock_manager
 
             result = asyncio.run(flow.async_step_user(user_input=user_input))
@@ -100,10 +104,10 @@ class TestDreoFlowHandler:
         assert flow._password == "testpass123"
 
         # Verify PyDreo was instantiated correctly
-        mock_pydreo.assert_called_once_with("test@example.com", "testpass123", region=None)
+        mock_pydreo.assert_called_once_with("test@example.com", "testpass123", region=None, aiohttp_session=mock_session.return_value)
 
         # Verify login was called
-        mock_hass.async_add_executor_job.assert_called_once_with(mock_manager.login)
+        mock_manager.async_login.assert_awaited_once()
 
         # Verify entry was created
         flow.async_create_entry.assert_called_once_with(
@@ -118,19 +122,22 @@ class TestDreoFlowHandler:
         flow.async_create_entry = MagicMock(return_value="entry_result")
 
         mock_hass = MagicMock()
-        mock_hass.async_add_executor_job = AsyncMock(return_value=True)
         flow.hass = mock_hass
 
         user_input = {"username": "test@example.com", "password": "testpass123", "region": "EU"}
 
-        with patch("custom_components.dreo.config_flow.PyDreo") as mock_pydreo:
+        with (
+            patch("custom_components.dreo.config_flow.PyDreo") as mock_pydreo,
+            patch("custom_components.dreo.config_flow.async_get_clientsession") as mock_session,
+        ):
             mock_manager = MagicMock()
+            mock_manager.async_login = AsyncMock(return_value=True)
             mock_pydreo.return_value = mock_manager
 
             result = asyncio.run(flow.async_step_user(user_input=user_input))
 
         assert result == "entry_result"
-        mock_pydreo.assert_called_once_with("test@example.com", "testpass123", region="EU")
+        mock_pydreo.assert_called_once_with("test@example.com", "testpass123", region="EU", aiohttp_session=mock_session.return_value)
         flow.async_create_entry.assert_called_once_with(
             title="test@example.com",
             data={"username": "test@example.com", "password": "testpass123", "region": "EU"},
@@ -143,13 +150,16 @@ class TestDreoFlowHandler:
         flow._show_form = MagicMock(return_value="form_with_error")
 
         mock_hass = MagicMock()
-        mock_hass.async_add_executor_job = AsyncMock(return_value=False)
         flow.hass = mock_hass
 
         user_input = {"username": "test@example.com", "password": "wrongpassword"}
 
-        with patch("custom_components.dreo.config_flow.PyDreo") as mock_pydreo:
+        with (
+            patch("custom_components.dreo.config_flow.PyDreo") as mock_pydreo,
+            patch("custom_components.dreo.config_flow.async_get_clientsession") as mock_session,
+        ):
             mock_manager = MagicMock()
+            mock_manager.async_login = AsyncMock(return_value=False)
             mock_pydreo.return_value = mock_manager
 
             result = asyncio.run(flow.async_step_user(user_input=user_input))
@@ -159,10 +169,10 @@ class TestDreoFlowHandler:
         assert flow._password == "wrongpassword"
 
         # Verify PyDreo was instantiated
-        mock_pydreo.assert_called_once_with("test@example.com", "wrongpassword", region=None)
+        mock_pydreo.assert_called_once_with("test@example.com", "wrongpassword", region=None, aiohttp_session=mock_session.return_value)
 
         # Verify login was attempted
-        mock_hass.async_add_executor_job.assert_called_once_with(mock_manager.login)
+        mock_manager.async_login.assert_awaited_once()
 
         # Verify error form was shown
         flow._show_form.assert_called_once_with(errors={"base": "invalid_auth"})
@@ -219,7 +229,7 @@ class TestOptionsFlowHandler:
 
         # Verify the schema contains auto_reconnect as a required boolean
         schema_dict = OPTIONS_SCHEMA.schema
-        assert len(schema_dict) == 1
+        assert len(schema_dict) == 5
 
         # Check that auto_reconnect key exists and is required
         keys = list(schema_dict.keys())
@@ -229,3 +239,32 @@ class TestOptionsFlowHandler:
         for key, value in schema_dict.items():
             if "auto_reconnect" in str(key):
                 assert value is bool
+
+    def test_options_schema_state_write_window(self):
+        """Test that the state write window defaults to 0 ms and rejects negative values."""
+        assert OPTIONS_SCHEMA({"auto_reconnect": True}) == {
+            "auto_reconnect": True,
+            "state_write_window": 0,
+            "metrics_sensors": False,
+            "command_tracing": False,
+            "discovery_interval": 60,
+        }
+        assert OPTIONS_SCHEMA({"auto_reconnect": True, "state_write_window": "50"})["state_write_window"] == 50
+        with pytest.raises(vol.Invalid):
+            OPTIONS_SCHEMA({"auto_reconnect": True, "state_write_window": -1})
+
+    def test_options_schema_discovery_interval(self):
+        """Test that device discovery defaults to hourly and accepts 0 to turn it off."""
+        assert OPTIONS_SCHEMA({"auto_reconnect": True, "discovery_interval": "0"})["discovery_interval"] == 0
+        with pytest.raises(vol.Invalid):
+            OPTIONS_SCHEMA({"auto_reconnect": True, "discovery_interval": -5})
+
+    def test_options_schema_metrics_sensors(self):
+        """Test that the metric sensors option defaults to off."""
+        assert OPTIONS_SCHEMA({"auto_reconnect": True})["metrics_sensors"] is False
+        assert OPTIONS_SCHEMA({"auto_reconnect": True, "metrics_sensors": True})["metrics_sensors"] is True
+
+    def test_options_schema_command_tracing(self):
+        """Test that the command tracing option defaults to off."""
+        assert OPTIONS_SCHEMA({"auto_reconnect": True})["command_tracing"] is False
+        assert OPTIONS_SCHEMA({"auto_reconnect": True, "command_tracing": True})["command_tracing"] is True
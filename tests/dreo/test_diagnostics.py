@@ -5,7 +5,9 @@ from unittest.mock import MagicMock
 import pytest
 from homeassistant.components.diagnostics import REDACTED
 from custom_components.dreo.diagnostics import _redact_values, _get_diagnostics, async_get_config_entry_diagnostics, KEYS_TO_REDACT
-from custom_components.dreo.const import DOMAIN, PYDREO_MANAGER
+from custom_components.dreo.const import DOMAIN, PYDREO_MANAGER, DREO_STATE_WRITER
+from custom_components.dreo.pydreo.metrics import MetricsRegistry
+from custom_components.dreo.pydreo.tracing import CommandTracer
 
 
 class TestRedactValues:
@@ -275,3 +277,45 @@ class TestAsyncGetConfigEntryDiagnostics:
 
         # Verify raw_devicelist is redacted
         assert result[DOMAIN]["raw_devicelist"]["username"] == REDACTED
+
+    def test_async_get_config_entry_diagnostics_state_writes(self):
+        """Test that state write counters are included when the entry has a state writer."""
+        mock_hass = MagicMock()
+        mock_manager = MagicMock()
+        mock_manager.devices = []
+        mock_manager.raw_response = {}
+        mock_writer = MagicMock()
+        mock_writer.stats.return_value = {"requested": 10, "written": 4, "coalesced": 6}
+        mock_hass.data = {DOMAIN: {PYDREO_MANAGER: mock_manager, DREO_STATE_WRITER: mock_writer}}
+
+        result = asyncio.run(async_get_config_entry_diagnostics(mock_hass, MagicMock()))
+
+        assert result[DOMAIN]["state_writes"] == {"requested": 10, "written": 4, "coalesced": 6}
+
+    def test_get_diagnostics_metrics(self):
+        """Test that the transport metrics snapshot is included."""
+        mock_manager = MagicMock()
+        mock_manager.devices = []
+        mock_manager.raw_response = {}
+        mock_manager.metrics = MetricsRegistry()
+        mock_manager.metrics.inc("ws_reconnects", 2)
+        mock_manager.metrics.observe("rest_latency", 0.2)
+
+        result = _get_diagnostics(mock_manager)
+
+        assert result[DOMAIN]["metrics"]["counters"] == {"ws_reconnects": 2}
+        assert result[DOMAIN]["metrics"]["histograms"]["rest_latency"]["count"] == 1
+
+    def test_get_diagnostics_command_traces(self):
+        """Test that recent command traces are exported in Chrome trace format."""
+        mock_manager = MagicMock()
+        mock_manager.devices = []
+        mock_manager.raw_response = {}
+        mock_manager.tracer = CommandTracer(enabled=True)
+        trace = mock_manager.tracer.start("SN", "Fan", ["poweron"])
+        trace.span("ws.send", trace.started)
+
+        result = _get_diagnostics(mock_manager)
+
+        events = result[DOMAIN]["command_traces"]["traceEvents"]
+        assert [event["name"] for event in events if event["ph"] == "X"] == ["ws.send"]
@@ -0,0 +1,139 @@
+"""Tests for periodic device discovery."""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.const import Platform
+
+from custom_components.dreo import _async_discover_devices
+from custom_components.dreo.const import DOMAIN, DREO_PLATFORMS
+from custom_components.dreo.discovery import DreoDeviceDiscovery
+from custom_components.dreo.onboarding import DreoDeviceOnboarding
+from custom_components.dreo.pydreo.constant import DreoDeviceType
+
+PATCH_TRACK_TIME_INTERVAL = "custom_components.dreo.discovery.async_track_time_interval"
+
+
+def _device(serial_number: str, device_type: DreoDeviceType, state_loaded: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(serial_number=serial_number, name=serial_number, type=device_type, state_loaded=state_loaded)
+
+
+class TestDreoDeviceDiscovery:
+    """Test discovery scheduling."""
+
+    def test_interval_changes_reschedule(self):
+        """Setting a new interval replaces the schedule; 0 stops it; the same interval is left alone."""
+        unsubs = [MagicMock(), MagicMock()]
+        with patch(PATCH_TRACK_TIME_INTERVAL, side_effect=unsubs) as track:
+            discovery = DreoDeviceDiscovery(MagicMock(), MagicMock(), AsyncMock())
+            discovery.async_set_interval(60)
+            discovery.async_set_interval(60)
+            assert track.call_count == 1
+            assert track.call_args.args[2] == timedelta(minutes=60)
+
+            discovery.async_set_interval(15)
+            unsubs[0].assert_called_once()
+            assert track.call_args.args[2] == timedelta(minutes=15)
+
+            discovery.async_set_interval(0)
+            unsubs[1].assert_called_once()
+            assert track.call_count == 2
+        assert discovery.stats()["interval_minutes"] == 0
+
+    def test_passes_do_not_overlap(self):
+        """A tick while a pass is running is skipped, and a failing pass is logged, not raised."""
+        release = asyncio.Event()
+        runs = []
+
+        async def discover():
+            runs.append(1)
+            await release.wait()
+            raise RuntimeError("boom")
+
+        config_entry = MagicMock()
+        discovery = DreoDeviceDiscovery(MagicMock(), config_entry, discover)
+
+        async def run():
+            first = asyncio.ensure_future(discovery.async_run())
+            await asyncio.sleep(0)
+            discovery._async_tick()  # pylint: disable=protected-access
+            await discovery.async_run()
+            release.set()
+            await first
+
+        asyncio.run(run())
+        config_entry.async_create_background_task.assert_not_called()
+        assert len(runs) == 1
+        assert discovery.stats()["runs"] == 1
+        assert discovery.stats()["skipped"] == 2
+
+
+class TestDiscoverDevices:
+    """Test attaching and detaching devices found by a discovery pass."""
+
+    def _run(self, added, removed, platforms, devices=()):
+        pydreo_manager = MagicMock()
+        pydreo_manager.devices = list(devices)
+        pydreo_manager.async_discover_devices = AsyncMock(return_value=(added, removed))
+        pydreo_manager.export_snapshot.return_value = {"version": 1}
+        hass = MagicMock()
+        hass.data = {DOMAIN: {DREO_PLATFORMS: platforms}}
+        hass.config_entries.async_forward_entry_setups = AsyncMock()
+        config_entry = MagicMock(entry_id="entry1")
+        store = MagicMock(async_save=AsyncMock())
+        registry = MagicMock()
+        registry.async_get_device.side_effect = lambda identifiers: SimpleNamespace(id=f"device-{next(iter(identifiers))[1]}")
+
+        async def run():
+            onboarding = DreoDeviceOnboarding(pydreo_manager)
+            add_fans = MagicMock()
+            onboarding.async_add_platform(lambda devices: [device.serial_number for device in devices], add_fans)
+            with patch("custom_components.dreo.dr.async_get", return_value=registry):
+                await _async_discover_devices(hass, config_entry, pydreo_manager, onboarding, store)
+            return onboarding, add_fans
+
+        onboarding, add_fans = asyncio.run(run())
+        return SimpleNamespace(hass=hass, config_entry=config_entry, store=store, registry=registry, onboarding=onboarding, add_fans=add_fans)
+
+    def test_added_and_removed_devices(self):
+        """New devices get entities on loaded platforms; removed devices leave the device registry."""
+        kept = _device("KEPT", DreoDeviceType.TOWER_FAN)
+        gone = _device("GONE", DreoDeviceType.TOWER_FAN)
+        new = _device("NEW", DreoDeviceType.TOWER_FAN)
+        platforms = {Platform.FAN, Platform.SENSOR, Platform.SWITCH, Platform.NUMBER}
+
+        result = self._run([new], [gone], platforms, devices=[kept, gone])
+
+        assert [call.args[0] for call in result.add_fans.call_args_list] == [["KEPT", "GONE"], ["NEW"]]
+        result.registry.async_update_device.assert_called_once_with("device-GONE", remove_config_entry_id="entry1")
+        result.hass.config_entries.async_forward_entry_setups.assert_not_awaited()
+        result.store.async_save.assert_awaited_once_with({"version": 1})
+        assert result.onboarding.stats()["devices"] == 2
+
+    def test_new_device_type_sets_up_its_platforms(self):
+        """A device needing platforms that are not loaded yet sets up just those platforms."""
+        heater = _device("HEATER", DreoDeviceType.HEATER)
+        platforms = {Platform.FAN, Platform.SENSOR, Platform.SWITCH, Platform.NUMBER}
+
+        result = self._run([heater], [], platforms)
+
+        result.hass.config_entries.async_forward_entry_setups.assert_awaited_once_with(result.config_entry, {Platform.CLIMATE})
+        assert Platform.CLIMATE in platforms
+
+    def test_device_without_state_is_retried(self):
+        """A new device whose state did not load is retried in the background rather than added."""
+        offline = _device("OFFLINE", DreoDeviceType.TOWER_FAN, state_loaded=False)
+
+        result = self._run([offline], [], {Platform.FAN})
+
+        result.add_fans.assert_not_called()
+        result.config_entry.async_create_background_task.assert_called_once()
+        result.config_entry.async_create_background_task.call_args.args[1].close()
+
+    def test_no_changes(self):
+        """A pass that finds nothing new touches nothing."""
+        result = self._run([], [], {Platform.FAN})
+        result.store.async_save.assert_not_awaited()
+        result.registry.async_update_device.assert_not_called()
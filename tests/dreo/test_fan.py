@@ -310,7 +310,8 @@ class TestDreoFanHA(TestDeviceBase):
         """Test async_setup_entry sets up fan entities from hass.data."""
         import asyncio
         from unittest.mock import MagicMock
-        from custom_components.dreo.const import DOMAIN, PYDREO_MANAGER
+        from custom_components.dreo.const import DOMAIN, DREO_ONBOARDING, PYDREO_MANAGER
+        from custom_components.dreo.onboarding import DreoDeviceOnboarding
 
         with patch(PATCH_UPDATE_HA_STATE):
             mocked_fan = self.create_mock_device(name="Test Fan", type="Tower Fan")
@@ -319,7 +320,7 @@ class TestDreoFanHA(TestDeviceBase):
             mock_pydreo.devices = [mocked_fan]
 
             mock_hass = MagicMock()
-            mock_hass.data = {DOMAIN: {PYDREO_MANAGER: mock_pydreo}}
+            mock_hass.data = {DOMAIN: {PYDREO_MANAGER: mock_pydreo, DREO_ONBOARDING: DreoDeviceOnboarding(mock_pydreo)}}
 
             mock_config_entry = MagicMock()
             mock_add_entities = MagicMock()
@@ -99,7 +99,8 @@ class TestDreoHumidifier(TestDeviceBase):
         """Test async_setup_entry sets up humidifier/dehumidifier entities from hass.data."""
         import asyncio
         from unittest.mock import MagicMock
-        from custom_components.dreo.const import DOMAIN, PYDREO_MANAGER
+        from custom_components.dreo.const import DOMAIN, DREO_ONBOARDING, PYDREO_MANAGER
+        from custom_components.dreo.onboarding import DreoDeviceOnboarding
 
         mocked_devices = [
             self.create_mock_device(name="Test Humidifier", type="Humidifier"),
@@ -111,7 +112,7 @@ class TestDreoHumidifier(TestDeviceBase):
         mock_pydreo.devices = mocked_devices
 
         mock_hass = MagicMock()
-        mock_hass.data = {DOMAIN: {PYDREO_MANAGER: mock_pydreo}}
+        mock_hass.data = {DOMAIN: {PYDREO_MANAGER: mock_pydreo, DREO_ONBOARDING: DreoDeviceOnboarding(mock_pydreo)}}
 
         mock_config_entry = MagicMock()
         mock_add_entities = MagicMock()
@@ -8,6 +8,37 @@ from homeassistant.exceptions import ConfigEntryNotReady
 from custom_components.dreo.const import DEBUG_TEST_MODE
 
 
+def _close_background_tasks(mock_entry) -> None:
+    """Close the coroutines handed to the mocked async_create_background_task so none is left unawaited."""
+    for call in mock_entry.async_create_background_task.call_args_list:
+        call.args[1].close()
+
+
+@pytest.fixture(autouse=True)
+def mock_clientsession():
+    """Keep setup from building a real aiohttp session on the mocked hass."""
+    with patch("custom_components.dreo.async_get_clientsession", return_value=MagicMock()) as mock_get:
+        yield mock_get
+
+
+@pytest.fixture(autouse=True)
+def mock_snapshot_store():
+    """Snapshot storage with no saved snapshot, so setup takes the cold-start path."""
+    store = MagicMock()
+    store.async_load = AsyncMock(return_value=None)
+    store.async_save = AsyncMock()
+    store.async_remove = AsyncMock()
+    with patch("custom_components.dreo.Store", return_value=store):
+        yield store
+
+
+@pytest.fixture(autouse=True)
+def mock_track_time_interval():
+    """Keep the periodic device discovery off the mocked hass."""
+    with patch("custom_components.dreo.discovery.async_track_time_interval", return_value=MagicMock()) as mock_track:
+        yield mock_track
+
+
 class TestInit:
     def test_debug_test_mode(self):
         """Test that DEBUG_TEST_MODE is set to False."""
@@ -19,15 +50,19 @@ class TestInit:
 
         mock_hass = MagicMock()
         mock_hass.data = {}
-        mock_hass.async_add_executor_job = AsyncMock(return_value=False)
         mock_hass.config_entries = MagicMock()
 
         mock_entry = MagicMock()
         mock_entry.data = {"username": "test@example.com", "password": "password"}
         mock_entry.options = {}
 
-        with pytest.raises(ConfigEntryNotReady):
+        mock_pydreo = MagicMock()
+        mock_pydreo.async_login = AsyncMock(return_value=False)
+        mock_pydreo.async_load_devices = AsyncMock(return_value=True)
+
+        with patch("custom_components.dreo.pydreo.PyDreo", return_value=mock_pydreo), pytest.raises(ConfigEntryNotReady):
             asyncio.run(async_setup_entry(mock_hass, mock_entry))
+        mock_pydreo.async_load_devices.assert_not_called()
 
     def test_load_devices_failure_raises_config_entry_not_ready(self):
         """Test that a load_devices failure raises ConfigEntryNotReady instead of returning False."""
@@ -35,15 +70,18 @@ class TestInit:
 
         mock_hass = MagicMock()
         mock_hass.data = {}
-        # login succeeds, load_devices fails
-        mock_hass.async_add_executor_job = AsyncMock(side_effect=[True, False])
         mock_hass.config_entries = MagicMock()
 
         mock_entry = MagicMock()
         mock_entry.data = {"username": "test@example.com", "password": "password"}
         mock_entry.options = {}
 
-        with pytest.raises(ConfigEntryNotReady):
+        # login succeeds, load_devices fails
+        mock_pydreo = MagicMock()
+        mock_pydreo.async_login = AsyncMock(return_value=True)
+        mock_pydreo.async_load_devices = AsyncMock(return_value=False)
+
+        with patch("custom_components.dreo.pydreo.PyDreo", return_value=mock_pydreo), pytest.raises(ConfigEntryNotReady):
             asyncio.run(async_setup_entry(mock_hass, mock_entry))
 
     def test_successful_setup_with_fan(self):
@@ -54,7 +92,6 @@ class TestInit:
 
         mock_hass = MagicMock()
         mock_hass.data = {}
-        mock_hass.async_add_executor_job = AsyncMock(side_effect=[True, True])  # login, load_devices
         mock_hass.config_entries = MagicMock()
         mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
 
@@ -70,12 +107,15 @@ class TestInit:
 
         # Mock PyDreo
         mock_pydreo = MagicMock()
+        mock_pydreo.async_login = AsyncMock(return_value=True)
+        mock_pydreo.async_load_devices = AsyncMock(return_value=True)
         mock_pydreo.devices = [mock_device]
         mock_pydreo.start_transport = MagicMock()
         mock_pydreo.auto_reconnect = True
 
         with patch("custom_components.dreo.pydreo.PyDreo", return_value=mock_pydreo):
             result = asyncio.run(async_setup_entry(mock_hass, mock_entry))
+            _close_background_tasks(mock_entry)
 
         assert result is True
         assert "dreo" in mock_hass.data
@@ -88,6 +128,8 @@ class TestInit:
         assert Platform.SWITCH in platforms
         assert Platform.NUMBER in platforms
 
+        mock_pydreo.async_login.assert_awaited_once()
+        mock_pydreo.async_load_devices.assert_awaited_once()
         mock_pydreo.start_transport.assert_called_once()
         mock_hass.config_entries.async_forward_entry_setups.assert_called_once()
 
@@ -99,7 +141,6 @@ class TestInit:
 
         mock_hass = MagicMock()
         mock_hass.data = {}
-        mock_hass.async_add_executor_job = AsyncMock(side_effect=[True, True])
         mock_hass.config_entries = MagicMock()
         mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
 
@@ -113,12 +154,15 @@ class TestInit:
         mock_device.type = DreoDeviceType.HEATER
 
         mock_pydreo = MagicMock()
+        mock_pydreo.async_login = AsyncMock(return_value=True)
+        mock_pydreo.async_load_devices = AsyncMock(return_value=True)
         mock_pydreo.devices = [mock_device]
         mock_pydreo.start_transport = MagicMock()
         mock_pydreo.auto_reconnect = True
 
         with patch("custom_components.dreo.pydreo.PyDreo", return_value=mock_pydreo):
             result = asyncio.run(async_setup_entry(mock_hass, mock_entry))
+            _close_background_tasks(mock_entry)
 
         assert result is True
         platforms = mock_hass.data["dreo"]["platforms"]
@@ -135,7 +179,6 @@ class TestInit:
 
         mock_hass = MagicMock()
         mock_hass.data = {}
-        mock_hass.async_add_executor_job = AsyncMock(side_effect=[True, True])
         mock_hass.config_entries = MagicMock()
         mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
 
@@ -149,12 +192,15 @@ class TestInit:
         mock_device.type = DreoDeviceType.CEILING_FAN
 
         mock_pydreo = MagicMock()
+        mock_pydreo.async_login = AsyncMock(return_value=True)
+        mock_pydreo.async_load_devices = AsyncMock(return_value=True)
         mock_pydreo.devices = [mock_device]
         mock_pydreo.start_transport = MagicMock()
         mock_pydreo.auto_reconnect = True
 
         with patch("custom_components.dreo.pydreo.PyDreo", return_value=mock_pydreo):
             result = asyncio.run(async_setup_entry(mock_hass, mock_entry))
+            _close_background_tasks(mock_entry)
 
         assert result is True
         platforms = mock_hass.data["dreo"]["platforms"]
@@ -172,7 +218,6 @@ class TestInit:
 
         mock_hass = MagicMock()
         mock_hass.data = {}
-        mock_hass.async_add_executor_job = AsyncMock(side_effect=[True, True])
         mock_hass.config_entries = MagicMock()
         mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
 
@@ -186,12 +231,15 @@ class TestInit:
         mock_device.type = DreoDeviceType.AIR_CIRCULATOR
 
         mock_pydreo = MagicMock()
+        mock_pydreo.async_login = AsyncMock(return_value=True)
+        mock_pydreo.async_load_devices = AsyncMock(return_value=True)
         mock_pydreo.devices = [mock_device]
         mock_pydreo.start_transport = MagicMock()
         mock_pydreo.auto_reconnect = True
 
         with patch("custom_components.dreo.pydreo.PyDreo", return_value=mock_pydreo):
             result = asyncio.run(async_setup_entry(mock_hass, mock_entry))
+            _close_background_tasks(mock_entry)
 
         assert result is True
         platforms = mock_hass.data["dreo"]["platforms"]
@@ -210,7 +258,6 @@ class TestInit:
 
         mock_hass = MagicMock()
         mock_hass.data = {}
-        mock_hass.async_add_executor_job = AsyncMock(side_effect=[True, True])
         mock_hass.config_entries = MagicMock()
         mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
 
@@ -224,12 +271,15 @@ class TestInit:
         mock_device.type = DreoDeviceType.HUMIDIFIER
 
         mock_pydreo = MagicMock()
+        mock_pydreo.async_login = AsyncMock(return_value=True)
+        mock_pydreo.async_load_devices = AsyncMock(return_value=True)
         mock_pydreo.devices = [mock_device]
         mock_pydreo.start_transport = MagicMock()
         mock_pydreo.auto_reconnect = True
 
         with patch("custom_components.dreo.pydreo.PyDreo", return_value=mock_pydreo):
             result = asyncio.run(async_setup_entry(mock_hass, mock_entry))
+            _close_background_tasks(mock_entry)
 
         assert result is True
         platforms = mock_hass.data["dreo"]["platforms"]
@@ -246,7 +296,6 @@ class TestInit:
 
         mock_hass = MagicMock()
         mock_hass.data = {}
-        mock_hass.async_add_executor_job = AsyncMock(side_effect=[True, True])
         mock_hass.config_entries = MagicMock()
         mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
 
@@ -260,12 +309,15 @@ class TestInit:
         mock_device.type = DreoDeviceType.DEHUMIDIFIER
 
         mock_pydreo = MagicMock()
+        mock_pydreo.async_login = AsyncMock(return_value=True)
+        mock_pydreo.async_load_devices = AsyncMock(return_value=True)
         mock_pydreo.devices = [mock_device]
         mock_pydreo.start_transport = MagicMock()
         mock_pydreo.auto_reconnect = True
 
         with patch("custom_components.dreo.pydreo.PyDreo", return_value=mock_pydreo):
             result = asyncio.run(async_setup_entry(mock_hass, mock_entry))
+            _close_background_tasks(mock_entry)
 
         assert result is True
         platforms = mock_hass.data["dreo"]["platforms"]
@@ -283,7 +335,6 @@ class TestInit:
 
         mock_hass = MagicMock()
         mock_hass.data = {}
-        mock_hass.async_add_executor_job = AsyncMock(side_effect=[True, True])
         mock_hass.config_entries = MagicMock()
         mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
 
@@ -297,12 +348,15 @@ class TestInit:
         mock_device.type = DreoDeviceType.CHEF_MAKER
 
         mock_pydreo = MagicMock()
+        mock_pydreo.async_login = AsyncMock(return_value=True)
+        mock_pydreo.async_load_devices = AsyncMock(return_value=True)
         mock_pydreo.devices = [mock_device]
         mock_pydreo.start_transport = MagicMock()
         mock_pydreo.auto_reconnect = True
 
         with patch("custom_components.dreo.pydreo.PyDreo", return_value=mock_pydreo):
             result = asyncio.run(async_setup_entry(mock_hass, mock_entry))
+            _close_background_tasks(mock_entry)
 
         assert result is True
         platforms = mock_hass.data["dreo"]["platforms"]
@@ -321,7 +375,6 @@ class TestInit:
 
         mock_hass = MagicMock()
         mock_hass.data = {}
-        mock_hass.async_add_executor_job = AsyncMock(side_effect=[True, True])
         mock_hass.config_entries = MagicMock()
         mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
 
@@ -335,12 +388,15 @@ class TestInit:
         mock_device.type = DreoDeviceType.EVAPORATIVE_COOLER
 
         mock_pydreo = MagicMock()
+        mock_pydreo.async_login = AsyncMock(return_value=True)
+        mock_pydreo.async_load_devices = AsyncMock(return_value=True)
         mock_pydreo.devices = [mock_device]
         mock_pydreo.start_transport = MagicMock()
         mock_pydreo.auto_reconnect = True
 
         with patch("custom_components.dreo.pydreo.PyDreo", return_value=mock_pydreo):
             result = asyncio.run(async_setup_entry(mock_hass, mock_entry))
+            _close_background_tasks(mock_entry)
 
         assert result is True
         platforms = mock_hass.data["dreo"]["platforms"]
@@ -356,7 +412,6 @@ class TestInit:
 
         mock_hass = MagicMock()
         mock_hass.data = {}
-        mock_hass.async_add_executor_job = AsyncMock(side_effect=[True, True])
         mock_hass.config_entries = MagicMock()
         mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
 
@@ -370,11 +425,14 @@ class TestInit:
         mock_device.type = DreoDeviceType.TOWER_FAN
 
         mock_pydreo = MagicMock()
+        mock_pydreo.async_login = AsyncMock(return_value=True)
+        mock_pydreo.async_load_devices = AsyncMock(return_value=True)
         mock_pydreo.devices = [mock_device]
         mock_pydreo.start_transport = MagicMock()
 
         with patch("custom_components.dreo.pydreo.PyDreo", return_value=mock_pydreo):
             result = asyncio.run(async_setup_entry(mock_hass, mock_entry))
+            _close_background_tasks(mock_entry)
 
         assert result is True
         assert mock_pydreo.auto_reconnect is True
@@ -386,7 +444,6 @@ class TestInit:
 
         mock_hass = MagicMock()
         mock_hass.data = {}
-        mock_hass.async_add_executor_job = AsyncMock(side_effect=[True, True])
         mock_hass.config_entries = MagicMock()
         mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
 
@@ -400,11 +457,14 @@ class TestInit:
         mock_device.type = DreoDeviceType.TOWER_FAN
 
         mock_pydreo = MagicMock()
+        mock_pydreo.async_login = AsyncMock(return_value=True)
+        mock_pydreo.async_load_devices = AsyncMock(return_value=True)
         mock_pydreo.devices = [mock_device]
         mock_pydreo.start_transport = MagicMock()
 
         with patch("custom_components.dreo.pydreo.PyDreo", return_value=mock_pydreo):
             result = asyncio.run(async_setup_entry(mock_hass, mock_entry))
+            _close_background_tasks(mock_entry)
 
         assert result is True
         assert mock_pydreo.auto_reconnect is False
@@ -421,13 +481,14 @@ class TestInit:
         mock_hass.data = {"dreo": {"pydreo_manager": mock_pydreo, "platforms": {Platform.FAN, Platform.SENSOR}}}
         mock_hass.config_entries = MagicMock()
         mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+        mock_hass.async_add_executor_job = AsyncMock()
 
         mock_entry = MagicMock()
 
         result = asyncio.run(async_unload_entry(mock_hass, mock_entry))
 
         assert result is True
-        mock_pydreo.stop_transport.assert_called_once()
+        mock_hass.async_add_executor_job.assert_awaited_once_with(mock_pydreo.stop_transport)
         assert "dreo" not in mock_hass.data
         mock_hass.config_entries.async_unload_platforms.assert_called_once()
 
@@ -488,7 +549,6 @@ class TestInit:
 
         mock_hass = MagicMock()
         mock_hass.data = {}
-        mock_hass.async_add_executor_job = AsyncMock(side_effect=[True, True])
         mock_hass.config_entries = MagicMock()
         mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
 
@@ -502,6 +562,8 @@ class TestInit:
         mock_device.type = DreoDeviceType.TOWER_FAN
 
         mock_pydreo = MagicMock()
+        mock_pydreo.async_login = AsyncMock(return_value=True)
+        mock_pydreo.async_load_devices = AsyncMock(return_value=True)
         mock_pydreo.devices = [mock_device]
         mock_pydreo.start_transport = MagicMock()
         mock_pydreo.auto_reconnect = True
@@ -515,6 +577,7 @@ class TestInit:
             patch("custom_components.dreo._LOGGER") as mock_logger,
         ):
             result = asyncio.run(async_setup_entry(mock_hass, mock_entry))
+            _close_background_tasks(mock_entry)
 
         assert result is True
         assert Platform.FAN in mock_hass.data["dreo"]["platforms"]
@@ -533,3 +596,165 @@ class TestInit:
         result = asyncio.run(async_remove_config_entry_device(mock_hass, mock_entry, mock_device))
 
         assert result is True
+
+
+class TestSnapshotWarmStart:
+    """Setup from a saved snapshot, and background reconciliation."""
+
+    @staticmethod
+    def _setup(mock_pydreo, options=None):
+        from custom_components.dreo import async_setup_entry
+        from custom_components.dreo.pydreo.constant import DreoDeviceType
+
+        mock_hass = MagicMock()
+        mock_hass.data = {}
+        mock_hass.config_entries = MagicMock()
+        mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
+
+        mock_entry = MagicMock()
+        mock_entry.entry_id = "entry1"
+        mock_entry.data = {"username": "test@example.com", "password": "password"}
+        mock_entry.options = options or {}
+
+        mock_device = MagicMock()
+        mock_device.type = DreoDeviceType.TOWER_FAN
+        mock_pydreo.devices = [mock_device]
+        mock_pydreo.async_login = AsyncMock(return_value=True)
+        mock_pydreo.async_load_devices = AsyncMock(return_value=True)
+
+        with patch("custom_components.dreo.pydreo.PyDreo", return_value=mock_pydreo):
+            result = asyncio.run(async_setup_entry(mock_hass, mock_entry))
+        return result, mock_hass, mock_entry
+
+    def test_cold_start_saves_snapshot(self, mock_snapshot_store):
+        """Without a snapshot, setup logs in, loads devices and onboards them in the background, then saves a snapshot."""
+        mock_pydreo = MagicMock()
+        mock_pydreo.export_snapshot.return_value = {"version": 1}
+
+        result, _, mock_entry = self._setup(mock_pydreo)
+
+        assert result is True
+        mock_pydreo.async_login.assert_awaited_once()
+        mock_pydreo.async_load_devices.assert_awaited_once_with(load_state=False)
+        mock_snapshot_store.async_save.assert_not_awaited()
+        mock_entry.async_create_background_task.assert_called_once()
+        assert mock_entry.async_create_background_task.call_args.args[2] == "dreo_onboard_devices"
+
+        asyncio.run(mock_entry.async_create_background_task.call_args.args[1])
+        mock_snapshot_store.async_save.assert_awaited_once_with({"version": 1})
+
+    def test_warm_start_skips_cloud_and_reconciles(self, mock_snapshot_store):
+        """A usable snapshot builds devices without login and schedules reconciliation."""
+        mock_snapshot_store.async_load.return_value = {"version": 1}
+        mock_pydreo = MagicMock()
+        mock_pydreo.load_from_snapshot.return_value = True
+
+        result, mock_hass, mock_entry = self._setup(mock_pydreo)
+
+        assert result is True
+        mock_pydreo.load_from_snapshot.assert_called_once_with({"version": 1})
+        mock_pydreo.async_login.assert_not_awaited()
+        mock_pydreo.async_load_devices.assert_not_awaited()
+        mock_pydreo.start_transport.assert_called_once()
+        mock_hass.config_entries.async_forward_entry_setups.assert_awaited_once()
+        mock_entry.async_create_background_task.assert_called_once()
+        _close_background_tasks(mock_entry)
+
+    def test_unusable_snapshot_falls_back_to_cloud(self, mock_snapshot_store):
+        """A snapshot the library rejects (stale, other account) means a normal cold start."""
+        mock_snapshot_store.async_load.return_value = {"version": 0}
+        mock_pydreo = MagicMock()
+        mock_pydreo.load_from_snapshot.return_value = False
+
+        result, _, mock_entry = self._setup(mock_pydreo)
+        _close_background_tasks(mock_entry)
+
+        assert result is True
+        mock_pydreo.async_login.assert_awaited_once()
+        mock_pydreo.async_load_devices.assert_awaited_once()
+
+    @pytest.mark.parametrize(
+        ("result", "saved", "reloaded"),
+        [(True, True, False), (False, False, True), (None, False, False)],
+    )
+    def test_reconcile_outcomes(self, mock_snapshot_store, result, saved, reloaded):
+        """Refreshed: save a new snapshot. Device list changed: reload. Cloud down: keep going."""
+        from custom_components.dreo import _async_reconcile_snapshot
+
+        mock_hass = MagicMock()
+        mock_entry = MagicMock()
+        mock_pydreo = MagicMock()
+        mock_pydreo.async_reconcile = AsyncMock(return_value=result)
+
+        asyncio.run(_async_reconcile_snapshot(mock_hass, mock_entry, mock_pydreo, mock_snapshot_store))
+
+        assert mock_snapshot_store.async_save.await_count == int(saved)
+        assert mock_hass.config_entries.async_schedule_reload.call_count == int(reloaded)
+
+
+class TestOptionsUpdate:
+    """Options changes applied to the running session."""
+
+    @staticmethod
+    def _hass(options: dict):
+        from custom_components.dreo.const import DOMAIN, DREO_DEVICE_DISCOVERY, DREO_OPTIONS, DREO_STATE_WRITER, PYDREO_MANAGER
+
+        mock_hass = MagicMock()
+        mock_hass.config_entries.async_reload = AsyncMock()
+        mock_hass.data = {
+            DOMAIN: {
+                PYDREO_MANAGER: MagicMock(),
+                DREO_STATE_WRITER: MagicMock(),
+                DREO_DEVICE_DISCOVERY: MagicMock(),
+                DREO_OPTIONS: ({"username": "test@example.com"}, options),
+            }
+        }
+        return mock_hass
+
+    @staticmethod
+    def _entry(options: dict, username: str = "test@example.com"):
+        mock_entry = MagicMock()
+        mock_entry.data = {"username": username}
+        mock_entry.options = options
+        return mock_entry
+
+    def test_live_options_applied_without_reload(self):
+        """Reconnect, tracing, write window and discovery interval changes reach the session directly."""
+        from custom_components.dreo import _async_update_listener
+
+        mock_hass = self._hass({"auto_reconnect": True})
+        options = {"auto_reconnect": False, "command_tracing": True, "state_write_window": 250, "discovery_interval": 0}
+        asyncio.run(_async_update_listener(mock_hass, self._entry(options)))
+
+        data = mock_hass.data["dreo"]
+        mock_hass.config_entries.async_reload.assert_not_awaited()
+        assert data["pydreo_manager"].auto_reconnect is False
+        assert data["pydreo_manager"].tracer.enabled is True
+        assert data["state_writer"].window == 0.25
+        data["device_discovery"].async_set_interval.assert_called_once_with(0)
+        assert data["options"][1] == options
+
+    @pytest.mark.parametrize(
+        ("options", "username"),
+        [({"metrics_sensors": True}, "test@example.com"), ({}, "other@example.com")],
+    )
+    def test_entity_or_account_changes_reload(self, options, username):
+        """Metric sensors add entities and new credentials need a new session, so both reload."""
+        from custom_components.dreo import _async_update_listener
+
+        mock_hass = self._hass({})
+        asyncio.run(_async_update_listener(mock_hass, self._entry(options, username)))
+
+        mock_hass.config_entries.async_reload.assert_awaited_once()
+        mock_hass.data["dreo"]["device_discovery"].async_set_interval.assert_not_called()
+
+    def test_setup_schedules_discovery(self, mock_track_time_interval):
+        """Setup schedules discovery at the configured interval; 0 turns it off."""
+        from datetime import timedelta
+
+        _close_background_tasks(TestSnapshotWarmStart._setup(MagicMock())[2])
+        assert mock_track_time_interval.call_args.args[2] == timedelta(minutes=60)
+
+        mock_track_time_interval.reset_mock()
+        _close_background_tasks(TestSnapshotWarmStart._setup(MagicMock(), {"discovery_interval": 0})[2])
+        mock_track_time_interval.assert_not_called()
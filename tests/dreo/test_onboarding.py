@@ -0,0 +1,139 @@
+"""Tests for progressive device onboarding."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from custom_components.dreo.onboarding import DreoDeviceOnboarding
+from custom_components.dreo.pydreo.reconnectpolicy import BackoffPolicy
+
+FAST_RETRY = BackoffPolicy(base_delay=0.001, max_delay=0.002)
+
+
+class _Manager:
+    """Stands in for PyDreo: loads states with per-device delays and failures."""
+
+    def __init__(self, devices, delays=None, failures=None, workers=4) -> None:
+        self.devices = devices
+        self.state_load_workers = workers
+        self.delays = delays or {}
+        self.failures = dict(failures or {})  # serial number -> loads that fail before one succeeds
+        self.loading = 0
+        self.max_loading = 0
+        self.loads = []
+
+    async def async_load_device_state(self, device) -> bool:
+        self.loading += 1
+        self.max_loading = max(self.max_loading, self.loading)
+        try:
+            await asyncio.sleep(self.delays.get(device.serial_number, 0))
+            self.loads.append(device.serial_number)
+            if self.failures.get(device.serial_number):
+                self.failures[device.serial_number] -= 1
+                return False
+            device.state_loaded = True
+            return True
+        finally:
+            self.loading -= 1
+
+
+def _device(serial_number: str, state_loaded: bool = False) -> SimpleNamespace:
+    return SimpleNamespace(serial_number=serial_number, name=serial_number, state_loaded=state_loaded)
+
+
+def _entities(devices):
+    return [f"entity-{device.serial_number}" for device in devices]
+
+
+class TestDreoDeviceOnboarding:
+    """Test readiness, publishing, bounded loads and retries."""
+
+    def test_devices_published_as_they_load(self):
+        """Loaded devices are added at registration; the rest are added one by one as their state arrives."""
+        devices = [_device("SN0", state_loaded=True), _device("SN1"), _device("SN2")]
+        manager = _Manager(devices, delays={"SN1": 0.05})
+        add_fan, add_sensor = MagicMock(), MagicMock()
+
+        async def run():
+            onboarding = DreoDeviceOnboarding(manager)
+            onboarding.async_add_platform(_entities, add_fan)
+            onboarding.async_add_platform(lambda devices: [], add_sensor)
+            assert [call.args[0] for call in add_fan.call_args_list] == [["entity-SN0"]]
+            assert [device.serial_number for device in onboarding.pending] == ["SN1", "SN2"]
+
+            assert await onboarding.async_load() == []
+            await onboarding.async_wait_ready(devices[1])
+            return onboarding
+
+        onboarding = asyncio.run(run())
+        assert [call.args[0] for call in add_fan.call_args_list] == [["entity-SN0"], ["entity-SN2"], ["entity-SN1"]]
+        add_sensor.assert_not_called()
+        stats = onboarding.stats()
+        assert (stats["devices"], stats["ready"], stats["entities_added"]) == (3, 3, 3)
+        assert stats["time_to_first_entity"] <= stats["time_to_all_entities"]
+
+    def test_loads_are_bounded_by_state_load_workers(self):
+        """No more than state_load_workers states load at once."""
+        manager = _Manager([_device(f"SN{i}") for i in range(8)], delays={f"SN{i}": 0.01 for i in range(8)}, workers=3)
+
+        async def run():
+            onboarding = DreoDeviceOnboarding(manager)
+            onboarding.async_add_platform(_entities, MagicMock())
+            return await onboarding.async_load()
+
+        assert asyncio.run(run()) == []
+        assert manager.max_loading == 3
+        assert len(manager.loads) == 8
+
+    def test_failed_devices_retried_in_background(self):
+        """A device that fails to load does not hold up the others and is retried until it loads."""
+        devices = [_device("SN0"), _device("SN1")]
+        manager = _Manager(devices, failures={"SN1": 2})
+        add_entities = MagicMock()
+
+        async def run():
+            onboarding = DreoDeviceOnboarding(manager, retry_backoff=FAST_RETRY)
+            onboarding.async_add_platform(_entities, add_entities)
+            failed = await onboarding.async_load()
+            assert failed == [devices[1]]
+            assert add_entities.call_args_list[-1].args[0] == ["entity-SN0"]
+            assert onboarding.stats()["time_to_all_entities"] is None
+
+            retry = asyncio.ensure_future(onboarding.async_retry(failed))
+            await asyncio.sleep(0)
+            assert onboarding.stats()["retrying"] == 1
+            await retry
+            return onboarding
+
+        onboarding = asyncio.run(run())
+        assert manager.loads.count("SN1") == 3
+        assert add_entities.call_args_list[-1].args[0] == ["entity-SN1"]
+        stats = onboarding.stats()
+        assert (stats["ready"], stats["retrying"], stats["load_failures"]) == (2, 0, 2)
+        assert stats["time_to_all_entities"] is not None
+
+    def test_load_exceptions_count_as_failures(self):
+        """An exception while loading a state is treated like a failed load."""
+        manager = _Manager([_device("SN0")])
+        manager.async_load_device_state = MagicMock(side_effect=RuntimeError("boom"))
+
+        async def run():
+            onboarding = DreoDeviceOnboarding(manager)
+            return onboarding, await onboarding.async_load()
+
+        onboarding, failed = asyncio.run(run())
+        assert failed == manager.devices
+        assert onboarding.stats()["load_failures"] == 1
+
+    def test_ready_device_not_published_twice(self):
+        """Marking a ready device ready again adds nothing."""
+        device = _device("SN0", state_loaded=True)
+        add_entities = MagicMock()
+
+        async def run():
+            onboarding = DreoDeviceOnboarding(_Manager([device]))
+            onboarding.async_add_platform(_entities, add_entities)
+            onboarding.async_device_ready(device)
+
+        asyncio.run(run())
+        add_entities.assert_called_once_with(["entity-SN0"])
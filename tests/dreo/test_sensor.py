@@ -1,13 +1,14 @@
 """Tests for the Dreo Sensor entity."""
 
 from datetime import datetime, timezone
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from homeassistant.components.sensor import SensorDeviceClass
 
 from custom_components.dreo import sensor
 from custom_components.dreo.haimports import MICROGRAMS_PER_CUBIC_METER
-from custom_components.dreo.sensor import DreoSensorHA, DreoSensorEntityDescription, SENSORS
+from custom_components.dreo.sensor import DreoMetricSensorHA, DreoSensorHA, DreoSensorEntityDescription, METRIC_SENSORS, SENSORS
+from custom_components.dreo.pydreo.metrics import METRIC_COMMAND_ACK_LATENCY, METRIC_REPORT_QUEUE_DEPTH, METRIC_WS_RECONNECTS, MetricsRegistry
 from custom_components.dreo.pydreo.constant import DreoDeviceType
 
 from .testdevicebase import TestDeviceBase
@@ -204,3 +205,26 @@ class TestDreoSensorHA(TestDeviceBase):
         target_reached = next(e for e in entities if e.entity_description.key == "Target Humidity Reached")
         assert target_reached.native_value == "yes"
         assert target_reached.native_value in target_reached._attr_options
+
+    def test_metric_sensors(self):
+        """Test the transport metric sensors read live values from the registry."""
+        metrics = MetricsRegistry()
+        config_entry = MagicMock()
+        config_entry.entry_id = "ENTRY"
+        entities = {description.key: DreoMetricSensorHA(config_entry, metrics, description) for description in METRIC_SENSORS}
+        assert len(entities) == len(METRIC_SENSORS)
+
+        reconnects = entities[METRIC_WS_RECONNECTS]
+        assert reconnects.unique_id == f"ENTRY-metrics-{METRIC_WS_RECONNECTS}"
+        assert reconnects.native_value == 0
+        metrics.inc(METRIC_WS_RECONNECTS)
+        assert reconnects.native_value == 1
+
+        latency = entities[f"{METRIC_COMMAND_ACK_LATENCY}_p95"]
+        assert latency.native_value is None
+        metrics.observe(METRIC_COMMAND_ACK_LATENCY, 0.04)
+        assert latency.native_value == 50.0
+
+        depth = [3]
+        metrics.gauge(METRIC_REPORT_QUEUE_DEPTH, lambda: depth[0])
+        assert entities[METRIC_REPORT_QUEUE_DEPTH].native_value == 3
@@ -0,0 +1,49 @@
+"""Helpers for benchmark tests that write JSON reports.
+
+Reports go to ``bench_results/<name>.json`` (or ``$DREO_BENCH_REPORT_DIR``) so
+CI can keep them as artifacts and compare runs across releases.
+"""
+
+import json
+import os
+import platform
+import statistics
+import time
+from pathlib import Path
+
+BENCH_REPORT_DIR_ENV = "DREO_BENCH_REPORT_DIR"
+DEFAULT_BENCH_REPORT_DIR = "bench_results"
+
+
+def latency_summary(samples: list[float]) -> dict:
+    """p50/p95/p99/max of latency samples in seconds, reported in milliseconds."""
+    if not samples:
+        return {"count": 0}
+    if len(samples) == 1:
+        p50 = p95 = p99 = samples[0]
+    else:
+        cuts = statistics.quantiles(samples, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    return {
+        "count": len(samples),
+        "p50_ms": round(p50 * 1000, 3),
+        "p95_ms": round(p95 * 1000, 3),
+        "p99_ms": round(p99 * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3),
+    }
+
+
+def write_report(name: str, results: dict) -> Path:
+    """Write a benchmark report and return its path."""
+    report_dir = Path(os.environ.get(BENCH_REPORT_DIR_ENV, DEFAULT_BENCH_REPORT_DIR))
+    report_dir.mkdir(parents=True, exist_ok=True)
+    path = report_dir / f"{name}.json"
+    report = {
+        "benchmark": name,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        **results,
+    }
+    path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return path
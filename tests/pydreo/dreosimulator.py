@@ -0,0 +1,336 @@
+"""Local stand-in for the Dreo cloud, for load and latency tests.
+
+Serves the REST endpoints PyDreo uses (login, devicelist, devicestate and
+settings) from the api_responses fixtures, and the ``/websocket`` protocol:
+``control`` messages are answered with a ``control-reply`` followed by a
+``control-report``, ``"2"`` keepalives are counted and ignored. Latency,
+dropped commands and forced reconnects are configurable, and the fleet can be
+scaled to thousands of devices by cloning fixture entries.
+
+Usage::
+
+    with DreoCloudSimulator(["get_devices_HTF005S.json"], copies=1000) as cloud:
+        pydreo = PyDreo("EMAIL", "PASSWORD")
+        ...
+
+The server runs on its own thread and event loop; while it runs, the REST and
+WebSocket URL formats in pydreo are patched to point at it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import logging
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from unittest.mock import patch
+
+from aiohttp import WSMsgType, web
+
+from .imports import *  # pylint: disable=W0401,W0614
+from . import call_json
+from .defaults import Defaults
+from .testbase import PATCH_BASE_PATH
+
+logger = logging.getLogger(__name__)
+
+PATCH_API_URL_FORMAT = f"{PATCH_BASE_PATH}.DREO_API_URL_FORMAT"
+PATCH_WEBSOCKET_URL_FORMAT = f"{PATCH_BASE_PATH}.commandtransport.DREO_WEBSOCKET_URL_FORMAT"
+
+
+@dataclass
+class SimulatedDevice:
+    """One device in the simulated fleet."""
+
+    entry: dict
+    mixed: dict
+    template_sn: str
+    settings: dict = field(default_factory=dict)
+
+    @property
+    def serial_number(self) -> str:
+        """The device serial number."""
+        return self.entry["sn"]
+
+
+@dataclass
+class SimulatorStats:
+    """Request counters, updated on the simulator loop."""
+
+    rest_calls: int = 0
+    unauthorized: int = 0
+    ws_connections: int = 0
+    pings: int = 0
+    controls: int = 0
+    dropped: int = 0
+    replies: int = 0
+    reports: int = 0
+    disconnects: int = 0
+
+
+class DreoCloudSimulator:
+    """REST + WebSocket stand-in for the Dreo cloud.
+
+    devices_files: get_devices_*.json fixtures whose entries make up the fleet.
+    copies: how many devices to create from each fixture entry; copies after
+        the first get the serial number suffix ``-<n>``.
+    latency: seconds before each REST response and before each control-reply.
+    report_delay: seconds between a control-reply and its control-report.
+    drop_rate: fraction of control messages that get no reply at all.
+    disconnect_every: close the WebSocket after every this many control
+        messages, once that command has been acknowledged.
+    """
+
+    def __init__(
+        self,
+        devices_files: list[str],
+        copies: int = 1,
+        latency: float = 0,
+        report_delay: float = 0,
+        drop_rate: float = 0,
+        disconnect_every: int | None = None,
+        token: str = Defaults.token,
+        seed: int | None = None,
+    ) -> None:
+        self.latency = latency
+        self.report_delay = report_delay
+        self.drop_rate = drop_rate
+        self.disconnect_every = disconnect_every
+        self.token = token
+        self.stats = SimulatorStats()
+        self.devices: dict[str, SimulatedDevice] = {}
+        self._random = random.Random(seed)
+        self._clients: set[web.WebSocketResponse] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._runner: web.AppRunner | None = None
+        self._thread: threading.Thread | None = None
+        self._patches = []
+        self.base_url: str | None = None
+
+        for file_name in devices_files:
+            for entry in call_json.get_response_from_file(file_name)[DATA_KEY][LIST_KEY]:
+                template_sn = entry["sn"]
+                mixed = self._fixture(f"get_device_state_{template_sn}.json")
+                mixed = mixed[DATA_KEY][MIXED_KEY] if mixed else {}
+                for copy_number in range(copies):
+                    serial_number = template_sn if copy_number == 0 else f"{template_sn}-{copy_number}"
+                    device_entry = {**entry, "sn": serial_number, "deviceId": f"{entry.get('deviceId')}-{copy_number}"}
+                    self.devices[serial_number] = SimulatedDevice(device_entry, copy.deepcopy(mixed), template_sn)
+
+    @staticmethod
+    def _fixture(file_name: str) -> dict | None:
+        try:
+            return call_json.get_response_from_file(file_name)
+        except FileNotFoundError:
+            return None
+
+    # Lifecycle
+
+    def start(self) -> None:
+        """Start serving and point pydreo at the simulator."""
+        started = threading.Event()
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self._start_server())
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._runner.cleanup())
+            self._loop.close()
+
+        self._thread = threading.Thread(name="DreoCloudSimulator", target=run, daemon=True)
+        self._thread.start()
+        started.wait(timeout=10)
+        self._patches = [
+            patch(PATCH_API_URL_FORMAT, self.base_url),
+            patch(PATCH_WEBSOCKET_URL_FORMAT, f"{self.base_url.replace('http', 'ws', 1)}/websocket"),
+        ]
+        for url_patch in self._patches:
+            url_patch.start()
+        logger.debug("DreoCloudSimulator: serving %d devices at %s", len(self.devices), self.base_url)
+
+    def stop(self) -> None:
+        """Stop serving and restore the cloud URLs."""
+        for url_patch in reversed(self._patches):
+            url_patch.stop()
+        self._patches = []
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self._close_clients(), self._loop).result(timeout=10)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=10)
+            self._loop = None
+
+    def __enter__(self) -> DreoCloudSimulator:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    async def _start_server(self) -> None:
+        app = web.Application()
+        app.router.add_post(DREO_APIS[DREO_API_LOGIN][DREO_API_PATH], self._handle_login)
+        app.router.add_get(DREO_APIS[DREO_API_DEVICELIST][DREO_API_PATH], self._handle_devicelist)
+        app.router.add_get(DREO_APIS[DREO_API_DEVICESTATE][DREO_API_PATH], self._handle_devicestate)
+        app.router.add_get(DREO_APIS[DREO_API_SETTING_GET][DREO_API_PATH], self._handle_setting_get)
+        app.router.add_put(DREO_APIS[DREO_API_SETTING_PUT][DREO_API_PATH], self._handle_setting_put)
+        app.router.add_get("/websocket", self._handle_websocket)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = self._runner.addresses[0][:2]
+        self.base_url = f"http://{host}:{port}"
+
+    # Test controls (thread-safe)
+
+    @property
+    def connected_clients(self) -> int:
+        """Open WebSocket connections."""
+        return len(self._clients)
+
+    def push_report(self, serial_number: str, reported: dict) -> None:
+        """Apply reported state to a device and broadcast it as a ``report``."""
+        asyncio.run_coroutine_threadsafe(self._push(serial_number, "report", reported), self._loop).result(timeout=10)
+
+    def push_frames(self, frames: list[str]) -> None:
+        """Broadcast pre-serialized frames to every client, in order."""
+
+        async def push() -> None:
+            for frame in frames:
+                await self._broadcast(frame)
+
+        asyncio.run_coroutine_threadsafe(push(), self._loop).result(timeout=60)
+
+    def disconnect_clients(self) -> None:
+        """Drop every WebSocket connection, as the cloud does on deploys."""
+        asyncio.run_coroutine_threadsafe(self._close_clients(), self._loop).result(timeout=10)
+
+    # REST
+
+    async def _rest_response(self, request: web.Request, body: dict) -> web.Response:
+        self.stats.rest_calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if request.path != DREO_APIS[DREO_API_LOGIN][DREO_API_PATH] and request.headers.get("authorization") != f"Bearer {self.token}":
+            self.stats.unauthorized += 1
+            return web.Response(status=401)
+        return web.json_response(body)
+
+    async def _handle_login(self, request: web.Request) -> web.Response:
+        return await self._rest_response(
+            request, {"code": 0, "msg": "OK", "data": {"region": DREO_AUTH_REGION_NA, "access_token": self.token}}
+        )
+
+    async def _handle_devicelist(self, request: web.Request) -> web.Response:
+        page_no = int(request.query.get("pageNo", 1))
+        page_size = int(request.query.get("pageSize", 100))
+        entries = [device.entry for device in self.devices.values()]
+        page = entries[(page_no - 1) * page_size : page_no * page_size]
+        data = {
+            "currentPage": page_no,
+            "pageSize": page_size,
+            "totalNum": len(entries),
+            "totalPage": math.ceil(len(entries) / page_size),
+            LIST_KEY: page,
+        }
+        return await self._rest_response(request, {"code": 0, "msg": "OK", DATA_KEY: data})
+
+    async def _handle_devicestate(self, request: web.Request) -> web.Response:
+        device = self.devices.get(request.query.get(DEVICESN_KEY))
+        if device is None:
+            return await self._rest_response(request, {"code": 1, "msg": "Device not found"})
+        return await self._rest_response(request, {"code": 0, "msg": "OK", DATA_KEY: {MIXED_KEY: device.mixed}})
+
+    async def _handle_setting_get(self, request: web.Request) -> web.Response:
+        device = self.devices.get(request.query.get(DEVICESN_KEY))
+        data_key = request.query.get(DREO_API_SETTING_DATA_KEY)
+        data = {DREO_API_SETTING_DATA_KEY: data_key}
+        if device is not None:
+            if data_key in device.settings:
+                data[DREO_API_SETTING_DATA_VALUE] = device.settings[data_key]
+            elif fixture := self._fixture(f"get_device_setting_{device.template_sn}_{data_key}.json"):
+                data = fixture[DATA_KEY]
+        return await self._rest_response(request, {"code": 0, "msg": "OK", DATA_KEY: data})
+
+    async def _handle_setting_put(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        device = self.devices.get(body.get(DEVICESN_KEY))
+        if device is None:
+            return await self._rest_response(request, {"code": 1, "msg": "Device not found"})
+        device.settings[body.get(DREO_API_SETTING_DATA_KEY)] = body.get(DREO_API_SETTING_DATA_VALUE)
+        return await self._rest_response(request, {"code": 0, "msg": "OK", DATA_KEY: {MIXED_KEY: device.mixed}})
+
+    # WebSocket
+
+    async def _handle_websocket(self, request: web.Request) -> web.StreamResponse:
+        if request.query.get("accessToken") != self.token:
+            self.stats.unauthorized += 1
+            return web.Response(status=401)
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        self.stats.ws_connections += 1
+        self._clients.add(ws)
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                if msg.data == "2":
+                    self.stats.pings += 1
+                    continue
+                message = json.loads(msg.data)
+                if message.get("method") == "control":
+                    await self._handle_control(ws, message)
+        finally:
+            self._clients.discard(ws)
+        return ws
+
+    async def _handle_control(self, ws: web.WebSocketResponse, message: dict) -> None:
+        self.stats.controls += 1
+        disconnect = bool(self.disconnect_every) and self.stats.controls % self.disconnect_every == 0
+        if self.drop_rate and self._random.random() < self.drop_rate:
+            self.stats.dropped += 1
+        elif disconnect:
+            await self._acknowledge(ws, message)
+        else:
+            # Reply on a task so a slow device does not hold up the socket.
+            asyncio.get_running_loop().create_task(self._acknowledge(ws, message))
+        if disconnect:
+            self.stats.disconnects += 1
+            await ws.close()
+
+    async def _acknowledge(self, ws: web.WebSocketResponse, message: dict) -> None:
+        serial_number = message.get("devicesn")
+        params = message.get("params") or {}
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if ws.closed or serial_number not in self.devices:
+            return
+        await ws.send_str(json.dumps({"devicesn": serial_number, "method": "control-reply", REPORTED_KEY: params}))
+        self.stats.replies += 1
+        if self.report_delay:
+            await asyncio.sleep(self.report_delay)
+        await self._push(serial_number, "control-report", params)
+
+    async def _push(self, serial_number: str, method: str, reported: dict) -> None:
+        device = self.devices[serial_number]
+        timestamp = int(time.time())
+        for key, value in reported.items():
+            device.mixed[key] = {"state": value, "timestamp": timestamp}
+        await self._broadcast(json.dumps({"devicesn": serial_number, "method": method, REPORTED_KEY: reported, "timestamp": timestamp}))
+
+    async def _broadcast(self, frame: str) -> None:
+        for ws in list(self._clients):
+            if not ws.closed:
+                await ws.send_str(frame)
+                self.stats.reports += 1
+
+    async def _close_clients(self) -> None:
+        for ws in list(self._clients):
+            await ws.close()
@@ -2,3 +2,15 @@ import sys
 import importlib.util
 from typing import TYPE_CHECKING
 from custom_components.dreo.pydreo import *  # pylint: disable=W0401,W0614
+from custom_components.dreo.pydreo import (  # device classes load lazily, so the star import above leaves them out
+    PyDreoAC,
+    PyDreoAirCirculator,
+    PyDreoAirPurifier,
+    PyDreoCeilingFan,
+    PyDreoChefMaker,
+    PyDreoDehumidifier,
+    PyDreoEvaporativeCooler,
+    PyDreoHeater,
+    PyDreoHumidifier,
+    PyDreoTowerFan,
+)
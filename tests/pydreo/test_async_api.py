@@ -0,0 +1,290 @@
+"""Tests for the PyDreo asyncio API (async_login, async_load_devices, async_send_command)."""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from typing import Optional
+from unittest.mock import AsyncMock, MagicMock, patch
+import pytest
+
+from .imports import *  # pylint: disable=W0401,W0614
+from .testbase import TestBase, PATCH_BASE_PATH
+from . import call_json
+
+from custom_components.dreo.pydreo import PyDreo
+from custom_components.dreo.pydreo.commandtransport import CommandTransport
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.DEBUG)
+
+PATCH_ASYNC_CALL_DREO_API = f"{PATCH_BASE_PATH}.PyDreo.async_call_dreo_api"
+PATCH_TRANSPORT_ASYNC_SEND = f"{PATCH_BASE_PATH}.CommandTransport.async_send_message"
+
+
+class TestAsyncApi(TestBase):
+    """Tests for the async API surface, backed by the same file-based fake as the sync API."""
+
+    @staticmethod
+    def _run(coro):
+        return asyncio.run(coro)
+
+    def _patch_async_api(self, latency: float = 0.0, device_list: Optional[list] = None):
+        """Route async REST calls to the TestBase fake; return the list of calls made.
+
+        The most calls ever in flight at once is kept in ``self.peak_calls``.
+        """
+        calls = []
+        in_flight = 0
+        self.peak_calls = 0
+
+        async def async_call_dreo_api(api: str, json_object: Optional[dict] = None):
+            nonlocal in_flight
+            calls.append((api, json_object))
+            if api == "devicelist" and device_list is not None:
+                return {"code": 0, DATA_KEY: {LIST_KEY: device_list}}, 200
+            in_flight += 1
+            self.peak_calls = max(self.peak_calls, in_flight)
+            try:
+                if latency:
+                    await asyncio.sleep(latency)
+                return self.call_dreo_api(api, json_object)
+            finally:
+                in_flight -= 1
+
+        return patch(PATCH_ASYNC_CALL_DREO_API, side_effect=async_call_dreo_api), calls
+
+    def test_async_load_devices_matches_sync(self):
+        """async_load_devices builds the same devices, in the same order, as load_devices."""
+        self.get_devices_file_name = "get_devices_multiple_1.json"
+        self.pydreo_manager.load_devices()
+        expected = [(d.serial_number, type(d), d.raw_state) for d in self.pydreo_manager.devices]
+
+        manager = PyDreo("EMAIL", "PASSWORD", redact=True)
+        manager.enabled = True
+        manager.token = self.pydreo_manager.token
+        async_patch, _ = self._patch_async_api()
+        with async_patch:
+            assert self._run(manager.async_load_devices()) is True
+
+        assert [(d.serial_number, type(d), d.raw_state) for d in manager.devices] == expected
+        for device in manager.devices:
+            device.dispose()
+
+    def test_async_load_devices_prefetches_settings(self):
+        """Settings read during construction are fetched up front, not from the loop thread."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        async_patch, calls = self._patch_async_api()
+        self.mock_api.reset_mock()
+        with async_patch:
+            assert self._run(self.pydreo_manager.async_load_devices()) is True
+
+        fan = self.pydreo_manager.devices[0]
+        assert fan.temperature_offset == -2
+        assert [api for api, _ in calls] == ["devicelist", "setting_get", "devicestate"]
+        self.mock_api.assert_not_called()  # no blocking call_dreo_api during construction
+        assert not self.pydreo_manager._prefetched_settings
+
+    def test_async_load_devices_fetches_concurrently(self):
+        """Per-device REST calls overlap, bounded by state_load_workers."""
+        template = call_json.get_response_from_file("get_devices_HTF005S.json")[DATA_KEY][LIST_KEY][0]
+        device_list = [{**template, "sn": f"ASYNC_FAN_{i}", "deviceId": f"ASYNC_ID_{i}"} for i in range(8)]
+        self.pydreo_manager.state_load_workers = 4
+        async_patch, calls = self._patch_async_api(0.01, device_list)
+        with async_patch:
+            assert self._run(self.pydreo_manager.async_load_devices()) is True
+
+        # Two calls per fan (temperature offset, state); every worker slot was busy at once, and no more.
+        assert len(calls) == 1 + 2 * len(device_list)
+        assert self.peak_calls == self.pydreo_manager.state_load_workers
+        assert [d.serial_number for d in self.pydreo_manager.devices] == [d["sn"] for d in device_list]
+
+    def test_async_load_devices_without_state(self):
+        """load_state=False builds devices without reading their state; loading it later applies the overrides."""
+        self.get_devices_file_name = "get_devices_HAF004S_2REVS.json"
+        async_patch, calls = self._patch_async_api()
+        with async_patch:
+            assert self._run(self.pydreo_manager.async_load_devices(load_state=False)) is True
+            assert "devicestate" not in [api for api, _ in calls]
+            old_rev = self.pydreo_manager.devices[0]
+            assert old_rev.state_loaded is False
+            assert old_rev.vertical_angle_range != (0, 90)
+
+            assert self._run(self.pydreo_manager.async_load_device_state(old_rev)) is True
+        assert old_rev.state_loaded is True
+        assert old_rev.vertical_angle_range == (0, 90)
+
+    def test_async_discover_devices(self):
+        """Discovery attaches new devices with their state and detaches removed ones, leaving the rest alone."""
+        self.get_devices_file_name = "get_devices_multiple_1.json"
+        self.pydreo_manager.load_devices()
+        kept, removed = self.pydreo_manager.devices[0], self.pydreo_manager.devices[1]
+        listed = self.pydreo_manager.raw_response[DATA_KEY][LIST_KEY]
+        new = call_json.get_response_from_file("get_devices_HAF004S.json")[DATA_KEY][LIST_KEY][0]
+        device_list = [dev for dev in listed if dev["sn"] != removed.serial_number] + [new]
+
+        async_patch, calls = self._patch_async_api(device_list=device_list)
+        with async_patch, patch.object(removed, "dispose") as dispose:
+            added, gone = self._run(self.pydreo_manager.async_discover_devices())
+
+        assert [device.serial_number for device in added] == [new["sn"]]
+        assert added[0].state_loaded is True
+        assert gone == [removed]
+        dispose.assert_called_once()
+        assert self.pydreo_manager.devices[0] is kept
+        assert removed not in self.pydreo_manager.devices
+        assert set(self.pydreo_manager._device_list_by_sn) == {dev["sn"] for dev in device_list}  # pylint: disable=protected-access
+        assert [json_object[DEVICESN_KEY] for api, json_object in calls if api == "devicestate"] == [new["sn"]]
+
+        with async_patch:
+            assert self._run(self.pydreo_manager.async_discover_devices()) == ([], [])
+
+    def test_async_discover_devices_cloud_unreachable(self):
+        """A device list that cannot be read changes nothing."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        with patch(PATCH_ASYNC_CALL_DREO_API, AsyncMock(return_value=(None, 500))):
+            assert self._run(self.pydreo_manager.async_discover_devices()) is None
+        assert len(self.pydreo_manager.devices) == 1
+
+    def test_async_login_follows_region(self):
+        """async_login retries in the region the auth server reports."""
+        manager = PyDreo("EMAIL", "PASSWORD", redact=True)
+        responses = [
+            ({"code": 0, "data": {"region": "EU", "access_token": "ignored"}}, 200),
+            ({"code": 0, "data": {"region": "EU", "access_token": "eu-token"}}, 200),
+        ]
+        with patch(PATCH_ASYNC_CALL_DREO_API, new_callable=AsyncMock, side_effect=responses) as mock_api:
+            assert self._run(manager.async_login()) is True
+
+        assert mock_api.await_count == 2
+        assert manager.token == "eu-token"
+        assert manager.api_server_region == "eu"
+
+    def test_async_login_failure(self):
+        """async_login reports failure on a non-zero API code."""
+        manager = PyDreo("EMAIL", "PASSWORD", redact=True)
+        with patch(PATCH_ASYNC_CALL_DREO_API, new_callable=AsyncMock, return_value=({"code": 1, "msg": "bad"}, 200)):
+            assert self._run(manager.async_login()) is False
+        assert manager.enabled is False
+
+    def test_async_call_dreo_api_relogins_on_401(self):
+        """A 401 on the aiohttp path triggers an async re-login and one retry."""
+        self.pydreo_manager.aiohttp_session = MagicMock()
+        self.pydreo_manager._transport = MagicMock()
+        responses = [
+            (None, 401),
+            ({"code": 0, "data": {"region": "NA", "access_token": "fresh"}}, 200),
+            ({"code": 0, "data": {}}, 200),
+        ]
+        with patch(f"{PATCH_BASE_PATH}.Helpers.async_call_api", new_callable=AsyncMock, side_effect=responses) as mock_call:
+            response, status = self._run(self.pydreo_manager.async_call_dreo_api("devicelist"))
+
+        assert status == 200 and response == {"code": 0, "data": {}}
+        assert mock_call.await_count == 3
+        assert mock_call.await_args_list[0].kwargs["session"] is self.pydreo_manager.aiohttp_session
+        assert self.pydreo_manager.token == "fresh"
+        self.pydreo_manager._transport.update_token.assert_called_once_with("fresh")
+
+
+class TestAsyncSendCommand(TestBase):
+    """Tests for async_send_command ack handling and per-device slots."""
+
+    def _load_fan(self):
+        self.get_devices_file_name = "get_devices_HAF004S.json"
+        self.pydreo_manager.load_devices()
+        return self.pydreo_manager.devices[0]
+
+    def test_ack_from_transport_thread_completes_command(self):
+        """An ack consumed on another thread wakes the awaiting coroutine."""
+        fan = self._load_fan()
+        sends = []
+
+        async def send(content):
+            command = json.loads(content)
+            sends.append(command)
+            ack = {"devicesn": command["devicesn"], "method": "control-report", "reported": command["params"]}
+            threading.Timer(0.05, self.pydreo_manager._transport_consume_message, args=(ack,)).start()
+
+        with patch(PATCH_TRANSPORT_ASYNC_SEND, side_effect=send):
+            assert asyncio.run(self.pydreo_manager.async_send_command(fan, {POWERON_KEY: True})) is True
+
+        assert len(sends) == 1
+        assert sends[0]["params"] == {POWERON_KEY: True}
+        assert fan.is_on is True
+        assert not self.pydreo_manager._pending_commands
+
+    def test_retries_then_gives_up_without_ack(self):
+        """Without an ack, the command is resent _MAX_COMMAND_RETRIES times and reports failure."""
+        fan = self._load_fan()
+        with patch(PATCH_TRANSPORT_ASYNC_SEND, new_callable=AsyncMock) as mock_send, patch(f"{PATCH_BASE_PATH}._COMMAND_ACK_TIMEOUT", 0.05):
+            assert asyncio.run(self.pydreo_manager.async_send_command(fan, {POWERON_KEY: True})) is False
+        assert mock_send.await_count == 3
+        assert not self.pydreo_manager._pending_commands
+
+    def test_releases_slot_on_send_error(self):
+        """A transport error propagates and frees the device's slot."""
+        fan = self._load_fan()
+        with patch(PATCH_TRANSPORT_ASYNC_SEND, new_callable=AsyncMock, side_effect=RuntimeError("Connection lost")):
+            with pytest.raises(RuntimeError):
+                asyncio.run(self.pydreo_manager.async_send_command(fan, {POWERON_KEY: True}))
+        assert fan.serial_number not in self.pydreo_manager._pending_commands
+
+    def test_same_device_commands_wait_for_slot(self):
+        """A second command to the same device waits for the first one's ack."""
+        fan = self._load_fan()
+        order = []
+
+        async def send(content):
+            order.append(json.loads(content)["params"][POWERON_KEY])
+
+        async def scenario():
+            first = asyncio.create_task(self.pydreo_manager.async_send_command(fan, {POWERON_KEY: True}))
+            await asyncio.sleep(0.01)
+            second = asyncio.create_task(self.pydreo_manager.async_send_command(fan, {POWERON_KEY: False}))
+            await asyncio.sleep(0.05)
+            assert order == [True]  # second still waiting on the slot
+            self.pydreo_manager._transport_consume_message(
+                {"devicesn": fan.serial_number, "method": "control-report", "reported": {POWERON_KEY: True}}
+            )
+            assert await first is True
+            await asyncio.sleep(0.01)
+            assert order == [True, False]
+            self.pydreo_manager._transport_consume_message(
+                {"devicesn": fan.serial_number, "method": "control-report", "reported": {POWERON_KEY: False}}
+            )
+            assert await second is True
+
+        with patch(PATCH_TRANSPORT_ASYNC_SEND, side_effect=send):
+            asyncio.run(scenario())
+
+
+class TestCommandTransportAsyncSend:
+    """Tests for CommandTransport.async_send_message."""
+
+    def test_async_send_from_another_loop(self):
+        """Callers on another loop await the send on the transport loop."""
+        transport = CommandTransport(MagicMock())
+        transport._transport_enabled = True
+        mock_ws = AsyncMock()
+        mock_ws.closed = False
+        transport._ws = mock_ws
+
+        loop = asyncio.new_event_loop()
+        transport._loop = loop
+        transport._ws_send_lock = asyncio.Lock()
+        t = threading.Thread(target=loop.run_forever, daemon=True)
+        t.start()
+        try:
+            asyncio.run(transport.async_send_message("payload"))
+            mock_ws.send.assert_awaited_once_with("payload")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            t.join(timeout=5)
+
+    def test_async_send_requires_enabled_transport(self):
+        """async_send_message refuses to send before start_transport."""
+        transport = CommandTransport(MagicMock())
+        with pytest.raises(RuntimeError, match="disabled"):
+            asyncio.run(transport.async_send_message("payload"))
@@ -0,0 +1,128 @@
+"""Benchmark: setter to state callback latency through the full command path.
+
+Each command runs setter -> CommandOutbox -> PyDreo.send_command ->
+CommandTransport.send_message -> control-reply ack -> control-report ->
+handle_server_update -> device callback against the local cloud simulator.
+Results are written to bench_results/command_latency.json. Run with
+``pytest -m benchmark``.
+"""
+
+import dataclasses
+import logging
+import threading
+import time
+
+import pytest
+
+from custom_components.dreo.pydreo.commandoutbox import OutboxTiming
+from custom_components.dreo.pydreo.pydreobasedevice import PyDreoBaseDevice
+from .imports import *  # pylint: disable=W0401,W0614
+from .benchreport import latency_summary, write_report
+from .dreosimulator import DreoCloudSimulator
+from .testbase import wait_for
+
+logger = logging.getLogger(__name__)
+
+DEVICES_FILE = "get_devices_HTF005S.json"
+CLOUD_LATENCY = 0.005  # seconds before each control-reply
+CALLBACK_TIMEOUT = 5
+
+# (name, timing, devices, commands per device)
+SCENARIOS = [
+    ("immediate_single_device", OutboxTiming.IMMEDIATE, 1, 100),
+    ("immediate_fleet", OutboxTiming.IMMEDIATE, 50, 20),
+    ("default", PyDreoBaseDevice._COMMAND_TIMING, 8, 4),  # pylint: disable=protected-access
+    ("short_quiet_period", OutboxTiming(quiet_period=0.02, max_wait=0.05, min_interval=0.50), 8, 4),
+    ("short_min_interval", OutboxTiming(quiet_period=0.10, max_wait=0.25, min_interval=0.10), 8, 4),
+]
+
+
+def _run_scenario(devices: list, timing: OutboxTiming, commands: int) -> dict:
+    """Drive every device from its own thread; each command waits for its state callback."""
+    latencies: list[float] = []
+    timeouts = 0
+    lock = threading.Lock()
+
+    def drive(device) -> None:
+        nonlocal timeouts
+        reported = threading.Event()
+        device.add_attr_callback(lambda _changed: reported.set(), ["fan_speed"])
+        low, high = device.speed_range
+        for _ in range(commands):
+            reported.clear()
+            started = time.perf_counter()
+            device.fan_speed = high if device.fan_speed == low else low
+            ok = reported.wait(CALLBACK_TIMEOUT)
+            with lock:
+                if ok:
+                    latencies.append(time.perf_counter() - started)
+                else:
+                    timeouts += 1
+
+    for device in devices:
+        device._outbox.timing = timing  # pylint: disable=protected-access
+    threads = [threading.Thread(target=drive, args=(device,)) for device in devices]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    for device in devices:
+        device._attr_cbs.clear()  # pylint: disable=protected-access
+
+    return {
+        "timing": dataclasses.asdict(timing),
+        "devices": len(devices),
+        "commands": len(latencies) + timeouts,
+        "timeouts": timeouts,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_cps": round(len(latencies) / elapsed, 1),
+        "latency": latency_summary(latencies),
+    }
+
+
+@pytest.mark.benchmark
+class TestCommandLatencyBenchmark:
+    """End-to-end command latency against the local cloud simulator."""
+
+    @pytest.fixture(autouse=True)
+    def cloud(self):
+        """A connected PyDreo with enough simulated devices for every scenario."""
+        fleet = max(devices for _, _, devices, _ in SCENARIOS)
+        with DreoCloudSimulator([DEVICES_FILE], copies=fleet, latency=CLOUD_LATENCY) as cloud:
+            self.pydreo = PyDreo("EMAIL", "PASSWORD", redact=True)
+            assert self.pydreo.login() is True
+            assert self.pydreo.load_devices() is True
+            self.pydreo.start_transport()
+            assert wait_for(lambda: cloud.connected_clients == 1, timeout=5)
+            # Per-message debug logging (log_cli runs at DEBUG) would dominate the numbers.
+            quiet = [logging.getLogger(name) for name in ("custom_components.dreo.pydreo", "websockets")]
+            levels = [quiet_logger.level for quiet_logger in quiet]
+            for quiet_logger in quiet:
+                quiet_logger.setLevel(logging.INFO)
+            try:
+                yield cloud
+            finally:
+                for quiet_logger, level in zip(quiet, levels):
+                    quiet_logger.setLevel(level)
+                self.pydreo.stop_transport()
+
+    def test_command_latency_benchmark(self):
+        """Measure latency percentiles and throughput per scenario and write the JSON report."""
+        results = {}
+        for name, timing, devices, commands in SCENARIOS:
+            results[name] = _run_scenario(self.pydreo.devices[:devices], timing, commands)
+            logger.info("command latency %s: %s", name, results[name])
+
+        path = write_report("command_latency", {"cloud_latency_s": CLOUD_LATENCY, "scenarios": results})
+        logger.info("command latency report written to %s", path)
+
+        assert all(result["timeouts"] == 0 for result in results.values())
+        immediate = results["immediate_single_device"]["latency"]
+        default = results["default"]["latency"]
+        # An immediate send skips the quiet period the default profile waits out.
+        assert immediate["p50_ms"] < default["p50_ms"]
+        assert default["p50_ms"] >= PyDreoBaseDevice._COMMAND_TIMING.quiet_period * 1000  # pylint: disable=protected-access
+        # Commands to different devices proceed in parallel.
+        assert results["immediate_fleet"]["throughput_cps"] > results["immediate_single_device"]["throughput_cps"]
@@ -12,7 +12,7 @@ import time
 
 import pytest
 
-from custom_components.dreo.pydreo.commandoutbox import CommandOutbox, OutboxTiming
+from custom_components.dreo.pydreo.commandoutbox import CommandDroppedError, CommandNotAckedError, CommandOutbox, OutboxTiming
 
 from .testbase import wait_for
 
@@ -314,6 +314,104 @@ class TestCallbacks:
         assert submitted == [{"lighton": True}, {"atmon": True}]
 
 
+class TestBatchFutures:
+    """The future returned by submit() tracks the batch that carries the keys."""
+
+    def test_burst_shares_one_future(self):
+        """Every caller in a merged batch gets the same future, resolved on send."""
+        outbox, sends = make_outbox()
+        first = outbox.submit({"lighton": True})
+        second = outbox.submit({"atmon": True})
+        assert first is second
+        assert first.result(timeout=2) is True
+        assert sends == [{"lighton": True, "atmon": True}]
+
+    def test_key_during_send_gets_next_batch_future(self):
+        """Keys that miss the in-flight batch resolve with the drained one."""
+        send_started = threading.Event()
+        release = threading.Event()
+        sends = []
+
+        def slow_send(params):
+            sends.append(params)
+            send_started.set()
+            release.wait(timeout=2)
+
+        outbox = CommandOutbox("test-device", TIMING, slow_send, timer_scheduler)
+        first = outbox.submit({"lighton": True})
+        assert send_started.wait(timeout=2)
+        second = outbox.submit({"atmon": True})
+        assert second is not first
+        assert not first.done()
+        release.set()
+        assert first.result(timeout=2) is True
+        assert second.result(timeout=2) is True
+        assert sends == [{"lighton": True}, {"atmon": True}]
+
+    def test_unacked_send_fails_future(self):
+        """A send that reports no ack fails the batch future."""
+        outbox = CommandOutbox("test-device", TIMING, lambda params: False, timer_scheduler)
+        future = outbox.submit({"lighton": True})
+        with pytest.raises(CommandNotAckedError):
+            future.result(timeout=2)
+
+    def test_deferred_send_error_fails_future(self):
+        """A deferred batch has no caller to raise to, but its future carries the error."""
+
+        def failing_send(_params):
+            raise RuntimeError("transport down")
+
+        outbox = CommandOutbox("test-device", TIMING, failing_send, timer_scheduler)
+        future = outbox.submit({"lighton": True})
+        with pytest.raises(RuntimeError, match="transport down"):
+            future.result(timeout=2)
+
+    def test_cancel_fails_pending_future(self):
+        """Dropped keys fail their future; later submits fail immediately."""
+        outbox, sends = make_outbox()
+        future = outbox.submit({"lighton": True})
+        outbox.cancel()
+        with pytest.raises(CommandDroppedError):
+            future.result(timeout=0)
+        with pytest.raises(CommandDroppedError):
+            outbox.submit({"atmon": True}).result(timeout=0)
+        assert sends == []
+
+    def test_finalize_exception_fails_future(self):
+        """A batch that finalize drops fails its future."""
+
+        def bad_finalize(_params):
+            raise ValueError("bad state")
+
+        outbox, sends = make_outbox(timing=OutboxTiming.IMMEDIATE, finalize=bad_finalize)
+        with pytest.raises(CommandDroppedError):
+            outbox.submit({"lighton": True}).result(timeout=0)
+        assert sends == []
+
+    @pytest.mark.parametrize("veto", [False, True], ids=["finalize_error", "finalize_empty"])
+    def test_dropped_batch_resolves_outside_lock(self, veto):
+        """A done-callback of a dropped batch can submit to the same outbox without deadlocking."""
+        calls = []
+
+        def finalize(params):
+            calls.append(params)
+            if len(calls) > 1:
+                return params
+            if veto:
+                return {}
+            raise ValueError("bad state")
+
+        outbox, sends = make_outbox(finalize=finalize)
+        outbox.submit({"lighton": True}).add_done_callback(lambda _future: outbox.submit({"atmon": True}))
+        assert wait_for(lambda: sends == [{"atmon": True}])
+
+    def test_immediate_and_empty_submits_are_already_resolved(self):
+        """Immediate mode resolves before submit returns; an empty submit trivially succeeds."""
+        outbox, _ = make_outbox(timing=OutboxTiming.IMMEDIATE)
+        assert outbox.submit({"lighton": True}).result(timeout=0) is True
+        assert outbox.submit({}).result(timeout=0) is True
+
+
 class TestImmediateMode:
     """OutboxTiming.IMMEDIATE - the synchronous opt-out used by the suite."""
 
@@ -5,6 +5,8 @@ import json
 import threading
 from unittest.mock import MagicMock, AsyncMock, patch, call
 import pytest
+from custom_components.dreo.pydreo.commandtransport import TransportUnavailableError
+from custom_components.dreo.pydreo.reconnectpolicy import BackoffPolicy, CircuitState, ConnectionState
 from .imports import CommandTransport
 
 
@@ -54,6 +56,27 @@ class TestCommandTransport:
         assert transport._auto_reconnect is True
         assert transport.auto_reconnect is True
 
+    def test_auto_reconnect_restarts_stopped_transport(self):
+        """Turning auto_reconnect back on restarts a transport that gave up reconnecting, and only that."""
+        transport = CommandTransport(MagicMock())
+        with patch.object(transport, "start_transport") as mock_start:
+            transport.auto_reconnect = True
+            mock_start.assert_not_called()  # never started
+
+            transport._transport_enabled = True
+            transport._api_server_region = "us"
+            transport._token = "token"
+            transport._event_thread = MagicMock()
+            transport._event_thread.is_alive.return_value = True
+            transport.auto_reconnect = True
+            mock_start.assert_not_called()  # still running
+
+            transport._event_thread.is_alive.return_value = False
+            transport.auto_reconnect = False
+            mock_start.assert_not_called()
+            transport.auto_reconnect = True
+            mock_start.assert_called_once_with("us", "token")
+
     def test_start_transport_creates_thread(self):
         """Test that start_transport creates and starts a thread."""
         callback = MagicMock()
@@ -576,7 +599,7 @@ class TestCommandTransport:
             # Mock websockets.connect to yield once
             mock_ws = AsyncMock()
 
-            async def mock_connect(url):
+            async def mock_connect(url, **kwargs):
                 yield mock_ws
 
             with patch("custom_components.dreo.pydreo.commandtransport.websockets.connect", side_effect=mock_connect):
@@ -603,7 +626,7 @@ class TestCommandTransport:
 
             iteration_count = [0]
 
-            async def mock_connect(url):
+            async def mock_connect(url, **kwargs):
                 iteration_count[0] += 1
                 if iteration_count[0] == 1:
                     yield mock_ws
@@ -634,7 +657,7 @@ class TestCommandTransport:
 
             # Create an async context manager mock that yields a websocket each time
             class MockWebSocketConnect:
-                def __init__(self, url):
+                def __init__(self, url, **kwargs):
                     self.url = url
 
                 async def __aenter__(self):
@@ -654,8 +677,8 @@ class TestCommandTransport:
                         return mock_ws
                     raise StopAsyncIteration
 
-            def mock_connect_factory(url):
-                return MockWebSocketConnect(url)
+            def mock_connect_factory(url, **kwargs):
+                return MockWebSocketConnect(url, **kwargs)
 
             with patch("custom_components.dreo.pydreo.commandtransport.websockets.connect", side_effect=mock_connect_factory):
                 # Handler raises exception first time to trigger reconnect
@@ -689,7 +712,7 @@ class TestCommandTransport:
 
             captured_url = [None]
 
-            async def mock_connect(url):
+            async def mock_connect(url, **kwargs):
                 captured_url[0] = url
                 # Signal close after capturing URL so the loop exits
                 transport._signal_close = True
@@ -857,7 +880,7 @@ class TestCommandTransport:
             captured_urls = []
             call_count = [0]
 
-            async def mock_connect(url):
+            async def mock_connect(url, **kwargs):
                 captured_urls.append(url)
                 call_count[0] += 1
                 if call_count[0] == 1:
@@ -892,7 +915,7 @@ class TestCommandTransport:
             transport._token = "test_token"
             transport._signal_close = True  # Exit immediately
 
-            async def mock_connect(url):
+            async def mock_connect(url, **kwargs):
                 yield AsyncMock()
 
             with patch("custom_components.dreo.pydreo.commandtransport.websockets.connect", side_effect=mock_connect):
@@ -914,7 +937,7 @@ class TestCommandTransport:
             transport._auto_reconnect = True
 
             # Simulate an unhandled BaseException (not caught by except Exception)
-            async def mock_connect(url):
+            async def mock_connect(url, **kwargs):
                 raise BaseException("simulated crash")  # noqa: TRY301 - intentional
                 yield  # pylint: disable=unreachable
 
@@ -1045,3 +1068,124 @@ class TestCommandTransport:
                 with patch("time.monotonic", side_effect=[0, 10]):  # Immediately expire deadline
                     with pytest.raises(RuntimeError, match="WebSocket event loop not available"):
                         transport.send_message({"command": "test"})
+
+    def test_connect_failures_back_off_and_open_circuit(self):
+        """Failed connects wait growing, jittered delays and open the circuit at the threshold."""
+
+        async def _test():
+            states = []
+            transport = CommandTransport(MagicMock(), on_state_change=lambda connection, circuit: states.append((connection, circuit)))
+            transport._api_server_region = "us"
+            transport._token = "test_token"
+            connect_kwargs = []
+
+            def mock_connect(url, **kwargs):
+                connect_kwargs.append(kwargs)
+                raise OSError("connection refused")
+
+            delays = []
+
+            async def record_sleep(delay):
+                delays.append(delay)
+                if len(delays) == 5:
+                    transport._signal_close = True
+
+            with patch("custom_components.dreo.pydreo.commandtransport.websockets.connect", side_effect=mock_connect):
+                with patch("custom_components.dreo.pydreo.commandtransport.asyncio.sleep", side_effect=record_sleep):
+                    await transport._start_websocket()
+
+            # Connection errors are surfaced to this loop instead of retried inside websockets.
+            assert connect_kwargs[0]["process_exception"](OSError()) is not None
+            assert len(delays) == 5
+            for attempt, delay in enumerate(delays, start=1):
+                ceiling = min(transport.reconnect_backoff.max_delay, transport.reconnect_backoff.base_delay * 2**attempt)
+                assert ceiling / 2 <= delay <= ceiling
+            assert (ConnectionState.BACKOFF, CircuitState.OPEN) in states
+            assert (ConnectionState.CONNECTING, CircuitState.HALF_OPEN) in states
+            assert transport.connection_state == ConnectionState.STOPPED
+            assert transport.circuit_state == CircuitState.OPEN
+            assert transport.available is False
+            assert transport.status()["circuit"]["failures"] == 5
+
+        asyncio.run(_test())
+
+    def test_successful_connect_closes_circuit(self):
+        """A connection after failures closes the circuit and reconnects promptly after a drop."""
+
+        async def _test():
+            transport = CommandTransport(MagicMock())
+            transport._api_server_region = "us"
+            transport._token = "test_token"
+            for _ in range(3):
+                transport._breaker.record_failure()
+            assert transport.available is False
+
+            async def mock_connect(url, **kwargs):
+                yield AsyncMock()
+
+            async def mock_handler(ws):
+                assert transport.connection_state == ConnectionState.CONNECTED
+                assert transport.available is True
+
+            delays = []
+
+            async def record_sleep(delay):
+                delays.append(delay)
+                transport._signal_close = True
+
+            with patch("custom_components.dreo.pydreo.commandtransport.websockets.connect", side_effect=mock_connect):
+                with patch.object(transport, "_ws_handler", side_effect=mock_handler):
+                    with patch("custom_components.dreo.pydreo.commandtransport.asyncio.sleep", side_effect=record_sleep):
+                        await transport._start_websocket()
+
+            assert transport.circuit_state == CircuitState.CLOSED
+            assert delays[0] <= transport.reconnect_backoff.base_delay
+
+        asyncio.run(_test())
+
+    def test_send_fails_fast_when_circuit_open(self):
+        """With the circuit open, a send raises at once without touching the socket."""
+        transport = CommandTransport(MagicMock())
+        transport._transport_enabled = True
+        mock_ws = AsyncMock()
+        mock_ws.closed = False
+        transport._ws = mock_ws
+        for _ in range(3):
+            transport._breaker.record_failure()
+
+        loop = asyncio.new_event_loop()
+        transport._loop = loop
+        transport._ws_send_lock = asyncio.Lock()
+        t = threading.Thread(target=loop.run_forever, daemon=True)
+        t.start()
+        try:
+            with pytest.raises(TransportUnavailableError):
+                transport.send_message({"command": "test"})
+            mock_ws.send.assert_not_called()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            t.join(timeout=5)
+
+    def test_send_retry_wakes_on_reconnect(self):
+        """A send waiting out a retry delay goes as soon as the socket reconnects."""
+
+        async def _test():
+            transport = CommandTransport(MagicMock())
+            transport._ws_send_lock = asyncio.Lock()
+            transport._connected_event = asyncio.Event()
+            transport._connection_state = ConnectionState.BACKOFF
+            mock_ws = AsyncMock()
+            mock_ws.closed = False
+
+            async def reconnect():
+                await asyncio.sleep(0.05)
+                transport._ws = mock_ws
+                transport._set_connection_state(ConnectionState.CONNECTED)
+
+            transport.send_backoff = BackoffPolicy(base_delay=10.0, max_delay=10.0)
+            reconnecting = asyncio.create_task(reconnect())
+            await asyncio.wait_for(transport._send_with_retries("payload"), 2)
+            await reconnecting
+            mock_ws.send.assert_called_once_with("payload")
+
+        asyncio.run(_test())
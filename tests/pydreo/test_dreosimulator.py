@@ -0,0 +1,144 @@
+"""End-to-end tests of PyDreo against the local Dreo cloud simulator."""
+
+import logging
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from custom_components.dreo.pydreo.commandoutbox import OutboxTiming
+from custom_components.dreo.pydreo.pydreobasedevice import PyDreoBaseDevice
+from custom_components.dreo.pydreo.metrics import (
+    METRIC_COMMAND_ACK_LATENCY,
+    METRIC_COMMAND_ACK_TIMEOUTS,
+    METRIC_COMMAND_BATCH_KEYS,
+    METRIC_COMMAND_RETRIES,
+    METRIC_COMMANDS_FAILED,
+    METRIC_COMMANDS_SENT,
+    METRIC_REST_CALLS,
+    METRIC_REST_LATENCY,
+    METRIC_WS_CONNECTED,
+    METRIC_WS_CONNECTS,
+    METRIC_WS_MESSAGES,
+    METRIC_WS_RECONNECTS,
+)
+from .imports import *  # pylint: disable=W0401,W0614
+from .dreosimulator import DreoCloudSimulator
+from .testbase import PATCH_BASE_PATH, wait_for
+
+logger = logging.getLogger(__name__)
+
+DEVICES_FILE = "get_devices_HTF005S.json"
+
+
+@pytest.fixture(autouse=True)
+def immediate_commands():
+    """Send setter commands on the caller's thread so tests can wait on acks directly."""
+    with patch.object(PyDreoBaseDevice, "_COMMAND_TIMING", OutboxTiming.IMMEDIATE):
+        yield
+
+
+def _connected_manager(cloud: DreoCloudSimulator) -> PyDreo:
+    pydreo = PyDreo("EMAIL", "PASSWORD", redact=True)
+    assert pydreo.login() is True
+    assert pydreo.load_devices() is True
+    pydreo.start_transport()
+    assert wait_for(lambda: cloud.connected_clients == 1, timeout=5)
+    return pydreo
+
+
+class TestDreoCloudSimulator:
+    """Drive the real REST, WebSocket and ack paths against the simulator."""
+
+    def test_login_and_load_devices(self):
+        """Login, devicelist, devicestate and setting reads go through Helpers.call_api."""
+        with DreoCloudSimulator([DEVICES_FILE], copies=5) as cloud:
+            pydreo = PyDreo("EMAIL", "PASSWORD", redact=True)
+            assert pydreo.login() is True
+            assert pydreo.token == cloud.token
+            assert pydreo.load_devices() is True
+
+            assert sorted(device.serial_number for device in pydreo.devices) == sorted(cloud.devices)
+            assert all(device.raw_state is not None for device in pydreo.devices)
+            assert cloud.stats.unauthorized == 0
+            pydreo.close_http_sessions()
+
+    def test_command_round_trip(self):
+        """A setter is acked by control-reply and its control-report updates the device."""
+        with DreoCloudSimulator([DEVICES_FILE]) as cloud:
+            pydreo = _connected_manager(cloud)
+            try:
+                fan = pydreo.devices[0]
+                expected = not fan.is_on
+                fan.is_on = expected
+
+                assert wait_for(lambda: cloud.stats.replies == 1 and cloud.stats.reports == 1)
+                assert cloud.devices[fan.serial_number].mixed[POWERON_KEY]["state"] == expected
+                assert wait_for(lambda: fan.is_on is expected)
+                cloud.push_report(fan.serial_number, {POWERON_KEY: not expected})
+                assert wait_for(lambda: fan.is_on is not expected)
+
+                metrics = pydreo.metrics.snapshot()
+                assert metrics["counters"][METRIC_COMMANDS_SENT] == 1
+                assert metrics["histograms"][METRIC_COMMAND_ACK_LATENCY]["count"] == 1
+                assert metrics["histograms"][METRIC_COMMAND_BATCH_KEYS]["buckets"]["1"] == 1
+                assert metrics["counters"][METRIC_REST_CALLS] == metrics["histograms"][METRIC_REST_LATENCY]["count"] >= 2
+                assert metrics["counters"][METRIC_WS_MESSAGES] >= 3
+                assert metrics["gauges"][METRIC_WS_CONNECTED] == 1
+            finally:
+                pydreo.stop_transport()
+
+    def test_dropped_command_is_retried(self):
+        """A command the cloud drops times out and is resent."""
+        with DreoCloudSimulator([DEVICES_FILE], drop_rate=1.0) as cloud:
+            pydreo = _connected_manager(cloud)
+            try:
+                with patch(f"{PATCH_BASE_PATH}._COMMAND_ACK_TIMEOUT", 0.2):
+                    assert pydreo.send_command(pydreo.devices[0], {POWERON_KEY: True}) is False
+                assert cloud.stats.dropped == cloud.stats.controls > 1
+                assert pydreo.metrics.value(METRIC_COMMAND_ACK_TIMEOUTS) == cloud.stats.controls
+                assert pydreo.metrics.value(METRIC_COMMAND_RETRIES) == cloud.stats.controls - 1
+                assert pydreo.metrics.value(METRIC_COMMANDS_FAILED) == 1
+            finally:
+                pydreo.stop_transport()
+
+    def test_reconnect_after_disconnect(self):
+        """The transport reconnects after the cloud drops the socket, and commands flow again."""
+        with DreoCloudSimulator([DEVICES_FILE], disconnect_every=1) as cloud:
+            pydreo = _connected_manager(cloud)
+            try:
+                fan = pydreo.devices[0]
+                assert pydreo.send_command(fan, {POWERON_KEY: True}) is True
+                assert wait_for(lambda: cloud.stats.ws_connections == 2 and cloud.connected_clients == 1, timeout=5)
+
+                cloud.disconnect_every = None
+                assert pydreo.send_command(fan, {POWERON_KEY: False}) is True
+                assert cloud.stats.disconnects == 1
+                assert pydreo.metrics.value(METRIC_WS_CONNECTS) == 2
+                assert pydreo.metrics.value(METRIC_WS_RECONNECTS) == 1
+            finally:
+                pydreo.stop_transport()
+
+    def test_rejects_bad_token(self):
+        """REST calls and WebSocket connects without the issued token get a 401."""
+        with DreoCloudSimulator([DEVICES_FILE]) as cloud:
+            response = requests.get(f"{cloud.base_url}{DREO_APIS[DREO_API_DEVICELIST][DREO_API_PATH]}", timeout=5)
+            assert response.status_code == 401
+            response = requests.get(f"{cloud.base_url}/websocket?accessToken=wrong", timeout=5)
+            assert response.status_code == 401
+            assert cloud.stats.unauthorized == 2
+
+    def test_large_fleet_devicelist_pages(self):
+        """A fleet of thousands of devices is served in devicelist pages."""
+        started = time.perf_counter()
+        with DreoCloudSimulator(["get_devices_multiple_1.json"], copies=1000) as cloud:
+            headers = {"authorization": f"Bearer {cloud.token}"}
+            url = f"{cloud.base_url}{DREO_APIS[DREO_API_DEVICELIST][DREO_API_PATH]}"
+            data = requests.get(url, params={"pageNo": 3, "pageSize": 100}, headers=headers, timeout=5).json()[DATA_KEY]
+
+            assert data["totalNum"] == len(cloud.devices) >= 2000
+            assert data["totalPage"] == -(-len(cloud.devices) // 100)
+            assert len(data[LIST_KEY]) == 100
+            assert data[LIST_KEY][0]["sn"] == list(cloud.devices)[200]
+        logger.info("simulator: %d devices served in %.3fs", len(cloud.devices), time.perf_counter() - started)
@@ -1,8 +1,17 @@
 """Test helpers for PyDreo."""
 
+import asyncio
+import datetime
+import logging
+import ssl
+import threading
 import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch, MagicMock
+
+import pytest
 import requests
+from urllib3.util.retry import Retry
 from .imports import Helpers
 
 
@@ -368,3 +377,177 @@ class TestHelpers:
         manager = MagicMock()
         body = Helpers.req_body(manager, "unknown_type")
         assert body == {}
+
+
+class TestBuildSession:
+    """Test Helpers.build_session and session-backed call_api."""
+
+    def test_int_retries_builds_get_only_policy(self):
+        """An int retry count only retries idempotent GETs."""
+        session = Helpers.build_session(pool_size=4, retries=3)
+        adapter = session.get_adapter("https://app-api-us.dreo-tech.com")
+        assert adapter.max_retries.total == 3
+        assert adapter.max_retries.allowed_methods == frozenset({"GET"})
+        assert adapter._pool_maxsize == 4  # pylint: disable=protected-access
+        session.close()
+
+    def test_retry_object_used_as_is(self):
+        """A urllib3 Retry is installed unchanged."""
+        retry = Retry(total=5, backoff_factor=1)
+        session = Helpers.build_session(pool_size=2, retries=retry)
+        assert session.get_adapter("https://app-api-eu.dreo-tech.com").max_retries is retry
+        session.close()
+
+    def test_call_api_uses_session(self):
+        """call_api sends through the given session instead of module-level requests."""
+        session = MagicMock()
+        session.get.return_value.status_code = 200
+        session.get.return_value.content = b'{"code": 0}'
+        session.get.return_value.json.return_value = {"code": 0}
+
+        with patch("custom_components.dreo.pydreo.helpers.requests.get") as mock_get:
+            response, status = Helpers.call_api("https://api.test.com", "/path", "get", {}, {}, session=session)
+
+        assert (response, status) == ({"code": 0}, 200)
+        session.get.assert_called_once()
+        mock_get.assert_not_called()
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Tiny HTTP/1.1 handler that counts the TLS connections it accepts."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+    connections = 0
+    lock = threading.Lock()
+
+    def setup(self):
+        with _KeepAliveHandler.lock:
+            _KeepAliveHandler.connections += 1
+        super().setup()
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Answer every GET with a small successful API response."""
+        payload = b'{"code": 0, "data": {}}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Keep the benchmark output quiet."""
+
+
+class TestAsyncCallApi:
+    """Tests for Helpers.async_call_api on an aiohttp session."""
+
+    @pytest.fixture
+    def server_url(self):
+        """Serve the keep-alive handler over plain HTTP on localhost."""
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+        server.shutdown()
+        server.server_close()
+
+    @staticmethod
+    def _call(url: str, api: str, method: str = "get"):
+        aiohttp = pytest.importorskip("aiohttp")
+
+        async def call():
+            async with aiohttp.ClientSession() as session:
+                return await Helpers.async_call_api(url, api, method, {"deviceSn": "SN"}, {}, session=session)
+
+        return asyncio.run(call())
+
+    def test_get_returns_json_and_status(self, server_url):
+        """A 200 response is decoded like call_api's."""
+        assert self._call(server_url, "/api/device/state") == ({"code": 0, "data": {}}, 200)
+
+    def test_non_200_status(self, server_url):
+        """A non-200 response yields (None, None)."""
+        assert self._call(server_url, "/api/device/state", "post") == (None, None)
+
+    def test_connection_error(self):
+        """A refused connection is logged and yields (None, None)."""
+        assert self._call("http://127.0.0.1:1", "/api/device/state") == (None, None)
+
+
+class TestCallApiPooling:
+    """call_api against a local TLS server, with and without pooling."""
+
+    CALLS = 40
+
+    @pytest.fixture(autouse=True)
+    def tls_server(self, tmp_path, monkeypatch):
+        """Serve HTTPS on localhost with a throwaway self-signed certificate."""
+        x509 = pytest.importorskip("cryptography.x509")
+        from cryptography.hazmat.primitives import hashes, serialization  # pylint: disable=import-outside-toplevel
+        from cryptography.hazmat.primitives.asymmetric import ec  # pylint: disable=import-outside-toplevel
+
+        key = ec.generate_private_key(ec.SECP256R1())
+        name = x509.Name([x509.NameAttribute(x509.oid.NameOID.COMMON_NAME, "localhost")])
+        now = datetime.datetime.now(datetime.timezone.utc)
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(minutes=1))
+            .not_valid_after(now + datetime.timedelta(hours=1))
+            .add_extension(x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False)
+            .sign(key, hashes.SHA256())
+        )
+        cert_file = tmp_path / "cert.pem"
+        key_file = tmp_path / "key.pem"
+        cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+        key_file.write_bytes(
+            key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+        )
+        # Module-level requests calls and sessions both honour this bundle.
+        monkeypatch.setenv("REQUESTS_CA_BUNDLE", str(cert_file))
+
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert_file, key_file)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.url = f"https://localhost:{server.server_port}"
+        yield
+        server.shutdown()
+        server.server_close()
+
+    def _run_calls(self, session) -> tuple[float, int]:
+        """Return (seconds per call, TLS connections opened) for CALLS GETs."""
+        _KeepAliveHandler.connections = 0
+        started = time.perf_counter()
+        for _ in range(self.CALLS):
+            response, status = Helpers.call_api(self.url, "/api/user-device/device/state", "get", {}, {}, session=session)
+            assert status == 200, response
+        return (time.perf_counter() - started) / self.CALLS, _KeepAliveHandler.connections
+
+    def _run_both(self) -> tuple[tuple[float, int], tuple[float, int]]:
+        """Run CALLS unpooled, then CALLS on a warmed-up pooled session."""
+        session = Helpers.build_session(pool_size=1, retries=0)
+        try:
+            self._run_calls(session)  # warm-up: imports, first handshake
+            return self._run_calls(None), self._run_calls(session)
+        finally:
+            session.close()
+
+    def test_pooled_session_reuses_connection(self):
+        """A pooled session pays one handshake; unpooled calls pay one per call."""
+        (_, unpooled_connections), (_, pooled_connections) = self._run_both()
+        assert unpooled_connections == self.CALLS
+        assert pooled_connections == 0  # every call rode the warm-up connection
+
+    @pytest.mark.benchmark
+    def test_pooling_benchmark(self):
+        """Benchmark: pooled calls are faster than unpooled ones."""
+        (unpooled, _), (pooled, _) = self._run_both()
+        logging.getLogger(__name__).info("call_api: unpooled %.2f ms/call, pooled %.2f ms/call", unpooled * 1000, pooled * 1000)
+        assert pooled < unpooled
@@ -0,0 +1,98 @@
+"""Cold import of the pydreo package and the HA platforms.
+
+Each check runs in a fresh interpreter (``python -X importtime``) so modules
+already loaded by the test session don't hide the cost. The device modules
+must stay out of a plain ``import`` of the library and of every platform; only
+the class for a device type that is actually found gets loaded.
+
+The timing benchmark writes bench_results/import_time.json. Run it with
+``pytest -m benchmark``.
+"""
+
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from custom_components.dreo.pydreo import _DREO_DEVICE_TYPE_TO_CLASS  # pylint: disable=protected-access
+
+from .benchreport import write_report
+
+logger = logging.getLogger(__name__)
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+PACKAGE = "custom_components.dreo.pydreo"
+DEVICE_MODULES = {f"{PACKAGE}.{module}" for module, _ in _DREO_DEVICE_TYPE_TO_CLASS.values()}
+PLATFORM_MODULES = [
+    f"custom_components.dreo.{platform}"
+    for platform in ("fan", "sensor", "switch", "number", "light", "select", "binary_sensor", "climate", "humidifier", "diagnostics", "config_flow")
+]
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+
+
+def _import_times(stderr: str) -> dict[str, tuple[int, int]]:
+    """Parse ``-X importtime`` output into {module: (self us, cumulative us)}, keeping each module's first entry."""
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        if self_us.strip().isdigit():
+            times.setdefault(name.strip(), (int(self_us), int(cumulative_us)))
+    return times
+
+
+class TestLazyDeviceModules:
+    """Device modules load only for device types that are present."""
+
+    def test_import_skips_device_modules(self):
+        """Importing pydreo loads no device module."""
+        times = _import_times(_run(f"import {PACKAGE}").stderr)
+        assert PACKAGE in times
+        assert not DEVICE_MODULES & times.keys()
+
+    def test_platform_imports_skip_device_modules(self):
+        """Importing every HA platform loads no device module either."""
+        times = _import_times(_run(f"import {', '.join(PLATFORM_MODULES)}").stderr)
+        assert set(PLATFORM_MODULES) <= times.keys()
+        assert not DEVICE_MODULES & times.keys()
+
+    def test_resolving_a_device_loads_only_its_module(self):
+        """Resolving a tower fan imports the tower fan module and no other device module."""
+        code = (
+            f"import sys; from {PACKAGE} import PyDreo; "
+            "print(PyDreo._resolve_device_class({'model': 'DR-HTF001S'})[0].__name__); "
+            f"print(' '.join(name for name in sys.modules if name.startswith('{PACKAGE}.')))"
+        )
+        class_name, modules = _run(code).stdout.splitlines()
+        assert class_name == "PyDreoTowerFan"
+        assert DEVICE_MODULES & set(modules.split()) == {f"{PACKAGE}.pydreotowerfan"}
+
+
+@pytest.mark.benchmark
+class TestImportTimeBenchmark:
+    """Measure the cold-start import cost of pydreo and the HA platforms."""
+
+    def test_import_time_benchmark(self):
+        """Time the imports and write the JSON report."""
+        times = _import_times(_run(f"import {PACKAGE}; import {', '.join(PLATFORM_MODULES)}").stderr)
+        own = {name: value for name, value in times.items() if name.startswith(f"{PACKAGE}.")}
+        package_ms = times[PACKAGE][1] / 1000
+        total_ms = max(cumulative for _, cumulative in times.values()) / 1000
+        slowest = sorted(own.items(), key=lambda item: item[1][0], reverse=True)[:5]
+        logger.info("Imported %s in %.1f ms (%d submodules), %.1f ms in total; slowest: %s", PACKAGE, package_ms, len(own), total_ms, slowest)
+        path = write_report(
+            "import_time",
+            {
+                "package_ms": round(package_ms, 3),
+                "total_ms": round(total_ms, 3),
+                "modules": {name: {"self_ms": self_us / 1000, "cumulative_ms": cumulative_us / 1000} for name, (self_us, cumulative_us) in own.items()},
+            },
+        )
+        logger.info("Import time report written to %s", path)
+        assert 0 < package_ms <= total_ms
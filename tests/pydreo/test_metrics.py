@@ -0,0 +1,69 @@
+"""Tests for the pydreo metrics registry."""
+
+import threading
+from unittest.mock import patch
+
+from custom_components.dreo.pydreo.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+
+class TestMetrics:
+    """Test counters, gauges, histograms and the registry."""
+
+    def test_counter_is_thread_safe(self):
+        """Concurrent increments are not lost."""
+        counter = Counter()
+
+        def work():
+            for _ in range(10000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert counter.value == 40000
+
+    def test_gauge_set_and_live(self):
+        """A gauge holds the value set on it, or reads its function on demand."""
+        gauge = Gauge()
+        gauge.set(3)
+        assert gauge.value == 3
+        depth = [5]
+        live = Gauge(lambda: depth[0])
+        depth[0] = 7
+        assert live.value == 7
+
+    def test_histogram_buckets_and_quantiles(self):
+        """Observations land in the first bucket whose bound is >= the value."""
+        histogram = Histogram((0.01, 0.1, 1.0))
+        for value in (0.005, 0.01, 0.05, 0.05, 0.5, 3.0):
+            histogram.observe(value)
+        snapshot = histogram.snapshot()
+        assert snapshot["buckets"] == {"0.01": 2, "0.1": 2, "1.0": 1, "+Inf": 1}
+        assert snapshot["count"] == 6
+        assert snapshot["max"] == 3.0
+        assert snapshot["p50"] == 0.1
+        # The +Inf bucket reports the largest observation.
+        assert snapshot["p95"] == 3.0
+        assert Histogram().quantile(0.5) is None
+
+    def test_registry_get_or_create_and_snapshot(self):
+        """Getters return the same metric for a name; snapshot reports every metric."""
+        metrics = MetricsRegistry()
+        assert metrics.counter("a") is metrics.counter("a")
+        metrics.inc("a", 2)
+        metrics.gauge("depth", lambda: 4)
+        metrics.observe("latency", 0.02)
+        with patch("custom_components.dreo.pydreo.metrics.time.perf_counter", side_effect=[1.0, 1.3]):
+            with metrics.timer("latency"):
+                pass
+
+        snapshot = metrics.snapshot()
+        assert snapshot["counters"] == {"a": 2}
+        assert snapshot["gauges"] == {"depth": 4}
+        assert snapshot["histograms"]["latency"]["count"] == 2
+        assert snapshot["histograms"]["latency"]["buckets"]["0.5"] == 1
+        assert metrics.value("a") == 2
+        assert metrics.value("depth") == 4
+        assert metrics.value("missing") is None
@@ -0,0 +1,101 @@
+"""Tests for the model resolution index."""
+
+import logging
+import random
+import time
+
+import pytest
+
+from custom_components.dreo.pydreo import PyDreo, PyDreoTowerFan, PyDreoUnknownDevice
+from custom_components.dreo.pydreo.constant import DreoDeviceType
+from custom_components.dreo.pydreo.modelindex import MODEL_INDEX, ModelIndex
+from custom_components.dreo.pydreo.models import SUPPORTED_DEVICES, SUPPORTED_MODEL_PREFIXES, DreoDeviceDetails
+
+logger = logging.getLogger(__name__)
+
+BENCH_MODELS = 10_000
+
+
+def _details(name: str) -> DreoDeviceDetails:
+    return DreoDeviceDetails(device_type=DreoDeviceType.TOWER_FAN, preset_modes=[name])
+
+
+class TestModelIndex:
+    """Test exact, prefix and unknown resolution."""
+
+    def test_exact_then_longest_prefix(self):
+        """An exact model wins; otherwise the longest prefix matches regardless of declaration order."""
+        devices = {name: _details(name) for name in ("DR-H", "DR-HTF", "DR-HTF00", "DR-HTF001S")}
+        for prefixes in (["DR-H", "DR-HTF", "DR-HTF00"], ["DR-HTF00", "DR-HTF", "DR-H"], {"DR-HTF", "DR-HTF00", "DR-H"}):
+            index = ModelIndex(devices, prefixes)
+            assert index.resolve("DR-HTF001S") == ("DR-HTF001S", devices["DR-HTF001S"], True)
+            assert index.resolve("DR-HTF009S").key == "DR-HTF00"
+            assert index.resolve("DR-HTF1").key == "DR-HTF"
+            assert index.resolve("DR-HAF004S").key == "DR-H"
+            assert index.resolve("DR-HTF009S").exact is False
+            assert index.prefixes == ["DR-HTF00", "DR-HTF", "DR-H"]
+
+    def test_unknown_models(self):
+        """Models with no definition, full model numbers used as prefixes and prefixes with no definition do not resolve."""
+        devices = {"DR-HSH011": _details("DR-HSH011"), "DR-HTF": _details("DR-HTF")}
+        index = ModelIndex(devices, ["DR-HTF", "WH"])
+        assert index.resolve("DR-HSH011X") is None
+        assert index.resolve("WH719S") is None
+        assert index.resolve("DR-HT") is None
+        assert index.resolve("") is None
+        assert index.resolve(None) is None
+        assert index.prefixes == ["DR-HTF"]
+
+    def test_resolutions_are_memoized(self):
+        """Repeated models are served from the memo."""
+        index = ModelIndex({"DR-HTF": _details("DR-HTF")}, ["DR-HTF"])
+        for _ in range(3):
+            index.resolve("DR-HTF004S")
+        info = index.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+
+    def test_supported_devices(self):
+        """Every supported model resolves to itself, and every family prefix resolves for an unlisted model."""
+        for model, details in SUPPORTED_DEVICES.items():
+            assert MODEL_INDEX.resolve(model) == (model, details, True)
+        for prefix in SUPPORTED_MODEL_PREFIXES & SUPPORTED_DEVICES.keys():
+            match = MODEL_INDEX.resolve(f"{prefix}999Z")
+            assert (match.key, match.exact) == (prefix, False)
+
+    def test_resolve_device_class(self):
+        """The devicelist entry's model picks the device class."""
+        device_class, details = PyDreo._resolve_device_class({"model": "DR-HTF999Z"})  # pylint: disable=protected-access
+        assert device_class is PyDreoTowerFan
+        assert details is SUPPORTED_DEVICES["DR-HTF"]
+
+        device_class, details = PyDreo._resolve_device_class({"model": "XX-UNKNOWN"})  # pylint: disable=protected-access
+        assert device_class is PyDreoUnknownDevice
+        assert details.device_type == DreoDeviceType.UNKNOWN
+
+    @pytest.mark.benchmark
+    def test_resolve_benchmark(self):
+        """Benchmark: resolve 10k synthetic model strings through a cold and a warm memo."""
+        rng = random.Random(0)
+        stems = sorted(SUPPORTED_DEVICES) + ["XX-UNKNOWN", "WH"]
+        models = [f"{rng.choice(stems)}{rng.randrange(1000):03d}" for _ in range(BENCH_MODELS)]
+        index = ModelIndex(SUPPORTED_DEVICES, SUPPORTED_MODEL_PREFIXES, cache_size=BENCH_MODELS)
+
+        started = time.perf_counter()
+        cold = [index.resolve(model) for model in models]
+        cold_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        warm = [index.resolve(model) for model in models]
+        warm_seconds = time.perf_counter() - started
+
+        logger.info(
+            "Resolved %d models: cold %.1f us/model, warm %.1f us/model, %d matched, %s",
+            BENCH_MODELS,
+            cold_seconds / BENCH_MODELS * 1e6,
+            warm_seconds / BENCH_MODELS * 1e6,
+            sum(1 for match in cold if match is not None),
+            index.cache_info(),
+        )
+        assert warm == cold
+        assert any(match is None for match in cold) and any(match is not None for match in cold)
+        # The second pass is served from the memo.
+        assert warm_seconds < cold_seconds
@@ -1,11 +1,21 @@
 """Tests for the PyDreo class."""
 
+import asyncio
+import copy
+import json
 import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
 from .imports import *  # pylint: disable=W0401,W0614
-from .testbase import TestBase, PATCH_SEND_COMMAND
+from .testbase import TestBase, PATCH_SEND_COMMAND, PATCH_BASE_PATH, wait_for
+from . import call_json
+from .dreosimulator import DreoCloudSimulator
 
 
 class TestPyDreoApiServerRegion:
@@ -204,6 +214,169 @@ class TestPyDreoProcessDevices(TestBase):
         assert isinstance(self.pydreo_manager.devices[0], PyDreoDehumidifier)
 
 
+class TestPyDreoParallelStateLoad(TestBase):
+    """Test that initial device state loads run concurrently but apply in order."""
+
+    def _device_list(self, count: int) -> list[dict]:
+        template = call_json.get_response_from_file("get_devices_HTF005S.json")[DATA_KEY][LIST_KEY][0]
+        return [{**template, "sn": f"PARALLEL_{i}", "deviceId": f"PARALLEL_ID_{i}", "deviceName": f"Fan {i}"} for i in range(count)]
+
+    def test_devices_keep_list_order_when_states_finish_out_of_order(self):
+        """Later devices finishing first must not reorder the device list."""
+        dev_list = self._device_list(6)
+
+        def slow_first_devices(api, json_object=None):
+            if api == DREO_API_DEVICESTATE:
+                # Earlier devices answer last.
+                time.sleep(0.01 * (6 - int(json_object[DEVICESN_KEY].split("_")[1])))
+            return self.call_dreo_api(api, json_object)
+
+        self.mock_api.side_effect = slow_first_devices
+        assert self.pydreo_manager._process_devices(dev_list) is True
+        assert [device.serial_number for device in self.pydreo_manager.devices] == [dev["sn"] for dev in dev_list]
+
+    def test_state_loads_run_concurrently(self):
+        """Device state and setting calls overlap up to state_load_workers, and no further."""
+        workers = 4
+        self.pydreo_manager.state_load_workers = workers
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        # The first `workers` calls only return once all of them are in flight together.
+        first_round = threading.Barrier(workers, timeout=5)
+        calls = 0
+
+        def track_concurrency(api, json_object=None):
+            nonlocal active, peak, calls
+            with lock:
+                active += 1
+                calls += 1
+                peak = max(peak, active)
+                in_first_round = calls <= workers
+            try:
+                if in_first_round:
+                    first_round.wait()
+                return self.call_dreo_api(api, json_object)
+            finally:
+                with lock:
+                    active -= 1
+
+        self.mock_api.side_effect = track_concurrency
+        self.pydreo_manager._process_devices(self._device_list(8))
+        assert len(self.pydreo_manager.devices) == 8
+        assert not first_round.broken
+        assert peak == workers
+
+    def test_single_worker_loads_sequentially(self):
+        """state_load_workers=1 restores one call at a time."""
+        self.pydreo_manager.state_load_workers = 1
+        active = 0
+        peak = 0
+
+        def track_concurrency(api, json_object=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            time.sleep(0.005)
+            active -= 1
+            return self.call_dreo_api(api, json_object)
+
+        self.mock_api.side_effect = track_concurrency
+        self.pydreo_manager._process_devices(self._device_list(3))
+        assert peak == 1
+
+    def test_unknown_model_error_is_isolated(self):
+        """A device that fails to build does not stop the others."""
+        dev_list = self._device_list(3)
+        original_init = PyDreoTowerFan.__init__
+
+        def fail_middle_device(device, device_definition, details, dreo):
+            if details["sn"] == "PARALLEL_1":
+                raise UnknownModelError("PARALLEL_1")
+            original_init(device, device_definition, details, dreo)
+
+        with patch.object(PyDreoTowerFan, "__init__", fail_middle_device):
+            assert self.pydreo_manager._process_devices(dev_list) is True
+        assert [device.serial_number for device in self.pydreo_manager.devices] == ["PARALLEL_0", "PARALLEL_2"]
+
+
+class _LatencyApiHandler(BaseHTTPRequestHandler):
+    """Fake Dreo REST endpoint that answers every request after a fixed delay."""
+
+    latency = 0.0
+    device_list: list[dict] = []
+    device_state: dict = {}
+    setting_response: dict = {}
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Serve devicelist, devicestate and setting reads."""
+        time.sleep(self.latency)
+        path = urlparse(self.path).path
+        if path == DREO_APIS[DREO_API_DEVICELIST][DREO_API_PATH]:
+            body = {"code": 0, "data": {"list": self.device_list}}
+        elif path == DREO_APIS[DREO_API_DEVICESTATE][DREO_API_PATH]:
+            body = self.device_state
+        elif path == DREO_APIS[DREO_API_SETTING_GET][DREO_API_PATH]:
+            body = self.setting_response
+        else:
+            self.send_error(404)
+            return
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Keep the benchmark output quiet."""
+
+
+class TestPyDreoStateLoadBenchmark:
+    """Benchmark load_devices against a local HTTP server with artificial latency."""
+
+    DEVICE_COUNT = 12
+    LATENCY = 0.05
+
+    @pytest.fixture(autouse=True)
+    def fake_server(self):
+        """Run a fake REST server and point PyDreo at it."""
+        template = call_json.get_response_from_file("get_devices_HTF005S.json")[DATA_KEY][LIST_KEY][0]
+        _LatencyApiHandler.latency = self.LATENCY
+        _LatencyApiHandler.device_list = [{**template, "sn": f"BENCH_{i}", "deviceId": f"BENCH_ID_{i}"} for i in range(self.DEVICE_COUNT)]
+        _LatencyApiHandler.device_state = call_json.get_response_from_file(f"get_device_state_{template['sn']}.json")
+        _LatencyApiHandler.setting_response = call_json.get_response_from_file(f"get_device_setting_{template['sn']}_kHafFanTempOffsetKey.json")
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _LatencyApiHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        with patch(f"{PATCH_BASE_PATH}.DREO_API_URL_FORMAT", f"http://127.0.0.1:{server.server_port}"):
+            yield
+        server.shutdown()
+        server.server_close()
+
+    def _timed_load(self, workers: int) -> float:
+        pydreo = PyDreo("EMAIL", "PASSWORD", redact=True, token="bench_token", state_load_workers=workers)
+        pydreo.enabled = True
+        started = time.perf_counter()
+        assert pydreo.load_devices() is True
+        elapsed = time.perf_counter() - started
+        assert len(pydreo.devices) == self.DEVICE_COUNT
+        assert all(device.raw_state is not None for device in pydreo.devices)
+        return elapsed
+
+    @pytest.mark.benchmark
+    def test_parallel_state_load_benchmark(self):
+        """Setup time with a worker pool is a fraction of the sequential load."""
+        sequential = self._timed_load(workers=1)
+        parallel = self._timed_load(workers=DEFAULT_STATE_LOAD_WORKERS)
+        logging.getLogger(__name__).info("load_devices: sequential %.3fs, parallel %.3fs", sequential, parallel)
+
+        # Each device costs a setting read and a state read, one LATENCY each.
+        assert sequential >= 2 * self.DEVICE_COUNT * self.LATENCY
+        assert parallel < sequential / 2
+
+
 class TestPyDreoLoadDevices(TestBase):
     """Test load_devices method."""
 
@@ -380,56 +553,96 @@ class TestPyDreoHandleCommandAck:
     def test_none_device_sn_returns_early(self):
         """Test None device_sn returns without doing anything."""
         pydreo = PyDreo("user", "pass", redact=False)
-        pydreo._pending_command_device = "SN123"
+        pending = pydreo._reserve_command_slot("SN123", {"poweron": True})
         pydreo._handle_command_ack(None, "control-report", {})
-        assert pydreo._ack_received is False
+        assert pending.ack_received is False
 
     def test_wrong_method_name_returns_early(self):
         """Test non-matching method name returns without signaling."""
         pydreo = PyDreo("user", "pass", redact=False)
-        pydreo._pending_command_device = "SN123"
+        pending = pydreo._reserve_command_slot("SN123", {"poweron": True})
         pydreo._handle_command_ack("SN123", "wrong-method", {})
-        assert pydreo._ack_received is False
+        assert pending.ack_received is False
 
     def test_matching_device_and_params_signals_ack(self):
         """Test matching device and params signals ack."""
         pydreo = PyDreo("user", "pass", redact=False)
-        pydreo._pending_command_device = "SN123"
-        pydreo._pending_command_params = {"poweron": True}
-        pydreo._ack_received = False
+        pending = pydreo._reserve_command_slot("SN123", {"poweron": True})
 
         pydreo._handle_command_ack("SN123", "control-report", {"poweron": True})
-        assert pydreo._ack_received is True
+        assert pending.ack_received is True
 
     def test_non_matching_params_still_signals_ack(self):
         """Test non-matching reported params still signals ack (device match is sufficient)."""
         pydreo = PyDreo("user", "pass", redact=False)
-        pydreo._pending_command_device = "SN123"
-        pydreo._pending_command_params = {"poweron": True}
-        pydreo._ack_received = False
+        pending = pydreo._reserve_command_slot("SN123", {"poweron": True})
 
         pydreo._handle_command_ack("SN123", "control-report", {"windlevel": 3})
-        assert pydreo._ack_received is True
+        assert pending.ack_received is True
 
     def test_no_params_to_match_falls_back(self):
         """Test no pending params falls back to device match and signals ack."""
         pydreo = PyDreo("user", "pass", redact=False)
-        pydreo._pending_command_device = "SN123"
-        pydreo._pending_command_params = None
-        pydreo._ack_received = False
+        pending = pydreo._reserve_command_slot("SN123", None)
 
         pydreo._handle_command_ack("SN123", "control-report", None)
-        assert pydreo._ack_received is True
+        assert pending.ack_received is True
 
     def test_different_pending_device_ignored(self):
         """Test ack for different device is ignored."""
         pydreo = PyDreo("user", "pass", redact=False)
-        pydreo._pending_command_device = "SN_OTHER"
-        pydreo._pending_command_params = {"poweron": True}
-        pydreo._ack_received = False
+        pending = pydreo._reserve_command_slot("SN_OTHER", {"poweron": True})
 
         pydreo._handle_command_ack("SN123", "control-report", {"poweron": True})
-        assert pydreo._ack_received is False
+        assert pending.ack_received is False
+
+    def test_ack_routed_to_matching_device_only(self):
+        """Test acks are routed per device when several commands are in flight."""
+        pydreo = PyDreo("user", "pass", redact=False)
+        pending_a = pydreo._reserve_command_slot("SN_A", {"poweron": True})
+        pending_b = pydreo._reserve_command_slot("SN_B", {"poweron": False})
+
+        pydreo._handle_command_ack("SN_B", "control-reply", {"poweron": False})
+        assert pending_a.ack_received is False
+        assert pending_b.ack_received is True
+
+
+class TestPyDreoHttpSessions:
+    """Test the pooled per-region HTTP sessions."""
+
+    def test_session_reused_within_region(self):
+        """Calls in one region share one pooled session."""
+        pydreo = PyDreo("user", "pass", redact=False, http_pool_size=3)
+        session = pydreo._http_session()
+        assert pydreo._http_session() is session
+        assert session.get_adapter("https://app-api-us.dreo-tech.com")._pool_maxsize == 3
+        pydreo.close_http_sessions()
+
+    def test_session_per_region(self):
+        """Switching auth region moves calls to a separate session."""
+        pydreo = PyDreo("user", "pass", redact=False)
+        us_session = pydreo._http_session()
+        pydreo.auth_region = DREO_AUTH_REGION_EU
+        assert pydreo._http_session() is not us_session
+        assert set(pydreo._http_sessions) == {DREO_API_REGION_US, DREO_API_REGION_EU}
+        pydreo.close_http_sessions()
+
+    def test_call_dreo_api_passes_session(self):
+        """call_dreo_api routes through the region's session."""
+        pydreo = PyDreo("user", "pass", redact=False)
+        with patch(f"{PATCH_BASE_PATH}.helpers.Helpers.call_api", return_value=({"code": 0}, 200)) as mock_call_api:
+            pydreo.call_dreo_api(DREO_API_DEVICELIST)
+        assert mock_call_api.call_args.kwargs["session"] is pydreo._http_session()
+        pydreo.close_http_sessions()
+
+    def test_stop_transport_closes_sessions(self):
+        """stop_transport closes and forgets pooled sessions."""
+        pydreo = PyDreo("user", "pass", redact=False, debug_test_mode=True, debug_test_mode_payload={})
+        session = pydreo._http_session()
+        with patch.object(session, "close") as mock_close:
+            pydreo.stop_transport()
+        mock_close.assert_called_once()
+        assert not pydreo._http_sessions
 
 
 class TestPyDreoScheduleCallLater:
@@ -485,3 +698,292 @@ class TestPyDreoScheduleCallLater:
             cancel = pydreo.schedule_call_later(0.1, work)
             mock_timer_cls.assert_called_once()
             assert cancel is mock_timer.cancel
+
+
+class TestPyDreoSnapshot(TestBase):
+    """Tests for export_snapshot / load_from_snapshot / async_reconcile."""
+
+    def _snapshot(self) -> dict:
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        # Snapshots are persisted as JSON, so round-trip through it.
+        return json.loads(json.dumps(self.pydreo_manager.export_snapshot()))
+
+    def _fresh_manager(self) -> PyDreo:
+        return PyDreo("EMAIL", "PASSWORD", redact=True)
+
+    def test_round_trip_needs_no_network(self):
+        """Devices, states, settings and token come back without any API call."""
+        snapshot = self._snapshot()
+        original = self.pydreo_manager.devices[0]
+        self.mock_api.reset_mock()
+
+        manager = self._fresh_manager()
+        assert manager.load_from_snapshot(snapshot) is True
+
+        self.mock_api.assert_not_called()
+        device = manager.devices[0]
+        assert (device.serial_number, type(device)) == (original.serial_number, type(original))
+        assert device.raw_state == original.raw_state
+        assert device.temperature_offset == original.temperature_offset == -2
+        assert device.is_on == original.is_on
+        assert manager.token == self.pydreo_manager.token
+        assert manager.enabled is True
+        device.dispose()
+
+    def test_missing_setting_is_not_read_on_warm_start(self):
+        """A calibrating fan whose offset could not be read last run is built without an API call."""
+        snapshot = self._snapshot()
+        snapshot["settings"] = {}
+        self.mock_api.reset_mock()
+
+        manager = self._fresh_manager()
+        assert manager.load_from_snapshot(snapshot) is True
+
+        self.mock_api.assert_not_called()
+        device = manager.devices[0]
+        assert device.temperature_offset == 0  # the class default for an unread offset
+        device.dispose()
+
+    @pytest.mark.parametrize(
+        ("change", "max_age"),
+        [
+            ({"version": 0}, 3600),
+            ({"username": "OTHER"}, 3600),
+            ({"token": None}, 3600),
+            ({"saved_at": 0}, 3600),
+            ({}, -1),
+        ],
+    )
+    def test_unusable_snapshot_is_rejected(self, change, max_age):
+        """Wrong version, other account, no token or too old: fall back to the cloud."""
+        snapshot = {**self._snapshot(), **change}
+        manager = self._fresh_manager()
+        assert manager.load_from_snapshot(snapshot, max_age=max_age) is False
+        assert manager.devices == []
+        assert manager.enabled is False
+
+    def test_reconcile_refreshes_state_and_fires_callbacks(self):
+        """A reconcile applies fresh REST state to snapshot-built devices."""
+        snapshot = self._snapshot()
+        manager = self._fresh_manager()
+        manager.load_from_snapshot(snapshot)
+        device = manager.devices[0]
+        callback = MagicMock()
+        device.add_attr_callback(callback)
+
+        fresh_state = call_json.get_response_from_file(f"get_device_state_{device.serial_number}.json")
+        fresh_state[DATA_KEY][MIXED_KEY][POWERON_KEY] = {"state": not device.is_on}
+
+        async def fake_api(api, json_object=None):
+            if api == "devicestate":
+                return fresh_state, 200
+            return self.call_dreo_api(api, json_object)
+
+        with patch(f"{PATCH_BASE_PATH}.PyDreo.async_call_dreo_api", side_effect=fake_api):
+            assert asyncio.run(manager.async_reconcile()) is True
+
+        assert device.raw_state is fresh_state
+        callback.assert_called_once()
+        device.dispose()
+
+    def test_reconcile_unchanged_state_fires_no_callbacks(self):
+        """REST state matching the snapshot leaves the device's callbacks alone."""
+        snapshot = self._snapshot()
+        manager = self._fresh_manager()
+        manager.load_from_snapshot(snapshot)
+        device = manager.devices[0]
+        callback = MagicMock()
+        device.add_attr_callback(callback)
+
+        async def fake_api(api, json_object=None):
+            return self.call_dreo_api(api, json_object)
+
+        with patch(f"{PATCH_BASE_PATH}.PyDreo.async_call_dreo_api", side_effect=fake_api):
+            assert asyncio.run(manager.async_reconcile()) is True
+
+        callback.assert_not_called()
+        device.dispose()
+
+    def test_reconcile_detects_device_list_change(self):
+        """A device list that no longer matches the snapshot asks for a reload."""
+        manager = self._fresh_manager()
+        manager.load_from_snapshot(self._snapshot())
+        self.get_devices_file_name = "get_devices_HAF004S.json"
+
+        async def fake_api(api, json_object=None):
+            return self.call_dreo_api(api, json_object)
+
+        with patch(f"{PATCH_BASE_PATH}.PyDreo.async_call_dreo_api", side_effect=fake_api):
+            assert asyncio.run(manager.async_reconcile()) is False
+        manager.devices[0].dispose()
+
+    def test_reconcile_keeps_snapshot_when_cloud_is_down(self):
+        """No device list response means keep running on snapshot state."""
+        manager = self._fresh_manager()
+        manager.load_from_snapshot(self._snapshot())
+        raw_state = manager.devices[0].raw_state
+
+        with patch(f"{PATCH_BASE_PATH}.PyDreo.async_call_dreo_api", new_callable=AsyncMock, return_value=(None, None)):
+            assert asyncio.run(manager.async_reconcile()) is None
+        assert manager.devices[0].raw_state == raw_state
+        manager.devices[0].dispose()
+
+
+class TestPyDreoRestStateOrdering(TestBase):
+    """devicestate responses against WebSocket reports for the same device."""
+
+    def _load_fan(self) -> PyDreoBaseDevice:
+        self.get_devices_file_name = "get_devices_HAF004S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+        fan.is_on = False
+        return fan
+
+    def _state(self, fan: PyDreoBaseDevice, is_on: bool) -> dict:
+        response = copy.deepcopy(self.pydreo_manager._fetch_device_state(fan.serial_number, fresh=True))  # pylint: disable=protected-access
+        response[DATA_KEY][MIXED_KEY][POWERON_KEY]["state"] = is_on
+        return response
+
+    def _report(self, fan: PyDreoBaseDevice, is_on: bool) -> None:
+        self.pydreo_manager._transport_consume_message({"devicesn": fan.serial_number, "method": "report", REPORTED_KEY: {POWERON_KEY: is_on}})  # pylint: disable=protected-access
+
+    def _overtaken_reads(self, fan: PyDreoBaseDevice, responses: list[dict], racing: int):
+        """A fetch stand-in whose first ``racing`` reads see a report turn the fan on while they are in flight."""
+        calls = []
+
+        def fetch(serial_number, fresh=False):
+            calls.append(fresh)
+            if len(calls) <= racing:
+                self._report(fan, True)
+            return responses[len(calls) - 1]
+
+        return fetch, calls
+
+    def test_overtaken_response_is_read_again(self):
+        """A response read while a report arrived is dropped and read again, bypassing the cache."""
+        fan = self._load_fan()
+        fetch, calls = self._overtaken_reads(fan, [self._state(fan, False), self._state(fan, True)], racing=1)
+        with patch.object(self.pydreo_manager, "_fetch_device_state", side_effect=fetch):
+            assert self.pydreo_manager._resync_device(fan) is True  # pylint: disable=protected-access
+        assert calls == [True, True]
+        assert fan.is_on is True
+
+    def test_reports_keep_overtaking_the_response(self):
+        """When every read is overtaken, the reported state stands."""
+        fan = self._load_fan()
+        fetch, calls = self._overtaken_reads(fan, [self._state(fan, False)] * 3, racing=3)
+        with patch.object(self.pydreo_manager, "_fetch_device_state", side_effect=fetch):
+            assert self.pydreo_manager.load_device_state(fan) is True
+        assert calls == [False, True, True]
+        assert fan.is_on is True
+
+    def test_unloaded_device_takes_an_overtaken_response(self):
+        """A device without state yet still takes the response as its baseline."""
+        fan = self._load_fan()
+        fan.state_loaded = False
+        fetch, calls = self._overtaken_reads(fan, [self._state(fan, False)] * 3, racing=3)
+        with patch.object(self.pydreo_manager, "_fetch_device_state", side_effect=fetch):
+            assert self.pydreo_manager.load_device_state(fan) is True
+        assert len(calls) == 3
+        assert fan.is_on is False
+        assert fan.state_loaded is True
+
+    def test_async_reconcile_rereads_an_overtaken_response(self):
+        """The async paths (onboarding, reconcile) drop an overtaken response too."""
+        fan = self._load_fan()
+        fetch, calls = self._overtaken_reads(fan, [self._state(fan, False), self._state(fan, True)], racing=1)
+        callback = MagicMock()
+        fan.add_attr_callback(callback)
+
+        async def fake_api(api, json_object=None):
+            return self.call_dreo_api(api, json_object)
+
+        with (
+            patch(f"{PATCH_BASE_PATH}.PyDreo.async_call_dreo_api", side_effect=fake_api),
+            patch.object(self.pydreo_manager, "_async_fetch_device_state", AsyncMock(side_effect=fetch)),
+        ):
+            assert asyncio.run(self.pydreo_manager.async_reconcile()) is True
+        assert calls == [False, True]
+        assert fan.is_on is True
+        assert all(call.args[0] for call in callback.call_args_list)
+
+    def test_response_waits_for_report_application(self):
+        """A response is not applied while the device's reports are being applied."""
+        fan = self._load_fan()
+        with patch.object(self.pydreo_manager, "_fetch_device_state", return_value=self._state(fan, True)):
+            with fan.state_lock:
+                loader = threading.Thread(target=self.pydreo_manager.load_device_state, args=(fan,))
+                loader.start()
+                loader.join(0.2)
+                assert loader.is_alive()
+                assert fan.is_on is False
+            loader.join(5)
+        assert not loader.is_alive()
+        assert fan.is_on is True
+
+
+class TestPyDreoDeviceListPages:
+    """Test loading a device list spread over several pages."""
+
+    FLEET = 250  # three pages of DEVICELIST_PAGE_SIZE
+
+    def _login(self) -> PyDreo:
+        pydreo = PyDreo("EMAIL", "PASSWORD", redact=True)
+        assert pydreo.login() is True
+        return pydreo
+
+    def test_load_devices_reads_every_page(self):
+        """Every page is loaded; the next page is fetched while the current one's devices load."""
+        with DreoCloudSimulator(["get_devices_HTF005S.json"], copies=self.FLEET):
+            pydreo = self._login()
+            fetched = []
+            added = []
+            fetch_page = pydreo._fetch_device_page  # pylint: disable=protected-access
+
+            def record_fetch(page_no):
+                fetched.append(page_no)
+                return fetch_page(page_no)
+
+            def on_devices(devices):
+                # The following page was requested before this one's callback.
+                if len(added) < 2:
+                    assert wait_for(lambda: len(fetched) >= len(added) + 2, timeout=5)
+                added.append(len(devices))
+
+            with patch.object(pydreo, "_fetch_device_page", side_effect=record_fetch):
+                assert pydreo.load_devices(on_devices) is True
+            assert fetched == [1, 2, 3]
+            assert added == [100, 100, 50]
+            assert len({device.serial_number for device in pydreo.devices}) == self.FLEET
+            assert len(pydreo.raw_response[DATA_KEY][LIST_KEY]) == self.FLEET
+            for device in pydreo.devices:
+                device.dispose()
+
+    def test_async_load_devices_reads_every_page(self):
+        """The async loader walks the pages too, and reconcile compares the whole list."""
+        with DreoCloudSimulator(["get_devices_HTF005S.json"], copies=self.FLEET):
+            pydreo = self._login()
+            added = []
+            assert asyncio.run(pydreo.async_load_devices(lambda devices: added.append(len(devices)))) is True
+            assert added == [100, 100, 50]
+            assert asyncio.run(pydreo.async_reconcile()) is True
+            for device in pydreo.devices:
+                device.dispose()
+
+    def test_failed_page_fails_the_load(self):
+        """A page that cannot be read fails the load instead of silently dropping devices."""
+        with DreoCloudSimulator(["get_devices_HTF005S.json"], copies=self.FLEET):
+            pydreo = self._login()
+            fetch_page = pydreo._fetch_device_page  # pylint: disable=protected-access
+            with patch.object(pydreo, "_fetch_device_page", side_effect=lambda page_no: None if page_no == 2 else fetch_page(page_no)):
+                assert pydreo.load_devices() is False
+            for device in pydreo.devices:
+                device.dispose()
+
+    def test_has_more_pages_without_total(self):
+        """Without totalPage a full page means there may be more."""
+        assert PyDreo._has_more_pages({DATA_KEY: {LIST_KEY: [{}] * 100}}, 1) is True  # pylint: disable=protected-access
+        assert PyDreo._has_more_pages({DATA_KEY: {LIST_KEY: [{}] * 3, "pageSize": 3}}, 2) is True  # pylint: disable=protected-access
+        assert PyDreo._has_more_pages({DATA_KEY: {LIST_KEY: [{}] * 99}}, 1) is False  # pylint: disable=protected-access
+        assert PyDreo._has_more_pages({DATA_KEY: {LIST_KEY: [], "totalPage": 3}}, 2) is True  # pylint: disable=protected-access
@@ -1519,7 +1519,7 @@ class TestPyDreoAirCirculator(TestBase):
         fan._fixed_conf_settle_seconds = 0  # pylint: disable=protected-access
         fan.handle_server_update({REPORTED_KEY: {FIXEDCONF_KEY: "0,0"}})
         ui_ticks: list[str | None] = []
-        fan.add_attr_callback(lambda: ui_ticks.append(fan.fixed_conf_commanded))
+        fan.add_attr_callback(lambda _changed: ui_ticks.append(fan.fixed_conf_commanded))
 
         with patch(PATCH_SEND_COMMAND, side_effect=RuntimeError("transport down")):
             with pytest.raises(RuntimeError, match="transport down"):
@@ -1563,7 +1563,7 @@ class TestPyDreoAirCirculator(TestBase):
         fan._fixed_conf_settle_seconds = 0  # pylint: disable=protected-access
         fan.handle_server_update({REPORTED_KEY: {FIXEDCONF_KEY: "0,0"}})
         ui_ticks: list[str | None] = []
-        fan.add_attr_callback(lambda: ui_ticks.append(fan.fixed_conf_commanded))
+        fan.add_attr_callback(lambda _changed: ui_ticks.append(fan.fixed_conf_commanded))
 
         with patch(PATCH_SEND_COMMAND):
             fan.vertical_angle = 35
@@ -1893,7 +1893,7 @@ class TestPyDreoAirCirculator(TestBase):
         assert fan.horizontal_angle == 0
 
         ui_ticks: list[bool] = []
-        fan.add_attr_callback(lambda: ui_ticks.append(fan.fixed_conf_settle_pending))
+        fan.add_attr_callback(lambda _changed: ui_ticks.append(fan.fixed_conf_settle_pending))
 
         with patch(PATCH_SEND_COMMAND) as mock_send_command:
             fan.vertical_angle = 30
@@ -1,9 +1,18 @@
-"""Tests for PyDreoBaseDevice callback safety."""
+"""Tests for PyDreoBaseDevice callback safety and report dispatch."""
 
 import logging
+import time
 from unittest.mock import MagicMock, patch
+
+import pytest
+
 from .imports import *  # pylint: disable=W0401,W0614
 from .testbase import TestBase
+from . import call_json
+
+from custom_components.dreo.pydreo.pydreobasedevice import PyDreoBaseDevice, ReportField
+from custom_components.dreo.pydreo.pydreofanbase import PyDreoFanBase
+from custom_components.dreo.pydreo.pydreoevaporativecooler import PyDreoEvaporativeCooler
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
@@ -41,3 +50,204 @@ class TestPyDreoBaseDevice(TestBase):
 
         # Should not raise
         device._do_callbacks()
+
+    def test_callbacks_receive_changed_attributes(self):
+        """A report that changes state runs callbacks with the changed attribute names."""
+        self.get_devices_file_name = "get_devices_HAF004S.json"
+        self.pydreo_manager.load_devices()
+        device = self.pydreo_manager.devices[0]
+        callback = MagicMock()
+        device.add_attr_callback(callback)
+
+        device.handle_server_update_base({"devicesn": device.serial_number, "method": "report", "reported": {POWERON_KEY: not device.is_on, CONNECTED_KEY: False}})
+
+        callback.assert_called_once_with(frozenset({"is_on", "connected"}))
+
+    def test_unchanged_report_skips_callbacks(self):
+        """Reports that repeat the cached state do not run callbacks."""
+        self.get_devices_file_name = "get_devices_HAF004S.json"
+        self.pydreo_manager.load_devices()
+        device = self.pydreo_manager.devices[0]
+        callback = MagicMock()
+        device.add_attr_callback(callback)
+        message = {"devicesn": device.serial_number, "method": "report", "reported": {POWERON_KEY: not device.is_on}}
+
+        device.handle_server_update_base(message)
+        device.handle_server_update_base(message)
+        device.handle_server_update_base({"devicesn": device.serial_number, "method": "report", "reported": {"unknownkey": 1}})
+
+        callback.assert_called_once_with(frozenset({"is_on"}))
+
+    def test_attribute_scoped_callbacks(self):
+        """Callbacks registered for attributes only run when one of them changes."""
+        self.get_devices_file_name = "get_devices_HAF004S.json"
+        self.pydreo_manager.load_devices()
+        device = self.pydreo_manager.devices[0]
+        power_cb = MagicMock()
+        speed_cb = MagicMock()
+        any_cb = MagicMock()
+        device.add_attr_callback(power_cb, ["is_on"])
+        device.add_attr_callback(speed_cb, ["fan_speed"])
+        device.add_attr_callback(any_cb)
+
+        device.handle_server_update_base({"devicesn": device.serial_number, "method": "report", "reported": {POWERON_KEY: not device.is_on}})
+        power_cb.assert_called_once_with(frozenset({"is_on"}))
+        speed_cb.assert_not_called()
+        any_cb.assert_called_once()
+
+        # An unspecified change reaches every callback.
+        device._do_callbacks()
+        speed_cb.assert_called_once_with(None)
+
+
+class TestReportDispatch(TestBase):
+    """Test the compiled report schema dispatch."""
+
+    # One device file per device class with a report schema.
+    REPLAY_DEVICE_FILES = [
+        "get_devices_HAF004S.json",
+        "get_devices_HTF005S.json",
+        "get_devices_HCF001S.json",
+        "get_devices_HAP003S.json",
+        "get_devices_HSH009S.json",
+        "get_devices_HAC005S.json",
+        "get_devices_HHM001S.json",
+        "get_devices_HDH002S.json",
+        "get_devices_HEC002S.json",
+    ]
+    REPLAY_ROUNDS = 50
+
+    def test_dispatch_chains_base_before_subclass(self):
+        """A key declared by a base and a subclass runs both fields, base first."""
+        appliers = PyDreoEvaporativeCooler._report_dispatch[TEMPOFFSET_KEY]
+        assert len(appliers) == 2
+        assert appliers[0][0] < appliers[1][0]
+        assert TEMPOFFSET_KEY in PyDreoFanBase._report_dispatch
+        assert TEMPOFFSET_KEY not in PyDreoBaseDevice._report_dispatch
+
+    def test_subclass_schema_compiled_at_class_creation(self):
+        """Defining a subclass compiles its schema with every base schema."""
+
+        class _Device(PyDreoFanBase):
+            _REPORT_SCHEMA = {"custom": ReportField("_custom", int, mapping={1: "one"}, convert=str.upper)}
+
+        assert "custom" in _Device._report_dispatch
+        assert "custom" not in PyDreoFanBase._report_dispatch
+        assert set(PyDreoFanBase._report_dispatch) < set(_Device._report_dispatch)
+
+        device = MagicMock()
+        _Device._report_dispatch["custom"][0][2](device, 1, {})
+        assert device._custom == "ONE"
+
+    def test_only_reported_keys_are_applied(self):
+        """Keys absent from the message and values of the wrong type leave state alone."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+        oscillating = fan.oscillating
+        speed = fan.fan_speed
+
+        fan.handle_server_update({"devicesn": fan.serial_number, "method": "report", "reported": {POWERON_KEY: False}})
+        assert fan.is_on is False
+        assert fan.oscillating == oscillating
+        assert fan.fan_speed == speed
+
+        fan.handle_server_update({"devicesn": fan.serial_number, "method": "report", "reported": {POWERON_KEY: "yes"}})
+        assert fan.is_on is False
+
+    def test_ignores_messages_without_reported(self):
+        """Messages without a reported dict are ignored."""
+        self.get_devices_file_name = "get_devices_HTF005S.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+        fan.handle_server_update({"devicesn": fan.serial_number, "method": "report"})
+        fan.handle_server_update({"devicesn": fan.serial_number, "method": "report", "reported": None})
+        assert fan.is_on is True
+
+    @pytest.mark.benchmark
+    def test_replay_throughput_benchmark(self):
+        """Benchmark: replay every recorded state key as a WebSocket delta through each device class."""
+        workload = []
+        for file_name in self.REPLAY_DEVICE_FILES:
+            self.get_devices_file_name = file_name
+            self.pydreo_manager.load_devices()
+            device = self.pydreo_manager.devices[-1]
+            mixed = call_json.get_response_from_file(f"get_device_state_{device.serial_number}.json")[DATA_KEY]["mixed"]
+            reported = {key: value["state"] for key, value in mixed.items() if isinstance(value, dict) and "state" in value}
+            messages = [{"devicesn": device.serial_number, "method": "report", REPORTED_KEY: {key: value}} for key, value in reported.items()]
+            messages.append({"devicesn": device.serial_number, "method": "report", REPORTED_KEY: reported})
+            workload.append((device, messages))
+
+        count = 0
+        started = time.perf_counter()
+        for _ in range(self.REPLAY_ROUNDS):
+            for device, messages in workload:
+                for message in messages:
+                    device.handle_server_update_base(message)
+                count += len(messages)
+        elapsed = time.perf_counter() - started
+
+        logger.info("report replay: %d messages across %d device classes in %.3fs (%.0f msgs/s)", count, len(workload), elapsed, count / elapsed)
+        # Every device class replayed its recorded keys, not just the full-state message.
+        assert all(len(messages) > 1 for _, messages in workload)
+
+
+class TestReportCoalescing(TestBase):
+    """Test coalescing queued reports into deltas."""
+
+    def _fan(self):
+        self.get_devices_file_name = "get_devices_HAF004S.json"
+        self.pydreo_manager.load_devices()
+        return self.pydreo_manager.devices[0]
+
+    def test_last_value_per_key_wins(self):
+        """Consecutive reports merge into one delta with the newest values and method."""
+        fan = self._fan()
+        burst = [
+            {"devicesn": fan.serial_number, "method": "report", REPORTED_KEY: {WINDLEVEL_KEY: 1, POWERON_KEY: True}},
+            {"devicesn": fan.serial_number, "method": "control-report", REPORTED_KEY: {WINDLEVEL_KEY: 3}},
+        ]
+        deltas = fan.coalesce_reports(burst)
+        assert deltas == [{"devicesn": fan.serial_number, "method": "control-report", REPORTED_KEY: {WINDLEVEL_KEY: 3, POWERON_KEY: True}}]
+        # The queued messages themselves are left as they were.
+        assert burst[0][REPORTED_KEY] == {WINDLEVEL_KEY: 1, POWERON_KEY: True}
+
+    def test_type_change_starts_new_delta(self):
+        """A value of another type would be ignored by the field, so the older value is kept apart."""
+        fan = self._fan()
+        burst = [{"method": "report", REPORTED_KEY: {WINDLEVEL_KEY: 2}}, {"method": "report", REPORTED_KEY: {WINDLEVEL_KEY: None}}]
+        deltas = fan.coalesce_reports(burst)
+        assert len(deltas) == 2
+        fan.handle_server_updates(deltas)
+        assert fan.fan_speed == 2
+
+    def test_barrier_key_starts_new_delta(self):
+        """A report carrying a merge barrier key is not merged into the previous delta."""
+        fan = self._fan()
+        burst = [
+            {"method": "report", REPORTED_KEY: {WINDLEVEL_KEY: 1}},
+            {"method": "report", REPORTED_KEY: {POWERON_KEY: True}},
+            {"method": "report", REPORTED_KEY: {WINDLEVEL_KEY: 2}},
+        ]
+        with patch.object(type(fan), "_REPORT_MERGE_BARRIERS", frozenset({POWERON_KEY})):
+            deltas = fan.coalesce_reports(burst)
+        assert [delta[REPORTED_KEY] for delta in deltas] == [{WINDLEVEL_KEY: 1}, {POWERON_KEY: True, WINDLEVEL_KEY: 2}]
+
+    def test_burst_runs_callbacks_once(self):
+        """handle_server_updates applies every message and fans out the net change once."""
+        fan = self._fan()
+        callback = MagicMock()
+        fan.add_attr_callback(callback)
+        low, high = fan.speed_range
+
+        fan.handle_server_updates(
+            [
+                {"method": "report", REPORTED_KEY: {POWERON_KEY: not fan.is_on}},
+                {"method": "report", REPORTED_KEY: {WINDLEVEL_KEY: low}},
+                {"method": "report", REPORTED_KEY: {WINDLEVEL_KEY: high}},
+            ]
+        )
+
+        callback.assert_called_once()
+        assert "is_on" in callback.call_args[0][0]
+        assert fan.fan_speed == high
@@ -771,7 +771,7 @@ class TestPyDreoCeilingFan(TestBase):
         # Firing it pulls REST state and notifies HA entities.
         with patch.object(self.pydreo_manager, "load_device_state", return_value=True) as mock_load:
             self.fire_last_scheduled(scheduled)
-            mock_load.assert_called_once_with(fan)
+            mock_load.assert_called_once_with(fan, fresh=True)
 
     def test_dispose_cancels_pending_verification(self):
         """On unload the pending verification must be cancelled, or a delayed
@@ -874,7 +874,7 @@ class TestPyDreoCeilingFan(TestBase):
         stale = self._rest_state(time.time() - 30, poweron=True, lighton=True, fanon=False, atmon=False)
         stale["windlevel"] = {"state": 5, "timestamp": time.time() - 30}
 
-        def fake_load(device):
+        def fake_load(device, fresh=False):
             device.update_state(stale)
             return True
 
@@ -1001,3 +1001,24 @@ class TestPyDreoCeilingFan(TestBase):
         fan.update_state(stale)
 
         assert fan.gate_diagnostics()["rest_readback_stale"] is True
+
+    def test_queued_gate_reopen_is_not_coalesced_away(self):
+        """A queued poweron False -> True burst still registers the gate-open."""
+        self.get_devices_file_name = "get_devices_HCF002S.json"
+        self.pydreo_manager.load_devices()
+        fan: PyDreoCeilingFan = self.pydreo_manager.devices[0]
+        fan.handle_server_update({REPORTED_KEY: {POWERON_KEY: True, FANON_KEY: True}})
+
+        burst = [
+            {"method": "report", REPORTED_KEY: {POWERON_KEY: False}},
+            {"method": "report", REPORTED_KEY: {POWERON_KEY: True}},
+            {"method": "report", REPORTED_KEY: {LIGHTON_KEY: True}},
+        ]
+        deltas = fan.coalesce_reports(burst)
+        assert [delta[REPORTED_KEY] for delta in deltas] == [{POWERON_KEY: False}, {POWERON_KEY: True, LIGHTON_KEY: True}]
+
+        with patch.object(fan, "_schedule_state_verification") as verify:
+            fan.handle_server_updates(deltas)
+        verify.assert_called_once()
+        assert fan.is_on is True
+        assert fan.light_on is True
@@ -281,3 +281,19 @@ class TestPyDreoChefMaker(TestBase):
         assert cm.mode == "cooking"
         # Cook end time is wkbegin + wkestdu = 1000 + 1000 = 2000.
         assert cm.cook_end_time == _end_time(1000, 1000)
+
+    def test_coalesced_reports_keep_poweron_ordering(self):
+        """poweron resets the mode, so a queued mode is not merged past a later poweron."""
+        cm = self._load_chefmaker()
+        cm.handle_server_update({REPORTED_KEY: {POWERON_KEY: True}})
+
+        burst = [{"method": "report", REPORTED_KEY: {CM_MODE_KEY: "cooking"}}, {"method": "report", REPORTED_KEY: {POWERON_KEY: False}}]
+        cm.handle_server_updates(cm.coalesce_reports(burst))
+        assert cm.mode == "off"
+
+        # poweron followed by a mode transition merges, and the mode still lands.
+        burst = [{"method": "report", REPORTED_KEY: {POWERON_KEY: True}}, {"method": "report", REPORTED_KEY: {CM_MODE_KEY: "cooking"}}]
+        deltas = cm.coalesce_reports(burst)
+        assert len(deltas) == 1
+        cm.handle_server_updates(deltas)
+        assert cm.mode == "cooking"
@@ -621,3 +621,21 @@ class TestPyDreoHeater(TestBase):
         for device in self.pydreo_manager.devices:
             heater: PyDreoHeater = device
             self._exercise_all_settable_properties(heater)
+
+    def test_coalesced_reports_keep_heater_ordering(self):
+        """Coalescing a heater burst gives the same state as applying it report by report."""
+        self.get_devices_file_name = "get_devices_HSH009S.json"
+        self.pydreo_manager.load_devices()
+        heater: PyDreoHeater = self.pydreo_manager.devices[0]
+        heater.handle_server_update({REPORTED_KEY: {POWERON_KEY: True, MODE_KEY: DreoHeaterMode.ECO}})
+
+        # An empty mode is ignored, so it must not replace the mode queued before it.
+        burst = [{"method": "report", REPORTED_KEY: {MODE_KEY: DreoHeaterMode.HOTAIR}}, {"method": "report", REPORTED_KEY: {MODE_KEY: ""}}]
+        heater.handle_server_updates(heater.coalesce_reports(burst))
+        assert heater.mode == DreoHeaterMode.HOTAIR
+
+        # ptcon infers poweron; a later poweron False must still win.
+        burst = [{"method": "report", REPORTED_KEY: {PTCON_KEY: True}}, {"method": "report", REPORTED_KEY: {POWERON_KEY: False}}]
+        assert len(heater.coalesce_reports(burst)) == 2
+        heater.handle_server_updates(heater.coalesce_reports(burst))
+        assert heater.poweron is False
@@ -2,7 +2,7 @@
 
 # pylint: disable=used-before-assignment
 import logging
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import pytest
 from .imports import *  # pylint: disable=W0401,W0614
 from .testbase import TestBase, PATCH_SEND_COMMAND
@@ -389,6 +389,21 @@ class TestPyDreoHumidifier(TestBase):
             mock_send_command.assert_called_once_with(humidifier, {TARGET_AUTO_HUMIDITY_KEY: 70})
         assert humidifier.target_humidity == 70
 
+    def test_target_humidity_setter_notifies_before_echo(self):
+        """The optimistic write runs the callbacks; the echoed control-report then changes nothing."""
+        self.get_devices_file_name = "get_devices_HHM001S.json"
+        self.pydreo_manager.load_devices()
+        humidifier: PyDreoHumidifier = self.pydreo_manager.devices[0]
+        callback = MagicMock()
+        humidifier.add_attr_callback(callback, ("target_humidity",))
+        with patch(PATCH_SEND_COMMAND):
+            humidifier.target_humidity = 70
+        callback.assert_called_once_with(frozenset({"target_humidity"}))
+
+        humidifier.handle_server_updates([{"method": "control-report", REPORTED_KEY: {TARGET_AUTO_HUMIDITY_KEY: 70}}])
+        callback.assert_called_once()
+        assert humidifier.target_humidity == 70
+
     def test_target_humidity_setter_noop(self):
         """Test target_humidity setter skips command when value unchanged."""
         self.get_devices_file_name = "get_devices_HHM001S.json"
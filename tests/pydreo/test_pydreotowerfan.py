@@ -868,3 +868,18 @@ class TestPyDreoTowerFan(TestBase):
         with patch(PATCH_SEND_COMMAND) as mock_send_command:
             fan.oscillating = False
             mock_send_command.assert_called_once_with(fan, {SHAKEHORIZON_KEY: False})
+
+    def test_coalesced_hoscangle_after_shakehorizonangle(self):  # pylint: disable=invalid-name
+        """A queued hoscangle is not merged into a shakehorizonangle report that would mask it."""
+        self.get_devices_file_name = "get_devices_HTF021AS.json"
+        self.pydreo_manager.load_devices()
+        fan = self.pydreo_manager.devices[0]
+
+        burst = [
+            {"method": "report", REPORTED_KEY: {SHAKEHORIZONANGLE_KEY: 60}},
+            {"method": "report", REPORTED_KEY: {HORIZONTAL_OSCILLATION_ANGLE_KEY: "-15,15"}},
+        ]
+        deltas = fan.coalesce_reports(burst)
+        assert len(deltas) == 2
+        fan.handle_server_updates(deltas)
+        assert fan.shakehorizonangle == 30
@@ -0,0 +1,100 @@
+"""Tests for the WebSocket reconnect backoff and circuit breaker."""
+
+from unittest.mock import MagicMock, patch
+
+from custom_components.dreo.pydreo.reconnectpolicy import BackoffPolicy, CircuitBreaker, CircuitState
+from .testbase import TestBase
+
+
+class TestBackoffPolicy:
+    """Test capped exponential backoff with jitter."""
+
+    def test_delay_grows_and_is_capped(self):
+        """Each attempt doubles the ceiling up to max_delay; jitter keeps delays in [ceiling / 2, ceiling]."""
+        policy = BackoffPolicy(base_delay=1.0, max_delay=10.0)
+        with patch("custom_components.dreo.pydreo.reconnectpolicy.random.random", return_value=1.0):
+            assert [policy.delay(attempt) for attempt in range(6)] == [1.0, 2.0, 4.0, 8.0, 10.0, 10.0]
+        with patch("custom_components.dreo.pydreo.reconnectpolicy.random.random", return_value=0.0):
+            assert [policy.delay(attempt) for attempt in range(6)] == [0.5, 1.0, 2.0, 4.0, 5.0, 5.0]
+        assert policy.max_total(3) == 7.0
+
+    def test_jitter_spreads_clients(self):
+        """Clients retrying the same attempt do not all wait the same time."""
+        policy = BackoffPolicy(base_delay=1.0, max_delay=60.0)
+        delays = {policy.delay(3) for _ in range(50)}
+        assert len(delays) > 40
+        assert all(4.0 <= delay <= 8.0 for delay in delays)
+
+
+class TestCircuitBreaker:
+    """Test circuit breaker transitions."""
+
+    def test_opens_after_threshold(self):
+        """Consecutive failures open the circuit at the threshold."""
+        on_change = MagicMock()
+        breaker = CircuitBreaker(failure_threshold=3, on_change=on_change)
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allows_requests is True
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.allows_requests is False
+        on_change.assert_called_once_with(CircuitState.OPEN)
+
+    def test_half_open_probe(self):
+        """The next attempt after opening is a probe: failure re-opens, success closes."""
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.attempt()
+        assert breaker.state == CircuitState.CLOSED
+        breaker.record_failure()
+        breaker.attempt()
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allows_requests is False
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        breaker.attempt()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.stats() == {"state": "closed", "failures": 0, "failure_threshold": 1, "opened": 1}
+
+    def test_success_resets_failure_count(self):
+        """Failures must be consecutive to open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_callback_errors_are_contained(self):
+        """A failing state callback does not break the breaker."""
+        breaker = CircuitBreaker(failure_threshold=1, on_change=MagicMock(side_effect=RuntimeError("boom")))
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+
+class TestTransportAvailability(TestBase):
+    """Test devices following the transport's circuit state."""
+
+    def test_devices_disconnected_while_circuit_open(self):
+        """Opening the circuit marks every device disconnected and notifies connected listeners."""
+        self.get_devices_file_name = "get_devices_HAF004S.json"
+        self.pydreo_manager.load_devices()
+        device = self.pydreo_manager.devices[0]
+        seen = []
+        device.add_attr_callback(seen.append, ["connected"])
+        assert device.connected is not False
+
+        breaker = self.pydreo_manager._transport._breaker  # pylint: disable=protected-access
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        assert self.pydreo_manager.transport_available is False
+        assert device.connected is False
+        assert seen == [frozenset({"connected"})]
+
+        breaker.attempt()
+        assert len(seen) == 1  # half-open is still unavailable
+        breaker.record_success()
+        assert device.connected is not False
+        assert len(seen) == 2
+        assert self.pydreo_manager.transport_status["circuit"]["state"] == "closed"
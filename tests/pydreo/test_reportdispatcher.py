@@ -0,0 +1,277 @@
+"""Tests for ReportDispatcher."""
+
+import threading
+from unittest.mock import MagicMock
+
+from custom_components.dreo.pydreo.reportdispatcher import OverflowPolicy, ReportDispatcher
+from .imports import *  # pylint: disable=W0401,W0614
+from .testbase import TestBase, wait_for
+
+
+def _device(serial_number: str) -> MagicMock:
+    device = MagicMock()
+    device.serial_number = serial_number
+    device.name = serial_number
+    return device
+
+
+def _report(serial_number: str, **reported) -> dict:
+    return {"devicesn": serial_number, "method": "report", REPORTED_KEY: reported}
+
+
+class _Recorder:
+    """apply() stand-in that records (serial number, reported) and can block per device."""
+
+    def __init__(self) -> None:
+        self.applied: list[tuple[str, dict]] = []
+        self.bursts: list[int] = []
+        self.gates: dict[str, threading.Event] = {}
+        self.entered: dict[str, threading.Event] = {}
+        self.lock = threading.Lock()
+
+    def block(self, serial_number: str) -> threading.Event:
+        self.gates[serial_number] = threading.Event()
+        self.entered[serial_number] = threading.Event()
+        return self.gates[serial_number]
+
+    def __call__(self, device, messages: list[dict]) -> None:
+        serial_number = device.serial_number
+        if serial_number in self.gates:
+            self.entered[serial_number].set()
+            self.gates[serial_number].wait(5)
+        with self.lock:
+            self.bursts.append(len(messages))
+            self.applied.extend((serial_number, message[REPORTED_KEY]) for message in messages)
+
+    def for_device(self, serial_number: str) -> list[dict]:
+        with self.lock:
+            return [reported for applied_sn, reported in self.applied if applied_sn == serial_number]
+
+
+class TestReportDispatcher:
+    """Test per-device report queues."""
+
+    def test_inline_until_started(self):
+        """Before start, reports are applied on the caller's thread."""
+        recorder = _Recorder()
+        dispatcher = ReportDispatcher(recorder)
+        dispatcher.submit(_device("A"), _report("A", poweron=True))
+        assert recorder.applied == [("A", {"poweron": True})]
+        assert dispatcher.stats()["dispatched"] == 0
+
+    def test_per_device_order(self):
+        """Reports for one device are applied in arrival order."""
+        recorder = _Recorder()
+        dispatcher = ReportDispatcher(recorder, workers=4, max_depth=1000)
+        dispatcher.start()
+        try:
+            device = _device("A")
+            for level in range(200):
+                dispatcher.submit(device, _report("A", windlevel=level))
+            assert wait_for(lambda: len(recorder.for_device("A")) == 200)
+            assert [reported["windlevel"] for reported in recorder.for_device("A")] == list(range(200))
+        finally:
+            dispatcher.stop()
+
+    def test_slow_device_does_not_block_others(self):
+        """A device stuck in state application neither blocks the submitter nor other devices."""
+        recorder = _Recorder()
+        gate = recorder.block("SLOW")
+        dispatcher = ReportDispatcher(recorder, workers=2)
+        dispatcher.start()
+        try:
+            dispatcher.submit(_device("SLOW"), _report("SLOW", poweron=True))
+            assert recorder.entered["SLOW"].wait(2)
+            dispatcher.submit(_device("SLOW"), _report("SLOW", poweron=False))
+            dispatcher.submit(_device("FAST"), _report("FAST", poweron=True))
+            # The gated handler cannot finish before gate.set(), so submits returning first proves
+            # the caller never waited on it.
+            assert recorder.for_device("SLOW") == []
+            assert wait_for(lambda: recorder.for_device("FAST") == [{"poweron": True}])
+            assert dispatcher.depths() == {"SLOW": 1}
+            gate.set()
+            assert wait_for(lambda: recorder.for_device("SLOW") == [{"poweron": True}, {"poweron": False}])
+        finally:
+            gate.set()
+            dispatcher.stop()
+
+    def test_overflow_coalesces_into_newest_report(self):
+        """With COALESCE, a full queue merges new keys into the newest queued report."""
+        recorder = _Recorder()
+        gate = recorder.block("A")
+        dispatcher = ReportDispatcher(recorder, workers=1, max_depth=2, overflow=OverflowPolicy.COALESCE)
+        dispatcher.start()
+        try:
+            device = _device("A")
+            dispatcher.submit(device, _report("A", windlevel=1))
+            assert recorder.entered["A"].wait(2)
+            dispatcher.submit(device, _report("A", windlevel=2))
+            dispatcher.submit(device, _report("A", windlevel=3, poweron=True))
+            dispatcher.submit(device, _report("A", windlevel=4))
+            dispatcher.submit(device, _report("A", shakehorizon=True))
+            assert dispatcher.depths() == {"A": 2}
+            gate.set()
+            assert wait_for(lambda: len(recorder.for_device("A")) == 3)
+            assert recorder.for_device("A") == [
+                {"windlevel": 1},
+                {"windlevel": 2},
+                {"windlevel": 4, "poweron": True, "shakehorizon": True},
+            ]
+            stats = dispatcher.stats()
+            assert stats["coalesced"] == 2
+            assert stats["dropped"] == 0
+            assert stats["peak_depth"] == 2
+        finally:
+            gate.set()
+            dispatcher.stop()
+
+    def test_overflow_drop_oldest(self):
+        """With DROP_OLDEST, a full queue discards its oldest report."""
+        recorder = _Recorder()
+        gate = recorder.block("A")
+        dispatcher = ReportDispatcher(recorder, workers=1, max_depth=2, overflow=OverflowPolicy.DROP_OLDEST)
+        dispatcher.start()
+        try:
+            device = _device("A")
+            dispatcher.submit(device, _report("A", windlevel=1))
+            assert recorder.entered["A"].wait(2)
+            for level in (2, 3, 4):
+                dispatcher.submit(device, _report("A", windlevel=level))
+            gate.set()
+            assert wait_for(lambda: len(recorder.for_device("A")) == 3)
+            assert [reported["windlevel"] for reported in recorder.for_device("A")] == [1, 3, 4]
+            assert dispatcher.stats()["dropped"] == 1
+        finally:
+            gate.set()
+            dispatcher.stop()
+
+    def test_apply_errors_are_isolated(self):
+        """An exception applying one report does not stop the device's later reports."""
+        applied = []
+
+        def apply(device, messages):
+            for message in messages:
+                if message[REPORTED_KEY].get("boom"):
+                    raise RuntimeError("boom")
+                applied.append(message[REPORTED_KEY])
+
+        dispatcher = ReportDispatcher(apply)
+        dispatcher.start()
+        try:
+            device = _device("A")
+            dispatcher.submit(device, _report("A", boom=True))
+            assert wait_for(lambda: dispatcher.stats()["dispatched"] == 1)
+            dispatcher.submit(device, _report("A", poweron=True))
+            assert wait_for(lambda: applied == [{"poweron": True}])
+        finally:
+            dispatcher.stop()
+
+    def test_stop_discards_queued_reports(self):
+        """Stopping drops queued reports and returns to inline application."""
+        recorder = _Recorder()
+        gate = recorder.block("A")
+        dispatcher = ReportDispatcher(recorder, workers=1)
+        dispatcher.start()
+        device = _device("A")
+        dispatcher.submit(device, _report("A", windlevel=1))
+        assert recorder.entered["A"].wait(2)
+        dispatcher.submit(device, _report("A", windlevel=2))
+        threading.Timer(0.05, gate.set).start()
+        dispatcher.stop()
+
+        assert recorder.for_device("A") == [{"windlevel": 1}]
+        assert dispatcher.running is False
+        del recorder.gates["A"]
+        dispatcher.submit(device, _report("A", windlevel=3))
+        assert recorder.for_device("A") == [{"windlevel": 1}, {"windlevel": 3}]
+
+    def test_queued_reports_are_applied_as_one_burst(self):
+        """Reports queued behind a busy worker are coalesced and applied together."""
+        recorder = _Recorder()
+        gate = recorder.block("A")
+
+        def coalesce(device, messages):
+            return [{"devicesn": device.serial_number, "method": "report", REPORTED_KEY: {k: v for m in messages for k, v in m[REPORTED_KEY].items()}}]
+
+        dispatcher = ReportDispatcher(recorder, workers=1, coalesce=coalesce)
+        dispatcher.start()
+        try:
+            device = _device("A")
+            dispatcher.submit(device, _report("A", windlevel=1))
+            assert recorder.entered["A"].wait(2)
+            for level in (2, 3, 4):
+                dispatcher.submit(device, _report("A", windlevel=level, poweron=True))
+            del recorder.gates["A"]
+            gate.set()
+            assert wait_for(lambda: len(recorder.for_device("A")) == 2)
+            assert recorder.for_device("A") == [{"windlevel": 1}, {"windlevel": 4, "poweron": True}]
+            assert recorder.bursts == [1, 1]
+            stats = dispatcher.stats()
+            assert stats["dispatched"] == 4
+            assert stats["bursts"] == 2
+            assert stats["merged"] == 2
+        finally:
+            gate.set()
+            dispatcher.stop()
+
+    def test_overflow_respects_coalesce(self):
+        """A report the coalesce hook will not merge falls back to dropping the oldest."""
+        recorder = _Recorder()
+        gate = recorder.block("A")
+        dispatcher = ReportDispatcher(recorder, workers=1, max_depth=1, coalesce=lambda device, messages: list(messages))
+        dispatcher.start()
+        try:
+            device = _device("A")
+            dispatcher.submit(device, _report("A", windlevel=1))
+            assert recorder.entered["A"].wait(2)
+            dispatcher.submit(device, _report("A", windlevel=2))
+            dispatcher.submit(device, _report("A", windlevel=3))
+            gate.set()
+            assert wait_for(lambda: len(recorder.for_device("A")) == 2)
+            assert recorder.for_device("A") == [{"windlevel": 1}, {"windlevel": 3}]
+            assert dispatcher.stats()["dropped"] == 1
+        finally:
+            gate.set()
+            dispatcher.stop()
+
+
+class TestPyDreoReportDispatch(TestBase):
+    """Test PyDreo routing WebSocket reports through the dispatcher."""
+
+    def test_transport_thread_does_not_wait_for_callbacks(self):
+        """With the dispatcher running, a slow device callback does not hold up the reader."""
+        self.get_devices_file_name = "get_devices_HAF004S.json"
+        self.pydreo_manager.load_devices()
+        device = self.pydreo_manager.devices[0]
+        release = threading.Event()
+        entered = threading.Event()
+        seen = []
+
+        def slow_callback(changed):
+            seen.append(changed)
+            entered.set()
+            release.wait(5)
+
+        device.add_attr_callback(slow_callback)
+        low, high = device.speed_range
+        self.pydreo_manager._dispatcher.start()  # pylint: disable=protected-access
+        try:
+            for reported in ({POWERON_KEY: not device.is_on}, {WINDLEVEL_KEY: low}, {WINDLEVEL_KEY: high}):
+                self.pydreo_manager._transport_consume_message(  # pylint: disable=protected-access
+                    {"devicesn": device.serial_number, "method": "report", REPORTED_KEY: reported}
+                )
+            # The callback is parked on release, which only this thread sets, so the reader
+            # returned while it was still running.
+            assert entered.wait(2)
+            assert len(seen) == 1
+            assert self.pydreo_manager.dispatch_stats["queued"] == 2
+            release.set()
+            # The two reports queued behind the slow callback are applied as one delta.
+            assert wait_for(lambda: len(seen) == 2)
+            assert device.fan_speed == high
+            stats = self.pydreo_manager.dispatch_stats
+            assert stats["dispatched"] == 3
+            assert stats["merged"] == 1
+        finally:
+            release.set()
+            self.pydreo_manager._dispatcher.stop()  # pylint: disable=protected-access
@@ -0,0 +1,203 @@
+"""Tests for the post-reconnect state resync."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from custom_components.dreo.pydreo.reconnectpolicy import CircuitState, ConnectionState
+from custom_components.dreo.pydreo.resync import RESYNC_BUSY_RETRY, RESYNC_DELAY, StateResyncer
+from .imports import *  # pylint: disable=W0401,W0614
+from .dreosimulator import DreoCloudSimulator
+from .testbase import TestBase, wait_for
+
+
+def _device(serial_number: str) -> SimpleNamespace:
+    return SimpleNamespace(serial_number=serial_number, name=serial_number)
+
+
+class _Scheduler:
+    """Records scheduled jobs; run() fires them in order."""
+
+    def __init__(self) -> None:
+        self.jobs: list[dict] = []
+
+    def __call__(self, delay, work):
+        job = {"delay": delay, "work": work, "cancelled": False}
+        self.jobs.append(job)
+
+        def cancel() -> None:
+            job["cancelled"] = True
+
+        return cancel
+
+    def pending(self) -> list[dict]:
+        return [job for job in self.jobs if not job["cancelled"] and "ran" not in job]
+
+    def run_next(self) -> dict:
+        job = self.pending()[0]
+        job["ran"] = True
+        job["work"]()
+        return job
+
+
+class TestStateResyncer:
+    """Test resync ordering, concurrency and cancellation."""
+
+    def test_priority_devices_first_with_bounded_workers(self):
+        """Priority devices are refreshed first, by at most ``workers`` jobs."""
+        scheduler = _Scheduler()
+        refreshed = []
+        resyncer = StateResyncer(lambda device: refreshed.append(device.serial_number) or True, scheduler, lambda device: False, workers=2)
+        devices = [_device(f"SN{i}") for i in range(5)]
+
+        resyncer.request(devices, priority=["SN3", "SN4"])
+        assert [job["delay"] for job in scheduler.pending()] == [RESYNC_DELAY, RESYNC_DELAY]
+        assert resyncer.pending == 5
+
+        scheduler.run_next()  # one job drains the queue; the other then finds it empty
+        scheduler.run_next()
+        assert refreshed == ["SN3", "SN4", "SN0", "SN1", "SN2"]
+        assert not scheduler.pending()
+        stats = resyncer.stats()
+        assert stats["requested"] == 5
+        assert stats["refreshed"] == 5
+        assert stats["queued"] == stats["running"] == 0
+        assert stats["last_duration"] is not None
+
+    def test_single_flight_per_device(self):
+        """A device requested twice is queued once; requested while running, it is refreshed once more."""
+        scheduler = _Scheduler()
+        refreshed = []
+        device = _device("SN")
+
+        def refresh(target) -> bool:
+            refreshed.append(target.serial_number)
+            if len(refreshed) == 1:
+                resyncer.request([device])
+            return True
+
+        resyncer = StateResyncer(refresh, scheduler, lambda target: False, workers=4)
+        resyncer.request([device])
+        resyncer.request([device])
+        assert len(scheduler.pending()) == 1
+
+        scheduler.run_next()
+        while scheduler.pending():
+            scheduler.run_next()
+        assert refreshed == ["SN", "SN"]
+
+    def test_busy_device_is_deferred(self):
+        """A device with commands pending is retried later, at priority, instead of being read mid-batch."""
+        scheduler = _Scheduler()
+        busy = {"SN"}
+        refreshed = []
+        resyncer = StateResyncer(lambda device: refreshed.append(device.serial_number) or True, scheduler, lambda device: device.serial_number in busy)
+
+        resyncer.request([_device("SN")])
+        scheduler.run_next()
+        assert refreshed == []
+        assert resyncer.stats()["deferred"] == 1
+        assert scheduler.pending()[0]["delay"] == RESYNC_BUSY_RETRY
+
+        busy.clear()
+        while scheduler.pending():
+            scheduler.run_next()
+        assert refreshed == ["SN"]
+
+    def test_refresh_failures_are_counted(self):
+        """A refresh that fails or raises does not stop the other devices."""
+        scheduler = _Scheduler()
+
+        def refresh(device) -> bool:
+            if device.serial_number == "SN0":
+                raise RuntimeError("boom")
+            return device.serial_number == "SN1"
+
+        resyncer = StateResyncer(refresh, scheduler, lambda device: False, workers=1)
+        resyncer.request([_device("SN0"), _device("SN1"), _device("SN2")])
+        scheduler.run_next()
+        assert resyncer.stats()["refreshed"] == 1
+        assert resyncer.stats()["failed"] == 2
+
+    def test_cancel_drops_queued_work(self):
+        """Cancel cancels scheduled jobs; a job that still runs does nothing."""
+        scheduler = _Scheduler()
+        refreshed = []
+        resyncer = StateResyncer(lambda device: refreshed.append(device) or True, scheduler, lambda device: False)
+        resyncer.request([_device("SN0"), _device("SN1")])
+        jobs = list(scheduler.jobs)
+
+        resyncer.cancel()
+        assert all(job["cancelled"] for job in jobs)
+        assert resyncer.pending == 0
+        jobs[0]["work"]()
+        assert refreshed == []
+
+
+class TestPyDreoResync(TestBase):
+    """Test PyDreo triggering a resync when the transport reconnects."""
+
+    def _connection(self, state: ConnectionState) -> None:
+        self.pydreo_manager._transport_state_changed(state, CircuitState.CLOSED)  # pylint: disable=protected-access
+
+    def test_resync_after_reconnect(self):
+        """Only a reconnect resyncs; devices with commands in flight at the drop go first."""
+        self.get_devices_file_name = "get_devices_HAF003S.json"
+        self.pydreo_manager.load_devices()
+        scheduled = self.install_manual_scheduler()
+        first, second = self.pydreo_manager.devices
+
+        self._connection(ConnectionState.CONNECTED)
+        assert not self.pending_scheduled(scheduled)
+
+        self.pydreo_manager._pending_commands[second.serial_number] = None  # pylint: disable=protected-access
+        self._connection(ConnectionState.BACKOFF)
+        del self.pydreo_manager._pending_commands[second.serial_number]  # pylint: disable=protected-access
+        self._connection(ConnectionState.CONNECTING)
+        self._connection(ConnectionState.CONNECTED)
+        assert self.pydreo_manager.resync_stats["queued"] == 2
+
+        with patch.object(self.pydreo_manager, "_fetch_device_state", wraps=self.pydreo_manager._fetch_device_state) as fetch:
+            for entry in self.pending_scheduled(scheduled):
+                entry["callback"]()
+        assert [call.args[0] for call in fetch.call_args_list] == [second.serial_number, first.serial_number]
+        assert self.pydreo_manager.resync_stats["refreshed"] == 2
+
+    def test_stop_transport_cancels_resync(self):
+        """Unload cancels resync work that has not started."""
+        self.get_devices_file_name = "get_devices_HAF004S.json"
+        self.pydreo_manager.load_devices()
+        scheduled = self.install_manual_scheduler()
+        self._connection(ConnectionState.CONNECTED)
+        self._connection(ConnectionState.BACKOFF)
+        self._connection(ConnectionState.CONNECTED)
+        assert self.pending_scheduled(scheduled)
+
+        self.pydreo_manager.stop_transport()
+        assert not self.pending_scheduled(scheduled)
+        assert self.pydreo_manager.resync_stats["queued"] == 0
+
+
+class TestResyncSimulator:
+    """Resync against the local cloud simulator."""
+
+    def test_state_missed_while_disconnected_is_resynced(self):
+        """A change the socket never reported reaches the device after the reconnect."""
+        with DreoCloudSimulator(["get_devices_HTF005S.json"]) as cloud:
+            pydreo = PyDreo("EMAIL", "PASSWORD", redact=True)
+            assert pydreo.login() is True
+            assert pydreo.load_devices() is True
+            pydreo.start_transport()
+            try:
+                assert wait_for(lambda: cloud.connected_clients == 1, timeout=5)
+                fan = pydreo.devices[0]
+                seen = []
+                fan.add_attr_callback(seen.append)
+                was_on = fan.is_on
+
+                cloud.devices[fan.serial_number].mixed[POWERON_KEY]["state"] = not was_on
+                cloud.disconnect_clients()
+                assert wait_for(lambda: pydreo.resync_stats["refreshed"] == 1, timeout=10)
+                assert fan.is_on is not was_on
+                assert any("is_on" in changed for changed in seen)
+            finally:
+                pydreo.stop_transport()
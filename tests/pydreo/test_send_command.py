@@ -1,5 +1,6 @@
 """Tests for PyDreo send_command retry logic, ACK handling, and command slot management."""
 
+import json
 import logging
 import threading
 import time
@@ -7,9 +8,10 @@ from unittest.mock import patch, MagicMock
 import pytest
 from .imports import *  # pylint: disable=W0401,W0614
 from .testbase import TestBase, PATCH_SEND_COMMAND, PATCH_BASE_PATH, wait_for
+from . import call_json
 
 from custom_components.dreo.pydreo import PyDreo
-from custom_components.dreo.pydreo.commandoutbox import OutboxTiming
+from custom_components.dreo.pydreo.commandoutbox import CommandNotAckedError, OutboxTiming
 from custom_components.dreo.pydreo.pydreobasedevice import PyDreoBaseDevice
 
 logger = logging.getLogger(__name__)
@@ -91,7 +93,7 @@ class TestSendCommand(TestBase):
                 fan.is_on = True
 
         # Slot should be released - another command should not deadlock
-        assert self.pydreo_manager._pending_command_device is None
+        assert fan.serial_number not in self.pydreo_manager._pending_commands
 
     def test_ack_ignores_wrong_device(self):
         """Test that ACK from a different device is ignored."""
@@ -137,6 +139,28 @@ class TestSendCommand(TestBase):
         )
         assert bool(fan.is_on) is (not initial)  # device-confirmed state applies
 
+    def test_batch_future_resolves_on_ack(self):
+        """A device command's future resolves once the device acks it."""
+        fan = self._load_fan()
+
+        def simulate_ack(content):
+            self.pydreo_manager._transport_consume_message(
+                {"devicesn": fan.serial_number, "method": "control-report", "reported": {POWERON_KEY: True}}
+            )
+
+        with patch(PATCH_TRANSPORT_SEND, side_effect=simulate_ack):
+            future = fan._send_command(POWERON_KEY, True)
+        assert future.result(timeout=0) is True
+
+    def test_batch_future_fails_without_ack(self):
+        """A command that exhausts its retries fails its future."""
+        fan = self._load_fan()
+
+        with patch(PATCH_TRANSPORT_SEND), patch(f"{PATCH_BASE_PATH}._COMMAND_ACK_TIMEOUT", 0.05):
+            future = fan._send_command(POWERON_KEY, True)
+        with pytest.raises(CommandNotAckedError):
+            future.result(timeout=0)
+
     def test_device_batches_near_simultaneous_commands(self):
         """Every device type routes commands through its outbox: two setters
         inside the quiet period merge into ONE multi-key send (the hardware
@@ -156,7 +180,7 @@ class TestSendCommand(TestBase):
         assert sends == [{POWERON_KEY: True, WINDLEVEL_KEY: 3}]
 
     def test_command_slot_serializes_commands(self):
-        """Test that only one command can be in-flight at a time."""
+        """Test that only one command can be in-flight at a time for a device."""
         fan = self._load_fan()
         slot_was_busy = threading.Event()
         first_command_started = threading.Event()
@@ -172,7 +196,7 @@ class TestSendCommand(TestBase):
 
             def send_second_command():
                 first_command_started.wait(timeout=2)
-                if self.pydreo_manager._pending_command_device is not None:
+                if fan.serial_number in self.pydreo_manager._pending_commands:
                     slot_was_busy.set()
                 fan.is_on = False
 
@@ -183,6 +207,78 @@ class TestSendCommand(TestBase):
 
             assert slot_was_busy.is_set(), "Second command should have found slot busy"
 
+    def _load_scene_fans(self, count: int) -> list:
+        """Load ``count`` fans with distinct serial numbers from one device template."""
+        template = call_json.get_response_from_file("get_devices_HAF004S.json")[DATA_KEY][LIST_KEY][0]
+        state = call_json.get_response_from_file(f"get_device_state_{template['sn']}.json")[DATA_KEY][MIXED_KEY]
+        dev_list = [{**template, "sn": f"SCENE_FAN_{i}", "deviceId": f"SCENE_ID_{i}"} for i in range(count)]
+        self.pydreo_manager._process_devices(dev_list)
+        assert len(self.pydreo_manager.devices) == count
+        for fan in self.pydreo_manager.devices:
+            fan.update_state(state)
+        return self.pydreo_manager.devices
+
+    def _run_scene(self, fans: list, ack_delay: float) -> float:
+        """Toggle every fan from its own thread (as HA executor jobs do); return wall time.
+
+        Acks arrive ``ack_delay`` seconds after each send, from another thread.
+        """
+
+        acked = []
+
+        def delayed_ack(content):
+            command = json.loads(content)
+            acked.append(command["devicesn"])
+            ack = {"devicesn": command["devicesn"], "method": "control-report", "reported": command["params"]}
+            threading.Timer(ack_delay, self.pydreo_manager._transport_consume_message, args=(ack,)).start()
+
+        with patch(PATCH_TRANSPORT_SEND, side_effect=delayed_ack), patch(f"{PATCH_BASE_PATH}._MAX_COMMAND_RETRIES", 0):
+            threads = [threading.Thread(target=setattr, args=(fan, "is_on", not fan.is_on)) for fan in fans]
+            started = time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(timeout=10)
+            elapsed = time.perf_counter() - started
+        assert sorted(acked) == sorted(fan.serial_number for fan in fans)
+        return elapsed
+
+    def test_commands_to_different_devices_are_in_flight_together(self):
+        """A command awaiting its ack must not block another device's command."""
+        fan_a, fan_b = self._load_scene_fans(2)
+        both_in_flight = threading.Event()
+
+        def send_without_ack(content):
+            pending = self.pydreo_manager._pending_commands
+            if fan_a.serial_number in pending and fan_b.serial_number in pending:
+                both_in_flight.set()
+
+        with (
+            patch(PATCH_TRANSPORT_SEND, side_effect=send_without_ack),
+            patch(f"{PATCH_BASE_PATH}._COMMAND_ACK_TIMEOUT", 0.3),
+            patch(f"{PATCH_BASE_PATH}._MAX_COMMAND_RETRIES", 0),
+        ):
+            t = threading.Thread(target=setattr, args=(fan_b, "is_on", True))
+            t.start()
+            fan_a.is_on = True
+            t.join(timeout=5)
+
+        assert both_in_flight.is_set(), "Commands to different devices should be in flight at the same time"
+        assert not self.pydreo_manager._pending_commands
+
+    @pytest.mark.benchmark
+    def test_scene_latency_benchmark(self):
+        """Benchmark: an N-device scene costs about one ack round trip, not N of them."""
+        ack_delay = 0.1
+        fans = self._load_scene_fans(16)
+
+        single = self._run_scene(fans[:1], ack_delay)
+        scene = self._run_scene(fans, ack_delay)
+        logger.info("scene latency: 1 device %.3fs, %d devices %.3fs", single, len(fans), scene)
+
+        # Serialized acks would take len(fans) * ack_delay = 1.6s.
+        assert scene < len(fans) * ack_delay / 2
+
 
 class TestAuthRegion(TestBase):
     """Tests for auth region validation."""
@@ -0,0 +1,152 @@
+"""Tests for single-flight, TTL-cached devicestate reads."""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.dreo.pydreo.statereader import DeviceStateReader
+from .imports import *  # pylint: disable=W0401,W0614
+from .testbase import TestBase
+
+OK = {"code": 0, "data": {"mixed": {}}}
+
+
+class _BlockingFetch:
+    """A fetch that blocks until released and counts its calls."""
+
+    def __init__(self, response=OK) -> None:
+        self.response = response
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, serial_number: str):
+        self.calls += 1
+        self.started.set()
+        assert self.release.wait(5)
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+    async def async_fetch(self, serial_number: str):
+        return await asyncio.to_thread(self, serial_number)
+
+
+class TestDeviceStateReader:
+    """Test request sharing, caching and invalidation."""
+
+    def test_concurrent_reads_share_one_request(self):
+        """Threads reading the same device while a request is in flight all get its response."""
+        fetch = _BlockingFetch()
+        reader = DeviceStateReader(fetch, fetch.async_fetch, ttl=0)
+        with ThreadPoolExecutor(4) as pool:
+            leader = pool.submit(reader.read, "SN")
+            assert fetch.started.wait(5)
+            followers = [pool.submit(reader.read, "SN") for _ in range(3)]
+            while reader.stats()["shared"] < 3:
+                pass
+            fetch.release.set()
+            assert [future.result() for future in [leader, *followers]] == [OK] * 4
+        assert fetch.calls == 1
+        assert reader.stats()["misses"] == 1
+        assert reader.stats()["in_flight"] == 0
+
+    def test_async_reads_share_one_request(self):
+        """Coroutines reading the same device share one request too."""
+        fetch = _BlockingFetch()
+        reader = DeviceStateReader(fetch, fetch.async_fetch, ttl=0)
+
+        async def run():
+            reads = [asyncio.create_task(reader.async_read("SN")) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            fetch.release.set()
+            return await asyncio.gather(*reads)
+
+        assert asyncio.run(run()) == [OK] * 3
+        assert fetch.calls == 1
+
+    def test_ttl_cache_and_fresh_bypass(self):
+        """Successful responses are reused within the TTL; fresh reads skip the cache."""
+        fetch = _BlockingFetch()
+        fetch.release.set()
+        reader = DeviceStateReader(fetch, fetch.async_fetch, ttl=60)
+        assert reader.read("SN") == OK
+        assert reader.read("SN") == OK
+        assert asyncio.run(reader.async_read("SN")) == OK
+        assert fetch.calls == 1
+        assert reader.read("SN", fresh=True) == OK
+        assert fetch.calls == 2
+
+        with patch("custom_components.dreo.pydreo.statereader.time.monotonic", return_value=1e12):
+            reader.read("SN")
+        assert fetch.calls == 3
+        stats = reader.stats()
+        assert (stats["hits"], stats["misses"], stats["bypassed"], stats["cached"]) == (2, 3, 1, 1)
+
+    def test_failed_responses_are_not_cached(self):
+        """Error responses are returned but read again next time."""
+        fetch = _BlockingFetch({"code": 1})
+        fetch.release.set()
+        reader = DeviceStateReader(fetch, fetch.async_fetch, ttl=60)
+        assert reader.read("SN") == {"code": 1}
+        reader.read("SN")
+        assert fetch.calls == 2
+
+    def test_invalidate_during_request_skips_cache(self):
+        """A response fetched across an invalidate is returned but not cached."""
+        fetch = _BlockingFetch()
+        reader = DeviceStateReader(fetch, fetch.async_fetch, ttl=60)
+        with ThreadPoolExecutor(1) as pool:
+            read = pool.submit(reader.read, "SN")
+            assert fetch.started.wait(5)
+            reader.invalidate("SN")
+            fetch.release.set()
+            assert read.result() == OK
+        assert reader.stats()["cached"] == 0
+        reader.read("SN")
+        assert fetch.calls == 2
+
+    def test_errors_reach_every_waiter(self):
+        """An exception from the shared request is raised in every caller."""
+        fetch = _BlockingFetch(RuntimeError("boom"))
+        reader = DeviceStateReader(fetch, fetch.async_fetch, ttl=60)
+        with ThreadPoolExecutor(2) as pool:
+            leader = pool.submit(reader.read, "SN")
+            assert fetch.started.wait(5)
+            follower = pool.submit(reader.read, "SN")
+            while reader.stats()["shared"] < 1:
+                pass
+            fetch.release.set()
+            for future in (leader, follower):
+                with pytest.raises(RuntimeError):
+                    future.result()
+        assert reader.stats()["in_flight"] == 0
+
+
+class TestPyDreoStateReads(TestBase):
+    """Test PyDreo reading device state through the reader."""
+
+    def test_cached_reads_and_invalidation(self):
+        """Repeated loads within the TTL are served from the cache; fresh reads and reports bypass it."""
+        self.get_devices_file_name = "get_devices_HAF004S.json"
+        self.pydreo_manager.load_devices()
+        device = self.pydreo_manager.devices[0]
+        self.mock_api.reset_mock()
+
+        # load_devices just read the device, so this is served from the cache.
+        assert self.pydreo_manager.load_device_state(device) is True
+        assert self.mock_api.call_count == 0
+        assert self.pydreo_manager.load_device_state(device, fresh=True) is True
+        assert self.mock_api.call_count == 1
+
+        self.pydreo_manager._transport_consume_message(  # pylint: disable=protected-access
+            {"devicesn": device.serial_number, "method": "report", "reported": {POWERON_KEY: True}}
+        )
+        self.pydreo_manager.load_device_state(device)
+        assert self.mock_api.call_count == 2
+        self.pydreo_manager.load_device_state(device)
+        assert self.mock_api.call_count == 2
+        assert self.pydreo_manager.state_read_stats["hits"] == 2
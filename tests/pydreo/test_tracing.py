@@ -0,0 +1,176 @@
+"""Tests for per-command tracing."""
+
+import threading
+import time
+from unittest.mock import patch
+
+from custom_components.dreo.pydreo.commandoutbox import CommandOutbox, OutboxTiming
+from custom_components.dreo.pydreo.tracing import (
+    OUTCOME_CONFIRMED,
+    OUTCOME_DROPPED,
+    OUTCOME_NOT_ACKED,
+    OUTCOME_UNCONFIRMED,
+    CommandTracer,
+    current_trace,
+)
+from .imports import *  # pylint: disable=W0401,W0614
+from .dreosimulator import DreoCloudSimulator
+from .testbase import PATCH_BASE_PATH, wait_for
+
+DEVICES_FILE = "get_devices_HTF005S.json"
+
+
+def _timer_scheduler(delay: float, work):
+    timer = threading.Timer(delay, work)
+    timer.daemon = True
+    timer.start()
+    return timer.cancel
+
+
+def _span_names(trace: dict) -> list[str]:
+    return [span["name"] for span in trace["spans"]]
+
+
+class TestCommandTracer:
+    """Test trace bookkeeping and export."""
+
+    def test_disabled_tracer_records_nothing(self):
+        """A disabled tracer starts no traces."""
+        tracer = CommandTracer()
+        assert tracer.start("SN", "Fan", {POWERON_KEY}) is None
+        assert tracer.recent() == []
+        assert tracer.chrome_trace()["traceEvents"] == []
+
+    def test_report_confirms_acked_trace(self):
+        """Only a report carrying one of the trace's keys confirms it."""
+        tracer = CommandTracer(enabled=True)
+        trace = tracer.start("SN", "Fan", {WINDLEVEL_KEY})
+        tracer.await_report(trace, time.monotonic())
+
+        tracer.on_report("OTHER", {WINDLEVEL_KEY: 3})
+        tracer.on_report("SN", {POWERON_KEY: True})
+        assert trace.outcome is None
+        tracer.on_report("SN", {WINDLEVEL_KEY: 3, POWERON_KEY: True})
+        assert trace.outcome == OUTCOME_CONFIRMED
+        assert tracer.recent()[0]["spans"][-1]["name"] == "report"
+        assert tracer.recent()[0]["spans"][-1]["keys"] == [WINDLEVEL_KEY]
+
+    def test_newer_command_supersedes_awaiting_trace(self):
+        """A trace still waiting for its report when the next one is acked stays unconfirmed."""
+        tracer = CommandTracer(enabled=True)
+        first = tracer.start("SN", "Fan", {WINDLEVEL_KEY})
+        tracer.await_report(first, time.monotonic())
+        second = tracer.start("SN", "Fan", {WINDLEVEL_KEY})
+        tracer.await_report(second, time.monotonic())
+        tracer.on_report("SN", {WINDLEVEL_KEY: 2})
+        assert first.outcome == OUTCOME_UNCONFIRMED
+        assert second.outcome == OUTCOME_CONFIRMED
+
+    def test_capacity_and_chrome_export(self):
+        """Only the most recent traces are kept; each becomes a thread of its device's process."""
+        tracer = CommandTracer(capacity=2, enabled=True)
+        for name in ("Fan", "Fan", "Heater"):
+            trace = tracer.start(name, name, {POWERON_KEY})
+            trace.span("ws.send", trace.started, trace.started + 0.002)
+            trace.event("submit", trace.started, keys=[POWERON_KEY])
+
+        assert [trace["device"] for trace in tracer.recent()] == ["Fan", "Heater"]
+        events = tracer.chrome_trace()["traceEvents"]
+        processes = {event["args"]["name"]: event["pid"] for event in events if event["name"] == "process_name"}
+        assert set(processes) == {"Fan", "Heater"}
+        spans = [event for event in events if event["ph"] == "X"]
+        assert len(spans) == 2
+        assert spans[0]["dur"] == 2000.0
+        assert spans[0]["args"]["keys"] == [POWERON_KEY]
+        assert len({span["tid"] for span in spans}) == 2
+        assert sum(event["ph"] == "i" for event in events) == 2
+
+
+class TestOutboxTracing:
+    """Test the outbox's part of a trace."""
+
+    def test_batch_trace_records_submits_and_waits(self):
+        """One trace per batch, with each submit, the collect window and min_interval pacing."""
+        tracer = CommandTracer(enabled=True)
+        seen = []
+
+        def send(params):
+            seen.append(current_trace())
+
+        timing = OutboxTiming(quiet_period=0.02, max_wait=0.1, min_interval=0.2)
+        outbox = CommandOutbox("Fan", timing, send, _timer_scheduler, tracer=tracer, serial_number="SN")
+        outbox.submit({POWERON_KEY: True})
+        outbox.submit({WINDLEVEL_KEY: 2})
+        assert wait_for(lambda: len(seen) == 1)
+        outbox.submit({WINDLEVEL_KEY: 3})
+        assert wait_for(lambda: len(seen) == 2)
+
+        first, second = tracer.recent()
+        assert seen[0].trace_id == first["trace_id"]
+        assert first["keys"] == sorted([POWERON_KEY, WINDLEVEL_KEY])
+        assert [event["keys"] for event in first["events"]] == [[POWERON_KEY], [WINDLEVEL_KEY]]
+        assert _span_names(first) == ["outbox.collect"]
+        assert first["spans"][0]["duration_ms"] >= 20
+        # The second batch was ready after its quiet period but held back by min_interval.
+        assert _span_names(second) == ["outbox.collect", "outbox.pace"]
+        assert second["spans"][1]["duration_ms"] > 100
+
+    def test_dropped_and_unacked_batches(self):
+        """Cancelled and unacknowledged batches close their traces."""
+        tracer = CommandTracer(enabled=True)
+        outbox = CommandOutbox("Fan", OutboxTiming.IMMEDIATE, lambda params: False, _timer_scheduler, tracer=tracer, serial_number="SN")
+        outbox.submit({POWERON_KEY: True})
+        deferred = CommandOutbox("Fan", OutboxTiming(1.0, 1.0, 0.0), lambda params: True, _timer_scheduler, tracer=tracer, serial_number="SN")
+        deferred.submit({POWERON_KEY: True})
+        deferred.cancel()
+        assert [trace["outcome"] for trace in tracer.recent()] == [OUTCOME_NOT_ACKED, OUTCOME_DROPPED]
+
+
+class TestCommandTracing:
+    """Trace commands end to end against the local cloud simulator."""
+
+    def test_command_trace_to_confirmed_report(self):
+        """A setter's trace covers every stage up to the confirming report."""
+        with DreoCloudSimulator([DEVICES_FILE], latency=0.01) as cloud:
+            pydreo = PyDreo("EMAIL", "PASSWORD", redact=True)
+            pydreo.tracer.enabled = True
+            assert pydreo.login() is True
+            assert pydreo.load_devices() is True
+            pydreo.start_transport()
+            try:
+                assert wait_for(lambda: cloud.connected_clients == 1, timeout=5)
+                fan = pydreo.devices[0]
+                fan._outbox.timing = OutboxTiming.IMMEDIATE  # pylint: disable=protected-access
+                fan.is_on = not fan.is_on
+
+                assert wait_for(lambda: pydreo.tracer.recent() and pydreo.tracer.recent()[0]["outcome"] == OUTCOME_CONFIRMED)
+                trace = pydreo.tracer.recent()[0]
+                assert trace["device"] == fan.name
+                assert set(_span_names(trace)) == {"outbox.collect", "command.slot", "ws.lock", "ws.write", "ws.send", "ack", "report"}
+                ack = next(span for span in trace["spans"] if span["name"] == "ack")
+                assert ack["duration_ms"] >= 10
+                assert [event["name"] for event in trace["events"]] == ["submit", "acked"]
+            finally:
+                pydreo.stop_transport()
+
+    def test_unacked_command_trace(self):
+        """Every attempt of a command the cloud never acks is traced and the trace is marked not acked."""
+        with DreoCloudSimulator([DEVICES_FILE], drop_rate=1.0) as cloud:
+            pydreo = PyDreo("EMAIL", "PASSWORD", redact=True)
+            pydreo.tracer.enabled = True
+            assert pydreo.login() is True
+            assert pydreo.load_devices() is True
+            pydreo.start_transport()
+            try:
+                assert wait_for(lambda: cloud.connected_clients == 1, timeout=5)
+                with patch(f"{PATCH_BASE_PATH}._COMMAND_ACK_TIMEOUT", 0.1):
+                    assert pydreo.send_command(pydreo.devices[0], {POWERON_KEY: True}) is False
+
+                trace = pydreo.tracer.recent()[0]
+                assert trace["outcome"] == OUTCOME_NOT_ACKED
+                acks = [span for span in trace["spans"] if span["name"] == "ack"]
+                assert len(acks) == cloud.stats.controls > 1
+                assert all(span["timed_out"] for span in acks)
+                assert [span["attempt"] for span in acks] == list(range(len(acks)))
+            finally:
+                pydreo.stop_transport()
@@ -0,0 +1,173 @@
+"""Benchmark: WebSocket frame throughput through the real consumer path.
+
+Synthetic ``report`` / ``control-report`` frames for many devices are fed to
+``CommandTransport._ws_consumer_handler``, which runs ``json.loads``, the ack
+check and the device's ``handle_server_update`` for each one - everything the
+transport thread does per frame except the socket read.
+
+Tuning (environment):
+    DREO_BENCH_WS_FRAMES   frames per device (default 200)
+    DREO_BENCH_PROFILE     if set, dump a cProfile of the run to
+                           bench_results/ws_throughput.prof and log the top functions
+
+Results are written to bench_results/ws_throughput.json. Run with
+``pytest -m benchmark``.
+"""
+
+import asyncio
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import time
+import tracemalloc
+from collections import defaultdict
+
+import pytest
+
+from .imports import *  # pylint: disable=W0401,W0614
+from .benchreport import write_report
+from .dreosimulator import DreoCloudSimulator
+
+logger = logging.getLogger(__name__)
+
+FRAMES_PER_DEVICE = int(os.environ.get("DREO_BENCH_WS_FRAMES", "200"))
+PROFILE = bool(os.environ.get("DREO_BENCH_PROFILE"))
+PROFILE_TOP = 25
+
+# One fixture per device class; each entry is cloned COPIES times.
+DEVICES_FILES = [
+    "get_devices_HAF004S.json",
+    "get_devices_HTF005S.json",
+    "get_devices_HCF001S.json",
+    "get_devices_HAP003S.json",
+    "get_devices_HSH009S.json",
+    "get_devices_HAC005S.json",
+    "get_devices_HHM001S.json",
+    "get_devices_HDH002S.json",
+    "get_devices_HEC002S.json",
+]
+COPIES = 10
+METHODS = ("report", "control-report")
+
+
+class _FrameStream:
+    """Async-iterable stand-in for a connected websocket that yields prepared frames."""
+
+    def __init__(self, frames: list[str]) -> None:
+        self._frames = frames
+
+    async def __aiter__(self):
+        for frame in self._frames:
+            yield frame
+
+
+def _synthetic_frames(device, count: int) -> list[str]:
+    """Frames cycling through the device's reported keys; booleans toggle, other values repeat."""
+    mixed = (device.raw_state or {}).get(DATA_KEY, {}).get(MIXED_KEY, {})
+    states = {key: value["state"] for key, value in mixed.items() if isinstance(value, dict) and isinstance(value.get("state"), (bool, int, str))}
+    keys = sorted(states)
+    frames = []
+    for index in range(count):
+        key = keys[index % len(keys)]
+        value = states[key]
+        if isinstance(value, bool) and (index // len(keys)) % 2:
+            value = not value
+        message = {"devicesn": device.serial_number, "method": METHODS[index % 2], REPORTED_KEY: {key: value}, "timestamp": index}
+        frames.append(json.dumps(message))
+    return frames
+
+
+def _consume(pydreo: PyDreo, frames: list[str]) -> float:
+    """Run frames through the transport consumer; return CPU seconds spent."""
+    started = time.process_time()
+    asyncio.run(pydreo._transport._ws_consumer_handler(_FrameStream(frames)))  # pylint: disable=protected-access
+    return time.process_time() - started
+
+
+@pytest.mark.benchmark
+class TestWsThroughputBenchmark:
+    """Frame throughput, per-class CPU cost and allocations for the WebSocket consumer."""
+
+    @pytest.fixture(autouse=True)
+    def fleet(self):
+        """Devices of every class, loaded over REST from the local cloud simulator."""
+        with DreoCloudSimulator(DEVICES_FILES, copies=COPIES) as cloud:
+            self.pydreo = PyDreo("EMAIL", "PASSWORD", redact=True)
+            assert self.pydreo.login() is True
+            assert self.pydreo.load_devices() is True
+            self.pydreo.close_http_sessions()
+            assert len(self.pydreo.devices) == len(cloud.devices)
+
+        # Debug logging is off in production; with log_cli at DEBUG it would dominate the numbers.
+        quiet = [logging.getLogger(name) for name in ("custom_components.dreo.pydreo",)]
+        levels = [quiet_logger.level for quiet_logger in quiet]
+        for quiet_logger in quiet:
+            quiet_logger.setLevel(logging.INFO)
+        yield
+        for quiet_logger, level in zip(quiet, levels):
+            quiet_logger.setLevel(level)
+        for device in self.pydreo.devices:
+            device.dispose()
+
+    def test_ws_throughput_benchmark(self):
+        """Measure messages/s, CPU per message by device class and allocations; write the JSON report."""
+        by_class: dict[str, list[str]] = defaultdict(list)
+        for device in self.pydreo.devices:
+            by_class[type(device).__name__].extend(_synthetic_frames(device, FRAMES_PER_DEVICE))
+        # Interleave devices the way a busy account's stream would arrive.
+        all_frames = [frame for frames in zip(*by_class.values()) for frame in frames]
+
+        _consume(self.pydreo, all_frames[: len(all_frames) // 10])  # warm up
+
+        wall_started = time.perf_counter()
+        cpu = _consume(self.pydreo, all_frames)
+        wall = time.perf_counter() - wall_started
+
+        per_class = {}
+        for class_name, frames in sorted(by_class.items()):
+            class_cpu = _consume(self.pydreo, frames)
+            per_class[class_name] = {"frames": len(frames), "cpu_us_per_message": round(class_cpu / len(frames) * 1e6, 2)}
+
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        _consume(self.pydreo, all_frames)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        diffs = after.compare_to(before, "lineno")
+        allocations = {
+            "peak_kib": round(peak / 1024, 1),
+            "retained_blocks": sum(diff.count_diff for diff in diffs if diff.count_diff > 0),
+            "retained_kib": round(sum(diff.size_diff for diff in diffs if diff.size_diff > 0) / 1024, 1),
+        }
+
+        results = {
+            "devices": len(self.pydreo.devices),
+            "frames": len(all_frames),
+            "messages_per_s": round(len(all_frames) / wall, 1),
+            "cpu_us_per_message": round(cpu / len(all_frames) * 1e6, 2),
+            "per_class": per_class,
+            "allocations": allocations,
+        }
+
+        if PROFILE:
+            profiler = cProfile.Profile()
+            profiler.enable()
+            _consume(self.pydreo, all_frames)
+            profiler.disable()
+            path = write_report("ws_throughput", results).with_suffix(".prof")
+            profiler.dump_stats(path)
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats("tottime").print_stats(PROFILE_TOP)
+            logger.info("ws throughput profile (%s):\n%s", path, stream.getvalue())
+
+        path = write_report("ws_throughput", results)
+        logger.info("ws throughput: %s (report %s)", results, path)
+
+        assert set(per_class) == {type(device).__name__ for device in self.pydreo.devices}
+        # Handling a frame must not leak: retained memory stays far below one block per frame.
+        assert allocations["retained_blocks"] < len(all_frames)